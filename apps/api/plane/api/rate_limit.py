@@ -3,15 +3,106 @@
 # See the LICENSE file for details.
 
 # python imports
+import hashlib
+import math
 import os
 
 # Third party imports
+import redis
 from rest_framework.throttling import SimpleRateThrottle
 
-
-class ApiKeyRateThrottle(SimpleRateThrottle):
-    scope = "api_key"
-    rate = os.environ.get("API_KEY_RATE_LIMIT", "60/minute")
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Generic cell rate algorithm over one or more buckets. Each bucket stores its
+# theoretical arrival time (TAT) in microseconds of the redis clock, so every
+# worker shares the same clock and the check and the update are one atomic
+# step. The request is only counted when every bucket allows it.
+#
+# KEYS: the buckets
+# ARGV: (emission interval, period) in microseconds for each bucket
+# Returns: allowed, remaining and limiting bucket index (1 based), retry after
+# and the time the limiting bucket is full again in microseconds
+GCRA_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000000 + tonumber(time[2])
+
+local denied = nil
+local remaining = -1
+local limiting = 1
+local retry_after = 0
+local tats = {}
+local full_at = {}
+
+for i, key in ipairs(KEYS) do
+    local emission = tonumber(ARGV[i * 2 - 1])
+    local period = tonumber(ARGV[i * 2])
+    local tat = math.max(tonumber(redis.call("GET", key) or now), now)
+    local new_tat = tat + emission
+    local allow_at = new_tat - period
+
+    if allow_at > now then
+        denied = denied or i
+        retry_after = math.max(retry_after, allow_at - now)
+    end
+
+    local left = math.max(math.floor((now - allow_at) / emission), 0)
+    if remaining < 0 or left < remaining then
+        remaining = left
+        limiting = i
+    end
+
+    tats[i] = new_tat
+    full_at[i] = tat
+end
+
+if not denied then
+    for i, key in ipairs(KEYS) do
+        redis.call("SET", key, string.format("%d", tats[i]), "PX", math.ceil((tats[i] - now) / 1000))
+    end
+    return {1, remaining, limiting, 0, tats[limiting]}
+end
+
+return {0, 0, denied, retry_after, full_at[denied]}
+"""
+
+_gcra_script = None
+
+
+def check_rate_limits(limits):
+    """
+    Count a request against every (key, num_requests, duration) limit at once.
+    Returns (allowed, remaining, limiting index, retry after seconds, reset
+    unix timestamp) for the most restrictive limit.
+    """
+    global _gcra_script
+    if _gcra_script is None:
+        _gcra_script = redis_instance().register_script(GCRA_SCRIPT)
+
+    keys = []
+    args = []
+    for key, num_requests, duration in limits:
+        keys.append(key)
+        args += [int(duration * 1000000 // num_requests), int(duration * 1000000)]
+
+    allowed, remaining, limiting, retry_after, reset = _gcra_script(keys=keys, args=args, client=redis_instance())
+    return bool(allowed), remaining, limiting - 1, retry_after / 1000000, math.ceil(reset / 1000000)
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """
+    Rate limit of an api key enforced in redis with GCRA. Besides the limit
+    of the key, a view can set `api_rate_limit` for a limit of the key on
+    that endpoint and `workspace_rate` limits every key of a workspace
+    together. If redis is unavailable requests are allowed.
+    """
+
+    workspace_rate = None
 
     def get_cache_key(self, request, view):
         # Retrieve the API key from the request header
@@ -19,73 +110,54 @@ class ApiKeyRateThrottle(SimpleRateThrottle):
         if not api_key:
             return None  # Allow the request if there's no API key
 
-        # Use the API key as part of the cache key
-        return f"{self.scope}:{api_key}"
-
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
-
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
+        # Hash the API key so it is not stored in the key names
+        return f"ratelimit:{self.scope}:{hashlib.sha256(api_key.encode()).hexdigest()}"
 
-            # Calculate the requests
-            num_requests = len(history)
+    def get_limits(self, request, view):
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return []
 
-            # Check available requests
-            available = self.num_requests - num_requests
+        limits = [(key, self.num_requests, self.duration)]
 
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
-
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
-
-        return allowed
-
-
-class ServiceTokenRateThrottle(SimpleRateThrottle):
-    scope = "service_token"
-    rate = "300/minute"
+        endpoint_rate = getattr(view, "api_rate_limit", None)
+        if endpoint_rate:
+            limits.append((f"{key}:{type(view).__name__}", *self.parse_rate(endpoint_rate)))
 
-    def get_cache_key(self, request, view):
-        # Retrieve the API key from the request header
-        api_key = request.headers.get("X-Api-Key")
-        if not api_key:
-            return None  # Allow the request if there's no API key
+        slug = getattr(view, "kwargs", {}).get("slug")
+        if self.workspace_rate and slug:
+            limits.append((f"ratelimit:workspace:{slug}", *self.parse_rate(self.workspace_rate)))
 
-        # Use the API key as part of the cache key
-        return f"{self.scope}:{api_key}"
+        return limits
 
     def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
+        limits = self.get_limits(request, view)
+        if not limits:
+            return True
 
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
+        try:
+            allowed, remaining, limiting, self.retry_after, reset_time = check_rate_limits(limits)
+        except redis.RedisError as e:
+            log_exception(e)
+            return True
 
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
+        # Add headers
+        request.META["X-RateLimit-Limit"] = limits[limiting][1]
+        request.META["X-RateLimit-Remaining"] = remaining
+        request.META["X-RateLimit-Reset"] = reset_time
 
-            # Calculate the requests
-            num_requests = len(history)
+        return allowed
 
-            # Check available requests
-            available = self.num_requests - num_requests
+    def wait(self):
+        return getattr(self, "retry_after", None)
 
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
 
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
+class ApiKeyRateThrottle(RedisRateThrottle):
+    scope = "api_key"
+    rate = os.environ.get("API_KEY_RATE_LIMIT", "60/minute")
+    workspace_rate = os.environ.get("WORKSPACE_API_RATE_LIMIT")
 
-        return allowed
+
+class ServiceTokenRateThrottle(RedisRateThrottle):
+    scope = "service_token"
+    rate = "300/minute"
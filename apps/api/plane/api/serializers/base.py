@@ -2,8 +2,33 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Django imports
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet, prefetch_related_objects
+from django.db.models.manager import BaseManager
+from django.db.models.query import ModelIterable
+
 # Third party imports
 from rest_framework import serializers
+from rest_framework.serializers import LIST_SERIALIZER_KWARGS, LIST_SERIALIZER_KWARGS_REMOVE
+
+
+class BaseListSerializer(serializers.ListSerializer):
+    """
+    Serializes a page of instances with the relations required by `expand`
+    and `fields` loaded up front, so the page costs a fixed number of
+    queries and related objects shared by instances are serialized once.
+    """
+
+    def to_representation(self, data):
+        if isinstance(data, BaseManager):
+            data = data.all()
+        if isinstance(data, QuerySet):
+            data = self.child.setup_eager_loading(data)
+
+        instances = list(data)
+        self.child.prepare_page(instances)
+        return [self.child.to_representation(item) for item in instances]
 
 
 class BaseSerializer(serializers.ModelSerializer):
@@ -16,11 +41,17 @@ class BaseSerializer(serializers.ModelSerializer):
 
     id = serializers.PrimaryKeyRelatedField(read_only=True)
 
+    # Relations read by the serializer itself, e.g. by a url property
+    select_related_fields = ()
+
     def __init__(self, *args, **kwargs):
         # If 'fields' is provided in the arguments, remove it and store it separately.
         # This is done so as not to pass this custom argument up to the superclass.
         fields = kwargs.pop("fields", [])
         self.expand = kwargs.pop("expand", []) or []
+        self.is_field_filtered = bool(fields)
+        # Serialized expansions by (serializer class, pk), shared by every instance
+        self._expanded = {}
 
         # Call the initialization of the superclass.
         super().__init__(*args, **kwargs)
@@ -29,6 +60,130 @@ class BaseSerializer(serializers.ModelSerializer):
         if fields:
             self.fields = self._filter_fields(fields=fields)
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {key: kwargs.pop(key) for key in LIST_SERIALIZER_KWARGS_REMOVE if kwargs.get(key) is not None}
+        list_kwargs["child"] = cls(*args, **kwargs)
+        list_kwargs.update({key: value for key, value in kwargs.items() if key in LIST_SERIALIZER_KWARGS})
+        meta = getattr(cls, "Meta", None)
+        list_serializer_class = getattr(meta, "list_serializer_class", BaseListSerializer)
+        return list_serializer_class(*args, **list_kwargs)
+
+    @staticmethod
+    def get_expansion_serializers():
+        # Import all the expandable serializers
+        from . import (
+            IssueSerializer,
+            IssueLiteSerializer,
+            ProjectLiteSerializer,
+            StateLiteSerializer,
+            UserLiteSerializer,
+            WorkspaceLiteSerializer,
+            EstimatePointSerializer,
+        )
+
+        # Expansion mapper
+        return {
+            "user": UserLiteSerializer,
+            "workspace": WorkspaceLiteSerializer,
+            "project": ProjectLiteSerializer,
+            "default_assignee": UserLiteSerializer,
+            "project_lead": UserLiteSerializer,
+            "state": StateLiteSerializer,
+            "created_by": UserLiteSerializer,
+            "updated_by": UserLiteSerializer,
+            "issue": IssueSerializer,
+            "actor": UserLiteSerializer,
+            "owned_by": UserLiteSerializer,
+            "members": UserLiteSerializer,
+            "parent": IssueLiteSerializer,
+            "estimate_point": EstimatePointSerializer,
+        }
+
+    def get_expanded_relations(self, model):
+        """Model fields of the requested expansions, by expansion name"""
+        expansion = self.get_expansion_serializers()
+        relations = {}
+        for expand in self.expand:
+            if expand not in self.fields or expand not in expansion:
+                continue
+            try:
+                field = model._meta.get_field(expand)
+            except FieldDoesNotExist:
+                continue
+            if field.is_relation:
+                relations[expand] = field
+        return relations
+
+    def setup_eager_loading(self, queryset):
+        """
+        Add the select_related and prefetch_related calls the expansions
+        need, and restrict the columns with only() when `fields` selects
+        model fields alone
+        """
+        if queryset._iterable_class is not ModelIterable or queryset.query.combinator:
+            return queryset
+
+        expansion = self.get_expansion_serializers()
+        select_related = list(self.select_related_fields)
+        prefetch_related = []
+        for expand, field in self.get_expanded_relations(queryset.model).items():
+            nested = [f"{expand}__{name}" for name in expansion[expand].select_related_fields]
+            if field.many_to_one or field.one_to_one:
+                select_related += [expand, *nested]
+            else:
+                prefetch_related += [expand, *nested]
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        # Leave querysets that already defer fields alone
+        if self.is_field_filtered and queryset.query.deferred_loading == (frozenset(), True):
+            concrete = {field.name for field in queryset.model._meta.concrete_fields}
+            sources = {field.source for field in self.fields.values()}
+            if sources <= concrete:
+                queryset = queryset.only("pk", *sources, *(name.split("__")[0] for name in select_related))
+
+        return queryset
+
+    def prepare_page(self, instances):
+        """Load and serialize the expansions of a page of instances in one batch per relation"""
+        if not instances:
+            return
+
+        if self.select_related_fields:
+            prefetch_related_objects(instances, *self.select_related_fields)
+
+        expansion = self.get_expansion_serializers()
+        for expand in self.get_expanded_relations(type(instances[0])):
+            # Relations loaded by select_related or a prefetch are not queried again
+            prefetch_related_objects(instances, expand)
+            related = []
+            for instance in instances:
+                value = getattr(instance, expand)
+                related.extend(value.all() if hasattr(value, "all") else [value])
+            self.load_expansions(expansion[expand], related)
+
+    def load_expansions(self, serializer_class, objects):
+        """Serialize the objects which are not expanded yet in one batch"""
+        missing = {}
+        for obj in objects:
+            if obj is not None and (serializer_class, obj.pk) not in self._expanded:
+                missing[obj.pk] = obj
+
+        if missing:
+            data = serializer_class(list(missing.values()), many=True).data
+            for pk, item in zip(missing, data):
+                self._expanded[(serializer_class, pk)] = item
+
+    def get_expansion(self, serializer_class, obj):
+        if obj is None:
+            return serializer_class(obj).data
+        self.load_expansions(serializer_class, [obj])
+        return self._expanded[(serializer_class, obj.pk)]
+
     def _filter_fields(self, fields):
         """
         Adjust the serializer's fields based on the provided 'fields' list.
@@ -74,43 +229,18 @@ class BaseSerializer(serializers.ModelSerializer):
 
         # Ensure 'expand' is iterable before processing
         if self.expand:
+            expansion = self.get_expansion_serializers()
             for expand in self.expand:
                 if expand in self.fields:
-                    # Import all the expandable serializers
-                    from . import (
-                        IssueSerializer,
-                        IssueLiteSerializer,
-                        ProjectLiteSerializer,
-                        StateLiteSerializer,
-                        UserLiteSerializer,
-                        WorkspaceLiteSerializer,
-                        EstimatePointSerializer,
-                    )
-
-                    # Expansion mapper
-                    expansion = {
-                        "user": UserLiteSerializer,
-                        "workspace": WorkspaceLiteSerializer,
-                        "project": ProjectLiteSerializer,
-                        "default_assignee": UserLiteSerializer,
-                        "project_lead": UserLiteSerializer,
-                        "state": StateLiteSerializer,
-                        "created_by": UserLiteSerializer,
-                        "updated_by": UserLiteSerializer,
-                        "issue": IssueSerializer,
-                        "actor": UserLiteSerializer,
-                        "owned_by": UserLiteSerializer,
-                        "members": UserLiteSerializer,
-                        "parent": IssueLiteSerializer,
-                        "estimate_point": EstimatePointSerializer,
-                    }
                     # Check if field in expansion  then expand the field
                     if expand in expansion:
+                        value = getattr(instance, expand)
                         if isinstance(response.get(expand), list):
-                            exp_serializer = expansion[expand](getattr(instance, expand), many=True)
+                            related = list(value.all() if hasattr(value, "all") else value)
+                            self.load_expansions(expansion[expand], related)
+                            response[expand] = [self.get_expansion(expansion[expand], obj) for obj in related]
                         else:
-                            exp_serializer = expansion[expand](getattr(instance, expand))
-                        response[expand] = exp_serializer.data
+                            response[expand] = self.get_expansion(expansion[expand], value)
                     else:
                         # You might need to handle this case differently
                         response[expand] = getattr(instance, f"{expand}_id", None)
@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Python imports
+import base64
+from collections import defaultdict
+
 # Django imports
 from django.utils import timezone
 from lxml import html
@@ -41,6 +45,12 @@ from .user import UserLiteSerializer
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
+# Work item relations serialized as id lists, or expanded
+ISSUE_RELATIONS = {
+    "assignees": (IssueAssignee, "assignee_id"),
+    "labels": (IssueLabel, "label_id"),
+}
+
 
 class IssueSerializer(BaseSerializer):
     """
@@ -65,11 +75,14 @@ class IssueSerializer(BaseSerializer):
     type_id = serializers.PrimaryKeyRelatedField(
         source="type", queryset=IssueType.objects.all(), required=False, allow_null=True
     )
+    # Base64 encoded, stored in the description blob by the model and only
+    # sent back on single work items, see to_representation
+    description_binary = serializers.CharField(required=False, allow_null=True, allow_blank=True, write_only=True)
 
     class Meta:
         model = Issue
         read_only_fields = ["id", "workspace", "project", "updated_by", "updated_at"]
-        exclude = ["description_json", "description_stripped"]
+        exclude = ["description_json", "description_stripped", "description_blob"]
 
     def validate(self, data):
         if (
@@ -286,35 +299,60 @@ class IssueSerializer(BaseSerializer):
         instance.updated_at = timezone.now()
         return super().update(instance, validated_data)
 
+    def prepare_page(self, instances):
+        super().prepare_page(instances)
+        # Pages leave the description binaries out, each one is a blob read
+        self._is_page = True
+
+        # Assignee and label ids of the whole page, one query per relation
+        self._page_relations = {}
+        issue_ids = [instance.id for instance in instances]
+        for name, (model, field) in ISSUE_RELATIONS.items():
+            if name in self.fields:
+                related_ids = defaultdict(list)
+                for issue_id, related_id in model.objects.filter(issue_id__in=issue_ids).values_list("issue_id", field):
+                    related_ids[issue_id].append(related_id)
+                self._page_relations[name] = related_ids
+                if name in self.expand:
+                    self.load_related_expansions(name, [pk for pks in related_ids.values() for pk in pks])
+
+    def get_related_ids(self, instance, name):
+        page_relations = getattr(self, "_page_relations", {})
+        if name in page_relations:
+            return page_relations[name].get(instance.id, [])
+
+        model, field = ISSUE_RELATIONS[name]
+        return list(model.objects.filter(issue=instance).values_list(field, flat=True))
+
+    def load_related_expansions(self, name, pks):
+        model, serializer_class = ISSUE_RELATION_EXPANSIONS[name]
+        missing = {pk for pk in pks if (serializer_class, pk) not in self._expanded}
+        if missing:
+            self.load_expansions(
+                serializer_class,
+                model.objects.filter(pk__in=missing).select_related(*serializer_class.select_related_fields),
+            )
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        if "assignees" in self.fields:
-            if "assignees" in self.expand:
-                from .user import UserLiteSerializer
-
-                data["assignees"] = UserLiteSerializer(
-                    User.objects.filter(
-                        pk__in=IssueAssignee.objects.filter(issue=instance).values_list("assignee_id", flat=True)
-                    ),
-                    many=True,
-                ).data
-            else:
-                data["assignees"] = [
-                    str(assignee)
-                    for assignee in IssueAssignee.objects.filter(issue=instance).values_list("assignee_id", flat=True)
+        for name in ISSUE_RELATIONS:
+            if name not in self.fields:
+                continue
+            related_ids = self.get_related_ids(instance, name)
+            if name in self.expand:
+                self.load_related_expansions(name, related_ids)
+                serializer_class = ISSUE_RELATION_EXPANSIONS[name][1]
+                data[name] = [
+                    self._expanded[(serializer_class, pk)]
+                    for pk in related_ids
+                    if (serializer_class, pk) in self._expanded
                 ]
-        if "labels" in self.fields:
-            if "labels" in self.expand:
-                data["labels"] = LabelSerializer(
-                    Label.objects.filter(
-                        pk__in=IssueLabel.objects.filter(issue=instance).values_list("label_id", flat=True)
-                    ),
-                    many=True,
-                ).data
             else:
-                data["labels"] = [
-                    str(label) for label in IssueLabel.objects.filter(issue=instance).values_list("label_id", flat=True)
-                ]
+                data[name] = [str(pk) for pk in related_ids]
+
+        if not getattr(self, "_is_page", False) and "description_binary" in self.fields:
+            description_binary = instance.description_binary
+            data["description_binary"] = base64.b64encode(description_binary).decode() if description_binary else None
 
         return data
 
@@ -387,6 +425,12 @@ class LabelSerializer(BaseSerializer):
         ]
 
 
+ISSUE_RELATION_EXPANSIONS = {
+    "assignees": (User, UserLiteSerializer),
+    "labels": (Label, LabelSerializer),
+}
+
+
 class IssueLinkCreateSerializer(BaseSerializer):
     """
     Serializer for creating work item external links with validation.
@@ -654,7 +698,7 @@ class IssueExpandSerializer(BaseSerializer):
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
         read_only_fields = [
             "id",
             "workspace",
@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Django imports
+from django.db.models import prefetch_related_objects
+
 # Third party imports
 from rest_framework import serializers
 
@@ -200,6 +203,10 @@ class ModuleSerializer(BaseSerializer):
             "deleted_at",
         ]
 
+    def prepare_page(self, instances):
+        super().prepare_page(instances)
+        prefetch_related_objects(instances, "members")
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         data["members"] = [str(member.id) for member in instance.members.all()]
@@ -216,6 +216,8 @@ class ProjectSerializer(BaseSerializer):
     is_deployed = serializers.BooleanField(read_only=True)
     cover_image_url = serializers.CharField(read_only=True)
 
+    select_related_fields = ("cover_image_asset",)
+
     class Meta:
         model = Project
         fields = "__all__"
@@ -300,6 +302,8 @@ class ProjectLiteSerializer(BaseSerializer):
 
     cover_image_url = serializers.CharField(read_only=True)
 
+    select_related_fields = ("cover_image_asset",)
+
     class Meta:
         model = Project
         fields = [
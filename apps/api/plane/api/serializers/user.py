@@ -23,6 +23,8 @@ class UserLiteSerializer(BaseSerializer):
         read_only=True,
     )
 
+    select_related_fields = ("avatar_asset",)
+
     class Meta:
         model = User
         fields = [
@@ -22,9 +22,9 @@ from rest_framework.exceptions import APIException
 from rest_framework.generics import GenericAPIView
 
 # Module imports
-from plane.db.models.api import APIToken
 from plane.api.middleware.api_authentication import APIKeyAuthentication
 from plane.api.rate_limit import ApiKeyRateThrottle, ServiceTokenRateThrottle
+from plane.utils.api_tokens import get_valid_api_token
 from plane.utils.exception_logger import log_exception
 from plane.utils.paginator import BasePaginator
 from plane.utils.core.mixins import ReadReplicaControlMixin
@@ -52,7 +52,7 @@ class BaseAPIView(TimezoneMixin, GenericAPIView, ReadReplicaControlMixin, BasePa
 
     permission_classes = [IsAuthenticated]
 
-    use_read_replica = False
+    use_read_replica = None
 
     def filter_queryset(self, queryset):
         for backend in list(self.filter_backends):
@@ -64,9 +64,9 @@ class BaseAPIView(TimezoneMixin, GenericAPIView, ReadReplicaControlMixin, BasePa
         api_key = self.request.headers.get("X-Api-Key")
 
         if api_key:
-            service_token = APIToken.objects.filter(token=api_key, is_service=True).first()
+            service_token = get_valid_api_token(api_key)
 
-            if service_token:
+            if service_token and service_token["is_service"]:
                 throttle_classes.append(ServiceTokenRateThrottle())
                 return throttle_classes
 
@@ -130,6 +130,10 @@ class BaseAPIView(TimezoneMixin, GenericAPIView, ReadReplicaControlMixin, BasePa
         response = super().finalize_response(request, response, *args, **kwargs)
 
         # Add custom headers if they exist in the request META
+        ratelimit_limit = request.META.get("X-RateLimit-Limit")
+        if ratelimit_limit is not None:
+            response["X-RateLimit-Limit"] = ratelimit_limit
+
         ratelimit_remaining = request.META.get("X-RateLimit-Remaining")
         if ratelimit_remaining is not None:
             response["X-RateLimit-Remaining"] = ratelimit_remaining
@@ -171,7 +175,7 @@ class BaseViewSet(TimezoneMixin, ReadReplicaControlMixin, ModelViewSet, BasePagi
     permission_classes = [
         IsAuthenticated,
     ]
-    use_read_replica = False
+    use_read_replica = None
 
     def get_queryset(self):
         try:
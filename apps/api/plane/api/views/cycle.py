@@ -47,6 +47,7 @@ from plane.db.models import (
 )
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
 from plane.utils.host import base_host
+from plane.utils.issue_change_log import record_membership_changes
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.openapi.decorators import cycle_docs
@@ -977,6 +978,7 @@ class CycleIssueListCreateAPIEndpoint(BaseAPIView):
 
         # Update the cycle issues
         CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        record_membership_changes(issues)
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1089,6 +1091,7 @@ class CycleIssueDetailAPIEndpoint(BaseAPIView):
         )
         issue_id = cycle_issue.issue_id
         cycle_issue.delete()
+        record_membership_changes([issue_id])
         issue_activity.delay(
             type="cycle.activity.deleted",
             requested_data=json.dumps(
@@ -42,6 +42,7 @@ from plane.db.models import (
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
 from plane.utils.host import base_host
+from plane.utils.issue_change_log import record_membership_changes
 from plane.utils.openapi import (
     module_docs,
     module_issue_docs,
@@ -709,6 +710,7 @@ class ModuleIssueListCreateAPIEndpoint(BaseAPIView):
         ModuleIssue.objects.bulk_create(record_to_create, batch_size=10, ignore_conflicts=True)
 
         ModuleIssue.objects.bulk_update(records_to_update, ["module"], batch_size=10)
+        record_membership_changes(issues)
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -876,6 +878,7 @@ class ModuleIssueDetailAPIEndpoint(BaseAPIView):
 
         module_name = module_issue.module.name if module_issue.module is not None else ""
         module_issue.delete()
+        record_membership_changes([issue_id])
         issue_activity.delay(
             type="module.activity.deleted",
             requested_data=json.dumps({"module_id": str(module_id), "issues": [str(module_issue.issue_id)]}),
@@ -80,6 +80,7 @@ from .issue import (
     IssueVersionDetailSerializer,
     IssueDescriptionVersionDetailSerializer,
     IssueListDetailSerializer,
+    IssueBulkOperationSerializer,
 )
 
 from .module import (
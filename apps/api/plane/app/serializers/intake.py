@@ -134,4 +134,4 @@ class IssueStateIntakeSerializer(BaseSerializer):
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
@@ -99,10 +99,12 @@ class IssueCreateSerializer(BaseSerializer):
     )
     project_id = serializers.UUIDField(source="project.id", read_only=True)
     workspace_id = serializers.UUIDField(source="workspace.id", read_only=True)
+    # Base64 encoded, stored in the description blob by the model
+    description_binary = serializers.CharField(required=False, allow_null=True, allow_blank=True, write_only=True)
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
         read_only_fields = [
             "workspace",
             "project",
@@ -736,7 +738,7 @@ class IssueStateSerializer(DynamicBaseSerializer):
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
 
 
 class IssueIntakeSerializer(DynamicBaseSerializer):
@@ -1027,3 +1029,99 @@ class IssueDescriptionVersionDetailSerializer(BaseSerializer):
             "updated_by",
         ]
         read_only_fields = ["workspace", "project", "issue"]
+
+
+class IssueBulkOperationSerializer(serializers.Serializer):
+    """
+    Validates a bulk update of issue properties. Every referenced object is
+    checked against the project with one query per property, so the whole
+    operation is rejected before anything is written.
+    """
+
+    MAX_ISSUES = 1000
+
+    issue_ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_ISSUES)
+    state_id = serializers.UUIDField(required=False)
+    priority = serializers.ChoiceField(choices=Issue.PRIORITY_CHOICES, required=False)
+    assignee_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+    label_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+    cycle_id = serializers.UUIDField(required=False, allow_null=True)
+    module_ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    start_date = serializers.DateField(required=False, allow_null=True)
+    target_date = serializers.DateField(required=False, allow_null=True)
+    estimate_point = serializers.UUIDField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        project_id = self.context["project_id"]
+
+        if len(attrs) == 1:
+            raise serializers.ValidationError("At least one property must be updated")
+
+        attrs["issue_ids"] = list(dict.fromkeys(attrs["issue_ids"]))
+        if Issue.issue_objects.filter(project_id=project_id, id__in=attrs["issue_ids"]).count() != len(
+            attrs["issue_ids"]
+        ):
+            raise serializers.ValidationError({"issue_ids": "Issues are not valid for this project"})
+
+        if (
+            attrs.get("start_date") is not None
+            and attrs.get("target_date") is not None
+            and attrs["start_date"] > attrs["target_date"]
+        ):
+            raise serializers.ValidationError("Start date cannot exceed target date")
+
+        # A single date is checked against the other date of every issue
+        issues = Issue.issue_objects.filter(id__in=attrs["issue_ids"])
+        if (
+            attrs.get("start_date") is not None
+            and "target_date" not in attrs
+            and issues.filter(target_date__lt=attrs["start_date"]).exists()
+        ) or (
+            attrs.get("target_date") is not None
+            and "start_date" not in attrs
+            and issues.filter(start_date__gt=attrs["target_date"]).exists()
+        ):
+            raise serializers.ValidationError("Start date cannot exceed target date")
+
+        if "state_id" in attrs and not State.objects.filter(project_id=project_id, pk=attrs["state_id"]).exists():
+            raise serializers.ValidationError({"state_id": "State is not valid please pass a valid state_id"})
+
+        if attrs.get("assignee_ids"):
+            attrs["assignee_ids"] = list(dict.fromkeys(attrs["assignee_ids"]))
+            if ProjectMember.objects.filter(
+                project_id=project_id, role__gte=15, is_active=True, member_id__in=attrs["assignee_ids"]
+            ).count() != len(attrs["assignee_ids"]):
+                raise serializers.ValidationError({"assignee_ids": "Assignees must be members of the project"})
+
+        if attrs.get("label_ids"):
+            attrs["label_ids"] = list(dict.fromkeys(attrs["label_ids"]))
+            if Label.objects.filter(project_id=project_id, id__in=attrs["label_ids"]).count() != len(
+                attrs["label_ids"]
+            ):
+                raise serializers.ValidationError({"label_ids": "Labels are not valid for this project"})
+
+        if attrs.get("cycle_id") is not None:
+            cycle = Cycle.objects.filter(project_id=project_id, pk=attrs["cycle_id"], archived_at__isnull=True).first()
+            if cycle is None:
+                raise serializers.ValidationError({"cycle_id": "Cycle is not valid for this project"})
+            if cycle.end_date is not None and cycle.end_date < timezone.now():
+                raise serializers.ValidationError(
+                    {"cycle_id": "The Cycle has already been completed so no new issues can be added"}
+                )
+
+        if "module_ids" in attrs:
+            attrs["module_ids"] = list(dict.fromkeys(attrs["module_ids"]))
+            if Module.objects.filter(
+                project_id=project_id, id__in=attrs["module_ids"], archived_at__isnull=True
+            ).count() != len(attrs["module_ids"]):
+                raise serializers.ValidationError({"module_ids": "Modules are not valid for this project"})
+
+        if (
+            attrs.get("estimate_point") is not None
+            and not EstimatePoint.objects.filter(project_id=project_id, pk=attrs["estimate_point"]).exists()
+        ):
+            raise serializers.ValidationError(
+                {"estimate_point": "Estimate point is not valid please pass a valid estimate_point_id"}
+            )
+
+        return attrs
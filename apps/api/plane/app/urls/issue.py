@@ -8,15 +8,20 @@ from plane.app.views import (
     BulkCreateIssueLabelsEndpoint,
     BulkDeleteIssuesEndpoint,
     SubIssuesEndpoint,
+    SubIssueTreeEndpoint,
     IssueLinkViewSet,
     IssueAttachmentEndpoint,
     CommentReactionViewSet,
     IssueActivityEndpoint,
+    IssueActivityFeedEndpoint,
+    IssueTimelineEndpoint,
+    ProjectActivityFeedEndpoint,
     IssueArchiveViewSet,
     IssueCommentViewSet,
     IssueListEndpoint,
     IssueReactionViewSet,
     IssueRelationViewSet,
+    IssueDependencyGraphEndpoint,
     IssueSubscriberViewSet,
     ProjectUserDisplayPropertyEndpoint,
     IssueViewSet,
@@ -27,6 +32,7 @@ from plane.app.views import (
     IssueDetailEndpoint,
     IssueAttachmentV2Endpoint,
     IssueBulkUpdateDateEndpoint,
+    IssueBulkOperationEndpoint,
     IssueVersionEndpoint,
     WorkItemDescriptionVersionEndpoint,
     IssueMetaEndpoint,
@@ -100,12 +106,22 @@ urlpatterns = [
         BulkArchiveIssuesEndpoint.as_view(),
         name="bulk-archive-issues",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-operation-issues/",
+        IssueBulkOperationEndpoint.as_view(),
+        name="bulk-operation-issues",
+    ),
     ##
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/sub-issues/",
         SubIssuesEndpoint.as_view(),
         name="sub-issues",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/sub-issues/tree/",
+        SubIssueTreeEndpoint.as_view(),
+        name="sub-issue-tree",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/issue-links/",
         IssueLinkViewSet.as_view({"get": "list", "post": "create"}),
@@ -151,6 +167,21 @@ urlpatterns = [
         IssueActivityEndpoint.as_view(),
         name="project-issue-history",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/activity-feed/",
+        IssueActivityFeedEndpoint.as_view(),
+        name="project-issue-activity-feed",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/timeline/",
+        IssueTimelineEndpoint.as_view(),
+        name="project-issue-timeline",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/activity-feed/",
+        ProjectActivityFeedEndpoint.as_view(),
+        name="project-activity-feed",
+    ),
     ## Issue Activity
     ## IssueComments
     path(
@@ -242,6 +273,16 @@ urlpatterns = [
         IssueRelationViewSet.as_view({"post": "remove_relation"}),
         name="issue-relation",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/dependency-graph/",
+        IssueDependencyGraphEndpoint.as_view(),
+        name="project-dependency-graph",
+    ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/cycles/<uuid:cycle_id>/dependency-graph/",
+        IssueDependencyGraphEndpoint.as_view(),
+        name="cycle-dependency-graph",
+    ),
     ## End Issue Relation
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/deleted-issues/",
@@ -79,4 +79,9 @@ urlpatterns = [
         PageViewSet.as_view({"post": "move"}),
         name="page-move",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/pages/<uuid:page_id>/descendants/",
+        PageViewSet.as_view({"get": "descendants"}),
+        name="page-descendants",
+    ),
 ]
@@ -18,6 +18,7 @@ from plane.app.views import (
     WorkspaceThemeViewSet,
     WorkspaceUserProfileStatsEndpoint,
     WorkspaceUserActivityEndpoint,
+    WorkspaceUserActivityFeedEndpoint,
     WorkspaceUserProfileEndpoint,
     WorkspaceUserProfileIssuesEndpoint,
     WorkspaceLabelsEndpoint,
@@ -139,6 +140,11 @@ urlpatterns = [
         WorkspaceUserActivityEndpoint.as_view(),
         name="workspace-user-activity",
     ),
+    path(
+        "workspaces/<str:slug>/user-activity/<uuid:user_id>/feed/",
+        WorkspaceUserActivityFeedEndpoint.as_view(),
+        name="workspace-user-activity-feed",
+    ),
     path(
         "workspaces/<str:slug>/user-activity/<uuid:user_id>/export/",
         ExportWorkspaceUserActivityEndpoint.as_view(),
@@ -128,10 +128,18 @@ from .issue.base import (
     IssueDetailIdentifierEndpoint,
 )
 
-from .issue.activity import IssueActivityEndpoint
+from .issue.activity import (
+    IssueActivityEndpoint,
+    IssueActivityFeedEndpoint,
+    IssueTimelineEndpoint,
+    ProjectActivityFeedEndpoint,
+    WorkspaceUserActivityFeedEndpoint,
+)
 
 from .issue.archive import IssueArchiveViewSet, BulkArchiveIssuesEndpoint
 
+from .issue.bulk_operation import IssueBulkOperationEndpoint
+
 from .issue.attachment import (
     IssueAttachmentEndpoint,
     # V2
@@ -144,11 +152,11 @@ from .issue.label import LabelViewSet, BulkCreateIssueLabelsEndpoint
 
 from .issue.link import IssueLinkViewSet
 
-from .issue.relation import IssueRelationViewSet
+from .issue.relation import IssueRelationViewSet, IssueDependencyGraphEndpoint
 
 from .issue.reaction import IssueReactionViewSet
 
-from .issue.sub_issue import SubIssuesEndpoint
+from .issue.sub_issue import SubIssuesEndpoint, SubIssueTreeEndpoint
 
 from .issue.subscriber import IssueSubscriberViewSet
 
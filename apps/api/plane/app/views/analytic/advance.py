@@ -5,9 +5,9 @@
 from rest_framework.response import Response
 from rest_framework import status
 from typing import Dict, List, Any
-from django.db.models import QuerySet, Q, Count
+from django.db.models import QuerySet, Q, Count, Sum, Value
 from django.http import HttpRequest
-from django.db.models.functions import TruncMonth
+from django.db.models.functions import Coalesce, TruncMonth
 from django.utils import timezone
 from plane.app.views.base import BaseAPIView
 from plane.app.permissions import ROLE, allow_permission
@@ -22,6 +22,11 @@ from plane.db.models import (
     Workspace,
     ProjectMember,
 )
+from plane.utils.analytics_rollup import (
+    build_rollup_analytics_chart,
+    can_use_rollups,
+    get_rollup_queryset,
+)
 from plane.utils.build_chart import build_analytics_chart
 from plane.utils.date_utils import (
     get_analytics_filters,
@@ -39,6 +44,13 @@ class AdvanceAnalyticsBaseView(BaseAPIView):
             project_ids=self.request.GET.get("project_ids", None),
         )
 
+    def get_rollups(self, axes=()):
+        """Precomputed rollups for the filtered projects, None when the live query must be used"""
+        date_range = self.filters["chart_period_range"]
+        if not can_use_rollups(axes, date_filtered=bool(date_range)):
+            return None
+        return get_rollup_queryset(Project.objects.filter(**self.filters["project_filters"]), date_range)
+
 
 class AdvanceAnalyticsEndpoint(AdvanceAnalyticsBaseView):
     def get_filtered_counts(self, queryset: QuerySet) -> Dict[str, int]:
@@ -142,18 +154,22 @@ class AdvanceAnalyticsStatsEndpoint(AdvanceAnalyticsBaseView):
         )
 
     def get_work_items_stats(self) -> Dict[str, Dict[str, int]]:
-        base_queryset = Issue.issue_objects.filter(**self.filters["base_filters"])
-        return (
-            base_queryset.values("project_id", "project__name")
-            .annotate(
-                cancelled_work_items=Count("id", filter=Q(state__group="cancelled")),
-                completed_work_items=Count("id", filter=Q(state__group="completed")),
-                backlog_work_items=Count("id", filter=Q(state__group="backlog")),
-                un_started_work_items=Count("id", filter=Q(state__group="unstarted")),
-                started_work_items=Count("id", filter=Q(state__group="started")),
+        rollups = self.get_rollups()
+        if rollups is not None:
+            return (
+                rollups.filter(dimension="")
+                .values("project_id", "project__name")
+                .annotate(
+                    cancelled_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="cancelled")), Value(0)),
+                    completed_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="completed")), Value(0)),
+                    backlog_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="backlog")), Value(0)),
+                    un_started_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="unstarted")), Value(0)),
+                    started_work_items=Coalesce(Sum("issue_count", filter=Q(state_group="started")), Value(0)),
+                )
+                .order_by("project_id")
             )
-            .order_by("project_id")
-        )
+
+        return self.get_project_issues_stats()
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER], level="WORKSPACE")
     def get(self, request: HttpRequest, slug: str) -> Response:
@@ -231,15 +247,28 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
             queryset = queryset.filter(created_at__date__gte=start_date, created_at__date__lte=end_date)
 
         # Annotate by month and count
-        monthly_stats = (
-            queryset.annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(
-                created_count=Count("id"),
-                completed_count=Count("id", filter=Q(state__group="completed")),
+        rollups = self.get_rollups(axes=["CREATED_AT"])
+        if rollups is not None:
+            queryset = rollups.filter(dimension="")
+            monthly_stats = (
+                queryset.annotate(month=TruncMonth("date"))
+                .values("month")
+                .annotate(
+                    created_count=Coalesce(Sum("issue_count"), Value(0)),
+                    completed_count=Coalesce(Sum("issue_count", filter=Q(state_group="completed")), Value(0)),
+                )
+                .order_by("month")
+            )
+        else:
+            monthly_stats = (
+                queryset.annotate(month=TruncMonth("created_at"))
+                .values("month")
+                .annotate(
+                    created_count=Count("id"),
+                    completed_count=Count("id", filter=Q(state__group="completed")),
+                )
+                .order_by("month")
             )
-            .order_by("month")
-        )
 
         # Create dictionary of month -> counts
         stats_dict = {
@@ -304,6 +333,13 @@ class AdvanceAnalyticsChartEndpoint(AdvanceAnalyticsBaseView):
                 start_date, end_date = self.filters["chart_period_range"]
                 queryset = queryset.filter(created_at__date__gte=start_date, created_at__date__lte=end_date)
 
+            rollups = self.get_rollups(axes=[x_axis, group_by])
+            if rollups is not None:
+                return Response(
+                    build_rollup_analytics_chart(rollups, x_axis, group_by),
+                    status=status.HTTP_200_OK,
+                )
+
             return Response(
                 build_analytics_chart(queryset, x_axis, group_by),
                 status=status.HTTP_200_OK,
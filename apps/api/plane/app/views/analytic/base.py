@@ -30,6 +30,13 @@ from plane.db.models import (
 )
 
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_rollup import (
+    build_rollup_graph_extras,
+    build_rollup_graph_plot,
+    can_use_rollups,
+    get_rollup_queryset,
+    get_rollup_total,
+)
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -75,6 +82,21 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
+        # Only project filters can be answered from the precomputed rollups
+        if set(filters) <= {"project__in"} and can_use_rollups([x_axis, segment]):
+            projects = Project.objects.filter(workspace__slug=slug, archived_at__isnull=True)
+            if filters:
+                projects = projects.filter(id__in=filters["project__in"])
+            rollups = get_rollup_queryset(projects)
+            return Response(
+                {
+                    "total": get_rollup_total(rollups),
+                    "distribution": build_rollup_graph_plot(rollups, x_axis=x_axis, y_axis=y_axis, segment=segment),
+                    "extras": build_rollup_graph_extras(rollups, x_axis=x_axis, segment=segment),
+                },
+                status=status.HTTP_200_OK,
+            )
+
         # Get the issues for the workspace with the additional filters applied
         queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
@@ -58,7 +58,7 @@ class BaseViewSet(TimezoneMixin, ReadReplicaControlMixin, ModelViewSet, BasePagi
 
     search_fields = []
 
-    use_read_replica = False
+    use_read_replica = None
 
     def get_queryset(self):
         try:
@@ -157,7 +157,7 @@ class BaseAPIView(TimezoneMixin, ReadReplicaControlMixin, APIView, BasePaginator
 
     search_fields = []
 
-    use_read_replica = False
+    use_read_replica = None
 
     def filter_queryset(self, queryset):
         for backend in list(self.filter_backends):
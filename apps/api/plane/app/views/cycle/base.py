@@ -4,7 +4,6 @@
 
 # Python imports
 import json
-import pytz
 
 
 # Django imports
@@ -50,15 +49,14 @@ from plane.db.models import (
     Label,
     User,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
 from plane.utils.host import base_host
 from plane.utils.cycle_transfer_issues import transfer_cycle_issues
 from .. import BaseAPIView, BaseViewSet
 from plane.bgtasks.webhook_task import model_activity
-from plane.utils.timezone_converter import convert_to_utc, user_timezone_converter
+from plane.utils.timezone_converter import convert_to_utc, get_project_timezone, user_timezone_converter
 
 
 class CycleViewSet(BaseViewSet):
@@ -75,17 +73,8 @@ class CycleViewSet(BaseViewSet):
             workspace__slug=self.kwargs.get("slug"),
         )
 
-        project = Project.objects.get(id=self.kwargs.get("project_id"))
-
-        # Fetch project for the specific record or pass project_id dynamically
-        project_timezone = project.timezone
-
-        # Convert the current time (timezone.now()) to the project's timezone
-        local_tz = pytz.timezone(project_timezone)
-        current_time_in_project_tz = timezone.now().astimezone(local_tz)
-
-        # Convert project local time back to UTC for comparison (start_date is stored in UTC)
-        current_time_in_utc = current_time_in_project_tz.astimezone(pytz.utc)
+        # start_date and end_date are stored in UTC
+        current_time_in_utc = timezone.now()
 
         return self.filter_queryset(
             super()
@@ -188,17 +177,10 @@ class CycleViewSet(BaseViewSet):
         # Update the order by
         queryset = queryset.order_by("-is_favorite", "-created_at")
 
-        project = Project.objects.get(id=self.kwargs.get("project_id"))
-
-        # Fetch project for the specific record or pass project_id dynamically
-        project_timezone = project.timezone
-
-        # Convert the current time (timezone.now()) to the project's timezone
-        local_tz = pytz.timezone(project_timezone)
-        current_time_in_project_tz = timezone.now().astimezone(local_tz)
+        project_timezone = get_project_timezone(self.kwargs.get("project_id"))
 
-        # Convert project local time back to UTC for comparison (start_date is stored in UTC)
-        current_time_in_utc = current_time_in_project_tz.astimezone(pytz.utc)
+        # start_date and end_date are stored in UTC
+        current_time_in_utc = timezone.now()
 
         # Current Cycle
         if cycle_view == "current":
@@ -308,8 +290,7 @@ class CycleViewSet(BaseViewSet):
                 )
 
                 # Fetch the project timezone
-                project = Project.objects.get(id=self.kwargs.get("project_id"))
-                project_timezone = project.timezone
+                project_timezone = get_project_timezone(self.kwargs.get("project_id"))
 
                 datetime_fields = ["start_date", "end_date"]
                 cycle = user_timezone_converter(cycle, datetime_fields, project_timezone)
@@ -387,8 +368,7 @@ class CycleViewSet(BaseViewSet):
             ).first()
 
             # Fetch the project timezone
-            project = Project.objects.get(id=self.kwargs.get("project_id"))
-            project_timezone = project.timezone
+            project_timezone = get_project_timezone(self.kwargs.get("project_id"))
 
             datetime_fields = ["start_date", "end_date"]
             cycle = user_timezone_converter(cycle, datetime_fields, project_timezone)
@@ -460,12 +440,11 @@ class CycleViewSet(BaseViewSet):
 
         queryset = queryset.first()
         # Fetch the project timezone
-        project = Project.objects.get(id=self.kwargs.get("project_id"))
-        project_timezone = project.timezone
+        project_timezone = get_project_timezone(self.kwargs.get("project_id"))
         datetime_fields = ["start_date", "end_date"]
         data = user_timezone_converter(data, datetime_fields, project_timezone)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="cycle",
             entity_identifier=pk,
@@ -508,12 +487,7 @@ class CycleViewSet(BaseViewSet):
             project_id=project_id,
         ).delete()
         # Delete the cycle from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="cycle",
-        ).delete(soft=False)
+        remove_recent_visits(slug, "cycle", [pk], project_id=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -16,9 +16,31 @@ from rest_framework import status
 
 # Module imports
 from .. import BaseAPIView
-from plane.app.serializers import IssueActivitySerializer, IssueCommentSerializer
+from plane.app.serializers import IssueActivitySerializer, IssueCommentSerializer, UserLiteSerializer
 from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
-from plane.db.models import IssueActivity, IssueComment, CommentReaction, IntakeIssue
+from plane.db.models import IssueActivity, IssueComment, CommentReaction, IntakeIssue, ProjectMember, User
+from plane.utils.timezone_converter import convert_datetime_columns
+
+# Activity fields kept out of the history, comments and reactions have their own endpoints
+HIDDEN_ACTIVITY_FIELDS = ["comment", "vote", "reaction", "draft"]
+
+ACTIVITY_FEED_FIELDS = [
+    "id",
+    "created_at",
+    "verb",
+    "field",
+    "old_value",
+    "new_value",
+    "comment",
+    "attachments",
+    "old_identifier",
+    "new_identifier",
+    "epoch",
+    "actor_id",
+    "issue_id",
+    "issue_comment_id",
+    "project_id",
+]
 
 
 class IssueActivityEndpoint(BaseAPIView):
@@ -84,3 +106,150 @@ class IssueActivityEndpoint(BaseAPIView):
         )
 
         return Response(result_list, status=status.HTTP_200_OK)
+
+
+class IssueTimelineEndpoint(BaseAPIView):
+    """
+    Oldest first timeline of the activities and comments of an issue, merged
+    from both tables page by page. `before` pages back from the latest
+    entries, `after` fetches the entries added since a page. Only the rows
+    of the returned page are loaded and serialized.
+    """
+
+    permission_classes = [ProjectEntityPermission]
+    use_read_replica = True
+
+    def get_entries(self, entries):
+        ids = {"activity": [], "comment": []}
+        for _, pk, kind in entries:
+            ids[kind].append(pk)
+
+        rows = {}
+        if ids["activity"]:
+            activities = IssueActivity.objects.filter(pk__in=ids["activity"]).select_related(
+                "actor__avatar_asset", "workspace", "issue", "project"
+            )
+            for activity in IssueActivitySerializer(activities, many=True).data:
+                rows[activity["id"]] = {**activity, "timeline_type": "activity"}
+        if ids["comment"]:
+            comments = (
+                IssueComment.objects.filter(pk__in=ids["comment"])
+                .select_related("actor__avatar_asset", "issue", "project", "workspace")
+                .prefetch_related(
+                    Prefetch(
+                        "comment_reactions",
+                        queryset=CommentReaction.objects.select_related("actor"),
+                    )
+                )
+            )
+            for comment in IssueCommentSerializer(comments, many=True).data:
+                rows[comment["id"]] = {**comment, "timeline_type": "comment"}
+
+        # Entries deleted since the page was merged are skipped
+        return [rows[str(pk)] for _, pk, _ in entries if str(pk) in rows]
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id, issue_id):
+        filters = {
+            "workspace__slug": slug,
+            "project_id": project_id,
+            "project__archived_at__isnull": True,
+            "issue_id": issue_id,
+        }
+        return self.paginate_timeline(
+            request=request,
+            querysets={
+                "activity": IssueActivity.objects.filter(**filters).exclude(field__in=HIDDEN_ACTIVITY_FIELDS),
+                "comment": IssueComment.objects.filter(**filters),
+            },
+            on_results=self.get_entries,
+        )
+
+
+class ActivityFeedEndpoint(BaseAPIView):
+    """
+    Newest first issue activity feed, paginated with a keyset cursor. Rows
+    reference their actor by id and each page carries the details of its
+    actors once. `field` restricts the feed to a comma separated list of
+    activity fields.
+    """
+
+    use_read_replica = True
+
+    def get_feed(self, request, queryset):
+        fields = [field for field in request.GET.get("field", "").split(",") if field]
+        if fields:
+            queryset = queryset.filter(field__in=fields)
+        else:
+            queryset = queryset.exclude(field__in=HIDDEN_ACTIVITY_FIELDS)
+
+        return self.paginate_keyset(
+            request=request,
+            queryset=queryset.values(*ACTIVITY_FEED_FIELDS),
+            on_results=lambda activities: convert_datetime_columns(
+                activities, ["created_at"], request.user.user_timezone
+            ),
+            extra_results=lambda activities: {"actors": self.get_actors(activities)},
+        )
+
+    def get_actors(self, activities):
+        actor_ids = {activity["actor_id"] for activity in activities if activity["actor_id"]}
+        if not actor_ids:
+            return {}
+        actors = User.objects.filter(id__in=actor_ids).select_related("avatar_asset")
+        return {str(actor["id"]): actor for actor in UserLiteSerializer(actors, many=True).data}
+
+
+class IssueActivityFeedEndpoint(ActivityFeedEndpoint):
+    permission_classes = [ProjectEntityPermission]
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id, issue_id):
+        return self.get_feed(
+            request,
+            IssueActivity.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                project__archived_at__isnull=True,
+                issue_id=issue_id,
+            ),
+        )
+
+
+class ProjectActivityFeedEndpoint(ActivityFeedEndpoint):
+    permission_classes = [ProjectEntityPermission]
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+    def get(self, request, slug, project_id):
+        return self.get_feed(
+            request,
+            IssueActivity.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                project__archived_at__isnull=True,
+            ),
+        )
+
+
+class WorkspaceUserActivityFeedEndpoint(ActivityFeedEndpoint):
+    @method_decorator(gzip_page)
+    @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
+    def get(self, request, slug, user_id):
+        # Only the activities of projects the requesting user is a member of
+        project_ids = ProjectMember.objects.filter(
+            workspace__slug=slug,
+            member=request.user,
+            is_active=True,
+            project__archived_at__isnull=True,
+        ).values("project_id")
+        return self.get_feed(
+            request,
+            IssueActivity.objects.filter(
+                workspace__slug=slug,
+                actor_id=user_id,
+                project_id__in=project_ids,
+            ),
+        )
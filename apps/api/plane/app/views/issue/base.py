@@ -11,10 +11,7 @@ from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
-    Count,
     Exists,
-    F,
-    Func,
     OuterRef,
     Prefetch,
     Q,
@@ -42,14 +39,20 @@ from plane.app.serializers import (
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.bgtasks.issue_description_version_task import issue_description_version_task
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
+from plane.utils.issue_annotations import (
+    annotate_issues,
+    enrich_issues,
+    issue_annotation_expressions,
+    issue_values,
+)
 from plane.bgtasks.webhook_task import model_activity
 from plane.db.models import (
     CycleIssue,
-    FileAsset,
     IntakeIssue,
     Issue,
     IssueAssignee,
+    IssueChangeLog,
     IssueLabel,
     IssueLink,
     IssueReaction,
@@ -59,7 +62,6 @@ from plane.db.models import (
     ModuleIssue,
     Project,
     ProjectMember,
-    UserRecentVisit,
 )
 from plane.utils.filters import ComplexFilterBackend, IssueFilterSet
 from plane.utils.global_paginator import paginate
@@ -69,6 +71,11 @@ from plane.utils.grouper import (
     issue_queryset_grouper,
 )
 from plane.utils.host import base_host
+from plane.utils.issue_change_log import (
+    get_change_log_cursor,
+    get_changed_issue_ids,
+    is_change_log_pruned,
+)
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
@@ -106,36 +113,7 @@ class IssueListEndpoint(BaseAPIView):
                 "assignees", "labels", "issue_module__module"
             )
 
-        # Add annotations
-        issue_queryset = (
-            issue_queryset.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .distinct()
-        )
+        issue_queryset = issue_queryset.distinct()
 
         order_by_param = request.GET.get("order_by", "-created_at")
         # Issue queryset
@@ -148,7 +126,7 @@ class IssueListEndpoint(BaseAPIView):
         # issue queryset
         issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -159,33 +137,36 @@ class IssueListEndpoint(BaseAPIView):
         if self.fields or self.expand:
             issues = IssueSerializer(queryset, many=True, fields=self.fields, expand=self.expand).data
         else:
-            issues = issue_queryset.values(
-                "id",
-                "name",
-                "state_id",
-                "sort_order",
-                "completed_at",
-                "estimate_point",
-                "priority",
-                "start_date",
-                "target_date",
-                "sequence_id",
-                "project_id",
-                "parent_id",
-                "cycle_id",
-                "module_ids",
-                "label_ids",
-                "assignee_ids",
-                "sub_issues_count",
-                "created_at",
-                "updated_at",
-                "created_by",
-                "updated_by",
-                "attachment_count",
-                "link_count",
-                "is_draft",
-                "archived_at",
-                "deleted_at",
+            issues = issue_values(
+                issue_queryset,
+                [
+                    "id",
+                    "name",
+                    "state_id",
+                    "sort_order",
+                    "completed_at",
+                    "estimate_point",
+                    "priority",
+                    "start_date",
+                    "target_date",
+                    "sequence_id",
+                    "project_id",
+                    "parent_id",
+                    "cycle_id",
+                    "module_ids",
+                    "label_ids",
+                    "assignee_ids",
+                    "sub_issues_count",
+                    "created_at",
+                    "updated_at",
+                    "created_by",
+                    "updated_by",
+                    "attachment_count",
+                    "link_count",
+                    "is_draft",
+                    "archived_at",
+                    "deleted_at",
+                ],
             )
             datetime_fields = ["created_at", "updated_at"]
             issues = user_timezone_converter(issues, datetime_fields, request.user.user_timezone)
@@ -211,42 +192,7 @@ class IssueViewSet(BaseViewSet):
         return issues
 
     def apply_annotations(self, issues):
-        issues = (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
-
-        return issues
+        return annotate_issues(issues)
 
     @method_decorator(gzip_page)
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
@@ -272,8 +218,7 @@ class IssueViewSet(BaseViewSet):
         # Keeping a copy of the queryset before applying annotations
         filtered_issue_queryset = copy.deepcopy(issue_queryset)
 
-        # Applying annotations to the issue queryset
-        issue_queryset = self.apply_annotations(issue_queryset)
+        # The computed issue fields are added to each page by issue_on_results
 
         # Issue queryset
         issue_queryset, order_by_param = order_issue_queryset(
@@ -287,7 +232,7 @@ class IssueViewSet(BaseViewSet):
         # issue queryset
         issue_queryset = issue_queryset_grouper(queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -487,34 +432,7 @@ class IssueViewSet(BaseViewSet):
                 pk=pk,
             )
             .select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
+            .annotate(**issue_annotation_expressions())
             .annotate(
                 label_ids=Coalesce(
                     Subquery(
@@ -600,7 +518,7 @@ class IssueViewSet(BaseViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="issue",
             entity_identifier=pk,
@@ -706,12 +624,7 @@ class IssueViewSet(BaseViewSet):
 
         issue.delete()
         # delete the issue from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="issue",
-        ).delete(soft=False)
+        remove_recent_visits(slug, "issue", [pk], project_id=project_id)
         issue_activity.delay(
             type="issue.activity.deleted",
             requested_data=json.dumps({"issue_id": str(pk)}),
@@ -775,6 +688,12 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
         # Then, delete all related module issues
         ModuleIssue.objects.filter(issue_id__in=issue_ids).delete()
 
+        # Bulk soft deletes bypass the post_save change log hook
+        IssueChangeLog.record(
+            issues.values_list("id", "project_id", "workspace_id"),
+            IssueChangeLog.CHANGE_DELETED,
+        )
+
         # Finally, delete the issues themselves
         issues.delete()
 
@@ -807,40 +726,10 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         issue_queryset = Issue.issue_objects.filter(workspace__slug=workspace_slug, project_id=project_id)
 
-        return (
-            issue_queryset.select_related("state")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=Subquery(
-                    IssueLink.objects.filter(issue=OuterRef("id"))
-                    .values("issue")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                attachment_count=Subquery(
-                    FileAsset.objects.filter(
-                        issue_id=OuterRef("id"),
-                        entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                    )
-                    .values("issue_id")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-            .annotate(
-                sub_issues_count=Subquery(
-                    Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .values("parent")
-                    .annotate(count=Count("id"))
-                    .values("count")
-                )
-            )
-        )
+        return issue_queryset.select_related("state")
 
     def process_paginated_result(self, fields, results, timezone):
-        paginated_data = results.values(*fields)
+        paginated_data = issue_values(results, fields)
 
         # converting the datetime fields in paginated data
         datetime_fields = ["created_at", "updated_at"]
@@ -848,12 +737,7 @@ class IssuePaginatedViewSet(BaseViewSet):
 
         return paginated_data
 
-    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
-    def list(self, request, slug, project_id):
-        cursor = request.GET.get("cursor", None)
-        is_description_required = request.GET.get("description", "false")
-        updated_at = request.GET.get("updated_at__gt", None)
-
+    def get_required_fields(self, request):
         # required fields
         required_fields = [
             "id",
@@ -884,34 +768,12 @@ class IssuePaginatedViewSet(BaseViewSet):
             "sub_issues_count",
         ]
 
-        if str(is_description_required).lower() == "true":
+        if str(request.GET.get("description", "false")).lower() == "true":
             required_fields.append("description_html")
+        return required_fields
 
-        # querying issues
-        base_queryset = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
-
-        base_queryset = base_queryset.order_by("updated_at")
-        queryset = self.get_queryset().order_by("updated_at")
-
-        # validation for guest user
-        project = Project.objects.get(pk=project_id, workspace__slug=slug)
-        project_member = ProjectMember.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            member=request.user,
-            role=5,
-            is_active=True,
-        )
-        if project_member.exists() and not project.guest_view_all_features:
-            base_queryset = base_queryset.filter(created_by=request.user)
-            queryset = queryset.filter(created_by=request.user)
-
-        # filtering issues by greater then updated_at given by the user
-        if updated_at:
-            base_queryset = base_queryset.filter(updated_at__gt=updated_at)
-            queryset = queryset.filter(updated_at__gt=updated_at)
-
-        queryset = queryset.annotate(
+    def annotate_relation_ids(self, queryset):
+        return queryset.annotate(
             label_ids=Coalesce(
                 Subquery(
                     IssueLabel.objects.filter(issue_id=OuterRef("pk"))
@@ -947,14 +809,107 @@ class IssuePaginatedViewSet(BaseViewSet):
             ),
         )
 
+    def is_guest_restricted(self, request, slug, project_id):
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        return (
+            ProjectMember.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                member=request.user,
+                role=5,
+                is_active=True,
+            ).exists()
+            and not project.guest_view_all_features
+        )
+
+    def list_changes(self, request, slug, project_id, since):
+        """
+        Return the issues changed in transactions after the cursor `since`.
+        Issues that are still visible are sent in full under `results`, the
+        rest are sent as tombstones under `deleted`. Clients keep calling
+        with `next_since` until `has_more` is false. When older changes were
+        already pruned `resync_required` is set and a full sync is needed.
+        """
+        if is_change_log_pruned(since):
+            return Response(
+                {
+                    "results": [],
+                    "deleted": [],
+                    "next_since": since,
+                    "has_more": False,
+                    "resync_required": True,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        issue_ids, next_since, has_more = get_changed_issue_ids(project_id, since)
+
+        queryset = self.get_queryset().filter(pk__in=issue_ids)
+        if self.is_guest_restricted(request, slug, project_id):
+            queryset = queryset.filter(created_by=request.user)
+
+        results = list(
+            self.process_paginated_result(
+                self.get_required_fields(request),
+                self.annotate_relation_ids(queryset).order_by("updated_at"),
+                request.user.user_timezone,
+            )
+        )
+        visible_ids = {issue["id"] for issue in results}
+
+        return Response(
+            {
+                "results": results,
+                "deleted": [issue_id for issue_id in issue_ids if issue_id not in visible_ids],
+                "next_since": next_since,
+                "has_more": has_more,
+                "resync_required": False,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def list(self, request, slug, project_id):
+        cursor = request.GET.get("cursor", None)
+        updated_at = request.GET.get("updated_at__gt", None)
+        since = request.GET.get("since", None)
+
+        if since is not None:
+            try:
+                since = int(since)
+            except ValueError:
+                return Response({"error": "Invalid since value"}, status=status.HTTP_400_BAD_REQUEST)
+            return self.list_changes(request, slug, project_id, since)
+
+        # Captured before reading so changes made during the sync are replayed
+        change_id = get_change_log_cursor()
+
+        # querying issues
+        base_queryset = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+
+        base_queryset = base_queryset.order_by("updated_at")
+        queryset = self.get_queryset().order_by("updated_at")
+
+        # validation for guest user
+        if self.is_guest_restricted(request, slug, project_id):
+            base_queryset = base_queryset.filter(created_by=request.user)
+            queryset = queryset.filter(created_by=request.user)
+
+        # filtering issues by greater then updated_at given by the user
+        if updated_at:
+            base_queryset = base_queryset.filter(updated_at__gt=updated_at)
+            queryset = queryset.filter(updated_at__gt=updated_at)
+
+        required_fields = self.get_required_fields(request)
         paginated_data = paginate(
             base_queryset=base_queryset,
-            queryset=queryset,
+            queryset=self.annotate_relation_ids(queryset),
             cursor=cursor,
             on_result=lambda results: self.process_paginated_result(
                 required_fields, results, request.user.user_timezone
             ),
         )
+        paginated_data["change_id"] = change_id
 
         return Response(paginated_data, status=status.HTTP_200_OK)
 
@@ -964,34 +919,9 @@ class IssueDetailEndpoint(BaseAPIView):
     filterset_class = IssueFilterSet
 
     def apply_annotations(self, issues):
+        # The computed issue fields are added to each page by enrich_issues
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .prefetch_related(
+            issues.prefetch_related(
                 Prefetch(
                     "issue_assignee",
                     queryset=IssueAssignee.objects.all(),
@@ -1085,7 +1015,7 @@ class IssueDetailEndpoint(BaseAPIView):
             queryset=issue,
             total_count_queryset=total_issue_queryset,
             on_results=lambda issue: IssueListDetailSerializer(
-                issue, many=True, fields=self.fields, expand=self.expand
+                enrich_issues(list(issue)), many=True, fields=self.fields, expand=self.expand
             ).data,
         )
 
@@ -1222,28 +1152,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
             .filter(workspace__slug=slug)
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(cycle_id=Subquery(CycleIssue.objects.filter(issue=OuterRef("id")).values("cycle_id")[:1]))
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(**issue_annotation_expressions())
             .filter(sequence_id=issue_identifier)
             .annotate(
                 label_ids=Coalesce(
@@ -1341,7 +1250,7 @@ class IssueDetailIdentifierEndpoint(BaseAPIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="issue",
             entity_identifier=str(issue.id),
@@ -0,0 +1,232 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import json
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+# Third Party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Module imports
+from .. import BaseAPIView
+from plane.app.permissions import allow_permission, ROLE
+from plane.app.serializers import IssueBulkOperationSerializer
+from plane.bgtasks.issue_activities_task import bulk_issue_activity
+from plane.bgtasks.webhook_task import bulk_model_activity
+from plane.db.models import (
+    CycleIssue,
+    Issue,
+    IssueAssignee,
+    IssueChangeLog,
+    IssueLabel,
+    ModuleIssue,
+    State,
+)
+from plane.utils.host import base_host
+
+# Properties stored on the issue row, updated with a single UPDATE
+SCALAR_PROPERTIES = {
+    "state_id": "state_id",
+    "priority": "priority",
+    "start_date": "start_date",
+    "target_date": "target_date",
+    "estimate_point": "estimate_point_id",
+}
+
+# Many to many properties, replaced with the difference to the current rows
+RELATION_PROPERTIES = {
+    "assignee_ids": (IssueAssignee, "assignee_id"),
+    "label_ids": (IssueLabel, "label_id"),
+}
+
+
+def to_json(value):
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return str(value) if value is not None else None
+
+
+class IssueBulkOperationEndpoint(BaseAPIView):
+    """
+    Update the properties of many issues at once. assignee_ids and label_ids
+    replace the current ones as in an issue update, cycle_id moves the issues
+    to a cycle (null removes them from their cycle) and module_ids adds them
+    to modules. Activities and webhooks are emitted once for the operation.
+    """
+
+    def get_current_values(self, issue_ids, properties):
+        """Current value of the updated properties per issue, with one query per property"""
+        current = {
+            str(issue["id"]): {key: to_json(issue[field]) for key, field in SCALAR_PROPERTIES.items()}
+            for issue in Issue.issue_objects.filter(id__in=issue_ids).values("id", *SCALAR_PROPERTIES.values())
+        }
+
+        for key, (model, field) in RELATION_PROPERTIES.items():
+            if key in properties:
+                for values in current.values():
+                    values[key] = []
+                for issue_id, value in model.objects.filter(issue_id__in=issue_ids).values_list("issue_id", field):
+                    current[str(issue_id)][key].append(str(value))
+
+        if "cycle_id" in properties:
+            for values in current.values():
+                values["cycle_id"] = None
+            for issue_id, cycle_id in CycleIssue.objects.filter(issue_id__in=issue_ids).values_list(
+                "issue_id", "cycle_id"
+            ):
+                current[str(issue_id)]["cycle_id"] = str(cycle_id)
+
+        if "module_ids" in properties:
+            for values in current.values():
+                values["module_ids"] = []
+            for issue_id, module_id in ModuleIssue.objects.filter(issue_id__in=issue_ids).values_list(
+                "issue_id", "module_id"
+            ):
+                current[str(issue_id)]["module_ids"].append(str(module_id))
+
+        return current
+
+    def update_relation(self, model, field, issue_ids, value_ids, current, key, project_id, workspace_id):
+        model.objects.filter(issue_id__in=issue_ids).exclude(**{f"{field}__in": value_ids}).delete()
+        model.objects.bulk_create(
+            [
+                model(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    created_by_id=self.request.user.id,
+                    updated_by_id=self.request.user.id,
+                    **{field: value_id},
+                )
+                for issue_id in issue_ids
+                for value_id in value_ids
+                if str(value_id) not in current[str(issue_id)][key]
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    def update_cycle(self, issue_ids, cycle_id, current, project_id, workspace_id):
+        cycle_issues = CycleIssue.objects.filter(issue_id__in=issue_ids)
+        if cycle_id is None:
+            cycle_issues.delete()
+            return
+
+        cycle_issues.exclude(cycle_id=cycle_id).update(
+            cycle_id=cycle_id, updated_at=timezone.now(), updated_by_id=self.request.user.id
+        )
+        CycleIssue.objects.bulk_create(
+            [
+                CycleIssue(
+                    issue_id=issue_id,
+                    cycle_id=cycle_id,
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    created_by_id=self.request.user.id,
+                    updated_by_id=self.request.user.id,
+                )
+                for issue_id in issue_ids
+                if current[str(issue_id)]["cycle_id"] is None
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    def add_to_modules(self, issue_ids, module_ids, current, project_id, workspace_id):
+        ModuleIssue.objects.bulk_create(
+            [
+                ModuleIssue(
+                    issue_id=issue_id,
+                    module_id=module_id,
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    created_by_id=self.request.user.id,
+                    updated_by_id=self.request.user.id,
+                )
+                for issue_id in issue_ids
+                for module_id in module_ids
+                if str(module_id) not in current[str(issue_id)]["module_ids"]
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
+    def post(self, request, slug, project_id):
+        serializer = IssueBulkOperationSerializer(data=request.data, context={"project_id": project_id})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        properties = dict(serializer.validated_data)
+        issue_ids = properties.pop("issue_ids")
+        issues = Issue.issue_objects.filter(project_id=project_id, id__in=issue_ids)
+        workspace_id = issues.values_list("workspace_id", flat=True).first()
+        current = self.get_current_values(issue_ids, properties)
+
+        fields = {SCALAR_PROPERTIES[key]: value for key, value in properties.items() if key in SCALAR_PROPERTIES}
+
+        with transaction.atomic():
+            if "state_id" in properties:
+                # Only issues moving into or out of the completed group change
+                # completed_at, issues already completed keep their date
+                if State.objects.filter(pk=properties["state_id"], group="completed").exists():
+                    issues.exclude(state__group="completed").update(completed_at=timezone.now())
+                else:
+                    issues.filter(state__group="completed").update(completed_at=None)
+
+            issues.update(**fields, updated_at=timezone.now(), updated_by_id=request.user.id)
+
+            for key, (model, field) in RELATION_PROPERTIES.items():
+                if key in properties:
+                    self.update_relation(
+                        model, field, issue_ids, properties[key], current, key, project_id, workspace_id
+                    )
+
+            if "cycle_id" in properties:
+                self.update_cycle(issue_ids, properties["cycle_id"], current, project_id, workspace_id)
+
+            if "module_ids" in properties:
+                self.add_to_modules(issue_ids, properties["module_ids"], current, project_id, workspace_id)
+
+            # Set based updates bypass the post_save change log hook
+            IssueChangeLog.record(
+                issues.values_list("id", "project_id", "workspace_id"),
+                IssueChangeLog.CHANGE_UPDATED,
+            )
+
+        requested_data = {key: to_json(value) for key, value in properties.items()}
+        origin = base_host(request=request, is_app=True)
+        bulk_issue_activity.delay(
+            changes=json.dumps(
+                [
+                    {
+                        "issue_id": str(issue_id),
+                        "requested_data": requested_data,
+                        "current_instance": current[str(issue_id)],
+                    }
+                    for issue_id in issue_ids
+                ],
+                cls=DjangoJSONEncoder,
+            ),
+            actor_id=str(request.user.id),
+            project_id=str(project_id),
+            epoch=int(timezone.now().timestamp()),
+            origin=origin,
+        )
+        bulk_model_activity.delay(
+            model_name="issue",
+            model_ids=[str(issue_id) for issue_id in issue_ids],
+            requested_data=requested_data,
+            actor_id=request.user.id,
+            slug=slug,
+            origin=origin,
+        )
+
+        return Response({"updated": len(issue_ids)}, status=status.HTTP_200_OK)
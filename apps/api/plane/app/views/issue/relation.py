@@ -3,11 +3,15 @@
 # See the LICENSE file for details.
 
 # Python imports
+import hashlib
 import json
 
 # Django imports
+from django.http import HttpResponse
 from django.utils import timezone
-from django.db.models import Q, OuterRef, F, Func, UUIDField, Value, CharField, Subquery
+from django.utils.decorators import method_decorator
+from django.views.decorators.gzip import gzip_page
+from django.db.models import Q, UUIDField, Value
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models.functions import Coalesce
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -18,20 +22,19 @@ from rest_framework.response import Response
 from rest_framework import status
 
 # Module imports
-from .. import BaseViewSet
+from .. import BaseAPIView, BaseViewSet
 from plane.app.serializers import IssueRelationSerializer, RelatedIssueSerializer
-from plane.app.permissions import ProjectEntityPermission
-from plane.db.models import (
-    Project,
-    IssueRelation,
-    Issue,
-    FileAsset,
-    IssueLink,
-    CycleIssue,
-)
+from plane.app.permissions import ProjectEntityPermission, allow_permission, ROLE
+from plane.db.models import Project, ProjectMember, IssueRelation, Issue, CycleIssue
 from plane.bgtasks.issue_activities_task import issue_activity
-from plane.utils.issue_relation_mapper import get_actual_relation
+from plane.utils.issue_relation_mapper import get_actual_relation, partition_relations
 from plane.utils.host import base_host
+from plane.utils.dependency_graph import (
+    DEPENDENCY_RELATIONS,
+    DependencyGraph,
+    get_dependency_graph,
+    invalidate_dependency_graphs_on_commit,
+)
 
 
 class IssueRelationViewSet(BaseViewSet):
@@ -40,95 +43,36 @@ class IssueRelationViewSet(BaseViewSet):
     permission_classes = [ProjectEntityPermission]
 
     def list(self, request, slug, project_id, issue_id):
-        issue_relations = (
-            IssueRelation.objects.filter(Q(issue_id=issue_id) | Q(related_issue=issue_id))
-            .filter(workspace__slug=self.kwargs.get("slug"))
-            .select_related("project")
-            .select_related("workspace")
-            .select_related("issue")
+        # Both directions of every relation of the issue in one query
+        relations = (
+            IssueRelation.objects.filter(Q(issue_id=issue_id) | Q(related_issue_id=issue_id))
+            .filter(workspace__slug=slug)
             .order_by("-created_at")
-            .distinct()
-        )
-        # get all blocking issues
-        blocking_issues = issue_relations.filter(relation_type="blocked_by", related_issue_id=issue_id).values_list(
-            "issue_id", flat=True
-        )
-
-        # get all blocked by issues
-        blocked_by_issues = issue_relations.filter(relation_type="blocked_by", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all duplicate issues
-        duplicate_issues = issue_relations.filter(issue_id=issue_id, relation_type="duplicate").values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all relates to issues
-        duplicate_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="duplicate"
-        ).values_list("issue_id", flat=True)
-
-        # get all relates to issues
-        relates_to_issues = issue_relations.filter(issue_id=issue_id, relation_type="relates_to").values_list(
-            "related_issue_id", flat=True
+            .values_list("issue_id", "related_issue_id", "relation_type")
         )
+        related_issue_ids = partition_relations(issue_id, relations)
 
-        # get all relates to issues
-        relates_to_issues_related = issue_relations.filter(
-            related_issue_id=issue_id, relation_type="relates_to"
-        ).values_list("issue_id", flat=True)
-
-        # get all start after issues
-        start_after_issues = issue_relations.filter(
-            relation_type="start_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all start_before issues
-        start_before_issues = issue_relations.filter(relation_type="start_before", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
-
-        # get all finish after issues
-        finish_after_issues = issue_relations.filter(
-            relation_type="finish_before", related_issue_id=issue_id
-        ).values_list("issue_id", flat=True)
-
-        # get all finish before issues
-        finish_before_issues = issue_relations.filter(relation_type="finish_before", issue_id=issue_id).values_list(
-            "related_issue_id", flat=True
-        )
+        # Fields
+        fields = [
+            "id",
+            "name",
+            "state_id",
+            "sort_order",
+            "priority",
+            "sequence_id",
+            "project_id",
+            "label_ids",
+            "assignee_ids",
+            "created_at",
+            "updated_at",
+            "created_by",
+            "updated_by",
+        ]
 
-        queryset = (
-            Issue.issue_objects.filter(workspace__slug=slug)
-            .select_related("workspace", "project", "state", "parent")
-            .prefetch_related("assignees", "labels", "issue_module__module")
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+        # The related issues of every relation type in one query
+        issue_ids = {pk for pks in related_issue_ids.values() for pk in pks}
+        issues = (
+            Issue.issue_objects.filter(workspace__slug=slug, pk__in=issue_ids)
             .annotate(
                 label_ids=Coalesce(
                     ArrayAgg(
@@ -151,58 +95,17 @@ class IssueRelationViewSet(BaseViewSet):
                     Value([], output_field=ArrayField(UUIDField())),
                 ),
             )
-        ).distinct()
-
-        # Fields
-        fields = [
-            "id",
-            "name",
-            "state_id",
-            "sort_order",
-            "priority",
-            "sequence_id",
-            "project_id",
-            "label_ids",
-            "assignee_ids",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "relation_type",
-        ]
-
-        response_data = {
-            "blocking": queryset.filter(pk__in=blocking_issues)
-            .annotate(relation_type=Value("blocking", output_field=CharField()))
-            .values(*fields),
-            "blocked_by": queryset.filter(pk__in=blocked_by_issues)
-            .annotate(relation_type=Value("blocked_by", output_field=CharField()))
-            .values(*fields),
-            "duplicate": queryset.filter(pk__in=duplicate_issues)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields)
-            | queryset.filter(pk__in=duplicate_issues_related)
-            .annotate(relation_type=Value("duplicate", output_field=CharField()))
-            .values(*fields),
-            "relates_to": queryset.filter(pk__in=relates_to_issues)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
             .values(*fields)
-            | queryset.filter(pk__in=relates_to_issues_related)
-            .annotate(relation_type=Value("relates_to", output_field=CharField()))
-            .values(*fields),
-            "start_after": queryset.filter(pk__in=start_after_issues)
-            .annotate(relation_type=Value("start_after", output_field=CharField()))
-            .values(*fields),
-            "start_before": queryset.filter(pk__in=start_before_issues)
-            .annotate(relation_type=Value("start_before", output_field=CharField()))
-            .values(*fields),
-            "finish_after": queryset.filter(pk__in=finish_after_issues)
-            .annotate(relation_type=Value("finish_after", output_field=CharField()))
-            .values(*fields),
-            "finish_before": queryset.filter(pk__in=finish_before_issues)
-            .annotate(relation_type=Value("finish_before", output_field=CharField()))
-            .values(*fields),
-        }
+            if issue_ids
+            else []
+        )
+
+        # An issue can be related in more than one way, so it is copied per relation type
+        response_data = {key: [] for key in related_issue_ids}
+        for issue in issues:
+            for relation_type, pks in related_issue_ids.items():
+                if issue["id"] in pks:
+                    response_data[relation_type].append({**issue, "relation_type": relation_type})
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -235,6 +138,8 @@ class IssueRelationViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        # Bulk creates bypass the post_save invalidation
+        invalidate_dependency_graphs_on_commit([project_id])
 
         issue_activity.delay(
             type="issue_relation.activity.created",
@@ -282,3 +187,79 @@ class IssueRelationViewSet(BaseViewSet):
             origin=base_host(request=request, is_app=True),
         )
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class IssueDependencyGraphEndpoint(BaseAPIView):
+    """
+    Dependency graph of the work items of a project, or of a cycle, built
+    from their blocked_by, start_before and finish_before relations, with
+    the transitive blockers, dependency cycles, topological order and the
+    critical path schedule.
+    """
+
+    permission_classes = [ProjectEntityPermission]
+
+    def load_graph(self, relations):
+        # The relations and the dates of both of their work items in one query
+        rows = relations.values_list(
+            "issue_id",
+            "related_issue_id",
+            "relation_type",
+            "issue__start_date",
+            "issue__target_date",
+            "related_issue__start_date",
+            "related_issue__target_date",
+        )
+        issues = {}
+        edges = []
+        for issue_id, related_issue_id, relation_type, *dates in rows:
+            issues[issue_id] = (dates[0], dates[1])
+            issues[related_issue_id] = (dates[2], dates[3])
+            edges.append((issue_id, related_issue_id, relation_type))
+        return DependencyGraph(issues, edges)
+
+    @method_decorator(gzip_page)
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def get(self, request, slug, project_id, cycle_id=None):
+        issues = Issue.issue_objects.filter(workspace__slug=slug)
+        # Guests only see the work items they created unless the project shares all of them
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        is_guest_restricted = (
+            ProjectMember.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                member=request.user,
+                role=5,
+                is_active=True,
+            ).exists()
+            and not project.guest_view_all_features
+        )
+        if is_guest_restricted:
+            issues = issues.filter(created_by=request.user)
+
+        relations = IssueRelation.objects.filter(
+            workspace__slug=slug,
+            project_id=project_id,
+            relation_type__in=DEPENDENCY_RELATIONS,
+            issue_id__in=issues.values("id"),
+            related_issue_id__in=issues.values("id"),
+        )
+        scope = "project"
+
+        if cycle_id is not None:
+            # The graph of the work items of the cycle, keyed by them as
+            # changes to the cycle do not bump the version of the project
+            issue_ids = sorted(
+                str(issue_id)
+                for issue_id in CycleIssue.objects.filter(
+                    workspace__slug=slug, project_id=project_id, cycle_id=cycle_id
+                ).values_list("issue_id", flat=True)
+            )
+            relations = relations.filter(issue_id__in=issue_ids, related_issue_id__in=issue_ids)
+            scope = f"cycle:{cycle_id}:{hashlib.sha1(','.join(issue_ids).encode()).hexdigest()}"
+
+        if is_guest_restricted:
+            scope = f"{scope}:guest:{request.user.id}"
+
+        body = get_dependency_graph(project_id, scope, lambda: self.load_graph(relations))
+        return HttpResponse(body, content_type="application/json")
@@ -28,6 +28,7 @@ from plane.utils.timezone_converter import user_timezone_converter
 from collections import defaultdict
 from plane.utils.host import base_host
 from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.issue_tree import MAX_SUB_ISSUE_DEPTH, fetch_sub_issue_tree, roll_up_sub_issue_tree
 
 
 class SubIssuesEndpoint(BaseAPIView):
@@ -215,3 +216,40 @@ class SubIssuesEndpoint(BaseAPIView):
             {"sub_issues": serializer.data, "state_distribution": result},
             status=status.HTTP_200_OK,
         )
+
+
+class SubIssueTreeEndpoint(BaseAPIView):
+    """
+    All the descendants of an issue down to `depth` levels, loaded with one
+    recursive query, as a flat list of nodes parents first pointing to their
+    parent. Each node carries the counts of its descendants by state group
+    and the sums of their estimates.
+    """
+
+    permission_classes = [ProjectEntityPermission]
+
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id, issue_id):
+        try:
+            depth = int(request.GET.get("depth", MAX_SUB_ISSUE_DEPTH))
+        except ValueError:
+            depth = 0
+        if not 1 <= depth <= MAX_SUB_ISSUE_DEPTH:
+            return Response(
+                {"error": f"Depth must be between 1 and {MAX_SUB_ISSUE_DEPTH}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        workspace_id = (
+            Issue.issue_objects.filter(pk=issue_id, project_id=project_id, workspace__slug=slug)
+            .values_list("workspace_id", flat=True)
+            .first()
+        )
+        if workspace_id is None:
+            return Response({"error": "Issue not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        sub_issues = fetch_sub_issue_tree(issue_id, workspace_id, max_depth=depth)
+        summary = roll_up_sub_issue_tree(sub_issues)
+        sub_issues = user_timezone_converter(sub_issues, ["completed_at"], request.user.user_timezone)
+
+        return Response({"sub_issues": sub_issues, **summary}, status=status.HTTP_200_OK)
@@ -112,6 +112,8 @@ class WorkItemDescriptionVersionEndpoint(BaseAPIView):
                 pk=pk,
             )
 
+            issue_description_version.load_description()
+
             serializer = IssueDescriptionVersionDetailSerializer(issue_description_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -58,13 +58,12 @@ from plane.db.models import (
     ModuleLink,
     ModuleUserProperties,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.analytics_plot import burndown_plot
 from plane.utils.timezone_converter import user_timezone_converter
 from plane.bgtasks.webhook_task import model_activity
 from .. import BaseAPIView, BaseViewSet
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
 from plane.utils.host import base_host
 
 
@@ -638,7 +637,7 @@ class ModuleViewSet(BaseViewSet):
                 module_id=pk,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="module",
             entity_identifier=pk,
@@ -750,12 +749,7 @@ class ModuleViewSet(BaseViewSet):
             project_id=project_id,
         ).delete()
         # delete the module from recent visits
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=pk,
-            entity_name="module",
-        ).delete(soft=False)
+        remove_recent_visits(slug, "module", [pk], project_id=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
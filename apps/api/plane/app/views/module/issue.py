@@ -6,7 +6,7 @@
 import copy
 import json
 
-from django.db.models import F, Func, OuterRef, Q, Subquery
+from django.db.models import Q
 
 # Django Imports
 from django.utils import timezone
@@ -22,11 +22,8 @@ from plane.app.serializers import ModuleIssueSerializer
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     ModuleIssue,
     Project,
-    CycleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -40,6 +37,7 @@ from plane.utils.filters import ComplexFilterBackend
 from plane.utils.filters import IssueFilterSet
 from .. import BaseViewSet
 from plane.utils.host import base_host
+from plane.utils.issue_change_log import record_membership_changes
 
 
 class ModuleIssueViewSet(BaseViewSet):
@@ -51,35 +49,8 @@ class ModuleIssueViewSet(BaseViewSet):
     filterset_class = IssueFilterSet
 
     def apply_annotations(self, issues):
-        return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .prefetch_related("assignees", "labels", "issue_module__module")
-        )
+        # The computed issue fields are added to each page by issue_on_results
+        return issues.prefetch_related("assignees", "labels", "issue_module__module")
 
     def get_queryset(self):
         return (
@@ -228,6 +199,7 @@ class ModuleIssueViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        record_membership_changes(issues)
         # Bulk Update the activity
         _ = [
             issue_activity.delay(
@@ -312,6 +284,9 @@ class ModuleIssueViewSet(BaseViewSet):
             )
             module_issue.delete()
 
+        if modules or removed_modules:
+            record_membership_changes([issue_id])
+
         return Response({"message": "success"}, status=status.HTTP_201_CREATED)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -334,4 +309,5 @@ class ModuleIssueViewSet(BaseViewSet):
             origin=base_host(request=request, is_app=True),
         )
         module_issue.delete()
+        record_membership_changes([issue_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -19,9 +19,16 @@ from plane.db.models import (
     IssueAssignee,
     IssueSubscriber,
     Notification,
+    NotificationSenderType,
     UserNotificationPreference,
     WorkspaceMember,
 )
+from plane.utils.notification_counters import (
+    MENTION_FIELD,
+    TOTAL_FIELD,
+    get_unread_counters,
+    track_notification_changes,
+)
 from plane.utils.paginator import BasePaginator
 from plane.app.permissions import allow_permission, ROLE
 
@@ -67,7 +74,7 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
             .annotate(is_intake_issue=Exists(intake_issue))
             .annotate(
                 is_mentioned_notification=Case(
-                    When(sender__icontains="mentioned", then=True),
+                    When(sender_type=NotificationSenderType.MENTIONED, then=True),
                     default=False,
                     output_field=BooleanField(),
                 )
@@ -98,9 +105,9 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
             notifications = notifications.filter(read_at__isnull=False)
 
         if mentioned:
-            notifications = notifications.filter(sender__icontains="mentioned")
+            notifications = notifications.filter(sender_type=NotificationSenderType.MENTIONED)
         else:
-            notifications = notifications.exclude(sender__icontains="mentioned")
+            notifications = notifications.exclude(sender_type=NotificationSenderType.MENTIONED)
 
         type = type.split(",")
         # Subscribed issues
@@ -156,39 +163,54 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         serializer = NotificationSerializer(notification, data=notification_data, partial=True)
 
         if serializer.is_valid():
+            was_unread = notification.is_unread
             serializer.save()
+            track_notification_changes(slug, [notification], {notification.id: was_unread})
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    def perform_destroy(self, instance):
+        was_unread = instance.is_unread
+        instance.delete()
+        track_notification_changes(self.kwargs.get("slug"), [instance], {instance.id: was_unread})
+
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def mark_read(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = notification.is_unread
         notification.read_at = timezone.now()
         notification.save()
+        track_notification_changes(slug, [notification], {notification.id: was_unread})
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def mark_unread(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = notification.is_unread
         notification.read_at = None
         notification.save()
+        track_notification_changes(slug, [notification], {notification.id: was_unread})
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def archive(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = notification.is_unread
         notification.archived_at = timezone.now()
         notification.save()
+        track_notification_changes(slug, [notification], {notification.id: was_unread})
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def unarchive(self, request, slug, pk):
         notification = Notification.objects.get(receiver=request.user, workspace__slug=slug, pk=pk)
+        was_unread = notification.is_unread
         notification.archived_at = None
         notification.save()
+        track_notification_changes(slug, [notification], {notification.id: was_unread})
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -198,32 +220,12 @@ class UnreadNotificationEndpoint(BaseAPIView):
 
     @allow_permission(allowed_roles=[ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def get(self, request, slug):
-        # Watching Issues Count
-        unread_notifications_count = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-                archived_at__isnull=True,
-                snoozed_till__isnull=True,
-            )
-            .exclude(sender__icontains="mentioned")
-            .count()
-        )
-
-        mention_notifications_count = Notification.objects.filter(
-            workspace__slug=slug,
-            receiver_id=request.user.id,
-            read_at__isnull=True,
-            archived_at__isnull=True,
-            snoozed_till__isnull=True,
-            sender__icontains="mentioned",
-        ).count()
+        counts = get_unread_counters(slug, request.user.id)
 
         return Response(
             {
-                "total_unread_notifications_count": int(unread_notifications_count),
-                "mention_unread_notifications_count": int(mention_notifications_count),
+                "total_unread_notifications_count": int(counts[TOTAL_FIELD]),
+                "mention_unread_notifications_count": int(counts[MENTION_FIELD]),
             },
             status=status.HTTP_200_OK,
         )
@@ -281,10 +283,13 @@ class MarkAllReadNotificationViewSet(BaseViewSet):
                 notifications = notifications.filter(entity_identifier__in=issue_ids)
 
         updated_notifications = []
+        was_unread = {}
         for notification in notifications:
+            was_unread[notification.id] = notification.is_unread
             notification.read_at = timezone.now()
             updated_notifications.append(notification)
         Notification.objects.bulk_update(updated_notifications, ["read_at"], batch_size=100)
+        track_notification_changes(slug, updated_notifications, was_unread)
         return Response({"message": "Successful"}, status=status.HTTP_200_OK)
 
 
@@ -8,7 +8,6 @@ from datetime import datetime
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Django imports
-from django.db import connection
 from django.db.models import (
     Exists,
     OuterRef,
@@ -21,6 +20,8 @@ from django.db.models import (
     IntegerField,
 )
 from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models.functions import Coalesce
@@ -37,13 +38,13 @@ from plane.app.serializers import (
     PageBinaryUpdateSerializer,
 )
 from plane.db.models import (
+    DescriptionBlob,
     Page,
     PageLog,
     UserFavorite,
     ProjectMember,
     ProjectPage,
     Project,
-    UserRecentVisit,
 )
 from plane.utils.error_codes import ERROR_CODES
 
@@ -51,25 +52,27 @@ from plane.utils.error_codes import ERROR_CODES
 from ..base import BaseAPIView, BaseViewSet
 from plane.bgtasks.page_transaction_task import page_transaction
 from plane.bgtasks.page_version_task import page_version
-from plane.bgtasks.recent_visited_task import recent_visited_task
-from plane.bgtasks.copy_s3_object import copy_s3_objects_of_description_and_assets
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
+from plane.utils.page_tree import (
+    delete_subtree,
+    detach_children,
+    duplicate_subtree,
+    get_depth,
+    get_subtree,
+    move_subtree_to_project,
+    set_subtree_access,
+    set_subtree_archived,
+)
+from plane.bgtasks.copy_s3_object import (
+    copy_s3_objects_of_description_and_assets,
+    copy_s3_objects_of_pages,
+)
 from plane.app.permissions import ProjectPagePermission
 
 
-def unarchive_archive_page_and_descendants(page_id, archived_at):
-    # Your SQL query
-    sql = """
-    WITH RECURSIVE descendants AS (
-        SELECT id FROM pages WHERE id = %s
-        UNION ALL
-        SELECT pages.id FROM pages, descendants WHERE pages.parent_id = descendants.id
-    )
-    UPDATE pages SET archived_at = %s WHERE id IN (SELECT id FROM descendants);
-    """
-
-    # Execute the SQL query
-    with connection.cursor() as cursor:
-        cursor.execute(sql, [page_id, archived_at])
+def include_descendants(request):
+    """Whether a page operation applies to the descendants of the page as well"""
+    return request.query_params.get("include_descendants", "false").lower() == "true"
 
 
 class PageViewSet(BaseViewSet):
@@ -171,6 +174,11 @@ class PageViewSet(BaseViewSet):
                     projects__id=project_id,
                     project_pages__deleted_at__isnull=True,
                 )
+                if get_subtree(page).filter(pk=parent).exists():
+                    return Response(
+                        {"error": "A page cannot be moved under itself or its descendants"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
             # Only update access if the page owner is the requesting  user
             if page.access != request.data.get("access", page.access) and page.owned_by_id != request.user.id:
@@ -234,7 +242,7 @@ class PageViewSet(BaseViewSet):
             data = PageDetailSerializer(page).data
             data["issue_ids"] = issue_ids
             if track_visit:
-                recent_visited_task.delay(
+                record_recent_visit(
                     slug=slug,
                     entity_name="page",
                     entity_identifier=page_id,
@@ -284,8 +292,12 @@ class PageViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        page.access = access
-        page.save()
+        if include_descendants(request):
+            # The descendants owned by the user follow the page
+            set_subtree_access(page, access, request.user.id)
+        else:
+            page.access = access
+            page.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def list(self, request, slug, project_id):
@@ -332,7 +344,7 @@ class PageViewSet(BaseViewSet):
             workspace__slug=slug,
         ).delete()
 
-        unarchive_archive_page_and_descendants(page_id, datetime.now())
+        set_subtree_archived(page, datetime.now())
 
         return Response({"archived_at": str(datetime.now())}, status=status.HTTP_200_OK)
 
@@ -361,7 +373,7 @@ class PageViewSet(BaseViewSet):
             page.parent = None
             page.save(update_fields=["parent"])
 
-        unarchive_archive_page_and_descendants(page_id, None)
+        set_subtree_archived(page, None)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -379,43 +391,47 @@ class PageViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if page.owned_by_id != request.user.id and (
-            not ProjectMember.objects.filter(
-                workspace__slug=slug,
-                member=request.user,
-                role=20,
-                project_id=project_id,
-                is_active=True,
-            ).exists()
-        ):
+        is_admin = ProjectMember.objects.filter(
+            workspace__slug=slug,
+            member=request.user,
+            role=20,
+            project_id=project_id,
+            is_active=True,
+        ).exists()
+        if page.owned_by_id != request.user.id and not is_admin:
             return Response(
                 {"error": "Only admin or owner can delete the page"},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # remove parent from all the children
-        _ = Page.objects.filter(
-            parent_id=page_id,
-            projects__id=project_id,
-            workspace__slug=slug,
-            project_pages__deleted_at__isnull=True,
-        ).update(parent=None)
+        # The pages of other owners are only deleted along by an admin
+        if (
+            include_descendants(request)
+            and not is_admin
+            and get_subtree(page).exclude(owned_by_id=request.user.id).exists()
+        ):
+            return Response(
+                {"error": "Only admin can delete pages owned by other members"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        if include_descendants(request):
+            page_ids = delete_subtree(page)
+        else:
+            # remove parent from all the children
+            detach_children(page)
+            page.delete()
+            page_ids = [page_id]
 
-        page.delete()
         # Delete the user favorite page
         UserFavorite.objects.filter(
             project=project_id,
             workspace__slug=slug,
-            entity_identifier=page_id,
+            entity_identifier__in=page_ids,
             entity_type="page",
         ).delete()
         # Delete the page from recent visit
-        UserRecentVisit.objects.filter(
-            project_id=project_id,
-            workspace__slug=slug,
-            entity_identifier=page_id,
-            entity_name="page",
-        ).delete(soft=False)
+        remove_recent_visits(slug, "page", page_ids, project_id=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def move(self, request, slug, project_id, page_id):
@@ -457,21 +473,43 @@ class PageViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # remove from current project, add to new project
-        ProjectPage.objects.filter(
-            page_id=page_id,
-            project_id=project_id,
-        ).delete()
+        # remove the page and its descendants from current project, add them to new project
+        move_subtree_to_project(page, project_id, new_project_id, request.user)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
-        ProjectPage.objects.create(
-            workspace_id=page.workspace_id,
-            project_id=new_project_id,
-            page_id=page_id,
-            created_by=request.user,
-            updated_by=request.user,
+    def descendants(self, request, slug, project_id, page_id):
+        page = Page.objects.get(
+            pk=page_id,
+            workspace__slug=slug,
+            projects__id=project_id,
+            project_pages__deleted_at__isnull=True,
         )
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        pages = (
+            get_subtree(page, include_self=False)
+            .filter(Q(owned_by=request.user) | Q(access=Page.PUBLIC_ACCESS))
+            .order_by("tree_path", "sort_order")
+            .values(
+                "id",
+                "name",
+                "parent_id",
+                "tree_path",
+                "access",
+                "owned_by_id",
+                "is_locked",
+                "archived_at",
+                "sort_order",
+                "logo_props",
+                "created_at",
+                "updated_at",
+            )
+        )
+        results = []
+        for descendant in pages:
+            descendant["depth"] = get_depth(descendant.pop("tree_path"), page)
+            results.append(descendant)
+        return Response(results, status=status.HTTP_200_OK)
 
     def summary(self, request, slug, project_id):
         queryset = (
@@ -554,23 +592,26 @@ class PagesDescriptionViewSet(BaseViewSet):
     permission_classes = [ProjectPagePermission]
 
     def retrieve(self, request, slug, project_id, page_id):
-        page = Page.objects.get(
+        # Only the hash and size of the blob, the content is streamed from the store
+        blob_hash, size = Page.objects.values_list("description_blob_id", "description_blob__size").get(
             Q(owned_by=self.request.user) | Q(access=0),
             pk=page_id,
             workspace__slug=slug,
             projects__id=project_id,
             project_pages__deleted_at__isnull=True,
         )
-        binary_data = page.description_binary
-
-        def stream_data():
-            if binary_data:
-                yield binary_data
-            else:
-                yield b""
 
-        response = StreamingHttpResponse(stream_data(), content_type="application/octet-stream")
-        response["Content-Disposition"] = 'attachment; filename="page_description.bin"'
+        etag = quote_etag(blob_hash or DescriptionBlob.EMPTY_HASH)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = StreamingHttpResponse(
+                DescriptionBlob.stream(blob_hash) if blob_hash else iter([b""]),
+                content_type="application/octet-stream",
+            )
+            response["Content-Disposition"] = 'attachment; filename="page_description.bin"'
+            response["Content-Length"] = size or 0
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
         return response
 
     def partial_update(self, request, slug, project_id, page_id):
@@ -646,6 +687,25 @@ class PageDuplicateEndpoint(BaseAPIView):
         # get all the project ids where page is present
         project_ids = ProjectPage.objects.filter(page_id=page_id).values_list("project_id", flat=True)
 
+        if include_descendants(request):
+            copies = duplicate_subtree(page, request.user, list(project_ids))
+            for copy in copies:
+                page_transaction.delay(
+                    new_description_html=copy.description_html,
+                    old_description_html=None,
+                    page_id=copy.id,
+                )
+
+            # Copy the s3 objects uploaded in the pages
+            copy_s3_objects_of_pages.delay(
+                page_ids=[str(copy.id) for copy in copies],
+                project_id=project_id,
+                slug=slug,
+                user_id=request.user.id,
+            )
+            page = copies[0]
+            return self.get_duplicate_response(page)
+
         page.pk = None
         page.name = f"{page.name} (Copy)"
         page.description_binary = None
@@ -678,6 +738,9 @@ class PageDuplicateEndpoint(BaseAPIView):
             user_id=request.user.id,
         )
 
+        return self.get_duplicate_response(page)
+
+    def get_duplicate_response(self, page):
         page = (
             Page.objects.filter(pk=page.id)
             .annotate(
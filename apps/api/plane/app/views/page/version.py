@@ -21,6 +21,7 @@ class PageVersionEndpoint(BaseAPIView):
         if pk:
             # Return a single page version
             page_version = PageVersion.objects.get(workspace__slug=slug, page_id=page_id, pk=pk)
+            page_version.load_description()
             # Serialize the page version
             serializer = PageVersionDetailSerializer(page_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
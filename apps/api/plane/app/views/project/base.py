@@ -23,7 +23,7 @@ from plane.app.serializers import (
     ProjectSerializer,
 )
 from plane.app.views.base import BaseAPIView, BaseViewSet
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
 from plane.bgtasks.webhook_task import model_activity, webhook_activity
 from plane.db.models import (
     UserFavorite,
@@ -238,7 +238,7 @@ class ProjectViewSet(BaseViewSet):
                     status=status.HTTP_409_CONFLICT,
                 )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=pk,
             entity_name="project",
@@ -392,6 +392,7 @@ class ProjectViewSet(BaseViewSet):
         ):
             project = Project.objects.get(pk=pk, workspace__slug=slug)
             project.delete()
+            remove_recent_visits(slug, "project", [pk], project_id=pk)
             webhook_activity.delay(
                 event="project",
                 verb="deleted",
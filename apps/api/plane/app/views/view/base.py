@@ -7,11 +7,8 @@ import copy
 # Django imports
 from django.db.models import (
     Exists,
-    F,
-    Func,
     OuterRef,
     Q,
-    Subquery,
     Prefetch,
 )
 from django.utils.decorators import method_decorator
@@ -27,22 +24,19 @@ from plane.app.permissions import allow_permission, ROLE
 from plane.app.serializers import IssueViewSerializer, ViewIssueListSerializer
 from plane.db.models import (
     Issue,
-    FileAsset,
-    IssueLink,
     IssueView,
     Workspace,
     WorkspaceMember,
     ProjectMember,
     Project,
-    CycleIssue,
-    UserRecentVisit,
     IssueAssignee,
     IssueLabel,
     ModuleIssue,
 )
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.utils.recent_visits import record_recent_visit, remove_recent_visits
+from plane.utils.issue_annotations import enrich_issues
 from .. import BaseViewSet
 from plane.db.models import UserFavorite
 from plane.utils.filters import ComplexFilterBackend
@@ -102,7 +96,7 @@ class WorkspaceViewViewSet(BaseViewSet):
     def retrieve(self, request, slug, pk):
         issue_view = self.get_queryset().filter(pk=pk).first()
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=None,
             entity_name="view",
@@ -162,34 +156,9 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
         )
 
     def apply_annotations(self, issues):
+        # The computed issue fields are added to each page by enrich_issues
         return (
-            issues.annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .prefetch_related(
+            issues.prefetch_related(
                 Prefetch(
                     "issue_assignee",
                     queryset=IssueAssignee.objects.all(),
@@ -248,7 +217,7 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
             order_by=order_by_param,
             request=request,
             queryset=issue_queryset,
-            on_results=lambda issues: ViewIssueListSerializer(issues, many=True).data,
+            on_results=lambda issues: ViewIssueListSerializer(enrich_issues(list(issues)), many=True).data,
             total_count_queryset=total_issue_count_queryset,
         )
 
@@ -331,7 +300,7 @@ class IssueViewViewSet(BaseViewSet):
             )
 
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="view",
@@ -384,12 +353,7 @@ class IssueViewViewSet(BaseViewSet):
                 entity_type="view",
             ).delete()
             # Delete the page from recent visit
-            UserRecentVisit.objects.filter(
-                project_id=project_id,
-                workspace__slug=slug,
-                entity_identifier=pk,
-                entity_name="view",
-            ).delete(soft=False)
+            remove_recent_visits(slug, "view", [pk], project_id=project_id)
         else:
             return Response(
                 {"error": "Only admin or owner can delete the view"},
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 
 from plane.db.models import UserRecentVisit
 from plane.app.serializers import WorkspaceRecentVisitSerializer
+from plane.utils.recent_visits import get_recent_visits
 
 # Modules imports
 from ..base import BaseViewSet
@@ -23,14 +24,14 @@ class UserRecentVisitViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST], level="WORKSPACE")
     def list(self, request, slug):
-        user_recent_visits = UserRecentVisit.objects.filter(workspace__slug=slug, user=request.user)
+        entity_names = ["issue", "page", "project"]
 
         entity_name = request.query_params.get("entity_name")
 
         if entity_name:
-            user_recent_visits = user_recent_visits.filter(entity_name=entity_name)
+            entity_names = [entity_name] if entity_name in entity_names else []
 
-        user_recent_visits = user_recent_visits.filter(entity_name__in=["issue", "page", "project"])
+        user_recent_visits = get_recent_visits(slug, request.user.id, entity_names=entity_names)
 
-        serializer = WorkspaceRecentVisitSerializer(user_recent_visits[:20], many=True)
+        serializer = WorkspaceRecentVisitSerializer(user_recent_visits, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -59,9 +59,10 @@ class MagicCodeProvider(CredentialAdapter):
 
         key = "magic_" + str(self.key)
 
-        # Check if the key already exists in python
-        if ri.exists(key):
-            data = json.loads(ri.get(key))
+        # Check if the key already exists in redis
+        existing = ri.get(key)
+        if existing:
+            data = json.loads(existing)
 
             current_attempt = data["current_attempt"] + 1
 
@@ -96,8 +97,9 @@ class MagicCodeProvider(CredentialAdapter):
 
     def set_user_data(self):
         ri = redis_instance()
-        if ri.exists(self.key):
-            data = json.loads(ri.get(self.key))
+        existing = ri.get(self.key)
+        if existing:
+            data = json.loads(existing)
             token = data["token"]
             email = data["email"]
 
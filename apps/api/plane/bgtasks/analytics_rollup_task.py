@@ -0,0 +1,118 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+
+# Django imports
+from django.db.models import Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import (
+    CycleIssue,
+    EstimatePoint,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+    Project,
+    State,
+)
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_rollup import (
+    get_rollup_watermark,
+    refresh_project_rollups,
+    set_rollup_watermark,
+)
+from plane.utils.exception_logger import log_exception
+
+logger = logging.getLogger("plane.worker")
+
+ROLLUP_LOCK_KEY = "issue_analytics_rollup:lock"
+ROLLUP_LOCK_TIMEOUT = 60 * 60
+
+
+def get_touched_buckets(since):
+    """
+    Return project id -> UTC days whose rollups may have changed since the
+    watermark, following issue edits as well as assignee, label, cycle,
+    module, state and estimate changes.
+    """
+    changed = Q(updated_at__gt=since) | Q(deleted_at__gt=since)
+    day = TruncDate("created_at", tzinfo=dt_timezone.utc)
+
+    sources = [
+        Issue.all_objects.filter(changed).annotate(day=day).values_list("project_id", "day"),
+        Issue.all_objects.filter(
+            Q(state__in=State.all_objects.filter(updated_at__gt=since))
+            | Q(estimate_point__in=EstimatePoint.all_objects.filter(updated_at__gt=since))
+        )
+        .annotate(day=day)
+        .values_list("project_id", "day"),
+    ]
+    for through in (IssueAssignee, IssueLabel, CycleIssue, ModuleIssue):
+        sources.append(
+            through.all_objects.filter(changed)
+            .annotate(day=TruncDate("issue__created_at", tzinfo=dt_timezone.utc))
+            .values_list("project_id", "day")
+        )
+
+    buckets = defaultdict(set)
+    for source in sources:
+        for project_id, date in source.order_by().distinct():
+            buckets[project_id].add(date)
+    return buckets
+
+
+@shared_task
+def rebuild_analytics_rollups():
+    """Recompute the rollups of every project, runs nightly to repair any drift"""
+    lock = redis_instance().lock(ROLLUP_LOCK_KEY, timeout=ROLLUP_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        logger.info("Analytics rollup refresh already running, skipping rebuild")
+        return
+
+    try:
+        started_at = timezone.now()
+        for project_id in Project.objects.values_list("id", flat=True).iterator():
+            try:
+                refresh_project_rollups(project_id)
+            except Exception as e:
+                log_exception(e)
+        set_rollup_watermark(started_at)
+    finally:
+        lock.release()
+
+
+@shared_task
+def refresh_analytics_rollups():
+    """Recompute the rollup days touched since the last run"""
+    watermark = get_rollup_watermark()
+    if watermark is None:
+        rebuild_analytics_rollups()
+        return
+
+    lock = redis_instance().lock(ROLLUP_LOCK_KEY, timeout=ROLLUP_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return
+
+    try:
+        # Changes committed while this run is in progress are picked up by the next one
+        started_at = timezone.now()
+        buckets = get_touched_buckets(datetime.fromisoformat(watermark))
+        for project_id, dates in buckets.items():
+            try:
+                refresh_project_rollups(project_id, dates=dates)
+            except Exception as e:
+                log_exception(e)
+        set_rollup_watermark(started_at)
+    finally:
+        lock.release()
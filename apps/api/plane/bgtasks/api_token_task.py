@@ -0,0 +1,15 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.utils.api_tokens import flush_api_token_last_used
+
+
+@shared_task
+def flush_api_token_last_used_task():
+    """Persist the api token uses recorded in redis since the last flush"""
+    flush_api_token_last_used()
@@ -10,7 +10,7 @@ import os
 
 # Django imports
 from django.utils import timezone
-from django.db.models import F, Window, Subquery
+from django.db.models import Exists, F, OuterRef, Window, Subquery
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -26,9 +26,13 @@ from plane.db.models import (
     APIActivityLog,
     IssueDescriptionVersion,
     WebhookLog,
+    DescriptionBlob,
+    Page,
+    Issue,
 )
 from plane.settings.mongo import MongoConnection
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_change_log import prune_change_log
 
 
 logger = logging.getLogger("plane.worker")
@@ -219,6 +223,8 @@ def transform_page_version(record: Dict) -> Dict:
         "updated_by_id": str(record["updated_by_id"]),
         "deleted_at": str(record["deleted_at"]) if record.get("deleted_at") else None,
         "last_saved_at": (str(record["last_saved_at"]) if record.get("last_saved_at") else None),
+        "base_version_id": (str(record["base_version_id"]) if record.get("base_version_id") else None),
+        "description_delta": record.get("description_delta"),
     }
 
 
@@ -239,6 +245,8 @@ def transform_issue_description_version(record: Dict) -> Dict:
         "description_stripped": record["description_stripped"],
         "description_json": record["description_json"],
         "deleted_at": str(record["deleted_at"]) if record.get("deleted_at") else None,
+        "base_version_id": (str(record["base_version_id"]) if record.get("base_version_id") else None),
+        "description_delta": record.get("description_delta"),
     }
 
 
@@ -332,8 +340,12 @@ def get_page_versions_queryset():
         .values("id")
     )
 
+    # Snapshots still referenced by a delta are removed on a later run, after the delta
+    referenced_snapshots = PageVersion.all_objects.filter(base_version__isnull=False).values("base_version_id")
+
     return (
         PageVersion.all_objects.filter(id__in=Subquery(subq))
+        .exclude(id__in=Subquery(referenced_snapshots))
         .values(
             "id",
             "created_at",
@@ -349,6 +361,8 @@ def get_page_versions_queryset():
             "updated_by_id",
             "deleted_at",
             "last_saved_at",
+            "base_version_id",
+            "description_delta",
         )
         .iterator(chunk_size=BATCH_SIZE)
     )
@@ -368,8 +382,14 @@ def get_issue_description_versions_queryset():
         .values("id")
     )
 
+    # Snapshots still referenced by a delta are removed on a later run, after the delta
+    referenced_snapshots = IssueDescriptionVersion.all_objects.filter(base_version__isnull=False).values(
+        "base_version_id"
+    )
+
     return (
         IssueDescriptionVersion.all_objects.filter(id__in=Subquery(subq))
+        .exclude(id__in=Subquery(referenced_snapshots))
         .values(
             "id",
             "created_at",
@@ -385,6 +405,8 @@ def get_issue_description_versions_queryset():
             "description_stripped",
             "description_json",
             "deleted_at",
+            "base_version_id",
+            "description_delta",
         )
         .iterator(chunk_size=BATCH_SIZE)
     )
@@ -477,3 +499,37 @@ def delete_webhook_logs():
         task_name="Webhook Log",
         collection_name="webhook_logs",
     )
+
+
+@shared_task
+def delete_issue_change_logs():
+    """Delete issue change logs older than the retention window, clients behind it resync"""
+    cutoff_days = int(os.environ.get("ISSUE_CHANGE_LOG_RETENTION_DAYS", 30))
+    cutoff_time = timezone.now() - timedelta(days=cutoff_days)
+
+    total_deleted = prune_change_log(cutoff_time, BATCH_SIZE)
+
+    logger.info(f"Issue Change Log cleanup completed. Deleted: {total_deleted}")
+
+
+@shared_task
+def delete_unreferenced_description_blobs():
+    """Delete the description blobs no page or issue references any more"""
+    # Saves in flight store their blob before pointing their row at it
+    cutoff_time = timezone.now() - timedelta(days=1)
+    unreferenced_blobs = (
+        DescriptionBlob.objects.filter(stored_at__lte=cutoff_time)
+        .exclude(Exists(Page.all_objects.filter(description_blob_id=OuterRef("pk"))))
+        .exclude(Exists(Issue.all_objects.filter(description_blob_id=OuterRef("pk"))))
+    )
+
+    total_deleted = 0
+    while True:
+        hashes = list(unreferenced_blobs.values_list("hash", flat=True)[:BATCH_SIZE])
+        if not hashes:
+            break
+        # A single DELETE checking the references again, the collector of
+        # delete() would clear the references of a blob reused meanwhile
+        total_deleted += unreferenced_blobs.filter(hash__in=hashes)._raw_delete(DescriptionBlob.objects.db)
+
+    logger.info(f"Description Blob cleanup completed. Deleted: {total_deleted}")
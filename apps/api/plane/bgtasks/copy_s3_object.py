@@ -12,7 +12,7 @@ from bs4 import BeautifulSoup
 from django.conf import settings
 
 # Module imports
-from plane.db.models import FileAsset, Page, Issue
+from plane.db.models import DescriptionBlob, FileAsset, Page, Issue
 from plane.utils.exception_logger import log_exception
 from plane.settings.storage import S3Storage
 from celery import shared_task
@@ -153,3 +153,87 @@ def copy_s3_objects_of_description_and_assets(entity_name, entity_identifier, pr
     except Exception as e:
         log_exception(e)
         return []
+
+
+def copy_page_assets(pages, project_id, user_id):
+    """
+    Duplicate the assets of the descriptions of pages copied together, reading
+    and creating the asset rows in bulk. Returns the pages with new descriptions.
+    """
+    asset_ids = {page.id: extract_asset_ids(page.description_html, "image-component") for page in pages}
+    all_asset_ids = {asset_id for ids in asset_ids.values() for asset_id in ids}
+    if not all_asset_ids:
+        return []
+
+    workspace_id = pages[0].workspace_id
+    original_assets = {
+        str(asset.id): asset
+        for asset in FileAsset.objects.filter(workspace_id=workspace_id, project_id=project_id, id__in=all_asset_ids)
+    }
+
+    storage = S3Storage()
+    duplicated_assets = []
+    updated_pages = []
+    for page in pages:
+        replacements = []
+        for asset_id in asset_ids[page.id]:
+            original_asset = original_assets.get(asset_id)
+            if original_asset is None:
+                continue
+            destination_key = f"{workspace_id}/{uuid.uuid4().hex}-{original_asset.attributes.get('name')}"
+            storage.copy_object(original_asset.asset, destination_key)
+            duplicated_asset = FileAsset(
+                attributes={
+                    "name": original_asset.attributes.get("name"),
+                    "type": original_asset.attributes.get("type"),
+                    "size": original_asset.attributes.get("size"),
+                },
+                asset=destination_key,
+                size=original_asset.size,
+                workspace_id=workspace_id,
+                created_by_id=user_id,
+                entity_type=original_asset.entity_type,
+                project_id=project_id,
+                storage_metadata=original_asset.storage_metadata,
+                is_uploaded=True,
+                **get_entity_id_field(original_asset.entity_type, page.id),
+            )
+            duplicated_assets.append(duplicated_asset)
+            replacements.append({"new_asset_id": str(duplicated_asset.id), "old_asset_id": asset_id})
+
+        if replacements:
+            page.description_html = replace_asset_ids(page.description_html, "image-component", replacements)
+            updated_pages.append(page)
+
+    FileAsset.objects.bulk_create(duplicated_assets, batch_size=100)
+    Page.objects.bulk_update(updated_pages, ["description_html"], batch_size=100)
+    return updated_pages
+
+
+@shared_task
+def copy_s3_objects_of_pages(page_ids, project_id, slug, user_id):
+    """
+    Bulk version of copy_s3_objects_of_description_and_assets for the pages
+    of a duplicated page tree
+    """
+    try:
+        pages = list(Page.objects.filter(id__in=page_ids))
+        if not pages:
+            return
+
+        updated_pages = copy_page_assets(pages, project_id, user_id)
+
+        # The live server converts one description at a time
+        synced_pages, binaries = [], []
+        for page in updated_pages:
+            external_data = sync_with_external_service("PAGE", page.description_html)
+            if external_data:
+                page.description_json = external_data.get("description_json")
+                synced_pages.append(page)
+                binaries.append(base64.b64decode(external_data.get("description_binary")))
+
+        for page, blob_hash in zip(synced_pages, DescriptionBlob.store_many(binaries)):
+            page.description_blob_id = blob_hash
+        Page.objects.bulk_update(synced_pages, ["description_json", "description_blob"], batch_size=100)
+    except Exception as e:
+        log_exception(e)
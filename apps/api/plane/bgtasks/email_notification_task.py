@@ -32,8 +32,8 @@ def remove_unwanted_characters(input_text):
 
 # acquire and delete redis lock
 def acquire_lock(lock_id, expire_time=300):
-    redis_client = redis_instance()
     """Attempt to acquire a lock with a specified expiration time."""
+    redis_client = redis_instance()
     return redis_client.set(lock_id, "true", nx=True, ex=expire_time)
 
 
@@ -161,7 +161,8 @@ def send_email_notification(issue_id, notification_data, receiver_id, email_noti
         if acquire_lock(lock_id=lock_id):
             # get the redis instance
             ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
+            base_api = ri.get(str(issue_id))
+            base_api = base_api.decode() if base_api else None
 
             # Skip if base api is not present
             if not base_api:
@@ -1602,3 +1602,157 @@ def issue_activity(
     except Exception as e:
         log_exception(e)
         return
+
+
+def track_bulk_cycle(
+    requested_data,
+    current_instance,
+    issue_id,
+    project_id,
+    workspace_id,
+    actor_id,
+    issue_activities,
+    epoch,
+    cycles,
+):
+    old_cycle = cycles.get(current_instance.get("cycle_id"))
+    new_cycle = cycles.get(requested_data.get("cycle_id"))
+    if old_cycle == new_cycle:
+        return
+
+    if new_cycle is None:
+        verb, comment = "deleted", f"removed this issue from {old_cycle.name}"
+    elif old_cycle is None:
+        verb, comment = "created", f"added cycle {new_cycle.name}"
+    else:
+        verb, comment = "updated", f"updated cycle from {old_cycle.name} to {new_cycle.name}"
+
+    issue_activities.append(
+        IssueActivity(
+            issue_id=issue_id,
+            actor_id=actor_id,
+            verb=verb,
+            old_value=old_cycle.name if old_cycle else "",
+            new_value=new_cycle.name if new_cycle else "",
+            field="cycles",
+            project_id=project_id,
+            workspace_id=workspace_id,
+            comment=comment,
+            old_identifier=old_cycle.id if old_cycle else None,
+            new_identifier=new_cycle.id if new_cycle else None,
+            epoch=epoch,
+        )
+    )
+
+
+def track_bulk_modules(
+    requested_data,
+    current_instance,
+    issue_id,
+    project_id,
+    workspace_id,
+    actor_id,
+    issue_activities,
+    epoch,
+    modules,
+):
+    current_modules = set(current_instance.get("module_ids", []))
+    for module_id in requested_data.get("module_ids", []):
+        module = modules.get(module_id)
+        if module is None or module_id in current_modules:
+            continue
+        issue_activities.append(
+            IssueActivity(
+                issue_id=issue_id,
+                actor_id=actor_id,
+                verb="created",
+                old_value="",
+                new_value=module.name,
+                field="modules",
+                project_id=project_id,
+                workspace_id=workspace_id,
+                comment=f"added module {module.name}",
+                new_identifier=module.id,
+                epoch=epoch,
+            )
+        )
+
+
+@shared_task
+def bulk_issue_activity(changes, actor_id, project_id, epoch, origin=None):
+    """
+    Record the activities of a bulk issue update in one task. changes is a
+    json list of {"issue_id", "requested_data", "current_instance"}, the
+    activities of every issue are saved with a single bulk insert and the
+    notifications are sent per issue from here.
+    """
+    try:
+        changes = json.loads(changes)
+        if not changes or not is_valid_uuid(str(project_id)):
+            return
+
+        workspace_id = Project.objects.values_list("workspace_id", flat=True).get(pk=project_id)
+
+        cycle_ids = set()
+        module_ids = set()
+        for change in changes:
+            cycle_ids.update([change["current_instance"].get("cycle_id"), change["requested_data"].get("cycle_id")])
+            module_ids.update(change["requested_data"].get("module_ids", []))
+        cycles = {str(cycle.id): cycle for cycle in Cycle.objects.filter(pk__in=cycle_ids - {None})}
+        modules = {str(module.id): module for module in Module.objects.filter(pk__in=module_ids)}
+
+        issue_activities = []
+        for change in changes:
+            arguments = {
+                "issue_id": change["issue_id"],
+                "project_id": project_id,
+                "workspace_id": workspace_id,
+                "actor_id": actor_id,
+                "issue_activities": issue_activities,
+                "epoch": epoch,
+            }
+            update_issue_activity(
+                requested_data=json.dumps(change["requested_data"]),
+                current_instance=json.dumps(change["current_instance"]),
+                **arguments,
+            )
+            if "cycle_id" in change["requested_data"]:
+                track_bulk_cycle(change["requested_data"], change["current_instance"], cycles=cycles, **arguments)
+            if "module_ids" in change["requested_data"]:
+                track_bulk_modules(change["requested_data"], change["current_instance"], modules=modules, **arguments)
+
+        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities, batch_size=500)
+
+        if origin:
+            pipe = redis_instance().pipeline(transaction=False)
+            for change in changes:
+                pipe.set(str(change["issue_id"]), origin, ex=600)
+            pipe.execute()
+
+        # Serialize the activities with their relations loaded once instead of per row
+        issue_activities_created = IssueActivity.objects.filter(
+            pk__in=[activity.id for activity in issue_activities_created]
+        ).select_related("actor", "issue", "project", "workspace")
+        activities_by_issue = {}
+        for activity in IssueActivitySerializer(issue_activities_created, many=True).data:
+            activities_by_issue.setdefault(str(activity["issue"]), []).append(activity)
+
+        for change in changes:
+            if str(change["issue_id"]) not in activities_by_issue:
+                continue
+            notifications.delay(
+                type="issue.activity.updated",
+                issue_id=str(change["issue_id"]),
+                actor_id=actor_id,
+                project_id=project_id,
+                subscriber=True,
+                issue_activities_created=json.dumps(
+                    activities_by_issue[str(change["issue_id"])], cls=DjangoJSONEncoder
+                ),
+                requested_data=json.dumps(change["requested_data"]),
+                current_instance=json.dumps(change["current_instance"]),
+            )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
@@ -53,14 +53,14 @@ def sync_issue_description_version(batch_size=5000, offset=0, countdown=300):
             # Fetch issues with related data
             issues_batch = (
                 base_query.order_by("created_at")
-                .select_related("workspace", "project")
+                .select_related("workspace", "project", "description_blob")
                 .only(
                     "id",
                     "workspace_id",
                     "project_id",
                     "created_by_id",
                     "updated_by_id",
-                    "description_binary",
+                    "description_blob",
                     "description_html",
                     "description_stripped",
                     "description_json",
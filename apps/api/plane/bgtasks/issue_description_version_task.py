@@ -23,10 +23,13 @@ def should_update_existing_version(
 
 
 def update_existing_version(version: IssueDescriptionVersion, issue) -> None:
-    version.description_json = issue.description_json
-    version.description_html = issue.description_html
-    version.description_binary = issue.description_binary
-    version.description_stripped = issue.description_stripped
+    version.set_description(
+        {
+            "description_json": issue.description_json,
+            "description_html": issue.description_html,
+            "description_binary": issue.description_binary,
+        }
+    )
     version.last_saved_at = timezone.now()
 
     version.save(
@@ -35,6 +38,8 @@ def update_existing_version(version: IssueDescriptionVersion, issue) -> None:
             "description_html",
             "description_binary",
             "description_stripped",
+            "base_version",
+            "description_delta",
             "last_saved_at",
         ]
     )
@@ -24,6 +24,10 @@ from plane.db.models import (
     UserNotificationPreference,
     ProjectMember,
 )
+from plane.utils.notification_counters import (
+    reconcile_unread_counters,
+    track_notification_changes,
+)
 from django.db.models import Subquery
 
 # Third Party imports
@@ -665,10 +669,19 @@ def notifications(
                 new_mentions=new_mentions,
                 removed_mention=removed_mention,
             )
-            # Bulk create notifications
+            # Bulk create notifications, bulk_create skips save() so set the sender type here
+            for notification in bulk_notifications:
+                notification.sender_type = Notification.get_sender_type(notification.sender)
             Notification.objects.bulk_create(bulk_notifications, batch_size=100)
+            track_notification_changes(project.workspace.slug, bulk_notifications, {})
             EmailNotificationLog.objects.bulk_create(bulk_email_logs, batch_size=100, ignore_conflicts=True)
         return
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def reconcile_unread_notification_counters():
+    """Repair unread notification counters that drifted from Postgres"""
+    reconcile_unread_counters()
@@ -25,21 +25,23 @@ def page_version(page_id, existing_instance, user_id):
         # Create a version if description_html is updated
         if current_instance.get("description_html") != page.description_html:
             # Create a new page version
-            PageVersion.objects.create(
+            version = PageVersion(
                 page_id=page_id,
                 workspace_id=page.workspace_id,
-                description_html=page.description_html,
-                description_binary=page.description_binary,
                 owned_by_id=user_id,
                 last_saved_at=page.updated_at,
-                description_json=page.description_json,
-                description_stripped=page.description_stripped,
             )
+            version.set_description(
+                {
+                    "description_html": page.description_html,
+                    "description_binary": page.description_binary,
+                    "description_json": page.description_json,
+                }
+            )
+            version.save()
 
-            # If page versions are greater than 20 delete the oldest one
-            if PageVersion.objects.filter(page_id=page_id).count() > 20:
-                # Delete the old page version
-                PageVersion.objects.filter(page_id=page_id).order_by("last_saved_at").first().delete()
+            # Keep the latest 20 page versions
+            PageVersion.trim_versions(page_id)
 
         return
     except Page.DoesNotExist:
@@ -12,6 +12,7 @@ from celery import shared_task
 # Module imports
 from plane.db.models import UserRecentVisit, Workspace
 from plane.utils.exception_logger import log_exception
+from plane.utils.recent_visits import flush_recent_visits
 
 
 @shared_task
@@ -59,3 +60,9 @@ def recent_visited_task(entity_name, entity_identifier, user_id, project_id, slu
     except Exception as e:
         log_exception(e)
         return
+
+
+@shared_task
+def flush_recent_visits_task():
+    """Persist the recent visits recorded in redis since the last flush"""
+    flush_recent_visits()
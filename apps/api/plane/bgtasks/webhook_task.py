@@ -504,3 +504,46 @@ def model_activity(model_name, model_id, requested_data, current_instance, actor
                 )
 
     return
+
+
+@shared_task
+def bulk_model_activity(model_name, model_ids, requested_data, actor_id, slug, origin=None):
+    """
+    Send a single webhook event for a bulk update of several instances of a
+    model, carrying all of them instead of one event per instance and field.
+    """
+    try:
+        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
+        if model_name == "issue":
+            webhooks = webhooks.filter(issue=True)
+
+        webhooks = list(webhooks)
+        if not webhooks:
+            return
+
+        event_data = get_model_data(event=model_name, event_id=model_ids, many=True)
+        activity = {
+            "field": None,
+            "fields": list(requested_data),
+            "new_value": requested_data,
+            "old_value": None,
+            "actor": get_model_data(event="user", event_id=actor_id),
+            "old_identifier": None,
+            "new_identifier": None,
+        }
+        for webhook in webhooks:
+            webhook_send_task.delay(
+                webhook_id=webhook.id,
+                slug=slug,
+                event=model_name,
+                event_data=event_data,
+                action="bulk_updated",
+                current_site=origin,
+                activity=activity,
+            )
+        return
+    except Exception as e:
+        if isinstance(e, ObjectDoesNotExist):
+            return
+        log_exception(e)
+        return
@@ -12,14 +12,9 @@ from pythonjsonlogger.jsonlogger import JsonFormatter
 from celery.signals import after_setup_logger, after_setup_task_logger
 from celery.schedules import crontab
 
-# Module imports
-from plane.settings.redis import redis_instance
-
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 
-ri = redis_instance()
-
 app = Celery("plane")
 
 # Using a string here means the worker will not have to
@@ -36,6 +31,22 @@ app.conf.beat_schedule = {
         "task": "plane.license.bgtasks.tracer.instance_traces",
         "schedule": crontab(hour="*/6", minute=0),  # Every 6 hours
     },
+    "reconcile-every-thirty-minutes-unread-notification-counters": {
+        "task": "plane.bgtasks.notification_task.reconcile_unread_notification_counters",
+        "schedule": crontab(minute="*/30"),  # Every 30 minutes
+    },
+    "flush-every-minute-recent-visits": {
+        "task": "plane.bgtasks.recent_visited_task.flush_recent_visits_task",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "flush-every-minute-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used_task",
+        "schedule": crontab(minute="*"),  # Every minute
+    },
+    "refresh-every-five-minutes-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.refresh_analytics_rollups",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
     # Occurs once every day
     "check-every-day-to-delete-hard-delete": {
         "task": "plane.bgtasks.deletion_task.hard_delete",
@@ -77,6 +88,18 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.exporter_expired_task.delete_old_s3_link",
         "schedule": crontab(hour=3, minute=45),  # UTC 03:45
     },
+    "check-every-day-to-delete-issue-change-logs": {
+        "task": "plane.bgtasks.cleanup_task.delete_issue_change_logs",
+        "schedule": crontab(hour=3, minute=50),  # UTC 03:50
+    },
+    "check-every-day-to-rebuild-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.rebuild_analytics_rollups",
+        "schedule": crontab(hour=4, minute=0),  # UTC 04:00
+    },
+    "check-every-day-to-delete-unreferenced-description-blobs": {
+        "task": "plane.bgtasks.cleanup_task.delete_unreferenced_description_blobs",
+        "schedule": crontab(hour=4, minute=15),  # UTC 04:15
+    },
 }
 
 
@@ -0,0 +1,55 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import json
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import User, WorkspaceMember
+from plane.utils.benchmark import ApiBenchmark
+
+
+class Command(BaseCommand):
+    help = "Replay a seeded mix of list, board, detail, search and analytics requests against a workspace"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", type=str, required=True, help="Email of the member sending the requests")
+        parser.add_argument("--slug", type=str, default="synthetic", help="Slug of the workspace")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--warmup", type=int, default=50, help="Requests sent before measuring")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--host", type=str, default="localhost", help="Host header of the requests")
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None:
+            raise CommandError(f"No user with the email {options['email']}")
+        if not WorkspaceMember.objects.filter(workspace__slug=options["slug"], member=user, is_active=True).exists():
+            raise CommandError(f"{options['email']} is not a member of {options['slug']}")
+
+        benchmark = ApiBenchmark(user, options["slug"], seed=options["seed"], host=options["host"])
+        report = benchmark.run(options["requests"], warmup=options["warmup"])
+        if not report:
+            raise CommandError(f"{options['email']} has no projects in {options['slug']}")
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'endpoint':<16} {'requests':>8} {'errors':>6} {'p50 ms':>8} {'p90 ms':>8} "
+            f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'queries':>8} {'max q':>6}"
+        )
+        for endpoint, row in report.items():
+            line = (
+                f"{endpoint:<16} {row['requests']:>8} {row['errors']:>6} {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+                f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f} "
+                f"{row['mean_queries']:>8.1f} {row['max_queries']:>6}"
+            )
+            self.stdout.write(self.style.ERROR(line) if row["errors"] else line)
+        self.stdout.write(self.style.SUCCESS(f"{sum(row['requests'] for row in report.values())} requests replayed"))
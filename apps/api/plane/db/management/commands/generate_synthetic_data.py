@@ -0,0 +1,77 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import time
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import User, Workspace
+from plane.utils.synthetic_data import SyntheticWorkspace
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic synthetic workspace for load testing and benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--email", type=str, required=True, help="Email of the existing user owning the workspace")
+        parser.add_argument("--slug", type=str, default="synthetic", help="Slug of the new workspace")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--projects", type=int, default=10)
+        parser.add_argument("--issues", type=int, default=10000, help="Issues across all projects")
+        parser.add_argument("--skew", type=float, default=1.0, help="Zipf skew of the issues per project, 0 is uniform")
+        parser.add_argument("--members", type=int, default=20, help="Members besides the owner")
+        parser.add_argument("--labels", type=int, default=30, help="Labels per project")
+        parser.add_argument("--labels-per-issue", type=float, default=2.0, help="Mean labels per issue")
+        parser.add_argument("--assignees-per-issue", type=float, default=1.0, help="Mean assignees per issue")
+        parser.add_argument("--activities-per-issue", type=float, default=6.0, help="Mean updates per issue")
+        parser.add_argument("--comments-per-issue", type=float, default=2.0, help="Mean comments per issue")
+        parser.add_argument("--pages", type=int, default=20, help="Pages per project")
+        parser.add_argument("--cycles", type=int, default=6, help="Cycles per project")
+        parser.add_argument("--modules", type=int, default=8, help="Modules per project")
+        parser.add_argument("--tail", type=float, default=2.5, help="Pareto shape of the per issue counts")
+        parser.add_argument("--days", type=int, default=365, help="Days of history")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per COPY batch")
+
+    def handle(self, *args, **options):
+        owner = User.objects.filter(email=options["email"]).first()
+        if owner is None:
+            raise CommandError(f"No user with the email {options['email']}")
+        if Workspace.objects.filter(slug=options["slug"]).exists():
+            raise CommandError(f"The workspace {options['slug']} already exists")
+        if options["projects"] < 1 or options["tail"] <= 1:
+            raise CommandError("At least one project and a tail above 1 are required")
+
+        generator = SyntheticWorkspace(
+            owner,
+            options["slug"],
+            seed=options["seed"],
+            projects=options["projects"],
+            issues=options["issues"],
+            skew=options["skew"],
+            members=options["members"],
+            labels=options["labels"],
+            labels_per_issue=options["labels_per_issue"],
+            assignees_per_issue=options["assignees_per_issue"],
+            activities_per_issue=options["activities_per_issue"],
+            comments_per_issue=options["comments_per_issue"],
+            pages=options["pages"],
+            cycles=options["cycles"],
+            modules=options["modules"],
+            tail=options["tail"],
+            days=options["days"],
+            batch_size=options["batch_size"],
+            log=self.stdout.write,
+        )
+        start = time.perf_counter()
+        workspace, counts = generator.generate()
+        seconds = time.perf_counter() - start
+
+        for table, count in sorted(counts.items()):
+            self.stdout.write(f"{table:<32} {count}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated {workspace.slug}: {sum(counts.values())} rows in {seconds:.1f} s")
+        )
@@ -0,0 +1,87 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import threading
+import time
+import uuid
+
+# Third party imports
+from rest_framework.throttling import SimpleRateThrottle
+
+# Django imports
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+# Module imports
+from plane.api.rate_limit import check_rate_limits
+from plane.settings.redis import redis_instance
+
+
+class CacheListThrottle(SimpleRateThrottle):
+    """The previous limiter, a list of timestamps rewritten in the django cache"""
+
+    def __init__(self, rate, key):
+        self.rate = rate
+        self.key_name = key
+        super().__init__()
+
+    def get_cache_key(self, request, view):
+        return self.key_name
+
+
+def run_concurrently(check, threads, requests):
+    """Send requests checks from threads started together, returns (allowed, seconds)"""
+    allowed = [0] * threads
+    barrier = threading.Barrier(threads)
+
+    def worker(index):
+        barrier.wait()
+        for _ in range(requests):
+            if check():
+                allowed[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(allowed), time.perf_counter() - start
+
+
+class Command(BaseCommand):
+    help = "Check how many concurrent requests the redis and the cache list rate limiters allow"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rate", default="300/minute", help="Limit under test")
+        parser.add_argument("--threads", type=int, default=32)
+        parser.add_argument("--requests", type=int, default=50, help="Requests per thread")
+
+    def handle(self, *args, **options):
+        run = uuid.uuid4().hex
+        redis_key = f"ratelimit:report:{run}"
+        cache_key = f"throttle_report_{run}"
+        num_requests, duration = CacheListThrottle(options["rate"], cache_key).parse_rate(options["rate"])
+
+        limiters = {
+            "redis gcra": lambda: check_rate_limits([(redis_key, num_requests, duration)])[0],
+            "cache list": lambda: CacheListThrottle(options["rate"], cache_key).allow_request(None, None),
+        }
+
+        total = options["threads"] * options["requests"]
+        self.stdout.write(f"limit:    {options['rate']}")
+        self.stdout.write(f"requests: {total} from {options['threads']} threads")
+        try:
+            for name, check in limiters.items():
+                allowed, elapsed = run_concurrently(check, options["threads"], options["requests"])
+                # Requests the limit allows over the run, the burst plus what refilled meanwhile
+                expected = min(total, num_requests + int(elapsed * num_requests / duration))
+                self.stdout.write(
+                    f"{name:<12} allowed {allowed:>6}  limit {expected:>6} ({allowed - expected:+d})  "
+                    f"{total / elapsed:>9.0f} req/s"
+                )
+        finally:
+            redis_instance().delete(redis_key)
+            cache.delete(cache_key)
@@ -0,0 +1,54 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+from collections import Counter
+
+# Django imports
+from django.core.management.base import BaseCommand
+from django.urls import URLPattern, URLResolver, get_resolver
+
+# Module imports
+from plane.middleware.db_routing import describe_view_routing
+
+
+def iter_patterns(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_patterns(pattern.url_patterns, prefix + str(pattern.pattern))
+        elif isinstance(pattern, URLPattern):
+            yield prefix + str(pattern.pattern), pattern.callback
+
+
+class Command(BaseCommand):
+    help = "Report which GET endpoints are routed to the read replica"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--routing",
+            type=str,
+            default=None,
+            help="Only list endpoints whose routing starts with this value, e.g. replica or primary",
+        )
+
+    def handle(self, *args, **options):
+        totals = Counter()
+        for route, callback in iter_patterns(get_resolver().url_patterns):
+            actions = getattr(callback, "actions", None)
+            # ViewSet routes only serve GET when a get action is mapped
+            if isinstance(actions, dict) and "get" not in actions:
+                continue
+
+            routing = describe_view_routing(callback)
+            totals[routing] += 1
+            if options["routing"] and not routing.startswith(options["routing"]):
+                continue
+
+            view_class = getattr(callback, "cls", None) or getattr(callback, "view_class", None) or callback
+            action = actions.get("get") if isinstance(actions, dict) else ""
+            self.stdout.write(f"{routing:<24} {view_class.__name__:<48} {action or '':<12} /{route}")
+
+        self.stdout.write("")
+        for routing, count in sorted(totals.items()):
+            self.stdout.write(self.style.SUCCESS(f"{routing}: {count}"))
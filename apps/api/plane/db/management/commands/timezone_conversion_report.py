@@ -0,0 +1,83 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import random
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+# Third party imports
+import pytz
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.utils.timezone_converter import convert_datetime_columns
+
+DATETIME_FIELDS = ["created_at", "updated_at", "archived_at", "completed_at"]
+
+
+def build_rows(count, rng):
+    start = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+    return [
+        {
+            "id": index,
+            "name": f"Issue {index}",
+            **{
+                field: start + timedelta(seconds=rng.randrange(60 * 60 * 24 * 365)) if rng.random() > 0.2 else None
+                for field in DATETIME_FIELDS
+            },
+        }
+        for index in range(count)
+    ]
+
+
+def convert_per_item(rows, datetime_fields, timezone_name):
+    """The previous conversion, one pytz astimezone call per item and field"""
+    tz = pytz.timezone(timezone_name)
+    rows = list(rows)
+    for item in rows:
+        for field in datetime_fields:
+            if field in item and item[field]:
+                item[field] = item[field].astimezone(tz)
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Compare the per item and column wise timezone conversion of list responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Rows of the synthetic response")
+        parser.add_argument("--timezone", default="America/New_York")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rows = build_rows(options["rows"], random.Random(options["seed"]))
+
+        timings = {}
+        results = {}
+        for name, convert in (
+            ("per item (pytz)", convert_per_item),
+            ("column wise (zoneinfo)", convert_datetime_columns),
+        ):
+            best = None
+            for _ in range(options["repeat"]):
+                copies = [dict(row) for row in rows]
+                start = time.perf_counter()
+                results[name] = convert(copies, DATETIME_FIELDS, options["timezone"])
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+
+        # Compare the rendered values, aware datetimes in a repeated hour never compare equal across zones
+        first, second = results.values()
+        if any(str(a[field]) != str(b[field]) for a, b in zip(first, second) for field in DATETIME_FIELDS):
+            raise CommandError("The conversions disagree")
+
+        self.stdout.write(f"rows:     {options['rows']} x {len(DATETIME_FIELDS)} datetime fields")
+        self.stdout.write(f"timezone: {options['timezone']}")
+        for name, elapsed in timings.items():
+            self.stdout.write(f"{name:<24} {elapsed * 1000:8.2f} ms")
@@ -0,0 +1,101 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import random
+import time
+import zlib
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce, Length
+
+# Module imports
+from plane.db.mixins import DescriptionVersionMixin
+from plane.db.models import IssueDescriptionVersion, PageVersion
+from plane.utils.version_delta import apply_delta, make_delta
+
+
+def build_document(paragraphs, rng):
+    words = ["plane", "issue", "cycle", "module", "page", "state", "label", "estimate", "intake", "view"]
+    return ["<p>" + " ".join(rng.choice(words) for _ in range(rng.randint(20, 60))) + "</p>" for _ in range(paragraphs)]
+
+
+def edit_document(document, rng):
+    document = list(document)
+    position = rng.randrange(len(document))
+    if rng.random() < 0.3:
+        document.insert(position, "<p>new paragraph " + str(rng.random()) + "</p>")
+    else:
+        document[position] = document[position].replace("</p>", " edited</p>", 1)
+    return document
+
+
+class Command(BaseCommand):
+    help = "Report the storage and reconstruction cost of delta compressed description versions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--versions", type=int, default=100, help="Versions of the synthetic document")
+        parser.add_argument("--paragraphs", type=int, default=2000, help="Paragraphs of the synthetic document")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--stored", action="store_true", help="Also report the stored version tables")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        document = build_document(options["paragraphs"], rng)
+
+        full_bytes = 0
+        stored_bytes = 0
+        encode_time = 0.0
+        decode_times = []
+        snapshot = None
+        deltas = 0
+        for _ in range(options["versions"]):
+            document = edit_document(document, rng)
+            html = "".join(document).encode()
+            full_bytes += len(html)
+
+            if snapshot is not None and deltas < DescriptionVersionMixin.SNAPSHOT_INTERVAL - 1:
+                start = time.perf_counter()
+                delta = make_delta([snapshot], [html])
+                encode_time += time.perf_counter() - start
+                if len(delta) < len(html) * DescriptionVersionMixin.SNAPSHOT_DELTA_RATIO:
+                    start = time.perf_counter()
+                    rebuilt = apply_delta([snapshot], delta)
+                    decode_times.append(time.perf_counter() - start)
+                    if rebuilt != [html]:
+                        raise CommandError("A delta did not rebuild its version")
+                    stored_bytes += len(delta)
+                    deltas += 1
+                    continue
+
+            snapshot = html
+            stored_bytes += len(html)
+            deltas = 0
+
+        decode_times.sort()
+        self.stdout.write(f"versions:            {options['versions']}")
+        self.stdout.write(f"document size:       {len(html)} bytes ({len(zlib.compress(html))} compressed)")
+        self.stdout.write(f"full copies:         {full_bytes} bytes")
+        self.stdout.write(f"snapshots + deltas:  {stored_bytes} bytes ({stored_bytes / full_bytes:.1%})")
+        if decode_times:
+            self.stdout.write(f"delta encode (avg):  {encode_time / len(decode_times) * 1000:.2f} ms")
+            self.stdout.write(f"reconstruct (p50):   {decode_times[len(decode_times) // 2] * 1000:.2f} ms")
+            self.stdout.write(f"reconstruct (max):   {decode_times[-1] * 1000:.2f} ms")
+
+        if options["stored"]:
+            for model in [PageVersion, IssueDescriptionVersion]:
+                totals = model.all_objects.aggregate(
+                    rows=Count("id"),
+                    deltas=Count("id", filter=Q(base_version__isnull=False)),
+                    html_bytes=Coalesce(Sum(Length("description_html")), 0),
+                    delta_bytes=Coalesce(Sum(Length("description_delta")), 0),
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{model.__name__}: {totals['rows']} rows, {totals['deltas']} deltas, "
+                        f"{totals['html_bytes']} html bytes, {totals['delta_bytes']} delta bytes"
+                    )
+                )
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0122_alter_issueproperty_deleted_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueAnalyticsRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('state_group', models.CharField(max_length=20, null=True)),
+                ('priority', models.CharField(max_length=30, null=True)),
+                ('dimension', models.CharField(blank=True, choices=[('', 'None'), ('assignee', 'Assignee'), ('label', 'Label'), ('cycle', 'Cycle'), ('module', 'Module')], default='', max_length=20)),
+                ('dimension_id', models.UUIDField(null=True)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('estimate_total', models.FloatField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_analytics_rollups', to='db.project')),
+                ('state', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='issue_analytics_rollups', to='db.state')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_analytics_rollups', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Analytics Rollup',
+                'verbose_name_plural': 'Issue Analytics Rollups',
+                'db_table': 'issue_analytics_rollups',
+                'ordering': ('-date',),
+                'indexes': [models.Index(fields=['workspace', 'dimension', 'date'], name='issue_rollup_ws_dim_date_idx'), models.Index(fields=['project', 'date'], name='issue_rollup_project_date_idx')],
+            },
+        ),
+    ]
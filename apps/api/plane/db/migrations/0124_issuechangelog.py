@@ -0,0 +1,32 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:23
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0123_issueanalyticsrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueChangeLog',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('issue_id', models.UUIDField()),
+                ('change', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted'), ('archived', 'Archived')], max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_change_logs', to='db.project')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_change_logs', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Change Log',
+                'verbose_name_plural': 'Issue Change Logs',
+                'db_table': 'issue_change_logs',
+                'ordering': ('id',),
+                'indexes': [models.Index(fields=['project', 'id'], name='issue_change_log_project_idx'), models.Index(fields=['created_at'], name='issue_change_log_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:24
+
+from django.db import migrations, models
+
+
+def populate_sender_type(apps, _schema_editor):
+    Notification = apps.get_model("db", "Notification")
+    for sender_type in ["created", "assigned", "subscribed", "mentioned"]:
+        Notification.objects.filter(sender__endswith=f":{sender_type}").update(sender_type=sender_type)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0124_issuechangelog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='sender_type',
+            field=models.CharField(choices=[('created', 'Created'), ('assigned', 'Assigned'), ('subscribed', 'Subscribed'), ('mentioned', 'Mentioned'), ('other', 'Other')], default='other', max_length=20),
+        ),
+        migrations.RunPython(populate_sender_type, reverse_code=migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('archived_at__isnull', True), ('deleted_at__isnull', True), ('read_at__isnull', True), ('snoozed_till__isnull', True)), fields=['receiver', 'workspace', 'sender_type'], name='notif_unread_sender_type_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0125_notification_sender_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issuedescriptionversion',
+            name='base_version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='db.issuedescriptionversion'),
+        ),
+        migrations.AddField(
+            model_name='issuedescriptionversion',
+            name='description_delta',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='pageversion',
+            name='base_version',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='db.pageversion'),
+        ),
+        migrations.AddField(
+            model_name='pageversion',
+            name='description_delta',
+            field=models.BinaryField(null=True),
+        ),
+    ]
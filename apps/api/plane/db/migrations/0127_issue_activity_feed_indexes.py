@@ -0,0 +1,27 @@
+# Generated by Django 4.2.28 on 2026-10-19 11:46
+
+from django.db import migrations, models
+from django.contrib.postgres.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('db', '0126_description_version_deltas'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='issueactivity',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['issue', 'created_at', 'id'], name='issue_activity_issue_feed_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issueactivity',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['project', 'created_at', 'id'], name='issue_activity_proj_feed_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issueactivity',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['actor', 'created_at', 'id'], name='issue_activity_actor_feed_idx'),
+        ),
+    ]
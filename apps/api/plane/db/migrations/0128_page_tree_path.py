@@ -0,0 +1,41 @@
+# Generated by Django 4.2.28 on 2026-10-19 12:03
+
+from django.db import migrations, models
+
+
+def populate_page_tree_paths(apps, schema_editor):
+    # Paths of the ancestors of every page with a parent, walked from the roots
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            WITH RECURSIVE tree AS (
+                SELECT id, ''::text AS tree_path FROM pages WHERE parent_id IS NULL
+                UNION ALL
+                SELECT pages.id, tree.tree_path || tree.id::text || '/'
+                FROM pages JOIN tree ON pages.parent_id = tree.id
+            )
+            UPDATE pages SET tree_path = tree.tree_path
+            FROM tree
+            WHERE pages.id = tree.id AND tree.tree_path <> ''
+            """
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0127_issue_activity_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='tree_path',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddIndex(
+            model_name='page',
+            index=models.Index(fields=['tree_path'], name='page_tree_path_idx', opclasses=['text_pattern_ops']),
+        ),
+        migrations.RunPython(populate_page_tree_paths, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 4.2.28 on 2026-10-19 15:40
+
+import hashlib
+import zlib
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+BATCH_SIZE = 500
+
+
+def move_description_binaries(apps, schema_editor):
+    # Compress the binaries of pages and issues into the blob store, sharing
+    # the blobs of identical descriptions
+    DescriptionBlob = apps.get_model("db", "DescriptionBlob")
+
+    for model_name in ("Page", "Issue"):
+        model = apps.get_model("db", model_name)
+        rows = (
+            model.objects.filter(description_binary__isnull=False)
+            .values_list("id", "description_binary")
+            .iterator(chunk_size=BATCH_SIZE)
+        )
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                store_batch(DescriptionBlob, model, batch)
+                batch = []
+        store_batch(DescriptionBlob, model, batch)
+
+
+def store_batch(DescriptionBlob, model, batch):
+    blobs = {}
+    instances = []
+    for pk, content in batch:
+        content = bytes(content)
+        if not content:
+            continue
+        blob_hash = hashlib.sha256(content).hexdigest()
+        if blob_hash not in blobs:
+            data, compression = zlib.compress(content, 6), "zlib"
+            if len(data) >= len(content):
+                data, compression = content, "none"
+            blobs[blob_hash] = DescriptionBlob(
+                hash=blob_hash,
+                data=data,
+                compression=compression,
+                size=len(content),
+                compressed_size=len(data),
+            )
+        instances.append(model(id=pk, description_blob_id=blob_hash))
+    DescriptionBlob.objects.bulk_create(blobs.values(), batch_size=100, ignore_conflicts=True)
+    model.objects.bulk_update(instances, ["description_blob"], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0128_page_tree_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DescriptionBlob',
+            fields=[
+                ('hash', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('data', models.BinaryField()),
+                ('compression', models.CharField(choices=[('none', 'None'), ('zlib', 'Zlib')], default='zlib', max_length=16)),
+                ('size', models.PositiveIntegerField()),
+                ('compressed_size', models.PositiveIntegerField()),
+                ('stored_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Description Blob',
+                'verbose_name_plural': 'Description Blobs',
+                'db_table': 'description_blobs',
+                'indexes': [models.Index(fields=['stored_at'], name='description_blob_stored_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='description_blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='db.descriptionblob'),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='description_blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='db.descriptionblob'),
+        ),
+        migrations.RunPython(move_description_binaries, reverse_code=migrations.RunPython.noop),
+    ]
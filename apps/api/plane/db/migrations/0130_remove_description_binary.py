@@ -0,0 +1,23 @@
+# Generated by Django 4.2.28 on 2026-10-19 15:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Separate from 0129 so the columns are dropped after the foreign keys
+    # written by its data migration are checked
+
+    dependencies = [
+        ('db', '0129_description_blob'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='issue',
+            name='description_binary',
+        ),
+        migrations.RemoveField(
+            model_name='page',
+            name='description_binary',
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.28 on 2026-10-19 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0130_remove_description_binary'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='issuechangelog',
+            name='issue_change_log_project_idx',
+        ),
+        migrations.AddField(
+            model_name='issuechangelog',
+            name='transaction_id',
+            field=models.BigIntegerField(default=0, editable=False),
+            preserve_default=False,
+        ),
+        # Cursors handed out before were row ids, existing rows keep them
+        migrations.RunSQL(
+            "UPDATE issue_change_logs SET transaction_id = id",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='issuechangelog',
+            index=models.Index(fields=['project', 'transaction_id'], name='issue_change_log_project_idx'),
+        ),
+    ]
@@ -2,6 +2,10 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Python imports
+import base64
+import json
+
 # Type imports
 from typing import Any
 
@@ -11,6 +15,8 @@ from django.utils import timezone
 
 # Module imports
 from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.utils.html_processor import strip_tags
+from plane.utils.version_delta import apply_delta, make_delta
 
 
 class TimeAuditModel(models.Model):
@@ -219,3 +225,191 @@ class ChangeTrackerMixin:
         """
         self._original_values = {}
         self._track_fields()
+
+
+class DescriptionBlobMixin(models.Model):
+    """
+    Keeps description_binary out of the row, in the DescriptionBlob store.
+
+    The binary is read from its blob on first access and written to the
+    store when the instance is saved, so querysets of the model never load
+    it unless asked to with select_related("description_blob"). Identical
+    descriptions share one blob.
+    """
+
+    description_blob = models.ForeignKey(
+        "db.DescriptionBlob",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def description_binary(self):
+        if "_pending_description_binary" in self.__dict__:
+            return self._pending_description_binary
+        if self.description_blob_id is None:
+            return None
+        return self.description_blob.read()
+
+    @description_binary.setter
+    def description_binary(self, value):
+        # Strings are base64, as accepted by BinaryField
+        if isinstance(value, str):
+            value = base64.b64decode(value.encode("ascii"))
+        self._pending_description_binary = bytes(value) if value else None
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if "_pending_description_binary" in self.__dict__:
+            content = self.__dict__.pop("_pending_description_binary")
+            blob_model = self._meta.get_field("description_blob").related_model
+            self.description_blob_id = blob_model.store(content) if content else None
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "description_binary" in update_fields:
+            kwargs["update_fields"] = [
+                "description_blob" if field == "description_binary" else field for field in update_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+class DescriptionVersionMixin(models.Model):
+    """
+    Store description versions as periodic full snapshots with compressed
+    deltas in between.
+
+    A snapshot row keeps the description fields as they are. A delta row
+    keeps them empty, points base_version at the latest snapshot of the same
+    owner and stores the changes against it in description_delta, so any
+    version is rebuilt with a single delta application.
+
+    Usage:
+        Define VERSION_OWNER_FIELD with the name of the owner foreign key and
+        store descriptions through set_description(). Call load_description()
+        before reading the description fields of a version.
+    """
+
+    # A new snapshot is written after this many deltas
+    SNAPSHOT_INTERVAL = 10
+    # Or when the delta is no longer much smaller than the full description
+    SNAPSHOT_DELTA_RATIO = 0.5
+    # Minimum number of versions kept per owner when trimming
+    MAX_VERSIONS = 20
+
+    VERSION_OWNER_FIELD = None
+
+    # Versions are only trimmed together with their dependents, the cleanup
+    # task removes a snapshot once no delta references it any more
+    base_version = models.ForeignKey(
+        "self",
+        on_delete=models.DO_NOTHING,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    description_delta = models.BinaryField(null=True)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.base_version_id is None
+
+    @staticmethod
+    def _description_bytes(description: dict) -> list:
+        binary = description.get("description_binary")
+        return [
+            (description.get("description_html") or "").encode(),
+            bytes(binary) if binary is not None else None,
+            json.dumps(description.get("description_json") or {}).encode(),
+        ]
+
+    @staticmethod
+    def _description_from_bytes(values: list) -> dict:
+        return {
+            "description_html": values[0].decode(),
+            "description_binary": values[1],
+            "description_json": json.loads(values[2]),
+        }
+
+    def get_snapshot_description(self) -> dict:
+        return {
+            "description_html": self.description_html,
+            "description_binary": self.description_binary,
+            "description_json": self.description_json,
+        }
+
+    def get_description(self) -> dict:
+        """Return the description of this version, rebuilding it when stored as a delta"""
+        if self.is_snapshot:
+            return self.get_snapshot_description()
+        base = self.base_version.get_snapshot_description()
+        values = apply_delta(self._description_bytes(base), bytes(self.description_delta))
+        return self._description_from_bytes(values)
+
+    def load_description(self) -> None:
+        """Populate the description fields of a delta version in memory"""
+        if self.is_snapshot:
+            return
+        description = self.get_description()
+        for field, value in description.items():
+            setattr(self, field, value)
+        self.description_stripped = strip_tags(self.description_html) if self.description_html else None
+
+    def set_description(self, description: dict) -> None:
+        """Store a description on an unsaved or latest version, as a delta when worthwhile"""
+        base = self._get_delta_base()
+        if base is not None:
+            targets = self._description_bytes(description)
+            delta = make_delta(self._description_bytes(base.get_snapshot_description()), targets)
+            full_size = sum(len(value) for value in targets if value is not None)
+            if len(delta) < full_size * self.SNAPSHOT_DELTA_RATIO:
+                self.base_version = base
+                self.description_delta = delta
+                self.description_html = ""
+                self.description_binary = None
+                self.description_json = {}
+                self.description_stripped = None
+                return
+
+        self.base_version = None
+        self.description_delta = None
+        for field, value in description.items():
+            setattr(self, field, value)
+        self.description_stripped = strip_tags(self.description_html) if self.description_html else None
+
+    def _get_delta_base(self):
+        owner_id = getattr(self, f"{self.VERSION_OWNER_FIELD}_id")
+        versions = type(self).objects.filter(**{f"{self.VERSION_OWNER_FIELD}_id": owner_id}).exclude(pk=self.pk)
+        snapshot = versions.filter(base_version__isnull=True).order_by("-created_at").first()
+        if snapshot is None:
+            return None
+
+        deltas = versions.filter(base_version=snapshot).count()
+        if deltas >= self.SNAPSHOT_INTERVAL - 1:
+            return None
+        return snapshot
+
+    @classmethod
+    def trim_versions(cls, owner_id) -> int:
+        """
+        Keep at least MAX_VERSIONS versions of an owner and soft delete the
+        older ones with a single update. The cut is moved back to the snapshot
+        the oldest kept version depends on, so up to SNAPSHOT_INTERVAL - 1
+        extra versions are kept.
+        """
+        versions = cls.objects.filter(**{f"{cls.VERSION_OWNER_FIELD}_id": owner_id}).order_by("-created_at")
+        oldest_kept = list(
+            versions.values("created_at", "base_version__created_at")[cls.MAX_VERSIONS - 1 : cls.MAX_VERSIONS]
+        )
+        if not oldest_kept:
+            return 0
+
+        boundary = oldest_kept[0]["base_version__created_at"] or oldest_kept[0]["created_at"]
+        return versions.filter(created_at__lt=boundary).delete()
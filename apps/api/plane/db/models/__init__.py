@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueAnalyticsRollup
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
@@ -34,6 +34,7 @@ from .issue import (
     IssueActivity,
     IssueAssignee,
     IssueBlocker,
+    IssueChangeLog,
     IssueComment,
     IssueLabel,
     IssueLink,
@@ -47,7 +48,12 @@ from .issue import (
     IssueDescriptionVersion,
 )
 from .module import Module, ModuleIssue, ModuleLink, ModuleMember, ModuleUserProperties
-from .notification import EmailNotificationLog, Notification, UserNotificationPreference
+from .notification import (
+    EmailNotificationLog,
+    Notification,
+    NotificationSenderType,
+    UserNotificationPreference,
+)
 from .page import Page, PageLabel, PageLog, ProjectPage, PageVersion
 from .project import (
     Project,
@@ -94,4 +100,4 @@ from .device import Device, DeviceSession
 
 from .sticky import Sticky
 
-from .description import Description, DescriptionVersion
+from .description import Description, DescriptionBlob, DescriptionVersion
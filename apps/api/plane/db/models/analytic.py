@@ -6,6 +6,7 @@
 from django.db import models
 
 from .base import BaseModel
+from ..mixins import TimeAuditModel
 
 
 class AnalyticView(BaseModel):
@@ -24,3 +25,56 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class IssueAnalyticsRollup(TimeAuditModel):
+    """
+    Daily issue counts per project, bucketed by the UTC creation date and the
+    issue's current state and priority. Rows with an empty dimension hold one
+    count per issue, the other dimensions repeat the bucket per assignee,
+    label, cycle or module. Maintained by plane.bgtasks.analytics_rollup_task.
+    """
+
+    DIMENSION_NONE = ""
+    DIMENSION_ASSIGNEE = "assignee"
+    DIMENSION_LABEL = "label"
+    DIMENSION_CYCLE = "cycle"
+    DIMENSION_MODULE = "module"
+
+    DIMENSION_CHOICES = (
+        (DIMENSION_NONE, "None"),
+        (DIMENSION_ASSIGNEE, "Assignee"),
+        (DIMENSION_LABEL, "Label"),
+        (DIMENSION_CYCLE, "Cycle"),
+        (DIMENSION_MODULE, "Module"),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="issue_analytics_rollups")
+    project = models.ForeignKey("db.Project", on_delete=models.CASCADE, related_name="issue_analytics_rollups")
+    date = models.DateField()
+    state = models.ForeignKey(
+        "db.State",
+        on_delete=models.CASCADE,
+        null=True,
+        related_name="issue_analytics_rollups",
+    )
+    state_group = models.CharField(max_length=20, null=True)
+    priority = models.CharField(max_length=30, null=True)
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES, default=DIMENSION_NONE, blank=True)
+    dimension_id = models.UUIDField(null=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate_total = models.FloatField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Analytics Rollup"
+        verbose_name_plural = "Issue Analytics Rollups"
+        db_table = "issue_analytics_rollups"
+        ordering = ("-date",)
+        indexes = [
+            models.Index(fields=["workspace", "dimension", "date"], name="issue_rollup_ws_dim_date_idx"),
+            models.Index(fields=["project", "date"], name="issue_rollup_project_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} {self.date} {self.dimension or 'issues'}"
@@ -2,8 +2,16 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Python imports
+import hashlib
+import zlib
+
+# Django imports
 from django.db import models
+from django.db.models.functions import Substr
 from django.utils.html import strip_tags
+
+# Module imports
 from .workspace import WorkspaceBaseModel
 
 
@@ -54,3 +62,118 @@ class DescriptionVersion(WorkspaceBaseModel):
             else strip_tags(self.description_html)
         )
         super(DescriptionVersion, self).save(*args, **kwargs)
+
+
+class DescriptionBlob(models.Model):
+    """
+    Content addressed store of compressed description binaries. Blobs are
+    immutable and keyed by the sha256 of their content, so identical
+    descriptions share a row and the hash doubles as an ETag. Storing a blob
+    again refreshes stored_at, the cleanup task removes the blobs no page or
+    issue references once stored_at is old enough.
+    """
+
+    COMPRESSION_NONE = "none"
+    COMPRESSION_ZLIB = "zlib"
+
+    COMPRESSION_CHOICES = ((COMPRESSION_NONE, "None"), (COMPRESSION_ZLIB, "Zlib"))
+
+    # Compressed bytes read from the database per query when streaming
+    STREAM_CHUNK_SIZE = 256 * 1024
+    EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+
+    hash = models.CharField(max_length=64, primary_key=True)
+    data = models.BinaryField()
+    compression = models.CharField(max_length=16, choices=COMPRESSION_CHOICES, default=COMPRESSION_ZLIB)
+    size = models.PositiveIntegerField()
+    compressed_size = models.PositiveIntegerField()
+    stored_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Description Blob"
+        verbose_name_plural = "Description Blobs"
+        db_table = "description_blobs"
+        indexes = [models.Index(fields=["stored_at"], name="description_blob_stored_idx")]
+
+    def __str__(self):
+        return self.hash
+
+    @staticmethod
+    def get_hash(content):
+        return hashlib.sha256(content).hexdigest()
+
+    @classmethod
+    def from_content(cls, content):
+        """An unsaved blob of content, compressed unless it does not get smaller"""
+        content = bytes(content)
+        data, compression = zlib.compress(content, 6), cls.COMPRESSION_ZLIB
+        if len(data) >= len(content):
+            data, compression = content, cls.COMPRESSION_NONE
+        return cls(
+            hash=cls.get_hash(content),
+            data=data,
+            compression=compression,
+            size=len(content),
+            compressed_size=len(data),
+        )
+
+    @classmethod
+    def store_many(cls, contents):
+        """Store contents in one query, returns their hashes"""
+        blobs = [cls.from_content(content) for content in contents]
+        unique_blobs = {blob.hash: blob for blob in blobs}
+        cls.objects.bulk_create(
+            unique_blobs.values(),
+            batch_size=100,
+            update_conflicts=True,
+            unique_fields=["hash"],
+            update_fields=["stored_at"],
+        )
+        return [blob.hash for blob in blobs]
+
+    @classmethod
+    def store(cls, content):
+        return cls.store_many([content])[0]
+
+    def read(self):
+        """The uncompressed content"""
+        data = bytes(self.data)
+        return zlib.decompress(data) if self.compression == self.COMPRESSION_ZLIB else data
+
+    @classmethod
+    def stream(cls, blob_hash, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Yield the uncompressed content of a blob, reading the compressed
+        bytes from the database a chunk at a time
+        """
+        blob = (
+            cls.objects.filter(pk=blob_hash)
+            .annotate(chunk=Substr("data", 1, chunk_size, output_field=models.BinaryField()))
+            .values("compression", "compressed_size", "chunk")
+            .first()
+        )
+        if blob is None:
+            return
+
+        decompressor = zlib.decompressobj() if blob["compression"] == cls.COMPRESSION_ZLIB else None
+        chunk, offset = blob["chunk"], 0
+        while True:
+            chunk = bytes(chunk)
+            data = decompressor.decompress(chunk) if decompressor else chunk
+            if data:
+                yield data
+            offset += len(chunk)
+            if not chunk or offset >= blob["compressed_size"]:
+                break
+            chunk = (
+                cls.objects.filter(pk=blob_hash)
+                .annotate(chunk=Substr("data", offset + 1, chunk_size, output_field=models.BinaryField()))
+                .values_list("chunk", flat=True)
+                .first()
+            )
+            if chunk is None:
+                break
+        if decompressor:
+            data = decompressor.flush()
+            if data:
+                yield data
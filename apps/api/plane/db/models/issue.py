@@ -13,16 +13,20 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction, connection
 from django.utils import timezone
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django import apps
 
 # Module imports
 from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
 from plane.utils.exception_logger import log_exception
+from plane.utils.public_board_cache import invalidate_public_boards_on_commit
+from plane.utils.dependency_graph import invalidate_dependency_graphs_on_commit
 from .project import ProjectBaseModel
 from plane.utils.uuid import convert_uuid_to_integer
 from .description import Description
-from plane.db.mixins import ChangeTrackerMixin
+from plane.db.mixins import ChangeTrackerMixin, DescriptionBlobMixin, DescriptionVersionMixin
 from .state import StateGroup
 
 
@@ -101,7 +105,7 @@ class IssueManager(SoftDeletionManager):
         )
 
 
-class Issue(ProjectBaseModel):
+class Issue(DescriptionBlobMixin, ProjectBaseModel):
     PRIORITY_CHOICES = (
         ("urgent", "Urgent"),
         ("high", "High"),
@@ -135,7 +139,6 @@ class Issue(ProjectBaseModel):
     description_json = models.JSONField(blank=True, default=dict)
     description_html = models.TextField(blank=True, default="<p></p>")
     description_stripped = models.TextField(blank=True, null=True)
-    description_binary = models.BinaryField(null=True)
     priority = models.CharField(
         max_length=30,
         choices=PRIORITY_CHOICES,
@@ -311,6 +314,12 @@ class IssueRelation(ProjectBaseModel):
         return f"{self.issue.name} {self.related_issue.name}"
 
 
+@receiver(post_save, sender=IssueRelation)
+@receiver(post_delete, sender=IssueRelation)
+def invalidate_dependency_graphs(sender, instance, **kwargs):
+    invalidate_dependency_graphs_on_commit([instance.project_id])
+
+
 class IssueMention(ProjectBaseModel):
     issue = models.ForeignKey(Issue, on_delete=models.CASCADE, related_name="issue_mention")
     mention = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="issue_mention")
@@ -432,6 +441,24 @@ class IssueActivity(ProjectBaseModel):
         verbose_name_plural = "Issue Activities"
         db_table = "issue_activities"
         ordering = ("-created_at",)
+        indexes = [
+            # Seeks of the newest first activity feeds
+            models.Index(
+                fields=["issue", "created_at", "id"],
+                condition=Q(deleted_at__isnull=True),
+                name="issue_activity_issue_feed_idx",
+            ),
+            models.Index(
+                fields=["project", "created_at", "id"],
+                condition=Q(deleted_at__isnull=True),
+                name="issue_activity_proj_feed_idx",
+            ),
+            models.Index(
+                fields=["actor", "created_at", "id"],
+                condition=Q(deleted_at__isnull=True),
+                name="issue_activity_actor_feed_idx",
+            ),
+        ]
 
     def __str__(self):
         """Return issue of the comment"""
@@ -769,7 +796,9 @@ class IssueVersion(ProjectBaseModel):
             return False
 
 
-class IssueDescriptionVersion(ProjectBaseModel):
+class IssueDescriptionVersion(DescriptionVersionMixin, ProjectBaseModel):
+    VERSION_OWNER_FIELD = "issue"
+
     issue = models.ForeignKey("db.Issue", on_delete=models.CASCADE, related_name="description_versions")
     description_binary = models.BinaryField(null=True)
     description_html = models.TextField(blank=True, default="<p></p>")
@@ -793,7 +822,7 @@ class IssueDescriptionVersion(ProjectBaseModel):
             """
             Log the issue description version
             """
-            cls.objects.create(
+            version = cls(
                 workspace_id=issue.workspace_id,
                 project_id=issue.project_id,
                 created_by_id=issue.created_by_id,
@@ -801,12 +830,107 @@ class IssueDescriptionVersion(ProjectBaseModel):
                 owned_by_id=user,
                 last_saved_at=timezone.now(),
                 issue_id=issue.id,
-                description_binary=issue.description_binary,
-                description_html=issue.description_html,
-                description_stripped=issue.description_stripped,
-                description_json=issue.description_json,
             )
+            version.set_description(
+                {
+                    "description_binary": issue.description_binary,
+                    "description_html": issue.description_html,
+                    "description_json": issue.description_json,
+                }
+            )
+            version.save()
+            cls.trim_versions(issue.id)
             return True
         except Exception as e:
             log_exception(e)
             return False
+
+
+class IssueChangeLog(models.Model):
+    """
+    Append-only feed of issue changes used for incremental sync.
+    Rows carry the id of the transaction that wrote them and clients resume
+    from the last transaction id they have seen. Ids and timestamps are
+    assigned before commit, so they are not in commit order, but a
+    transaction below the xmin of a snapshot has always finished. Rows only
+    say that an issue changed; readers resolve the current state of the
+    issue and send a tombstone when it is no longer visible (deleted,
+    archived, converted to draft or moved to triage).
+    """
+
+    CHANGE_CREATED = "created"
+    CHANGE_UPDATED = "updated"
+    CHANGE_DELETED = "deleted"
+    CHANGE_ARCHIVED = "archived"
+
+    CHANGE_CHOICES = (
+        (CHANGE_CREATED, "Created"),
+        (CHANGE_UPDATED, "Updated"),
+        (CHANGE_DELETED, "Deleted"),
+        (CHANGE_ARCHIVED, "Archived"),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="issue_change_logs")
+    project = models.ForeignKey("db.Project", on_delete=models.CASCADE, related_name="issue_change_logs")
+    # Not a foreign key so tombstones outlive hard deleted issues
+    issue_id = models.UUIDField()
+    change = models.CharField(max_length=20, choices=CHANGE_CHOICES)
+    # pg_current_xact_id() of the writing transaction
+    transaction_id = models.BigIntegerField(editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Issue Change Log"
+        verbose_name_plural = "Issue Change Logs"
+        db_table = "issue_change_logs"
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=["project", "transaction_id"], name="issue_change_log_project_idx"),
+            models.Index(fields=["created_at"], name="issue_change_log_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.id} {self.change} {self.issue_id}"
+
+    @classmethod
+    def record(cls, issues, change):
+        """Append one change per issue, issues are (id, project_id, workspace_id) tuples"""
+        try:
+            # The transaction id is read in the transaction inserting the rows
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT pg_current_xact_id()::text::bigint")
+                    transaction_id = cursor.fetchone()[0]
+                changes = cls.objects.bulk_create(
+                    [
+                        cls(
+                            issue_id=issue_id,
+                            project_id=project_id,
+                            workspace_id=workspace_id,
+                            change=change,
+                            transaction_id=transaction_id,
+                        )
+                        for issue_id, project_id, workspace_id in issues
+                    ],
+                    batch_size=1000,
+                )
+            # Published boards of these projects are served from snapshots
+            invalidate_public_boards_on_commit(log.project_id for log in changes)
+            # The schedule of the dependency graphs follows the dates of the issues
+            invalidate_dependency_graphs_on_commit(log.project_id for log in changes)
+        except Exception as e:
+            log_exception(e)
+
+
+@receiver(post_save, sender=Issue)
+def record_issue_change(sender, instance, created, **kwargs):
+    if created:
+        change = IssueChangeLog.CHANGE_CREATED
+    elif instance.deleted_at is not None:
+        change = IssueChangeLog.CHANGE_DELETED
+    elif instance.archived_at is not None:
+        change = IssueChangeLog.CHANGE_ARCHIVED
+    else:
+        change = IssueChangeLog.CHANGE_UPDATED
+    IssueChangeLog.record([(instance.id, instance.project_id, instance.workspace_id)], change)
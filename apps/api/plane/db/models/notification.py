@@ -10,6 +10,14 @@ from django.db import models
 from .base import BaseModel
 
 
+class NotificationSenderType(models.TextChoices):
+    CREATED = "created", "Created"
+    ASSIGNED = "assigned", "Assigned"
+    SUBSCRIBED = "subscribed", "Subscribed"
+    MENTIONED = "mentioned", "Mentioned"
+    OTHER = "other", "Other"
+
+
 class Notification(BaseModel):
     workspace = models.ForeignKey("db.Workspace", related_name="notifications", on_delete=models.CASCADE)
     project = models.ForeignKey("db.Project", related_name="notifications", on_delete=models.CASCADE, null=True)
@@ -21,6 +29,12 @@ class Notification(BaseModel):
     message_html = models.TextField(blank=True, default="<p></p>")
     message_stripped = models.TextField(blank=True, null=True)
     sender = models.CharField(max_length=255)
+    # Last segment of the sender, kept in its own column so it can be indexed
+    sender_type = models.CharField(
+        max_length=20,
+        choices=NotificationSenderType.choices,
+        default=NotificationSenderType.OTHER,
+    )
     triggered_by = models.ForeignKey(
         "db.User",
         related_name="triggered_notifications",
@@ -62,12 +76,44 @@ class Notification(BaseModel):
                 fields=["workspace", "entity_identifier", "entity_name"],
                 name="notif_entity_lookup_idx",
             ),
+            models.Index(
+                fields=["receiver", "workspace", "sender_type"],
+                name="notif_unread_sender_type_idx",
+                condition=models.Q(
+                    read_at__isnull=True,
+                    archived_at__isnull=True,
+                    snoozed_till__isnull=True,
+                    deleted_at__isnull=True,
+                ),
+            ),
         ]
 
     def __str__(self):
         """Return name of the notifications"""
         return f"{self.receiver.email} <{self.workspace.name}>"
 
+    @staticmethod
+    def get_sender_type(sender):
+        sender_type = (sender or "").rsplit(":", 1)[-1]
+        if sender_type in NotificationSenderType.values:
+            return sender_type
+        return NotificationSenderType.OTHER
+
+    @property
+    def is_mention(self):
+        return self.sender_type == NotificationSenderType.MENTIONED
+
+    @property
+    def is_unread(self):
+        """Whether the notification is counted in the unread counters"""
+        return (
+            self.read_at is None and self.archived_at is None and self.snoozed_till is None and self.deleted_at is None
+        )
+
+    def save(self, *args, **kwargs):
+        self.sender_type = self.get_sender_type(self.sender)
+        super(Notification, self).save(*args, **kwargs)
+
 
 def get_default_preference():
     return {
@@ -8,10 +8,14 @@ from django.conf import settings
 from django.utils import timezone
 
 # Django imports
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
 
 # Module imports
 from plane.utils.html_processor import strip_tags
+from plane.db.mixins import ChangeTrackerMixin, DescriptionBlobMixin, DescriptionVersionMixin
 
 from .base import BaseModel
 
@@ -20,17 +24,17 @@ def get_view_props():
     return {"full_width": False}
 
 
-class Page(BaseModel):
+class Page(ChangeTrackerMixin, DescriptionBlobMixin, BaseModel):
     PRIVATE_ACCESS = 1
     PUBLIC_ACCESS = 0
     DEFAULT_SORT_ORDER = 65535
+    TRACKED_FIELDS = ["parent_id", "tree_path"]
 
     ACCESS_CHOICES = ((PRIVATE_ACCESS, "Private"), (PUBLIC_ACCESS, "Public"))
 
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="pages")
     name = models.TextField(blank=True)
     description_json = models.JSONField(default=dict, blank=True)
-    description_binary = models.BinaryField(null=True)
     description_html = models.TextField(blank=True, default="<p></p>")
     description_stripped = models.TextField(blank=True, null=True)
     owned_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="pages")
@@ -53,6 +57,8 @@ class Page(BaseModel):
     moved_to_page = models.UUIDField(null=True, blank=True)
     moved_to_project = models.UUIDField(null=True, blank=True)
     sort_order = models.FloatField(default=DEFAULT_SORT_ORDER)
+    # Ids of the ancestors, root first, each followed by a slash. Empty for root pages
+    tree_path = models.TextField(default="", blank=True)
 
     external_id = models.CharField(max_length=255, null=True, blank=True)
     external_source = models.CharField(max_length=255, null=True, blank=True)
@@ -62,11 +68,29 @@ class Page(BaseModel):
         verbose_name_plural = "Pages"
         db_table = "pages"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["tree_path"], name="page_tree_path_idx", opclasses=["text_pattern_ops"]),
+        ]
 
     def __str__(self):
         """Return owner email and page name"""
         return f"{self.owned_by.email} <{self.name}>"
 
+    @property
+    def descendants_path(self):
+        """The tree_path prefix of every descendant of the page"""
+        return f"{self.tree_path}{self.id}/"
+
+    def get_tree_path(self):
+        if self.parent_id is None:
+            return ""
+        parent_path = Page.all_objects.filter(pk=self.parent_id).values_list("tree_path", flat=True).first()
+        if parent_path is None:
+            return ""
+        if str(self.id) in parent_path.split("/") or self.parent_id == self.id:
+            raise ValidationError("A page cannot be moved under itself or its descendants")
+        return f"{parent_path}{self.parent_id}/"
+
     def save(self, *args, **kwargs):
         # Strip the html tags using html parser
         self.description_stripped = (
@@ -74,8 +98,34 @@ class Page(BaseModel):
             if (self.description_html == "" or self.description_html is None)
             else strip_tags(self.description_html)
         )
+
+        # Keep the path of the page and of its descendants in sync with the parent
+        update_fields = kwargs.get("update_fields")
+        parent_saved = update_fields is None or {"parent", "parent_id"} & set(update_fields)
+        old_descendants_path = None
+        if self._state.adding:
+            self.tree_path = self.get_tree_path()
+        elif parent_saved and self.has_changed("parent_id"):
+            if "tree_path" in self._original_values:
+                old_tree_path = self._original_values["tree_path"]
+            else:
+                old_tree_path = Page.all_objects.filter(pk=self.pk).values_list("tree_path", flat=True).first()
+            old_descendants_path = f"{old_tree_path or ''}{self.id}/"
+            self.tree_path = self.get_tree_path()
+            if update_fields is not None:
+                kwargs["update_fields"] = [*update_fields, "tree_path"]
+
         super(Page, self).save(*args, **kwargs)
 
+        if old_descendants_path is not None and old_descendants_path != self.descendants_path:
+            Page.all_objects.filter(tree_path__startswith=old_descendants_path).update(
+                tree_path=Concat(
+                    Value(self.descendants_path),
+                    Substr("tree_path", len(old_descendants_path) + 1),
+                    output_field=models.TextField(),
+                )
+            )
+
 
 class PageLog(BaseModel):
     TYPE_CHOICES = (
@@ -155,7 +205,9 @@ class ProjectPage(BaseModel):
         return f"{self.project.name} {self.page.name}"
 
 
-class PageVersion(BaseModel):
+class PageVersion(DescriptionVersionMixin, BaseModel):
+    VERSION_OWNER_FIELD = "page"
+
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="page_versions")
     page = models.ForeignKey("db.Page", on_delete=models.CASCADE, related_name="page_versions")
     last_saved_at = models.DateTimeField(default=timezone.now)
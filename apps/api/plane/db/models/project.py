@@ -12,6 +12,8 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.mixins import AuditModel
@@ -177,6 +179,14 @@ class Project(BaseModel):
         return super().save(*args, **kwargs)
 
 
+@receiver(post_save, sender=Project)
+def invalidate_project_timezone(sender, instance, **kwargs):
+    # Module imports
+    from plane.utils.timezone_converter import forget_project_timezone
+
+    forget_project_timezone(instance.id)
+
+
 class ProjectBaseModel(BaseModel):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="project_%(class)s")
     workspace = models.ForeignKey("db.Workspace", on_delete=models.CASCADE, related_name="workspace_%(class)s")
@@ -26,7 +26,10 @@ from plane.license.models import InstanceConfiguration
 from plane.license.api.serializers import InstanceConfigurationSerializer
 from plane.license.utils.encryption import encrypt_data
 from plane.utils.cache import cache_response, invalidate_cache
-from plane.license.utils.instance_value import get_email_configuration
+from plane.license.utils.instance_value import (
+    get_email_configuration,
+    invalidate_configuration_cache,
+)
 
 
 class InstanceConfigurationEndpoint(BaseAPIView):
@@ -53,6 +56,8 @@ class InstanceConfigurationEndpoint(BaseAPIView):
             bulk_configurations.append(configuration)
 
         InstanceConfiguration.objects.bulk_update(bulk_configurations, ["value"], batch_size=100)
+        # bulk_update does not send post_save, so refresh the cached configurations here
+        invalidate_configuration_cache()
 
         serializer = InstanceConfigurationSerializer(configurations, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -76,6 +81,7 @@ class DisableEmailFeatureEndpoint(BaseAPIView):
                     ]
                 )
             ).update(value=Case(When(key="ENABLE_SMTP", then=Value("0")), default=Value("")))
+            invalidate_configuration_cache()
             return Response(status=status.HTTP_200_OK)
         except Exception:
             return Response(
@@ -0,0 +1,29 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Third party imports
+from rest_framework import status
+from rest_framework.response import Response
+
+# Module imports
+from .base import BaseAPIView
+from plane.license.api.permissions import InstanceAdminPermission
+from plane.settings.redis import redis_pool_metrics
+from plane.utils.profiler import get_route_profiles
+
+
+class InstanceRequestProfileEndpoint(BaseAPIView):
+    permission_classes = [InstanceAdminPermission]
+
+    def get(self, request):
+        routes = get_route_profiles()
+
+        route_filter = request.GET.get("route")
+        if route_filter:
+            routes = [route for route in routes if route_filter in route["route"]]
+
+        return Response(
+            {"routes": routes, "redis_pool": redis_pool_metrics()},
+            status=status.HTTP_200_OK,
+        )
@@ -6,8 +6,10 @@
 from enum import Enum
 
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.models import BaseModel
@@ -83,6 +85,15 @@ class InstanceConfiguration(BaseModel):
         ordering = ("-created_at",)
 
 
+@receiver(post_save, sender=InstanceConfiguration)
+@receiver(post_delete, sender=InstanceConfiguration)
+def invalidate_instance_configuration(sender, instance, **kwargs):
+    # Module imports
+    from plane.license.utils.instance_value import invalidate_configuration_cache
+
+    transaction.on_commit(invalidate_configuration_cache)
+
+
 class ChangeLog(BaseModel):
     """Change Log model to store the release changelogs made in the application."""
 
@@ -4,6 +4,10 @@
 
 # Python imports
 import os
+import threading
+
+# Third party imports
+from redis.exceptions import RedisError
 
 # Django imports
 from django.conf import settings
@@ -11,6 +15,67 @@ from django.conf import settings
 # Module imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+CONFIGURATION_VERSION_KEY = "instance_configuration_version"
+
+TRUTHY_VALUES = {"1", "true", "yes", "on"}
+
+_cache_lock = threading.Lock()
+_configuration_cache = {"version": None, "values": None}
+
+
+def _get_configuration_version():
+    """Return the shared configuration version, or None if redis is unavailable"""
+    try:
+        version = redis_instance().get(CONFIGURATION_VERSION_KEY)
+    except RedisError as e:
+        log_exception(e, warning=True)
+        return None
+    return version.decode() if version else "0"
+
+
+def _load_configurations():
+    # Decrypt once per load so lookups are plain dict reads
+    configurations = {}
+    for item in InstanceConfiguration.objects.values("key", "value", "is_encrypted"):
+        if item["is_encrypted"]:
+            configurations[item["key"]] = decrypt_data(item["value"])
+        else:
+            configurations[item["key"]] = item["value"]
+    return configurations
+
+
+def get_configurations():
+    """
+    Return every instance configuration as a decrypted dict, served from an
+    in-process cache that is reloaded whenever the version in redis changes.
+    """
+    version = _get_configuration_version()
+    if version is None:
+        return _load_configurations()
+
+    cached = _configuration_cache
+    if cached["version"] == version and cached["values"] is not None:
+        return cached["values"]
+
+    with _cache_lock:
+        if _configuration_cache["version"] != version or _configuration_cache["values"] is None:
+            _configuration_cache["values"] = _load_configurations()
+            _configuration_cache["version"] = version
+        return _configuration_cache["values"]
+
+
+def invalidate_configuration_cache():
+    """Bump the shared version so every process reloads its configurations"""
+    with _cache_lock:
+        _configuration_cache["version"] = None
+        _configuration_cache["values"] = None
+    try:
+        redis_instance().incr(CONFIGURATION_VERSION_KEY)
+    except RedisError as e:
+        log_exception(e, warning=True)
 
 
 # Helper function to return value from the passed key
@@ -18,17 +83,11 @@ def get_configuration_value(keys):
     environment_list = []
     if settings.SKIP_ENV_VAR:
         # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values("key", "value", "is_encrypted")
+        configurations = get_configurations()
 
         for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(decrypt_data(item.get("value")))
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
+            if key.get("key") in configurations:
+                environment_list.append(configurations[key.get("key")])
             else:
                 environment_list.append(key.get("default"))
     else:
@@ -39,6 +98,26 @@ def get_configuration_value(keys):
     return tuple(environment_list)
 
 
+def get_configuration_str(key, default=None):
+    (value,) = get_configuration_value([{"key": key, "default": default}])
+    return value
+
+
+def get_configuration_bool(key, default=False):
+    value = get_configuration_str(key, None)
+    if value is None or value == "":
+        return default
+    return str(value).strip().lower() in TRUTHY_VALUES
+
+
+def get_configuration_int(key, default=0):
+    value = get_configuration_str(key, None)
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def get_email_configuration():
     return get_configuration_value(
         [
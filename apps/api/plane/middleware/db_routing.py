@@ -11,15 +11,27 @@ read replicas or the primary database based on HTTP method and view configuratio
 import logging
 from typing import Callable, Optional
 
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 
 from plane.utils.core import (
     set_use_read_replica,
+    set_read_replica_alias,
     clear_read_replica_context,
 )
+from plane.utils.core.replicas import (
+    get_sticky_key,
+    has_recent_write,
+    mark_recent_write,
+    release_replica,
+    select_replica,
+)
 
 logger = logging.getLogger("plane.api")
 
+# ViewSet actions that only read and are safe to serve from a replica
+DEFAULT_SAFE_ACTIONS = {"list", "retrieve"}
+
 
 class ReadReplicaRoutingMiddleware:
     """
@@ -29,7 +41,11 @@ class ReadReplicaRoutingMiddleware:
     • GET requests:
         - View has use_read_replica=False ➜ Primary database
         - View has use_read_replica=True ➜ Read replica
-        - View has no use_read_replica attribute ➜ Primary database (safe default)
+        - View has no use_read_replica attribute (or None) ➜ Primary database,
+          unless READ_REPLICA_AUTO_OPT_IN is enabled and the request maps to
+          one of the READ_REPLICA_SAFE_ACTIONS of a DRF ViewSet
+    • A client that wrote within READ_REPLICA_STICKY_SECONDS ➜ Primary database
+    • Every replica lagging beyond READ_REPLICA_MAX_LAG_SECONDS ➜ Primary database
     The middleware supports both Django CBVs and DRF APIViews/ViewSets.
     Context is properly isolated per request to prevent data leakage.
     """
@@ -54,17 +70,22 @@ class ReadReplicaRoutingMiddleware:
             HttpResponse: The HTTP response from the view
         """
         # For non-read operations, set primary database immediately
-        if request.method not in self.READ_ONLY_METHODS:
+        is_write = request.method not in self.READ_ONLY_METHODS
+        if is_write:
             set_use_read_replica(False)
             logger.debug(f"Routing {request.method} {request.path} to primary database")
 
         try:
             # Process the request through the middleware chain
             response = self.get_response(request)
+            # Keep this client on the primary until its write has replicated
+            if is_write and response.status_code < 400:
+                mark_recent_write(get_sticky_key(request))
             return response
         finally:
             # Always clean up context, even if an exception occurs
             # This prevents context leakage between requests
+            release_replica(getattr(request, "_read_replica_alias", None))
             clear_read_replica_context()
 
     def process_view(
@@ -86,7 +107,9 @@ class ReadReplicaRoutingMiddleware:
         """
         # Only process read operations (write operations already handled in __call__)
         if request.method in self.READ_ONLY_METHODS:
-            use_replica = self._should_use_read_replica(view_func)
+            use_replica = self._should_use_read_replica(view_func) or self._is_auto_eligible(request, view_func)
+            if use_replica:
+                use_replica = self._assign_replica(request)
             set_use_read_replica(use_replica)
 
             db_type = "read replica" if use_replica else "primary database"
@@ -112,6 +135,47 @@ class ReadReplicaRoutingMiddleware:
 
         return bool(use_replica_attr)
 
+    def _is_auto_eligible(self, request: HttpRequest, view_func: Callable) -> bool:
+        """
+        Determine if a view that did not declare use_read_replica can be
+        routed to a replica automatically.
+        Only DRF ViewSet actions listed in READ_REPLICA_SAFE_ACTIONS qualify,
+        and only when READ_REPLICA_AUTO_OPT_IN is enabled.
+        Args:
+            request: The HTTP request object
+            view_func: The view function to inspect
+        Returns:
+            bool: True if the request can be served from a replica
+        """
+        if not getattr(settings, "READ_REPLICA_AUTO_OPT_IN", False) or view_func is None:
+            return False
+
+        if self._get_use_replica_attribute(view_func) is not None:
+            return False
+
+        safe_actions = getattr(settings, "READ_REPLICA_SAFE_ACTIONS", DEFAULT_SAFE_ACTIONS)
+        return get_view_action(view_func, request.method) in safe_actions
+
+    def _assign_replica(self, request: HttpRequest) -> bool:
+        """
+        Pick a replica for the request, honouring stickiness and lag.
+        Args:
+            request: The HTTP request object
+        Returns:
+            bool: True if a replica was assigned, False to stay on primary
+        """
+        if has_recent_write(get_sticky_key(request)):
+            logger.debug(f"Keeping {request.path} on primary after a recent write")
+            return False
+
+        alias = select_replica()
+        if alias is None:
+            return False
+
+        request._read_replica_alias = alias
+        set_read_replica_alias(alias)
+        return True
+
     def _get_use_replica_attribute(self, view_func: Callable) -> Optional[bool]:
         """
         Extract the use_read_replica attribute from various view types.
@@ -162,3 +226,42 @@ class ReadReplicaRoutingMiddleware:
 
         # Return None to let the exception continue propagating
         return None
+
+
+def get_view_action(view_func: Callable, method: str) -> Optional[str]:
+    """
+    Return the ViewSet action a request method maps to, e.g. "list".
+    Args:
+        view_func: The view function produced by a DRF router
+        method: The HTTP method of the request
+    Returns:
+        Optional[str]: The action name, or None for non-ViewSet views
+    """
+    actions = getattr(view_func, "actions", None)
+    if not isinstance(actions, dict):
+        return None
+    return actions.get(method.lower())
+
+
+def describe_view_routing(view_func: Callable, method: str = "GET") -> str:
+    """
+    Describe how a read request to a view would be routed.
+    Used by the read_replica_report management command.
+    Args:
+        view_func: The view function to inspect
+        method: The HTTP method to evaluate
+    Returns:
+        str: One of "replica", "replica (auto)", "primary (auto eligible)",
+             "primary (explicit)" or "primary"
+    """
+    middleware = ReadReplicaRoutingMiddleware(lambda request: None)
+    use_replica = middleware._get_use_replica_attribute(view_func)
+    if use_replica is not None:
+        return "replica" if use_replica else "primary (explicit)"
+
+    action = get_view_action(view_func, method)
+    if action in getattr(settings, "READ_REPLICA_SAFE_ACTIONS", DEFAULT_SAFE_ACTIONS):
+        if getattr(settings, "READ_REPLICA_AUTO_OPT_IN", False):
+            return "replica (auto)"
+        return "primary (auto eligible)"
+    return "primary"
@@ -57,18 +57,25 @@ class RequestLoggerMiddleware:
 
         user_agent = request.META.get("HTTP_USER_AGENT", "")
 
+        extra = {
+            "path": request.path,
+            "method": request.method,
+            "status_code": response.status_code,
+            "duration_ms": int(duration * 1000),
+            "remote_addr": get_client_ip(request),
+            "user_agent": user_agent,
+            "user_id": user_id,
+        }
+
+        # Sampled requests carry the profile collected by RequestProfilerMiddleware
+        profile = getattr(request, "_request_profile", None)
+        if profile is not None:
+            extra.update(profile.as_log_fields())
+
         # Log the request information
         api_logger.info(
             f"{request.method} {request.get_full_path()} {response.status_code}",
-            extra={
-                "path": request.path,
-                "method": request.method,
-                "status_code": response.status_code,
-                "duration_ms": int(duration * 1000),
-                "remote_addr": get_client_ip(request),
-                "user_agent": user_agent,
-                "user_id": user_id,
-            },
+            extra=extra,
         )
 
         # return the response
@@ -0,0 +1,94 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+import random
+import time
+from contextlib import ExitStack
+
+# Django imports
+from django.conf import settings
+from django.db import connections
+
+# Module imports
+from plane.utils.profiler import (
+    clear_profile,
+    query_profiler,
+    record_route_profile,
+    start_profile,
+)
+
+
+class RequestProfilerMiddleware:
+    """
+    Profiles a sampled fraction of requests.
+    For a sampled request it records the SQL count and time (including
+    duplicated statements), cache operations and view/render phases, adds a
+    Server-Timing header, attaches the profile to the request so the request
+    logger can emit it, and pushes a sample into the per-route aggregates.
+    The fraction is set with REQUEST_PROFILER_SAMPLE_RATE (0 disables it).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _should_profile(self, request):
+        sample_rate = getattr(settings, "REQUEST_PROFILER_SAMPLE_RATE", 0)
+        if sample_rate <= 0:
+            return False
+        # Don't profile health checks
+        if request.path == "/" and request.method == "GET":
+            return False
+        return sample_rate >= 1 or random.random() < sample_rate
+
+    def __call__(self, request):
+        if not self._should_profile(request):
+            return self.get_response(request)
+
+        profile = start_profile()
+        request._request_profile = profile
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(query_profiler))
+                response = self.get_response(request)
+        finally:
+            clear_profile()
+
+        view_started_at = getattr(request, "_profile_view_started_at", None)
+        if view_started_at is not None and "view" not in profile.phases:
+            profile.add_phase("view", time.perf_counter() - view_started_at)
+
+        duration = profile.total_time()
+        response["Server-Timing"] = profile.server_timing()
+
+        resolver_match = getattr(request, "resolver_match", None)
+        route = resolver_match.route if resolver_match else request.path
+        record_route_profile(f"{request.method} /{route.lstrip('/')}", profile, duration)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        profile = getattr(request, "_request_profile", None)
+        if profile is not None:
+            profile.add_phase("middleware", time.perf_counter() - profile.started_at)
+            request._profile_view_started_at = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after this hook, time the render separately
+        profile = getattr(request, "_request_profile", None)
+        if profile is None:
+            return response
+
+        view_started_at = getattr(request, "_profile_view_started_at", None)
+        if view_started_at is not None:
+            profile.add_phase("view", time.perf_counter() - view_started_at)
+
+        render_started_at = time.perf_counter()
+
+        def record_render(rendered_response):
+            profile.add_phase("render", time.perf_counter() - render_started_at)
+
+        response.add_post_render_callback(record_render)
+        return response
@@ -74,8 +74,12 @@ MIDDLEWARE = [
     "plane.middleware.request_body_size.RequestBodySizeLimitMiddleware",
     "plane.middleware.logger.APITokenLogMiddleware",
     "plane.middleware.logger.RequestLoggerMiddleware",
+    "plane.middleware.profiler.RequestProfilerMiddleware",
 ]
 
+# Fraction of requests profiled by RequestProfilerMiddleware, 0 disables it
+REQUEST_PROFILER_SAMPLE_RATE = float(os.environ.get("REQUEST_PROFILER_SAMPLE_RATE", 0))
+
 # Rest Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework.authentication.SessionAuthentication",),
@@ -158,7 +162,13 @@ else:
 
 
 if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
-    if bool(os.environ.get("DATABASE_READ_REPLICA_URL")):
+    if bool(os.environ.get("DATABASE_READ_REPLICA_URLS")):
+        # Comma separated list of replicas, aliased replica, replica_2, ...
+        replica_urls = [url.strip() for url in os.environ.get("DATABASE_READ_REPLICA_URLS").split(",") if url.strip()]
+        for index, replica_url in enumerate(replica_urls):
+            alias = "replica" if index == 0 else f"replica_{index + 1}"
+            DATABASES[alias] = dj_database_url.parse(replica_url)
+    elif bool(os.environ.get("DATABASE_READ_REPLICA_URL")):
         # Parse database configuration from $DATABASE_URL
         DATABASES["replica"] = dj_database_url.parse(os.environ.get("DATABASE_READ_REPLICA_URL"))
     else:
@@ -171,6 +181,18 @@ if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
             "PORT": os.environ.get("POSTGRES_READ_REPLICA_PORT", "5432"),
         }
 
+    READ_REPLICA_ALIASES = [alias for alias in DATABASES if alias.startswith("replica")]
+    # round_robin or least_connections
+    READ_REPLICA_SELECTION = os.environ.get("READ_REPLICA_SELECTION", "round_robin")
+    # Replicas lagging more than this many seconds are skipped, 0 disables the probe
+    READ_REPLICA_MAX_LAG_SECONDS = float(os.environ.get("READ_REPLICA_MAX_LAG_SECONDS", 10))
+    READ_REPLICA_LAG_CHECK_INTERVAL = float(os.environ.get("READ_REPLICA_LAG_CHECK_INTERVAL", 5))
+    # Clients stay on the primary for this many seconds after a write
+    READ_REPLICA_STICKY_SECONDS = int(os.environ.get("READ_REPLICA_STICKY_SECONDS", 5))
+    # Route undeclared ViewSet list/retrieve actions to replicas
+    READ_REPLICA_AUTO_OPT_IN = os.environ.get("READ_REPLICA_AUTO_OPT_IN", "0") == "1"
+    READ_REPLICA_SAFE_ACTIONS = {"list", "retrieve"}
+
     # Database Routers
     DATABASE_ROUTERS = ["plane.utils.core.dbrouters.ReadReplicaRouter"]
     # Add middleware at the end for read replica routing
@@ -180,6 +202,9 @@ if os.environ.get("ENABLE_READ_REPLICA", "0") == "1":
 # Redis Config
 REDIS_URL = os.environ.get("REDIS_URL")
 REDIS_SSL = REDIS_URL and "rediss" in REDIS_URL
+# Connection pool shared by every redis_instance() caller in a process
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
+REDIS_POOL_TIMEOUT = int(os.environ.get("REDIS_POOL_TIMEOUT", 20))
 
 if REDIS_SSL:
     CACHES = {
@@ -187,7 +212,7 @@ if REDIS_SSL:
             "BACKEND": "django_redis.cache.RedisCache",
             "LOCATION": REDIS_URL,
             "OPTIONS": {
-                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "CLIENT_CLASS": "plane.utils.profiler.ProfilingRedisClient",
                 "CONNECTION_POOL_KWARGS": {"ssl_cert_reqs": False},
             },
         }
@@ -197,7 +222,7 @@ else:
         "default": {
             "BACKEND": "django_redis.cache.RedisCache",
             "LOCATION": REDIS_URL,
-            "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+            "OPTIONS": {"CLIENT_CLASS": "plane.utils.profiler.ProfilingRedisClient"},
         }
     }
 
@@ -282,6 +307,7 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.cleanup_task",
+    "plane.bgtasks.api_token_task",
     "plane.license.bgtasks.tracer",
     # management tasks
     "plane.bgtasks.dummy_data_task",
@@ -2,23 +2,131 @@
 # SPDX-License-Identifier: AGPL-3.0-only
 # See the LICENSE file for details.
 
+# Python imports
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+# Third party imports
 import redis
 from django.conf import settings
-from urllib.parse import urlparse
 
+_lock = threading.Lock()
+_client = None
 
-def redis_instance():
-    # connect to redis
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """
+    Blocking connection pool that records how long callers wait for a
+    connection and how many checkouts fail, so pool exhaustion is visible.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.errors = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def get_connection(self, command_name, *keys, **options):
+        start = time.perf_counter()
+        try:
+            connection = super().get_connection(command_name, *keys, **options)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self.errors += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+        self.checkouts += 1
+        return connection
+
+
+def _build_pool():
+    pool_options = {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT,
+    }
     if settings.REDIS_SSL:
         url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
+        return InstrumentedConnectionPool(
+            connection_class=redis.SSLConnection,
             host=url.hostname,
             port=url.port,
             password=url.password,
-            ssl=True,
             ssl_cert_reqs=None,
+            **pool_options,
         )
-    else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
+    return InstrumentedConnectionPool.from_url(settings.REDIS_URL, db=0, **pool_options)
+
+
+def _reset_after_fork():
+    # Sockets inherited from the parent must never be shared with a forked
+    # child (celery prefork, gunicorn), so every child builds its own pool
+    global _client, _lock
+    _client = None
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def redis_instance():
+    """Return the process wide redis client backed by a shared connection pool"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = redis.Redis(connection_pool=_build_pool())
+    return _client
+
+
+def redis_get_many(keys):
+    """Fetch several keys in one round trip, returns a dict of key -> value"""
+    keys = list(keys)
+    if not keys:
+        return {}
+    return dict(zip(keys, redis_instance().mget(keys)))
+
+
+def redis_set_many(mapping, ex=None):
+    """Set several keys with an optional expiry in one pipelined round trip"""
+    if not mapping:
+        return
+    pipe = redis_instance().pipeline(transaction=False)
+    for key, value in mapping.items():
+        pipe.set(key, value, ex=ex)
+    pipe.execute()
+
+
+def redis_delete_many(keys):
+    """Delete several keys in one round trip, returns the number deleted"""
+    keys = list(keys)
+    if not keys:
+        return 0
+    return redis_instance().delete(*keys)
+
+
+def redis_pool_metrics():
+    """Snapshot of the connection pool usage for the current process"""
+    if _client is None:
+        return {"initialized": False}
 
-    return ri
+    pool = _client.connection_pool
+    idle = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+    created = len(pool._connections)
+    return {
+        "initialized": True,
+        "pid": pool.pid,
+        "max_connections": pool.max_connections,
+        "created_connections": created,
+        "in_use_connections": created - idle,
+        "idle_connections": idle,
+        "checkouts": pool.checkouts,
+        "errors": pool.errors,
+        "wait_time_total": round(pool.wait_time_total, 6),
+        "wait_time_max": round(pool.wait_time_max, 6),
+    }
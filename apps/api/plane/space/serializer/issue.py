@@ -178,7 +178,7 @@ class IssueSerializer(BaseSerializer):
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
         read_only_fields = [
             "workspace",
             "project",
@@ -257,10 +257,12 @@ class IssueCreateSerializer(BaseSerializer):
         write_only=True,
         required=False,
     )
+    # Base64 encoded, stored in the description blob by the model
+    description_binary = serializers.CharField(required=False, allow_null=True, allow_blank=True, write_only=True)
 
     class Meta:
         model = Issue
-        fields = "__all__"
+        exclude = ["description_blob"]
         read_only_fields = [
             "workspace",
             "project",
@@ -22,6 +22,7 @@ from plane.db.models import (
     State,
     WorkspaceMember,
 )
+from plane.utils.issue_annotations import annotate_issues, issue_values
 
 
 def issue_queryset_grouper(
@@ -43,6 +44,10 @@ def issue_queryset_grouper(
         if group_key in GROUP_FILTER_MAPPER:
             queryset = queryset.filter(GROUP_FILTER_MAPPER[group_key])
 
+    # The grouped paginators partition the queryset by the group field in SQL
+    if "cycle_id" in {group_by, sub_group_by}:
+        queryset = annotate_issues(queryset, ["cycle_id"])
+
     annotations_map = {
         "assignee_ids": (
             "assignees__id",
@@ -176,9 +181,9 @@ def issue_on_results(
             filter=Q(issue_reactions__isnull=False, issue_reactions__deleted_at__isnull=True),
             distinct=True,
         ),
-    ).values(*required_fields, "vote_items", "reaction_items")
+    )
 
-    return issues
+    return issue_values(issues, [*required_fields, "vote_items", "reaction_items"])
 
 
 def issue_group_values(
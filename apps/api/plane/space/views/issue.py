@@ -22,7 +22,6 @@ from django.db.models import (
     JSONField,
     Value,
     OuterRef,
-    Func,
     CharField,
     Subquery,
 )
@@ -46,6 +45,7 @@ from plane.space.utils.grouper import (
 
 
 from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.public_board_cache import serve_public_board_snapshot
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from plane.app.serializers import (
     CommentReactionSerializer,
@@ -56,14 +56,12 @@ from plane.app.serializers import (
 from plane.db.models import (
     Issue,
     IssueComment,
-    IssueLink,
     IssueReaction,
     ProjectMember,
     CommentReaction,
     DeployBoard,
     IssueVote,
     ProjectPublicMember,
-    FileAsset,
     CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
@@ -74,13 +72,22 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
     permission_classes = [AllowAny]
 
     def get(self, request, anchor):
-        filters = issue_filters(request.query_params, "GET")
-        order_by_param = request.GET.get("order_by", "-created_at")
-
         deploy_board = DeployBoard.objects.filter(anchor=anchor, entity_name="project").first()
         if not deploy_board:
             return Response({"error": "Project is not published"}, status=status.HTTP_404_NOT_FOUND)
 
+        # Anonymous traffic is served from a snapshot shared by every visitor
+        return serve_public_board_snapshot(
+            request,
+            anchor=anchor,
+            project_id=deploy_board.entity_identifier,
+            compute=lambda: self.get_issues(request, deploy_board),
+        )
+
+    def get_issues(self, request, deploy_board):
+        filters = issue_filters(request.query_params, "GET")
+        order_by_param = request.GET.get("order_by", "-created_at")
+
         project_id = deploy_board.entity_identifier
         slug = deploy_board.workspace.slug
 
@@ -95,32 +102,6 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                 )
             )
             .prefetch_related(Prefetch("votes", queryset=IssueVote.objects.select_related("actor")))
-            .annotate(
-                cycle_id=Subquery(
-                    CycleIssue.objects.filter(issue=OuterRef("id"), deleted_at__isnull=True).values("cycle_id")[:1]
-                )
-            )
-            .annotate(
-                link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                attachment_count=FileAsset.objects.filter(
-                    issue_id=OuterRef("id"),
-                    entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
-                )
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
         ).distinct()
 
         issue_queryset = issue_queryset.filter(**filters)
@@ -751,7 +732,6 @@ class IssueRetrievePublicEndpoint(BaseAPIView):
                 "description_json",
                 "description_html",
                 "description_stripped",
-                "description_binary",
                 "module_ids",
                 "label_ids",
                 "assignee_ids",
@@ -0,0 +1,153 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Module,
+    ModuleMember,
+    Project,
+    ProjectMember,
+    State,
+    User,
+)
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    State.objects.create(name="Todo", group="unstarted", default=True, project=project, workspace=workspace)
+    return project
+
+
+@pytest.fixture
+def members(db):
+    """Users assigned to the created work items"""
+    return [User.objects.create(email=f"member-{index}@plane.so", username=f"member-{index}") for index in range(2)]
+
+
+def create_issues(project, create_user, members, count):
+    """Create work items sharing their assignees and labels"""
+    labels = [
+        Label.objects.get_or_create(name=f"Label {index}", project=project, workspace=project.workspace)[0]
+        for index in range(2)
+    ]
+    for _ in range(count):
+        issue = Issue.objects.create(
+            name="Work item",
+            project=project,
+            workspace=project.workspace,
+            created_by=create_user,
+        )
+        for member in members:
+            IssueAssignee.objects.create(issue=issue, assignee=member, project=project, workspace=project.workspace)
+        for label in labels:
+            IssueLabel.objects.create(issue=issue, label=label, project=project, workspace=project.workspace)
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    return len(context.captured_queries)
+
+
+def assert_constant_queries(client, url, add_rows):
+    """The query count of the list does not grow with the number of rows"""
+    # Warm up the per token and per project lookups
+    count_queries(client, url)
+    baseline = count_queries(client, url)
+    add_rows()
+    assert count_queries(client, url) == baseline
+
+
+@pytest.mark.contract
+class TestExpandQueryCounts:
+    """Test that expanded list endpoints run a fixed number of queries per page"""
+
+    @pytest.mark.django_db
+    def test_work_items(self, api_key_client, workspace, project, create_user, members):
+        url = (
+            f"/api/v1/workspaces/{workspace.slug}/projects/{project.id}/work-items/"
+            "?expand=assignees,labels,state,created_by"
+        )
+        create_issues(project, create_user, members, 1)
+
+        assert_constant_queries(api_key_client, url, lambda: create_issues(project, create_user, members, 5))
+
+        results = api_key_client.get(url).json()["results"]
+        assert len(results) == 6
+        assert {assignee["email"] for assignee in results[0]["assignees"]} == {member.email for member in members}
+        assert results[0]["state"]["name"] == "Todo"
+        assert results[0]["created_by"]["id"] == str(create_user.id)
+
+    @pytest.mark.django_db
+    def test_labels(self, api_key_client, workspace, project, create_user):
+        url = f"/api/v1/workspaces/{workspace.slug}/projects/{project.id}/labels/?expand=created_by,project"
+
+        def add_labels(count):
+            for _ in range(count):
+                Label.objects.create(
+                    name=f"Label {Label.objects.count()}",
+                    project=project,
+                    workspace=workspace,
+                    created_by=create_user,
+                )
+
+        add_labels(1)
+        assert_constant_queries(api_key_client, url, lambda: add_labels(5))
+
+    @pytest.mark.django_db
+    def test_cycles(self, api_key_client, workspace, project, create_user):
+        url = f"/api/v1/workspaces/{workspace.slug}/projects/{project.id}/cycles/?expand=owned_by"
+
+        def add_cycles(count):
+            for _ in range(count):
+                Cycle.objects.create(
+                    name=f"Cycle {Cycle.objects.count()}",
+                    project=project,
+                    workspace=workspace,
+                    owned_by=create_user,
+                )
+
+        add_cycles(1)
+        assert_constant_queries(api_key_client, url, lambda: add_cycles(5))
+
+    @pytest.mark.django_db
+    def test_modules(self, api_key_client, workspace, project, create_user, members):
+        url = f"/api/v1/workspaces/{workspace.slug}/projects/{project.id}/modules/?expand=project"
+
+        def add_modules(count):
+            for _ in range(count):
+                module = Module.objects.create(
+                    name=f"Module {Module.objects.count()}",
+                    project=project,
+                    workspace=workspace,
+                    lead=create_user,
+                )
+                for member in members:
+                    ModuleMember.objects.create(module=module, member=member, project=project, workspace=workspace)
+
+        add_modules(1)
+        assert_constant_queries(api_key_client, url, lambda: add_modules(5))
@@ -0,0 +1,104 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from plane.db.models import Issue, Project, ProjectMember, State
+from plane.utils import analytics_rollup
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def issues(project):
+    states = {
+        group: State.objects.create(name=group.title(), group=group, project=project, workspace=project.workspace)
+        for group in ("backlog", "started", "completed")
+    }
+    issues = [
+        Issue.objects.create(
+            name=f"Work item {index}",
+            project=project,
+            workspace=project.workspace,
+            state=states[group],
+            priority=priority,
+        )
+        for index, (group, priority) in enumerate(
+            [("backlog", "high"), ("started", "high"), ("completed", "low"), ("completed", "urgent")]
+        )
+    ]
+    # An old issue outside of the chart periods
+    Issue.objects.filter(pk=issues[3].pk).update(created_at=timezone.now() - timedelta(days=60))
+    analytics_rollup.refresh_project_rollups(project.id)
+    return issues
+
+
+def get_both(session_client, url):
+    """Responses of the live queries and of the rollups"""
+    with patch.object(analytics_rollup, "rollups_ready", return_value=False):
+        live = session_client.get(url)
+    with patch.object(analytics_rollup, "rollups_ready", return_value=True):
+        rollup = session_client.get(url)
+    assert live.status_code == rollup.status_code == status.HTTP_200_OK
+    return live.json(), rollup.json()
+
+
+def sort_distribution(distribution):
+    return {key: sorted(rows, key=lambda row: str(row.get("segment"))) for key, rows in distribution.items()}
+
+
+@pytest.mark.contract
+class TestAnalyticsRollups:
+    """Test that the rollups answer analytics requests like the live queries"""
+
+    @pytest.mark.django_db
+    def test_graph_plot(self, session_client, workspace, issues):
+        url = f"/api/workspaces/{workspace.slug}/analytics/?x_axis=priority&y_axis=issue_count"
+
+        live, rollup = get_both(session_client, url)
+
+        assert rollup["total"] == live["total"] == 4
+        assert rollup["distribution"] == live["distribution"]
+        assert rollup["distribution"]["high"] == [{"dimension": "high", "count": 2}]
+
+    @pytest.mark.django_db
+    def test_graph_plot_with_segment(self, session_client, workspace, issues):
+        url = f"/api/workspaces/{workspace.slug}/analytics/?x_axis=state__group&y_axis=issue_count&segment=priority"
+
+        live, rollup = get_both(session_client, url)
+
+        assert sort_distribution(rollup["distribution"]) == sort_distribution(live["distribution"])
+        assert {"dimension": "completed", "segment": "low", "count": 1} in rollup["distribution"]["completed"]
+
+    @pytest.mark.django_db
+    def test_work_items_stats_in_a_period(self, session_client, workspace, issues):
+        url = f"/api/workspaces/{workspace.slug}/advance-analytics-stats/?type=work-items&date_filter=last_30_days"
+
+        with timezone.override("UTC"):
+            live, rollup = get_both(session_client, url)
+
+        assert rollup == live
+        assert live[0]["completed_work_items"] == 1
+        assert live[0]["backlog_work_items"] == 1
@@ -0,0 +1,121 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+
+from plane.app.views.issue import bulk_operation
+from plane.db.models import Issue, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def states(project):
+    return {
+        group: State.objects.create(name=group, group=group, project=project, workspace=project.workspace)
+        for group in ["started", "completed", "cancelled"]
+    }
+
+
+@pytest.fixture(autouse=True)
+def activities():
+    with (
+        patch.object(bulk_operation, "bulk_issue_activity") as issue_activity,
+        patch.object(bulk_operation, "bulk_model_activity"),
+    ):
+        yield issue_activity
+
+
+@pytest.mark.contract
+@pytest.mark.django_db
+class TestIssueBulkOperation:
+    """Test the state updates of the bulk operation endpoint"""
+
+    def create_issue(self, project, state):
+        return Issue.objects.create(name=state.name, project=project, workspace=project.workspace, state=state)
+
+    def post(self, client, project, data):
+        return client.post(
+            f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/bulk-operation-issues/",
+            data,
+            format="json",
+        )
+
+    def test_completing_issues(self, session_client, project, states, activities):
+        started = self.create_issue(project, states["started"])
+        completed = self.create_issue(project, states["completed"])
+        completed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        Issue.objects.filter(pk=completed.pk).update(completed_at=completed_at)
+
+        response = self.post(
+            session_client,
+            project,
+            {"issue_ids": [str(started.id), str(completed.id)], "state_id": str(states["completed"].id)},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"updated": 2}
+        started.refresh_from_db()
+        completed.refresh_from_db()
+        assert started.state_id == completed.state_id == states["completed"].id
+        assert started.completed_at is not None and started.completed_at > completed_at
+        # Issues already completed keep the date they were completed on
+        assert completed.completed_at == completed_at
+        activities.delay.assert_called_once()
+
+    def test_moving_issues_out_of_completed(self, session_client, project, states):
+        completed = self.create_issue(project, states["completed"])
+        assert completed.completed_at is not None
+
+        response = self.post(
+            session_client, project, {"issue_ids": [str(completed.id)], "state_id": str(states["cancelled"].id)}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        completed.refresh_from_db()
+        assert completed.state_id == states["cancelled"].id
+        assert completed.completed_at is None
+
+    def test_other_properties_keep_completed_at(self, session_client, project, states):
+        completed = self.create_issue(project, states["completed"])
+        completed_at = completed.completed_at
+
+        response = self.post(session_client, project, {"issue_ids": [str(completed.id)], "priority": "high"})
+
+        assert response.status_code == status.HTTP_200_OK
+        completed.refresh_from_db()
+        assert completed.priority == "high"
+        assert completed.completed_at == completed_at
+
+    def test_state_of_another_project(self, session_client, project, states, workspace):
+        started = self.create_issue(project, states["started"])
+        other = Project.objects.create(name="Other", identifier="OT", workspace=workspace)
+        state = State.objects.create(name="Done", group="completed", project=other, workspace=workspace)
+
+        response = self.post(session_client, project, {"issue_ids": [str(started.id)], "state_id": str(state.id)})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        started.refresh_from_db()
+        assert started.state_id == states["started"].id
+        assert started.completed_at is None
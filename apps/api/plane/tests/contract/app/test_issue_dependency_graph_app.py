@@ -0,0 +1,94 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import json
+from unittest.mock import patch
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework import status
+
+from plane.app.views.issue import relation
+from plane.db.models import Issue, IssueRelation, Project, ProjectMember, User, WorkspaceMember
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a guest"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=5,  # Guest role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def other_user(project):
+    user = User.objects.create(email="other@plane.so", first_name="Other", last_name="User")
+    WorkspaceMember.objects.create(workspace=project.workspace, member=user, role=15)
+    ProjectMember.objects.create(project=project, member=user, role=15, is_active=True)
+    return user
+
+
+@pytest.fixture
+def scopes():
+    """Compute the graph on every request and keep the cache scopes"""
+    scopes = []
+
+    def get_dependency_graph(project_id, scope, compute):
+        scopes.append(scope)
+        return json.dumps(compute().to_dict(), cls=DjangoJSONEncoder)
+
+    with patch.object(relation, "get_dependency_graph", side_effect=get_dependency_graph):
+        yield scopes
+
+
+def blocked_by(project, user):
+    issue, blocker = [
+        Issue.objects.create(name=name, project=project, workspace=project.workspace) for name in ["Issue", "Blocker"]
+    ]
+    # Saves outside a request clear created_by
+    Issue.objects.filter(pk__in=[issue.pk, blocker.pk]).update(created_by=user)
+    IssueRelation.objects.create(
+        issue=issue, related_issue=blocker, relation_type="blocked_by", project=project, workspace=project.workspace
+    )
+    return {str(issue.id), str(blocker.id)}
+
+
+@pytest.mark.contract
+@pytest.mark.django_db
+class TestIssueDependencyGraph:
+    """Test the dependency graph served to guests"""
+
+    def get_url(self, project):
+        return f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/dependency-graph/"
+
+    def test_guest_sees_only_own_work_items(self, session_client, project, create_user, other_user, scopes):
+        own = blocked_by(project, create_user)
+        blocked_by(project, other_user)
+
+        response = session_client.get(self.get_url(project))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {node["id"] for node in response.json()["nodes"]} == own
+        assert scopes == [f"project:guest:{create_user.id}"]
+
+    def test_guest_sees_all_work_items_when_shared(self, session_client, project, create_user, other_user, scopes):
+        Project.objects.filter(pk=project.pk).update(guest_view_all_features=True)
+        own = blocked_by(project, create_user)
+        others = blocked_by(project, other_user)
+
+        response = session_client.get(self.get_url(project))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {node["id"] for node in response.json()["nodes"]} == own | others
+        assert scopes == ["project"]
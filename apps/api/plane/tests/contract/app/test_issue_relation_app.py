@@ -0,0 +1,95 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from plane.db.models import Issue, IssueRelation, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    State.objects.create(name="Todo", group="unstarted", default=True, project=project, workspace=workspace)
+    return project
+
+
+@pytest.fixture
+def issue(project, create_user):
+    return Issue.objects.create(name="Work item", project=project, workspace=project.workspace, created_by=create_user)
+
+
+def relate(issue, project, relation_type, outgoing=True):
+    """Relate a new work item to the issue, stored on the issue when outgoing"""
+    other = Issue.objects.create(name=relation_type, project=project, workspace=project.workspace)
+    IssueRelation.objects.create(
+        issue=issue if outgoing else other,
+        related_issue=other if outgoing else issue,
+        relation_type=relation_type,
+        project=project,
+        workspace=project.workspace,
+    )
+    return other
+
+
+@pytest.mark.contract
+class TestIssueRelationList:
+    """Test the relations of a work item"""
+
+    def get_url(self, issue):
+        return f"/api/workspaces/{issue.workspace.slug}/projects/{issue.project_id}/issues/{issue.id}/issue-relation/"
+
+    def get_response(self, client, issue):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(self.get_url(issue))
+        assert response.status_code == status.HTTP_200_OK
+        return response.json(), len(context.captured_queries)
+
+    @pytest.mark.django_db
+    def test_relations_by_direction(self, session_client, project, issue):
+        expected = {
+            "blocked_by": relate(issue, project, "blocked_by"),
+            "blocking": relate(issue, project, "blocked_by", outgoing=False),
+            "start_before": relate(issue, project, "start_before"),
+            "start_after": relate(issue, project, "start_before", outgoing=False),
+            "finish_before": relate(issue, project, "finish_before"),
+            "finish_after": relate(issue, project, "finish_before", outgoing=False),
+            "relates_to": relate(issue, project, "relates_to", outgoing=False),
+        }
+        duplicates = {relate(issue, project, "duplicate").id, relate(issue, project, "duplicate", outgoing=False).id}
+
+        data, _ = self.get_response(session_client, issue)
+
+        for relation_type, other in expected.items():
+            assert [row["id"] for row in data[relation_type]] == [str(other.id)]
+            assert data[relation_type][0]["relation_type"] == relation_type
+        assert {row["id"] for row in data["duplicate"]} == {str(pk) for pk in duplicates}
+
+    @pytest.mark.django_db
+    def test_query_count_is_constant(self, session_client, project, issue):
+        relate(issue, project, "blocked_by")
+        self.get_response(session_client, issue)
+        _, baseline = self.get_response(session_client, issue)
+
+        for relation_type in ("blocked_by", "start_before", "finish_before", "duplicate", "relates_to"):
+            relate(issue, project, relation_type)
+            relate(issue, project, relation_type, outgoing=False)
+
+        data, queries = self.get_response(session_client, issue)
+        assert queries == baseline
+        assert sum(len(rows) for rows in data.values()) == 11
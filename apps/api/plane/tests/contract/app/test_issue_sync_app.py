@@ -0,0 +1,137 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from plane.app.views.module import issue as module_issue_views
+from plane.db.models import Issue, IssueChangeLog, Module, ModuleIssue, Project, ProjectMember
+from plane.utils import issue_change_log
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def redis():
+    with patch.object(issue_change_log, "redis_instance") as redis_instance:
+        redis_instance.return_value.get.return_value = None
+        yield redis_instance.return_value
+
+
+# The change log only hands out committed transactions, so every save commits
+@pytest.mark.contract
+@pytest.mark.django_db(transaction=True)
+class TestIssueDeltaSync:
+    """Test the incremental issue sync read from the change log"""
+
+    def create_issue(self, project, name="Work item"):
+        return Issue.objects.create(name=name, project=project, workspace=project.workspace)
+
+    def get_url(self, project):
+        return f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/v2/issues/"
+
+    def test_changes_after_a_full_sync(self, session_client, project, redis):
+        updated, deleted, archived = [self.create_issue(project) for _ in range(3)]
+        url = self.get_url(project)
+
+        response = session_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        since = response.data["change_id"]
+
+        updated.name = "Renamed"
+        updated.save()
+        # Issue.delete() also queues the cleanup of related rows
+        deleted.deleted_at = timezone.now()
+        deleted.save()
+        archived.archived_at = timezone.now().date()
+        archived.save()
+        created = self.create_issue(project, name="New")
+
+        response = session_client.get(url, {"since": since})
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [issue["id"] for issue in data["results"]] == [str(updated.id), str(created.id)]
+        assert data["results"][0]["name"] == "Renamed"
+        assert set(data["deleted"]) == {str(deleted.id), str(archived.id)}
+        assert data["next_since"] > since
+        assert not data["has_more"]
+        assert not data["resync_required"]
+
+        response = session_client.get(url, {"since": data["next_since"]})
+        assert response.json()["results"] == response.json()["deleted"] == []
+
+    def test_module_membership_changes(self, session_client, project, redis):
+        issue = self.create_issue(project)
+        module = Module.objects.create(name="Module", project=project, workspace=project.workspace)
+        url = self.get_url(project)
+        since = session_client.get(url).data["change_id"]
+
+        with patch.object(module_issue_views, "issue_activity"):
+            response = session_client.post(
+                f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/modules/{module.id}/issues/",
+                {"issues": [str(issue.id)]},
+                format="json",
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert ModuleIssue.objects.filter(module=module, issue=issue).exists()
+
+        data = session_client.get(url, {"since": since}).json()
+        assert [row["id"] for row in data["results"]] == [str(issue.id)]
+        assert data["results"][0]["module_ids"] == [str(module.id)]
+
+        with patch.object(module_issue_views, "issue_activity"):
+            response = session_client.delete(
+                f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/modules/{module.id}/issues/{issue.id}/"
+            )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        data = session_client.get(url, {"since": data["next_since"]}).json()
+        assert [row["id"] for row in data["results"]] == [str(issue.id)]
+        assert data["results"][0]["module_ids"] == []
+
+    def test_cursor_behind_the_retention_window(self, session_client, project, redis):
+        self.create_issue(project)
+        redis.get.return_value = b"1000000"
+
+        response = session_client.get(self.get_url(project), {"since": 10})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["resync_required"]
+        assert response.json()["results"] == []
+
+    def test_prune_removes_old_changes(self, project, redis):
+        issue = self.create_issue(project)
+        cutoff = timezone.now()
+        self.create_issue(project)
+
+        deleted = issue_change_log.prune_change_log(cutoff, batch_size=1)
+
+        assert deleted == 1
+        assert not IssueChangeLog.objects.filter(issue_id=issue.id).exists()
+        assert IssueChangeLog.objects.count() == 1
+        redis.set.assert_called_once()
+
+    def test_invalid_since(self, session_client, project, redis):
+        response = session_client.get(self.get_url(project), {"since": "yesterday"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
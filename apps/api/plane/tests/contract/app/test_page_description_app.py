@@ -0,0 +1,74 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import pytest
+from rest_framework import status
+
+from plane.db.models import DescriptionBlob, Page, Project, ProjectMember, ProjectPage
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.mark.contract
+class TestPageDescription:
+    """Test the page description binary streamed from the blob store"""
+
+    def create_page(self, project, user, description_binary):
+        page = Page.objects.create(
+            name="Page",
+            workspace=project.workspace,
+            owned_by=user,
+            description_binary=description_binary,
+        )
+        ProjectPage.objects.create(workspace=project.workspace, project=project, page=page)
+        return page
+
+    def get_url(self, project, page):
+        return f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/pages/{page.id}/description/"
+
+    @pytest.mark.django_db
+    def test_description_is_streamed_with_its_hash(self, session_client, project, create_user):
+        content = b"\x01\x02\x03\x04" * 1000
+        page = self.create_page(project, create_user, content)
+        url = self.get_url(project, page)
+
+        response = session_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == content
+        assert response["ETag"] == f'"{DescriptionBlob.get_hash(content)}"'
+
+        response = session_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.django_db
+    def test_identical_descriptions_share_a_blob(self, project, create_user):
+        pages = [self.create_page(project, create_user, b"\x01\x02\x03\x04") for _ in range(2)]
+
+        assert pages[0].description_blob_id == pages[1].description_blob_id
+        assert DescriptionBlob.objects.count() == 1
+
+    @pytest.mark.django_db
+    def test_empty_description(self, session_client, project, create_user):
+        page = self.create_page(project, create_user, None)
+
+        response = session_client.get(self.get_url(project, page))
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b""
+        assert response["ETag"] == f'"{DescriptionBlob.EMPTY_HASH}"'
@@ -0,0 +1,121 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from plane.app.views.page import base
+from plane.db.models import Page, Project, ProjectMember, ProjectPage, User, WorkspaceMember
+from plane.utils import page_tree
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def other_user(project):
+    """Another member of the project"""
+    user = User.objects.create(email="other@plane.so", first_name="Other", last_name="User")
+    WorkspaceMember.objects.create(workspace=project.workspace, member=user, role=15)
+    ProjectMember.objects.create(project=project, member=user, role=15, is_active=True)
+    return user
+
+
+@pytest.fixture(autouse=True)
+def tasks():
+    with (
+        patch.object(base, "page_transaction"),
+        patch.object(base, "copy_s3_objects_of_pages"),
+        patch.object(page_tree, "soft_delete_related_objects"),
+    ):
+        yield
+
+
+def create_page(project, owner, name, parent=None, access=Page.PUBLIC_ACCESS):
+    page = Page.objects.create(
+        name=name,
+        workspace=project.workspace,
+        owned_by=owner,
+        parent=parent,
+        access=access,
+    )
+    ProjectPage.objects.create(workspace=project.workspace, project=project, page=page)
+    return page
+
+
+@pytest.mark.contract
+@pytest.mark.django_db
+class TestPageSubtree:
+    """Test the operations on a page and its descendants"""
+
+    def get_url(self, project, page, action=""):
+        return f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/pages/{page.id}/{action}"
+
+    def test_duplicate_leaves_out_private_pages_of_others(self, session_client, project, create_user, other_user):
+        page = create_page(project, create_user, "Spec")
+        hidden = create_page(project, other_user, "Private", parent=page, access=Page.PRIVATE_ACCESS)
+        create_page(project, other_user, "Public", parent=hidden)
+        create_page(project, create_user, "Mine", parent=page, access=Page.PRIVATE_ACCESS)
+
+        response = session_client.post(
+            self.get_url(project, page, "duplicate/") + "?include_descendants=true", format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        page_copy = Page.objects.get(pk=response.json()["id"])
+        copies = Page.objects.filter(tree_path__startswith=page_copy.descendants_path)
+        assert sorted(copies.values_list("name", flat=True)) == ["Mine", "Public"]
+        # The public page of the skipped private page moves under the copy of the root
+        assert set(copies.values_list("parent_id", flat=True)) == {page_copy.id}
+        assert not Page.objects.filter(name="Private").exclude(pk=hidden.pk).exists()
+
+    def test_owner_can_not_delete_descendants_of_others(self, session_client, project, create_user, other_user):
+        ProjectMember.objects.filter(project=project, member=create_user).update(role=15)
+        page = create_page(project, create_user, "Spec")
+        child = create_page(project, other_user, "Child", parent=page)
+        Page.objects.filter(pk=page.pk).update(archived_at=timezone.now())
+
+        response = session_client.delete(self.get_url(project, page) + "?include_descendants=true")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert Page.objects.filter(pk__in=[page.pk, child.pk]).count() == 2
+
+    def test_owner_deletes_own_descendants(self, session_client, project, create_user):
+        ProjectMember.objects.filter(project=project, member=create_user).update(role=15)
+        page = create_page(project, create_user, "Spec")
+        child = create_page(project, create_user, "Child", parent=page)
+        Page.objects.filter(pk=page.pk).update(archived_at=timezone.now())
+
+        response = session_client.delete(self.get_url(project, page) + "?include_descendants=true")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not Page.objects.filter(pk__in=[page.pk, child.pk]).exists()
+
+    def test_admin_deletes_descendants_of_others(self, session_client, project, create_user, other_user):
+        page = create_page(project, create_user, "Spec")
+        child = create_page(project, other_user, "Child", parent=page, access=Page.PRIVATE_ACCESS)
+        Page.objects.filter(pk=page.pk).update(archived_at=timezone.now())
+
+        response = session_client.delete(self.get_url(project, page) + "?include_descendants=true")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not Page.objects.filter(pk__in=[page.pk, child.pk]).exists()
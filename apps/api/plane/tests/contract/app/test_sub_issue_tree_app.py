@@ -0,0 +1,82 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from plane.db.models import Issue, Project, ProjectMember, State
+
+
+@pytest.fixture
+def project(db, workspace, create_user):
+    """Create a test project with the user as a member"""
+    project = Project.objects.create(
+        name="Test Project",
+        identifier="TP",
+        workspace=workspace,
+        created_by=create_user,
+    )
+    ProjectMember.objects.create(
+        project=project,
+        member=create_user,
+        role=20,  # Admin role
+        is_active=True,
+    )
+    return project
+
+
+@pytest.fixture
+def states(project):
+    return {
+        group: State.objects.create(
+            name=group.title(), group=group, default=group == "backlog", project=project, workspace=project.workspace
+        )
+        for group in ("backlog", "started", "completed")
+    }
+
+
+@pytest.mark.contract
+class TestSubIssueTree:
+    """Test the descendants of a work item loaded as a tree"""
+
+    def create_issue(self, project, state, parent=None):
+        return Issue.objects.create(
+            name="Work item", project=project, workspace=project.workspace, state=state, parent=parent
+        )
+
+    @pytest.mark.django_db
+    def test_tree_with_rolled_up_states(self, session_client, project, states):
+        root = self.create_issue(project, states["started"])
+        child = self.create_issue(project, states["started"], parent=root)
+        grandchildren = [self.create_issue(project, states["completed"], parent=child) for _ in range(2)]
+        great_grandchild = self.create_issue(project, states["backlog"], parent=grandchildren[0])
+        url = f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/issues/{root.id}/sub-issues/tree/"
+
+        with CaptureQueriesContext(connection) as context:
+            response = session_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        tree_queries = len([query for query in context.captured_queries if "RECURSIVE" in query["sql"]])
+        assert tree_queries == 1
+
+        data = response.json()
+        nodes = {node["id"]: node for node in data["sub_issues"]}
+        assert [node["depth"] for node in data["sub_issues"]] == [1, 2, 2, 3]
+        assert nodes[str(great_grandchild.id)]["parent_id"] == str(grandchildren[0].id)
+        assert nodes[str(child.id)]["descendant_count"] == 3
+        assert nodes[str(child.id)]["state_distribution"]["completed"] == 2
+        assert data["state_distribution"]["started"] == 1
+
+        response = session_client.get(f"{url}?depth=2")
+        assert len(response.json()["sub_issues"]) == 3
+
+    @pytest.mark.django_db
+    def test_invalid_depth(self, session_client, project, states):
+        root = self.create_issue(project, states["started"])
+        url = f"/api/workspaces/{project.workspace.slug}/projects/{project.id}/issues/{root.id}/sub-issues/tree/"
+
+        response = session_client.get(f"{url}?depth=0")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
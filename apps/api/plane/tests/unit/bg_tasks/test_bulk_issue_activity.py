@@ -0,0 +1,74 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from uuid import uuid4
+
+import pytest
+
+from plane.bgtasks.issue_activities_task import track_bulk_cycle, track_bulk_modules
+from plane.db.models import Cycle, Module
+
+
+def tracker_arguments(issue_activities):
+    return {
+        "issue_id": str(uuid4()),
+        "project_id": str(uuid4()),
+        "workspace_id": str(uuid4()),
+        "actor_id": str(uuid4()),
+        "issue_activities": issue_activities,
+        "epoch": 1700000000,
+    }
+
+
+@pytest.mark.unit
+class TestBulkIssueActivity:
+    """Test the activities recorded for bulk issue updates"""
+
+    def test_cycle_move_is_an_update(self):
+        old_cycle, new_cycle = Cycle(id=uuid4(), name="Sprint 1"), Cycle(id=uuid4(), name="Sprint 2")
+        cycles = {str(old_cycle.id): old_cycle, str(new_cycle.id): new_cycle}
+        activities = []
+
+        track_bulk_cycle(
+            {"cycle_id": str(new_cycle.id)},
+            {"cycle_id": str(old_cycle.id)},
+            cycles=cycles,
+            **tracker_arguments(activities),
+        )
+
+        assert len(activities) == 1
+        assert activities[0].verb == "updated"
+        assert activities[0].old_identifier == old_cycle.id
+        assert activities[0].new_identifier == new_cycle.id
+
+    def test_cycle_removal_and_unchanged_cycle(self):
+        cycle = Cycle(id=uuid4(), name="Sprint 1")
+        cycles = {str(cycle.id): cycle}
+        activities = []
+
+        track_bulk_cycle(
+            {"cycle_id": None}, {"cycle_id": str(cycle.id)}, cycles=cycles, **tracker_arguments(activities)
+        )
+        track_bulk_cycle(
+            {"cycle_id": str(cycle.id)}, {"cycle_id": str(cycle.id)}, cycles=cycles, **tracker_arguments(activities)
+        )
+
+        assert [activity.verb for activity in activities] == ["deleted"]
+        assert activities[0].comment == "removed this issue from Sprint 1"
+
+    def test_only_new_modules_are_recorded(self):
+        existing, added = Module(id=uuid4(), name="Backend"), Module(id=uuid4(), name="Frontend")
+        modules = {str(existing.id): existing, str(added.id): added}
+        activities = []
+
+        track_bulk_modules(
+            {"module_ids": [str(existing.id), str(added.id)]},
+            {"module_ids": [str(existing.id)]},
+            modules=modules,
+            **tracker_arguments(activities),
+        )
+
+        assert len(activities) == 1
+        assert activities[0].new_identifier == added.id
+        assert activities[0].comment == "added module Frontend"
@@ -421,3 +421,148 @@ class TestEdgeCases:
 
         assert result1 is None  # Both should return None safely
         assert result2 is None
+
+
+@pytest.fixture
+def replica_settings(settings):
+    """Fixture enabling two replicas with round-robin selection."""
+    from plane.utils.core import replicas
+
+    settings.READ_REPLICA_ALIASES = ["replica", "replica_2"]
+    settings.READ_REPLICA_SELECTION = "round_robin"
+    settings.READ_REPLICA_MAX_LAG_SECONDS = 0
+    settings.READ_REPLICA_STICKY_SECONDS = 0
+    replicas._active_connections.clear()
+    replicas._lag_cache.clear()
+    yield settings
+    replicas._active_connections.clear()
+    replicas._lag_cache.clear()
+
+
+@pytest.mark.unit
+class TestReplicaSelection:
+    """Test cases for multi-replica selection, lag and stickiness."""
+
+    def test_round_robin_alternates_replicas(self, replica_settings):
+        """Test round-robin cycles through every configured replica."""
+        from plane.utils.core.replicas import release_replica, select_replica
+
+        chosen = []
+        for _ in range(4):
+            alias = select_replica()
+            chosen.append(alias)
+            release_replica(alias)
+
+        assert set(chosen) == {"replica", "replica_2"}
+        assert chosen[0] != chosen[1]
+
+    def test_least_connections_prefers_idle_replica(self, replica_settings):
+        """Test least-connections picks the replica with fewer active requests."""
+        from plane.utils.core.replicas import select_replica
+
+        replica_settings.READ_REPLICA_SELECTION = "least_connections"
+        first = select_replica()
+        second = select_replica()
+
+        assert first != second
+
+    def test_lagging_replicas_are_skipped(self, replica_settings):
+        """Test replicas beyond the staleness budget are excluded."""
+        from plane.utils.core.replicas import select_replica
+
+        replica_settings.READ_REPLICA_MAX_LAG_SECONDS = 5
+        lags = {"replica": 30.0, "replica_2": 1.0}
+        with patch("plane.utils.core.replicas.get_replica_lag", side_effect=lags.get):
+            assert select_replica() == "replica_2"
+
+        lags = {"replica": 30.0, "replica_2": None}
+        with patch("plane.utils.core.replicas.get_replica_lag", side_effect=lags.get):
+            assert select_replica() is None
+
+    @patch("plane.middleware.db_routing.set_use_read_replica")
+    @patch("plane.middleware.db_routing.has_recent_write", return_value=True)
+    def test_recent_writer_stays_on_primary(self, mock_recent, mock_set, middleware, get_request, replica_settings):
+        """Test read-your-writes stickiness overrides an opted-in view."""
+        view_func = Mock()
+        view_func.use_read_replica = True
+
+        middleware.process_view(get_request, view_func, (), {})
+
+        mock_set.assert_called_once_with(False)
+
+    @patch("plane.middleware.db_routing.mark_recent_write")
+    def test_successful_write_marks_client(self, mock_mark, middleware, post_request):
+        """Test a successful write records the stickiness marker."""
+        middleware(post_request)
+
+        mock_mark.assert_called_once()
+
+    @patch("plane.middleware.db_routing.set_read_replica_alias")
+    @patch("plane.middleware.db_routing.set_use_read_replica")
+    def test_api_key_writer_stays_on_primary(self, mock_set, mock_alias, request_factory, replica_settings):
+        """Test an API key client reads from the primary after its write."""
+        from django.core.cache.backends.locmem import LocMemCache
+
+        replica_settings.READ_REPLICA_STICKY_SECONDS = 30
+
+        def authenticate(request):
+            # DRF resolves the user of the key inside the view, after process_view
+            request.user = Mock(is_authenticated=True, id="api-user")
+            return HttpResponse(status=201)
+
+        middleware = ReadReplicaRoutingMiddleware(authenticate)
+        view_func = Mock()
+        view_func.use_read_replica = True
+
+        with patch("plane.utils.core.replicas.cache", LocMemCache("sticky", {})):
+            post_request = request_factory.post("/api/test/", HTTP_X_API_KEY="plane_api_key")
+            middleware(post_request)
+
+            get_request = request_factory.get("/api/test/", HTTP_X_API_KEY="plane_api_key")
+            get_request.user = Mock(is_authenticated=False)
+            middleware.process_view(get_request, view_func, (), {})
+            mock_set.assert_called_with(False)
+            mock_alias.assert_not_called()
+
+            other_request = request_factory.get("/api/test/", HTTP_X_API_KEY="other_api_key")
+            other_request.user = Mock(is_authenticated=False)
+            middleware.process_view(other_request, view_func, (), {})
+            mock_set.assert_called_with(True)
+
+    @patch("plane.middleware.db_routing.set_read_replica_alias")
+    @patch("plane.middleware.db_routing.set_use_read_replica")
+    def test_auto_opt_in_for_safe_viewset_actions(self, mock_set, mock_alias, middleware, request_factory, settings):
+        """Test undeclared ViewSet list actions are routed when auto opt-in is on."""
+        settings.READ_REPLICA_AUTO_OPT_IN = True
+        settings.READ_REPLICA_ALIASES = ["replica"]
+        settings.READ_REPLICA_MAX_LAG_SECONDS = 0
+
+        class TestViewSet(ViewSet):
+            pass
+
+        middleware.process_view(request_factory.get("/api/test/"), TestViewSet.as_view({"get": "list"}), (), {})
+        mock_set.assert_called_with(True)
+        mock_alias.assert_called_once_with("replica")
+
+        middleware.process_view(request_factory.get("/api/test/"), TestViewSet.as_view({"get": "custom"}), (), {})
+        mock_set.assert_called_with(False)
+
+    def test_describe_view_routing(self, settings):
+        """Test the eligibility report labels for each kind of view."""
+        from plane.middleware.db_routing import describe_view_routing
+
+        settings.READ_REPLICA_AUTO_OPT_IN = False
+
+        class ReplicaViewSet(ViewSet):
+            use_read_replica = True
+
+        class PrimaryViewSet(ViewSet):
+            use_read_replica = False
+
+        class PlainViewSet(ViewSet):
+            pass
+
+        assert describe_view_routing(ReplicaViewSet.as_view({"get": "list"})) == "replica"
+        assert describe_view_routing(PrimaryViewSet.as_view({"get": "list"})) == "primary (explicit)"
+        assert describe_view_routing(PlainViewSet.as_view({"get": "list"})) == "primary (auto eligible)"
+        assert describe_view_routing(PlainViewSet.as_view({"get": "summary"})) == "primary"
@@ -0,0 +1,94 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import Mock, patch
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from plane.middleware.profiler import RequestProfilerMiddleware
+from plane.utils import profiler
+
+
+@pytest.fixture
+def request_factory():
+    return RequestFactory()
+
+
+@pytest.mark.unit
+class TestRequestProfile:
+    """Test the per-request profile bookkeeping"""
+
+    def test_duplicate_queries_are_counted(self):
+        profile = profiler.RequestProfile()
+        profile.record_query("SELECT 1", 0.001)
+        profile.record_query("SELECT 1", 0.001)
+        profile.record_query("SELECT 1", 0.001)
+        profile.record_query("SELECT 2", 0.002)
+
+        assert profile.query_count == 4
+        assert profile.duplicate_queries == 2
+        assert profile.top_duplicates() == [{"sql": "SELECT 1", "count": 3}]
+
+    def test_server_timing_header(self):
+        profile = profiler.RequestProfile()
+        profile.record_query("SELECT 1", 0.010)
+        profile.record_cache(0.002, hits=1)
+        profile.add_phase("serialize", 0.005)
+
+        header = profile.server_timing()
+
+        assert 'db;dur=10.00;desc="1 queries"' in header
+        assert 'cache;dur=2.00;desc="1 ops"' in header
+        assert "serialize;dur=5.00" in header
+        assert "total;dur=" in header
+
+    def test_profile_phase_is_noop_without_profile(self):
+        profiler.clear_profile()
+        with profiler.profile_phase("serialize"):
+            pass
+        assert profiler.get_current_profile() is None
+
+    def test_query_profiler_records_into_active_profile(self):
+        profile = profiler.start_profile()
+        try:
+            execute = Mock(return_value="rows")
+            assert profiler.query_profiler(execute, "SELECT 1", (), False, {}) == "rows"
+        finally:
+            profiler.clear_profile()
+
+        assert profile.query_count == 1
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert profiler.percentile(values, 0.5) == 50
+        assert profiler.percentile(values, 0.95) == 95
+        assert profiler.percentile([], 0.5) is None
+
+
+@pytest.mark.unit
+class TestRequestProfilerMiddleware:
+    """Test sampling and the emitted profile"""
+
+    def test_unsampled_requests_are_untouched(self, settings, request_factory):
+        settings.REQUEST_PROFILER_SAMPLE_RATE = 0
+        middleware = RequestProfilerMiddleware(Mock(return_value=HttpResponse()))
+
+        response = middleware(request_factory.get("/api/test/"))
+
+        assert "Server-Timing" not in response
+
+    @patch("plane.middleware.profiler.record_route_profile")
+    def test_sampled_request_gets_server_timing(self, mock_record, settings, request_factory):
+        settings.REQUEST_PROFILER_SAMPLE_RATE = 1
+        middleware = RequestProfilerMiddleware(Mock(return_value=HttpResponse()))
+        request = request_factory.get("/api/test/")
+
+        response = middleware(request)
+
+        assert "db;dur=" in response["Server-Timing"]
+        assert request._request_profile.as_log_fields()["profile_query_count"] == 0
+        assert mock_record.call_args[0][0] == "GET /api/test/"
+        assert profiler.get_current_profile() is None
@@ -0,0 +1,75 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from plane.api import rate_limit
+from plane.api.rate_limit import ApiKeyRateThrottle, ServiceTokenRateThrottle
+
+
+def api_request(api_key="plane_api_key"):
+    request = MagicMock()
+    request.headers = {"X-Api-Key": api_key} if api_key else {}
+    request.META = {}
+    return request
+
+
+def api_view(slug="workspace", **attributes):
+    view = MagicMock(spec=["kwargs", *attributes])
+    view.kwargs = {"slug": slug}
+    for name, value in attributes.items():
+        setattr(view, name, value)
+    return view
+
+
+@pytest.mark.unit
+class TestRateLimit:
+    """Test the redis rate limiting of api keys"""
+
+    @patch.object(rate_limit, "check_rate_limits", return_value=(True, 41, 0, 0, 1700000060))
+    def test_allowed_request_sets_headers(self, mock_check):
+        request = api_request()
+
+        assert ApiKeyRateThrottle().allow_request(request, api_view())
+
+        ((key, num_requests, duration),) = mock_check.call_args.args[0]
+        assert "plane_api_key" not in key
+        assert (num_requests, duration) == (60, 60)
+        assert request.META == {
+            "X-RateLimit-Limit": 60,
+            "X-RateLimit-Remaining": 41,
+            "X-RateLimit-Reset": 1700000060,
+        }
+
+    @patch.object(rate_limit, "check_rate_limits", return_value=(False, 0, 1, 1.5, 1700000060))
+    def test_endpoint_limit_is_checked_with_the_key_limit(self, mock_check):
+        throttle = ServiceTokenRateThrottle()
+        request = api_request()
+
+        assert not throttle.allow_request(request, api_view(api_rate_limit="10/second"))
+
+        key_limit, endpoint_limit = mock_check.call_args.args[0]
+        assert endpoint_limit[0].startswith(key_limit[0])
+        assert endpoint_limit[1:] == (10, 1)
+        assert request.META["X-RateLimit-Limit"] == 10
+        assert throttle.wait() == 1.5
+
+    @patch.object(rate_limit, "check_rate_limits", return_value=(True, 1, 0, 0, 0))
+    def test_workspace_limit(self, mock_check):
+        with patch.object(ApiKeyRateThrottle, "workspace_rate", "1000/hour"):
+            ApiKeyRateThrottle().allow_request(api_request(), api_view(slug="plane"))
+
+        assert mock_check.call_args.args[0][-1] == ("ratelimit:workspace:plane", 1000, 3600)
+
+    @patch.object(rate_limit, "check_rate_limits")
+    def test_requests_without_key_are_not_limited(self, mock_check):
+        assert ApiKeyRateThrottle().allow_request(api_request(api_key=None), api_view())
+        mock_check.assert_not_called()
+
+    @patch.object(rate_limit, "check_rate_limits", side_effect=redis.ConnectionError)
+    def test_redis_errors_allow_the_request(self, mock_check):
+        assert ApiKeyRateThrottle().allow_request(api_request(), api_view())
@@ -0,0 +1,93 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import base64
+import hashlib
+import os
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plane.db.models import DescriptionBlob, Page
+from plane.db.models.base import BaseModel
+
+
+@pytest.mark.unit
+class TestDescriptionBlob:
+    """Test the compression and streaming of description blobs"""
+
+    def test_content_is_compressed_and_keyed_by_its_hash(self):
+        content = b"<p>description</p>" * 100
+
+        blob = DescriptionBlob.from_content(content)
+
+        assert blob.hash == hashlib.sha256(content).hexdigest()
+        assert blob.compression == DescriptionBlob.COMPRESSION_ZLIB
+        assert blob.compressed_size < blob.size == len(content)
+        assert blob.read() == content
+
+    def test_incompressible_content_is_stored_as_is(self):
+        content = os.urandom(256)
+
+        blob = DescriptionBlob.from_content(content)
+
+        assert blob.compression == DescriptionBlob.COMPRESSION_NONE
+        assert blob.read() == content
+
+    def test_identical_contents_are_stored_once(self):
+        with patch.object(DescriptionBlob.objects, "bulk_create") as bulk_create:
+            hashes = DescriptionBlob.store_many([b"same", b"same", b"other"])
+
+        assert hashes[0] == hashes[1] != hashes[2]
+        assert len(list(bulk_create.call_args.args[0])) == 2
+
+    def test_stream_reads_the_blob_a_chunk_at_a_time(self):
+        content = os.urandom(1000) + b"a" * 5000
+        blob = DescriptionBlob.from_content(content)
+        chunks = [blob.data[offset : offset + 100] for offset in range(0, blob.compressed_size, 100)]
+        queryset = MagicMock()
+        queryset.annotate.return_value.values.return_value.first.return_value = {
+            "compression": blob.compression,
+            "compressed_size": blob.compressed_size,
+            "chunk": chunks[0],
+        }
+        queryset.annotate.return_value.values_list.return_value.first.side_effect = chunks[1:]
+
+        with patch.object(DescriptionBlob.objects, "filter", return_value=queryset):
+            streamed = list(DescriptionBlob.stream(blob.hash, chunk_size=100))
+
+        assert b"".join(streamed) == content
+        assert queryset.annotate.call_count == len(chunks)
+
+
+@pytest.mark.unit
+class TestDescriptionBlobMixin:
+    """Test the description binary of pages kept in the blob store"""
+
+    def test_binary_is_stored_on_save(self):
+        page = Page(id=uuid.uuid4(), name="Page", description_binary=base64.b64encode(b"binary").decode())
+
+        assert page.description_binary == b"binary"
+        with (
+            patch.object(DescriptionBlob, "store", return_value="hash") as store,
+            patch.object(BaseModel, "save") as save,
+        ):
+            page.save()
+
+        store.assert_called_once_with(b"binary")
+        save.assert_called_once()
+        assert page.description_blob_id == "hash"
+
+    def test_update_fields_name_the_blob(self):
+        page = Page(id=uuid.uuid4(), name="Page")
+        page._state.adding = False
+        page.description_binary = None
+
+        with patch.object(DescriptionBlob, "store") as store, patch.object(BaseModel, "save") as save:
+            page.save(update_fields=["description_binary", "description_html"])
+
+        store.assert_not_called()
+        assert page.description_blob_id is None
+        assert save.call_args.kwargs["update_fields"] == ["description_blob", "description_html"]
@@ -0,0 +1,54 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from uuid import uuid4
+
+import pytest
+
+from plane.api.serializers import IssueSerializer, LabelSerializer
+from plane.api.serializers.base import BaseListSerializer
+from plane.db.models import Issue, Label, User
+
+
+@pytest.mark.unit
+class TestAPIExpansions:
+    """Test the eager loading and batched expansion of the API serializers"""
+
+    def test_expansions_are_serialized_once_per_page(self):
+        user = User(id=uuid4(), email="user@example.com", display_name="user")
+        labels = [Label(id=uuid4(), name=f"Label {index}", created_by=user, updated_by=user) for index in range(3)]
+
+        serializer = LabelSerializer(labels, many=True, expand=["created_by", "updated_by"])
+        data = serializer.data
+
+        assert isinstance(serializer, BaseListSerializer)
+        assert data[0]["created_by"]["email"] == "user@example.com"
+        assert all(item["created_by"] is data[0]["created_by"] for item in data)
+        assert all(item["updated_by"] is data[0]["created_by"] for item in data)
+
+    def test_expanded_foreign_keys_are_selected(self):
+        serializer = IssueSerializer(expand=["state", "created_by"])
+
+        sql = str(serializer.setup_eager_loading(Issue.objects.all()).query)
+
+        assert 'JOIN "states"' in sql
+        assert 'JOIN "users"' in sql
+        # The avatar url of the expanded user needs its asset
+        assert 'JOIN "file_assets"' in sql
+
+    def test_model_fields_are_loaded_alone(self):
+        serializer = IssueSerializer(fields=["id", "name", "state"], expand=["state"])
+
+        sql = str(serializer.setup_eager_loading(Issue.objects.all()).query)
+
+        assert '"issues"."description_html"' not in sql
+        assert '"issues"."name"' in sql
+        assert '"states"."group"' in sql
+
+    def test_computed_fields_load_every_column(self):
+        serializer = IssueSerializer(fields=["id", "assignees"])
+
+        sql = str(serializer.setup_eager_loading(Issue.objects.all()).query)
+
+        assert '"issues"."description_html"' in sql
@@ -0,0 +1,73 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import base64
+from unittest.mock import PropertyMock, patch
+from uuid import uuid4
+
+import pytest
+from rest_framework import serializers
+
+from plane.api.serializers import IssueSerializer
+from plane.app.serializers import IssueCreateSerializer
+from plane.db.models import Issue
+from plane.space.serializer.issue import IssueCreateSerializer as SpaceIssueCreateSerializer
+
+SERIALIZERS = [IssueCreateSerializer, IssueSerializer, SpaceIssueCreateSerializer]
+
+
+@pytest.mark.unit
+class TestIssueDescriptionBinary:
+    """Test the description binary written through the issue serializers"""
+
+    @pytest.mark.parametrize("serializer_class", SERIALIZERS)
+    def test_binary_is_write_only_and_blob_is_hidden(self, serializer_class):
+        fields = serializer_class().fields
+
+        assert fields["description_binary"].write_only
+        assert "description_blob" not in fields
+
+    @pytest.mark.parametrize("serializer_class", SERIALIZERS)
+    def test_binary_is_stored_on_the_issue(self, serializer_class):
+        content = b"\x01\x02\x03\x04" * 10
+        issue = Issue(id=uuid4(), name="Work item")
+        serializer = serializer_class()
+        value = serializer.fields["description_binary"].run_validation(base64.b64encode(content).decode())
+
+        with patch.object(Issue, "save"):
+            serializer.update(issue, {"description_binary": value})
+
+        # The mixin keeps the decoded content until the blob is written on save
+        assert issue.description_binary == content
+
+    @pytest.mark.parametrize("serializer_class", SERIALIZERS)
+    def test_invalid_binary_is_rejected(self, serializer_class):
+        serializer = serializer_class(context={"project_id": uuid4()})
+
+        with pytest.raises(serializers.ValidationError) as error:
+            serializer.validate({"description_binary": base64.b64encode(b"\x01").decode()})
+
+        assert "description_binary" in error.value.detail
+
+    def test_binary_is_read_on_single_work_items(self):
+        content = b"\x01\x02\x03\x04" * 10
+        issue = Issue(id=uuid4(), name="Work item", description_binary=content)
+
+        data = IssueSerializer(issue, fields=["id", "description_binary"]).data
+
+        assert base64.b64decode(data["description_binary"]) == content
+        assert "description_binary" not in IssueSerializer(issue, fields=["id"]).data
+        assert (
+            IssueSerializer(Issue(id=uuid4()), fields=["id", "description_binary"]).data["description_binary"] is None
+        )
+
+    def test_binary_is_left_out_of_pages(self):
+        issues = [Issue(id=uuid4(), name="Work item", description_binary=b"\x01\x02\x03\x04") for _ in range(2)]
+
+        with patch.object(Issue, "description_binary", new_callable=PropertyMock) as description_binary:
+            data = IssueSerializer(issues, many=True, fields=["id", "description_binary"]).data
+
+        assert [item["id"] for item in data] == [issue.id for issue in issues]
+        assert all("description_binary" not in item for item in data)
+        description_binary.assert_not_called()
@@ -0,0 +1,101 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plane.settings import redis as plane_redis
+
+
+@pytest.fixture(autouse=True)
+def reset_client(settings):
+    settings.REDIS_URL = "redis://localhost:6379/"
+    settings.REDIS_SSL = False
+    plane_redis._reset_after_fork()
+    yield
+    plane_redis._reset_after_fork()
+
+
+@pytest.mark.unit
+class TestRedisInstance:
+    """Test the pooled redis client facility"""
+
+    def test_redis_instance_is_shared(self):
+        """Test that every call returns the same client and pool"""
+        first = plane_redis.redis_instance()
+        second = plane_redis.redis_instance()
+
+        assert first is second
+        assert isinstance(first.connection_pool, plane_redis.InstrumentedConnectionPool)
+
+    def test_pool_respects_max_connections(self, settings):
+        """Test that the pool size is read from settings"""
+        settings.REDIS_MAX_CONNECTIONS = 7
+        client = plane_redis.redis_instance()
+        assert client.connection_pool.max_connections == 7
+
+    def test_client_is_rebuilt_after_fork(self):
+        """Test that a forked child does not reuse the parent client"""
+        parent = plane_redis.redis_instance()
+        plane_redis._reset_after_fork()
+        child = plane_redis.redis_instance()
+
+        assert parent is not child
+        assert parent.connection_pool is not child.connection_pool
+
+    def test_pool_metrics(self):
+        """Test that metrics are reported once the pool exists"""
+        assert plane_redis.redis_pool_metrics() == {"initialized": False}
+
+        plane_redis.redis_instance()
+        metrics = plane_redis.redis_pool_metrics()
+
+        assert metrics["initialized"] is True
+        assert metrics["created_connections"] == 0
+        assert metrics["in_use_connections"] == 0
+        assert metrics["errors"] == 0
+
+    def test_connection_errors_are_counted(self):
+        """Test that a failed checkout increments the error counter"""
+        client = plane_redis.redis_instance()
+        pool = client.connection_pool
+
+        with patch.object(pool, "make_connection", side_effect=plane_redis.redis.ConnectionError):
+            with pytest.raises(plane_redis.redis.ConnectionError):
+                pool.get_connection("GET")
+
+        assert plane_redis.redis_pool_metrics()["errors"] == 1
+
+
+@pytest.mark.unit
+class TestRedisBatchHelpers:
+    """Test the multi-key helpers issue a single round trip"""
+
+    @patch("plane.settings.redis.redis_instance")
+    def test_get_many(self, mock_instance):
+        client = MagicMock()
+        client.mget.return_value = [b"1", None]
+        mock_instance.return_value = client
+
+        assert plane_redis.redis_get_many(["a", "b"]) == {"a": b"1", "b": None}
+        client.mget.assert_called_once_with(["a", "b"])
+
+    @patch("plane.settings.redis.redis_instance")
+    def test_set_many_uses_pipeline(self, mock_instance):
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        mock_instance.return_value = client
+
+        plane_redis.redis_set_many({"a": 1, "b": 2}, ex=60)
+
+        assert pipe.set.call_count == 2
+        pipe.execute.assert_called_once()
+
+    @patch("plane.settings.redis.redis_instance")
+    def test_empty_inputs_skip_redis(self, mock_instance):
+        assert plane_redis.redis_get_many([]) == {}
+        assert plane_redis.redis_delete_many([]) == 0
+        plane_redis.redis_set_many({})
+        mock_instance.assert_not_called()
@@ -0,0 +1,124 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import uuid
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.db.models.query import ValuesIterable
+from django.utils import timezone
+
+from plane.app.views.analytic import advance
+from plane.app.views.analytic.advance import AdvanceAnalyticsStatsEndpoint
+from plane.db.models import IssueAnalyticsRollup
+from plane.utils import analytics_rollup
+
+
+@pytest.fixture
+def rollups_ready():
+    with patch.object(analytics_rollup, "rollups_ready", return_value=True) as mock_ready:
+        yield mock_ready
+
+
+@pytest.mark.unit
+class TestCanUseRollups:
+    """Test which analytics requests are answered from the rollups"""
+
+    def test_supported_axes(self, rollups_ready):
+        assert analytics_rollup.can_use_rollups(["state_id", "priority"])
+        assert analytics_rollup.can_use_rollups(["LABELS", "STATE_GROUPS"])
+
+    def test_unsupported_axis_falls_back(self, rollups_ready):
+        assert not analytics_rollup.can_use_rollups(["target_date"])
+        assert not analytics_rollup.can_use_rollups(["ESTIMATE_POINTS"])
+
+    def test_two_multi_valued_dimensions_fall_back(self, rollups_ready):
+        assert not analytics_rollup.can_use_rollups(["labels__id", "assignees__id"])
+
+    def test_dates_require_utc(self, rollups_ready):
+        with timezone.override("Asia/Kolkata"):
+            assert not analytics_rollup.can_use_rollups(["created_at"])
+            assert not analytics_rollup.can_use_rollups(["PRIORITY"], date_filtered=True)
+            assert analytics_rollup.can_use_rollups(["PRIORITY"])
+
+        with timezone.override("UTC"):
+            assert analytics_rollup.can_use_rollups(["CREATED_AT"], date_filtered=True)
+
+    def test_not_ready_falls_back(self):
+        with patch.object(analytics_rollup, "rollups_ready", return_value=False):
+            assert not analytics_rollup.can_use_rollups(["priority"])
+
+
+@pytest.fixture
+def rollup_rows():
+    """Rows returned by values() querysets, with the compiled queries"""
+    queries = []
+
+    def set_rows(rows):
+        def iterate(iterable):
+            queries.append(str(iterable.queryset.query))
+            return iter([dict(row) for row in rows])
+
+        return patch.object(ValuesIterable, "__iter__", iterate)
+
+    set_rows.queries = queries
+    return set_rows
+
+
+@pytest.mark.unit
+class TestBuildRollupGraphPlot:
+    """Test the graph plot built from the rollups"""
+
+    def test_rows_are_keyed_by_dimension(self, rollup_rows):
+        rows = [{"dimension_key": "high", "count": 3}, {"dimension_key": "low", "count": 2}]
+
+        with rollup_rows(rows):
+            data = analytics_rollup.build_rollup_graph_plot(
+                IssueAnalyticsRollup.objects.all(), "priority", "issue_count"
+            )
+
+        assert data == {"low": [{"dimension": "low", "count": 2}], "high": [{"dimension": "high", "count": 3}]}
+        assert '"issue_analytics_rollups"."priority" AS "dimension_key"' in rollup_rows.queries[0]
+
+    def test_segment_over_a_dimension(self, rollup_rows):
+        label_id = uuid.uuid4()
+        rows = [{"dimension_key": "2024-1", "segment_key": label_id, "estimate": 5.0}]
+
+        with rollup_rows(rows):
+            data = analytics_rollup.build_rollup_graph_plot(
+                IssueAnalyticsRollup.objects.all(), "created_at", "estimate", segment="labels__id"
+            )
+
+        assert data == {"2024-1": [{"dimension": "2024-1", "segment": label_id, "estimate": 5.0}]}
+        assert '"issue_analytics_rollups"."dimension" = label' in rollup_rows.queries[0]
+
+
+@pytest.mark.unit
+class TestWorkItemsStats:
+    """Test that the work item stats apply the chart period to the rollups and the live query"""
+
+    def get_view(self):
+        view = AdvanceAnalyticsStatsEndpoint()
+        view.filters = {
+            "base_filters": {"workspace__slug": "test-workspace"},
+            "project_filters": {"workspace__slug": "test-workspace"},
+            "chart_period_range": (date(2024, 1, 1), date(2024, 1, 31)),
+        }
+        return view
+
+    def test_live_query_is_limited_to_the_period(self):
+        with patch.object(advance, "can_use_rollups", return_value=False):
+            query = str(self.get_view().get_work_items_stats().query)
+
+        assert "2024-01-01" in query and "2024-01-31" in query
+        assert "issue_analytics_rollups" not in query
+
+    def test_rollups_are_limited_to_the_period(self):
+        with patch.object(advance, "can_use_rollups", return_value=True) as can_use:
+            query = str(self.get_view().get_work_items_stats().query)
+
+        can_use.assert_called_once_with((), date_filtered=True)
+        assert '"issue_analytics_rollups"."date" >= 2024-01-01' in query
+        assert '"issue_analytics_rollups"."date" <= 2024-01-31' in query
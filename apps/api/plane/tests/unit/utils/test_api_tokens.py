@@ -0,0 +1,108 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from plane.utils import api_tokens
+
+
+@pytest.fixture(autouse=True)
+def clear_local_tokens():
+    api_tokens._local_tokens.clear()
+    api_tokens._last_recorded.clear()
+    yield
+    api_tokens._local_tokens.clear()
+    api_tokens._last_recorded.clear()
+
+
+def token_fields(**fields):
+    return {
+        "id": str(uuid4()),
+        "user_id": str(uuid4()),
+        "workspace_id": None,
+        "is_service": False,
+        "expired_at": None,
+        **fields,
+    }
+
+
+@pytest.mark.unit
+class TestAPITokenCache:
+    """Test the cached api token lookups and deferred last used writes"""
+
+    @patch.object(api_tokens, "redis_instance")
+    @patch.object(api_tokens, "load_api_token")
+    def test_token_is_loaded_once(self, mock_load, mock_redis):
+        mock_load.return_value = token_fields()
+        mock_redis.return_value.get.return_value = None
+
+        assert api_tokens.get_valid_api_token("plane_api_token") == mock_load.return_value
+        assert api_tokens.get_valid_api_token("plane_api_token") == mock_load.return_value
+
+        assert mock_load.call_count == 1
+        key = mock_redis.return_value.set.call_args.args[0]
+        assert key == api_tokens.get_token_key(api_tokens.hash_token("plane_api_token"))
+        assert "plane_api_token" not in key
+
+    @patch.object(api_tokens, "redis_instance")
+    @patch.object(api_tokens, "load_api_token")
+    def test_token_cached_in_redis(self, mock_load, mock_redis):
+        mock_redis.return_value.get.return_value = json.dumps(token_fields(is_service=True))
+
+        assert api_tokens.get_valid_api_token("plane_api_token")["is_service"]
+        mock_load.assert_not_called()
+
+    @patch.object(api_tokens, "redis_instance")
+    @patch.object(api_tokens, "load_api_token")
+    def test_expired_token_is_rejected_from_the_cache(self, mock_load, mock_redis):
+        mock_redis.return_value.get.return_value = json.dumps(token_fields(expired_at=time.time() - 1))
+
+        assert api_tokens.get_valid_api_token("plane_api_token") is None
+
+    @patch.object(api_tokens, "redis_instance")
+    @patch.object(api_tokens, "load_api_token")
+    def test_forget_api_token(self, mock_load, mock_redis):
+        mock_load.return_value = token_fields()
+        mock_redis.return_value.get.return_value = None
+        api_tokens.get_valid_api_token("plane_api_token")
+
+        api_tokens.forget_api_token("plane_api_token")
+        api_tokens.get_valid_api_token("plane_api_token")
+
+        assert mock_load.call_count == 2
+        mock_redis.return_value.delete.assert_called_once()
+
+    @patch.object(api_tokens, "redis_instance")
+    def test_uses_are_recorded_once_per_interval(self, mock_redis):
+        api_tokens.record_api_token_use("token-id")
+        api_tokens.record_api_token_use("token-id")
+
+        assert mock_redis.return_value.hset.call_count == 1
+
+    @patch.object(api_tokens, "APIToken")
+    @patch.object(api_tokens, "redis_instance")
+    def test_flush_writes_last_used_in_bulk(self, mock_redis, mock_api_token):
+        token_id = str(uuid4())
+        pipe = MagicMock()
+        pipe.execute.return_value = [{token_id.encode(): b"1700000000.5"}, 1]
+        mock_redis.return_value.pipeline.return_value = pipe
+
+        assert api_tokens.flush_api_token_last_used() == 1
+
+        mock_api_token.objects.bulk_update.assert_called_once()
+        assert mock_api_token.call_args.kwargs["id"] == token_id
+        assert mock_api_token.call_args.kwargs["last_used"].timestamp() == 1700000000.5
+
+    @patch.object(api_tokens, "APIToken")
+    @patch.object(api_tokens, "redis_instance", side_effect=ConnectionError)
+    def test_use_is_written_when_redis_is_down(self, mock_redis, mock_api_token):
+        api_tokens.record_api_token_use("token-id")
+
+        mock_api_token.objects.filter.assert_called_once_with(pk="token-id")
@@ -0,0 +1,50 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import random
+import uuid
+from collections import Counter
+
+import pytest
+
+from plane.utils.benchmark import build_requests, percentile, summarize
+
+
+@pytest.mark.unit
+class TestBenchmark:
+    """Test the request mix and report of the API benchmark"""
+
+    def test_percentile_uses_the_nearest_rank(self):
+        values = list(range(100, 0, -1))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([7], 95) == 7
+        assert percentile([], 95) == 0
+
+    def test_request_mix_is_seeded_and_weighted_by_issues(self):
+        busy, empty = uuid.uuid4(), uuid.uuid4()
+        projects = [(busy, 900, [uuid.uuid4() for _ in range(10)]), (empty, 0, [])]
+
+        requests = build_requests(random.Random(1), projects, 500)
+
+        assert requests == build_requests(random.Random(1), projects, 500)
+        endpoints = Counter(endpoint for endpoint, _ in requests)
+        assert set(endpoints) == {"issue-list", "issue-board", "issue-detail", "issue-timeline", "search", "analytics"}
+        assert sum(str(empty) in path for _, path in requests) < 10
+        # Issue pages of a project without issues fall back to the list
+        assert all(str(busy) in path for endpoint, path in requests if endpoint == "issue-detail")
+
+    def test_summary_per_endpoint(self):
+        samples = [("search", 200, 0.010, 4), ("search", 200, 0.030, 6), ("search", 500, 0.020, 2)]
+
+        report = summarize(samples)["search"]
+
+        assert report["requests"] == 3
+        assert report["errors"] == 1
+        assert report["p50_ms"] == pytest.approx(20)
+        assert report["max_ms"] == pytest.approx(30)
+        assert report["mean_queries"] == 4
+        assert report["max_queries"] == 6
@@ -0,0 +1,125 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from plane.utils import dependency_graph
+from plane.utils.dependency_graph import DependencyGraph, strongly_connected_components
+
+
+@pytest.mark.unit
+class TestDependencyGraph:
+    """Test the blockers, cycles, order and schedule of a dependency graph"""
+
+    def test_strongly_connected_components_are_returned_after_their_successors(self):
+        # 0 -> 1 <-> 2 -> 3
+        components = strongly_connected_components(4, [[1], [2], [1, 3], []])
+
+        assert [sorted(component) for component in components] == [[3], [1, 2], [0]]
+
+    def test_transitive_blockers_and_order(self):
+        # a blocks b, b blocks c, c starts before d
+        graph = DependencyGraph(
+            {issue: (None, None) for issue in "abcd"},
+            [("b", "a", "blocked_by"), ("c", "b", "blocked_by"), ("c", "d", "start_before")],
+        )
+
+        data = graph.to_dict()
+        blockers = {node["id"]: set(node["blocker_ids"]) for node in data["nodes"]}
+
+        assert blockers == {"a": set(), "b": {"a"}, "c": {"a", "b"}, "d": set()}
+        assert data["topological_order"] == ["a", "b", "c", "d"]
+        assert data["cycles"] == []
+
+    def test_cycles_are_left_out_of_the_order(self):
+        graph = DependencyGraph(
+            {issue: (None, None) for issue in "abcd"},
+            [("a", "b", "blocked_by"), ("b", "a", "blocked_by"), ("c", "b", "blocked_by")],
+        )
+
+        data = graph.to_dict()
+        blockers = {node["id"]: set(node["blocker_ids"]) for node in data["nodes"]}
+
+        assert data["cycles"] == [["a", "b"]]
+        assert data["topological_order"] == ["d"]
+        assert blockers["c"] == {"a", "b"}
+        assert blockers["a"] == {"b"}
+        assert next(node for node in data["nodes"] if node["id"] == "c")["earliest_start"] is None
+
+    def test_critical_path_schedule(self):
+        # design (3 days) blocks build (5 days), docs (2 days) finish before build
+        graph = DependencyGraph(
+            {
+                "design": (date(2024, 7, 1), date(2024, 7, 3)),
+                "build": (date(2024, 7, 4), date(2024, 7, 8)),
+                "docs": (date(2024, 7, 2), date(2024, 7, 3)),
+            },
+            [("build", "design", "blocked_by"), ("docs", "build", "finish_before")],
+        )
+
+        data = graph.to_dict()
+        nodes = {node["id"]: node for node in data["nodes"]}
+
+        assert data["critical_path"] == ["design", "build"]
+        assert nodes["build"]["earliest_start"] == date(2024, 7, 4)
+        assert nodes["build"]["earliest_finish"] == date(2024, 7, 8)
+        assert nodes["docs"]["is_critical"] is False
+        assert nodes["docs"]["slack"] == 5
+        assert nodes["docs"]["latest_finish"] == date(2024, 7, 8)
+        assert data["start_date"] == date(2024, 7, 1)
+        assert data["finish_date"] == date(2024, 7, 8)
+
+    def test_successors_are_delayed_by_their_predecessors(self):
+        graph = DependencyGraph(
+            {"a": (date(2024, 7, 1), date(2024, 7, 10)), "b": (date(2024, 7, 2), date(2024, 7, 3))},
+            [("b", "a", "blocked_by")],
+        )
+
+        nodes = {node["id"]: node for node in graph.to_dict()["nodes"]}
+
+        assert nodes["b"]["earliest_start"] == date(2024, 7, 11)
+        assert nodes["b"]["is_critical"] is True
+
+
+@pytest.mark.unit
+class TestDependencyGraphCache:
+    """Test the graphs cached under the version of their project"""
+
+    def test_miss_computes_and_stores_the_graph(self):
+        redis = MagicMock()
+        redis.get.side_effect = [b"3", None]
+        compute = MagicMock(return_value=DependencyGraph({"a": (None, None)}, []))
+
+        with patch.object(dependency_graph, "redis_instance", return_value=redis):
+            body = dependency_graph.get_dependency_graph("project", "project", compute)
+
+        assert json.loads(body)["topological_order"] == ["a"]
+        redis.set.assert_called_once_with("dependency_graph:project:3:project", body, ex=dependency_graph.GRAPH_TTL)
+
+    def test_hit_returns_the_cached_graph(self):
+        redis = MagicMock()
+        redis.get.side_effect = [b"3", b'{"nodes": []}']
+        compute = MagicMock()
+
+        with patch.object(dependency_graph, "redis_instance", return_value=redis):
+            body = dependency_graph.get_dependency_graph("project", "project", compute)
+
+        assert body == '{"nodes": []}'
+        compute.assert_not_called()
+
+    def test_graph_is_computed_without_redis(self):
+        redis = MagicMock()
+        redis.get.side_effect = RedisError
+        compute = MagicMock(return_value=DependencyGraph({}, []))
+
+        with patch.object(dependency_graph, "redis_instance", return_value=redis):
+            body = dependency_graph.get_dependency_graph("project", "project", compute)
+
+        assert json.loads(body)["nodes"] == []
+        redis.set.assert_not_called()
@@ -0,0 +1,66 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from plane.db.models import Issue
+from plane.utils.filters import ComplexFilterBackend, IssueFilterSet, filter_backend
+
+
+class IssueView:
+    filterset_class = IssueFilterSet
+
+
+@pytest.fixture(autouse=True)
+def clear_plans():
+    filter_backend.clear_filter_plans()
+    yield
+    filter_backend.clear_filter_plans()
+
+
+def apply(filter_data):
+    return ComplexFilterBackend().filter_queryset(None, Issue.objects.all(), IssueView(), filter_data=filter_data)
+
+
+@pytest.mark.unit
+class TestFilterPlans:
+    """Test compiling and caching rich filter plans"""
+
+    def test_equivalent_filters_share_a_key(self):
+        first = {"and": [{"priority__in": "high,urgent"}, {"state_group": "started"}]}
+        second = {"and": [{"state_group": "started"}, {"priority__in": "urgent,high"}]}
+
+        assert filter_backend.get_filter_plan_key(first, "scope") == filter_backend.get_filter_plan_key(second, "scope")
+        assert filter_backend.get_filter_plan_key(first, "scope") != filter_backend.get_filter_plan_key(first, "other")
+
+    def test_repeated_filter_is_compiled_once(self):
+        filter_data = {"state_group__in": "started,backlog"}
+
+        with patch.object(
+            ComplexFilterBackend, "_evaluate_node", autospec=True, side_effect=ComplexFilterBackend._evaluate_node
+        ) as mock_evaluate:
+            first = apply(filter_data)
+            second = apply(filter_data)
+
+        assert mock_evaluate.call_count == 1
+        assert str(first.query) == str(second.query)
+
+    def test_invalid_filter_is_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                apply({"name": "not allowed"})
+
+        assert not filter_backend._filter_plans
+
+    def test_relation_filters_use_exists_without_joins(self):
+        label_id = uuid4()
+
+        sql = str(apply({"and": [{"label_id": str(label_id)}, {"not": {"assignee_id": str(uuid4())}}]}).query)
+
+        assert "JOIN" not in sql
+        assert sql.count("EXISTS") == 2
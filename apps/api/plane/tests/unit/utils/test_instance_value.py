@@ -0,0 +1,91 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from plane.license.utils import instance_value
+from plane.license.utils.encryption import encrypt_data
+
+ROWS = [
+    {"key": "EMAIL_HOST", "value": "smtp.plane.so", "is_encrypted": False},
+    {"key": "EMAIL_PORT", "value": "2525", "is_encrypted": False},
+    {"key": "ENABLE_SMTP", "value": "1", "is_encrypted": False},
+    {"key": "EMAIL_HOST_PASSWORD", "value": None, "is_encrypted": True},
+]
+
+
+@pytest.fixture
+def configuration_rows():
+    rows = [dict(row) for row in ROWS]
+    rows[3]["value"] = encrypt_data("secret")
+    with patch.object(instance_value, "InstanceConfiguration") as mock_model:
+        mock_model.objects.values.return_value = rows
+        yield mock_model
+
+
+@pytest.fixture
+def mock_redis():
+    client = MagicMock()
+    client.get.return_value = b"1"
+    with patch.object(instance_value, "redis_instance", return_value=client):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(settings):
+    settings.SKIP_ENV_VAR = True
+    instance_value._configuration_cache.update({"version": None, "values": None})
+    yield
+    instance_value._configuration_cache.update({"version": None, "values": None})
+
+
+@pytest.mark.unit
+class TestConfigurationCache:
+    """Test the cached instance configuration resolver"""
+
+    def test_values_are_decrypted_and_defaulted(self, configuration_rows, mock_redis):
+        host, password, missing = instance_value.get_configuration_value(
+            [
+                {"key": "EMAIL_HOST", "default": None},
+                {"key": "EMAIL_HOST_PASSWORD", "default": None},
+                {"key": "MISSING", "default": "fallback"},
+            ]
+        )
+        assert (host, password, missing) == ("smtp.plane.so", "secret", "fallback")
+
+    def test_table_is_loaded_once_per_version(self, configuration_rows, mock_redis):
+        for _ in range(5):
+            instance_value.get_configuration_value([{"key": "EMAIL_HOST", "default": None}])
+
+        assert configuration_rows.objects.values.call_count == 1
+
+        mock_redis.get.return_value = b"2"
+        instance_value.get_configuration_value([{"key": "EMAIL_HOST", "default": None}])
+
+        assert configuration_rows.objects.values.call_count == 2
+
+    def test_invalidate_bumps_version(self, configuration_rows, mock_redis):
+        instance_value.get_configurations()
+        instance_value.invalidate_configuration_cache()
+
+        mock_redis.incr.assert_called_once_with(instance_value.CONFIGURATION_VERSION_KEY)
+        assert instance_value._configuration_cache["values"] is None
+
+    def test_redis_outage_reads_from_database(self, configuration_rows, mock_redis):
+        mock_redis.get.side_effect = RedisConnectionError()
+
+        instance_value.get_configurations()
+        instance_value.get_configurations()
+
+        assert configuration_rows.objects.values.call_count == 2
+
+    def test_typed_accessors(self, configuration_rows, mock_redis):
+        assert instance_value.get_configuration_int("EMAIL_PORT") == 2525
+        assert instance_value.get_configuration_bool("ENABLE_SMTP") is True
+        assert instance_value.get_configuration_bool("MISSING", default=True) is True
+        assert instance_value.get_configuration_int("EMAIL_HOST", default=7) == 7
+        assert instance_value.get_configuration_str("MISSING", "x") == "x"
@@ -0,0 +1,62 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plane.db.models import Issue
+from plane.utils import issue_annotations
+
+
+@pytest.mark.unit
+class TestIssueAnnotations:
+    """Test computing the issue annotation fields for a page of issues"""
+
+    @patch.object(issue_annotations, "fetch_issue_annotations")
+    def test_enrich_fills_missing_fields_with_defaults(self, mock_fetch):
+        mock_fetch.return_value = {"link_count": {1: 3}, "cycle_id": {}}
+        issues = [{"id": 1}, {"id": 2}]
+
+        issue_annotations.enrich_issues(issues, ["link_count", "cycle_id"])
+
+        mock_fetch.assert_called_once_with([1, 2], ["link_count", "cycle_id"])
+        assert issues == [
+            {"id": 1, "link_count": 3, "cycle_id": None},
+            {"id": 2, "link_count": 0, "cycle_id": None},
+        ]
+
+    @patch.object(issue_annotations, "fetch_issue_annotations")
+    def test_enrich_keeps_present_values(self, mock_fetch):
+        mock_fetch.return_value = {"sub_issues_count": {}}
+        issue = Issue(name="Issue")
+        issue.link_count = 5
+
+        issue_annotations.enrich_issues([issue], ["link_count", "sub_issues_count"])
+
+        mock_fetch.assert_called_once_with([issue.id], ["sub_issues_count"])
+        assert issue.link_count == 5
+        assert issue.sub_issues_count == 0
+
+    @patch.object(issue_annotations, "fetch_issue_annotations")
+    def test_issue_values_defers_fields_not_annotated(self, mock_fetch):
+        mock_fetch.return_value = {"link_count": {1: 2}}
+        queryset = MagicMock()
+        queryset.query.annotations = {"cycle_id": None}
+        queryset.values.return_value = [{"id": 1, "name": "Issue", "cycle_id": None}]
+
+        result = issue_annotations.issue_values(queryset, ["id", "name", "cycle_id", "link_count"])
+
+        queryset.values.assert_called_once_with("id", "name", "cycle_id")
+        assert result == [{"id": 1, "name": "Issue", "cycle_id": None, "link_count": 2}]
+
+    def test_annotate_skips_annotated_fields(self):
+        queryset = MagicMock()
+        queryset.query.annotations = {"cycle_id": None}
+
+        issue_annotations.annotate_issues(queryset, ["cycle_id", "link_count"])
+
+        assert list(queryset.annotate.call_args.kwargs) == ["link_count"]
+        queryset.query.annotations = {"cycle_id": None, "link_count": None}
+        assert issue_annotations.annotate_issues(queryset, ["cycle_id", "link_count"]) is queryset
@@ -0,0 +1,185 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import uuid
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from plane.bgtasks import cleanup_task
+from plane.db.models import IssueChangeLog
+from plane.db.models import issue as issue_models
+from plane.utils import issue_change_log
+
+
+def settled_changes(rows, transaction_rows=None, more=False):
+    """Mock the settled changes returning rows and the rows of a whole transaction"""
+    changes = MagicMock()
+    changes.order_by.return_value.values_list.return_value.__getitem__.return_value = rows
+    changes.filter.return_value.order_by.return_value.values_list.return_value = transaction_rows or []
+    changes.filter.return_value.exists.return_value = more
+    settled = MagicMock()
+    settled.filter.return_value = changes
+    return patch.object(issue_change_log, "_settled_changes", return_value=settled)
+
+
+@pytest.mark.unit
+class TestChangedIssueIds:
+    """Test the batches of changed issues read from the change log"""
+
+    def test_batches_end_on_a_transaction_boundary(self):
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        with settled_changes([(10, a), (10, b), (11, c), (12, a)]):
+            issue_ids, next_since, has_more = issue_change_log.get_changed_issue_ids("project", 5, limit=3)
+
+        assert issue_ids == [a, b, c]
+        assert next_since == 11
+        assert has_more
+
+    def test_issues_are_sent_once_in_their_last_change_order(self):
+        a, b = uuid.uuid4(), uuid.uuid4()
+
+        with settled_changes([(10, a), (11, b), (12, a)]):
+            issue_ids, next_since, has_more = issue_change_log.get_changed_issue_ids("project", 5, limit=5)
+
+        assert issue_ids == [b, a]
+        assert next_since == 12
+        assert not has_more
+
+    def test_transaction_larger_than_a_batch_is_sent_whole(self):
+        issues = [uuid.uuid4() for _ in range(4)]
+        rows = [(10, issue_id) for issue_id in issues]
+
+        with settled_changes(rows[:3], transaction_rows=rows, more=True):
+            issue_ids, next_since, has_more = issue_change_log.get_changed_issue_ids("project", 5, limit=2)
+
+        assert issue_ids == issues
+        assert next_since == 10
+        assert has_more
+
+    def test_no_changes_keep_the_cursor(self):
+        with settled_changes([]):
+            assert issue_change_log.get_changed_issue_ids("project", 5) == ([], 5, False)
+
+    def test_only_finished_transactions_are_read(self):
+        query = str(issue_change_log._settled_changes().query)
+
+        assert '"issue_change_logs"."transaction_id" < (pg_snapshot_xmin(pg_current_snapshot())' in query
+
+
+@pytest.mark.unit
+class TestChangeLogCursor:
+    """Test the cursors handed out by full syncs and the pruning watermark"""
+
+    def test_cursor_is_below_the_oldest_running_transaction(self):
+        connections = MagicMock()
+        cursor = connections.__getitem__.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (500,)
+
+        with patch.object(issue_change_log, "connections", connections):
+            assert issue_change_log.get_change_log_cursor() == 499
+
+        assert "pg_snapshot_xmin" in cursor.execute.call_args.args[0]
+
+    @pytest.mark.parametrize(
+        "watermark, since, pruned",
+        [(None, 0, False), (b"100", 99, True), (b"100", 100, False), (b"100", 250, False)],
+    )
+    def test_pruned_when_the_cursor_is_behind_the_watermark(self, watermark, since, pruned):
+        with patch.object(issue_change_log, "redis_instance") as redis:
+            redis.return_value.get.return_value = watermark
+            assert issue_change_log.is_change_log_pruned(since) is pruned
+
+    def test_pruned_without_the_watermark(self):
+        with patch.object(issue_change_log, "redis_instance") as redis:
+            redis.return_value.get.side_effect = RedisError
+            assert issue_change_log.is_change_log_pruned(100)
+
+
+@pytest.mark.unit
+class TestPruneChangeLog:
+    """Test the retention cleanup of the change log"""
+
+    def test_watermark_is_raised_before_deleting(self):
+        manager = MagicMock()
+        manager.filter.return_value.aggregate.return_value = {"transaction_id": 120}
+        manager.filter.return_value.order_by.return_value.values_list.return_value.__getitem__.side_effect = [
+            [1, 2],
+            [],
+        ]
+        manager.filter.return_value.delete.return_value = (2, {})
+
+        with (
+            patch.object(IssueChangeLog, "objects", manager),
+            patch.object(issue_change_log, "set_change_log_pruned") as set_pruned,
+        ):
+            set_pruned.side_effect = lambda transaction_id: manager.filter.return_value.delete.assert_not_called()
+            deleted = issue_change_log.prune_change_log(datetime(2024, 1, 1, tzinfo=timezone.utc), 100)
+
+        assert deleted == 2
+        set_pruned.assert_called_once_with(120)
+        assert call(transaction_id__lte=120) in manager.filter.call_args_list
+
+    def test_nothing_expired(self):
+        with (
+            patch.object(IssueChangeLog.objects, "filter") as filter_changes,
+            patch.object(issue_change_log, "set_change_log_pruned") as set_pruned,
+        ):
+            filter_changes.return_value.aggregate.return_value = {"transaction_id": None}
+            assert issue_change_log.prune_change_log(datetime(2024, 1, 1, tzinfo=timezone.utc), 100) == 0
+
+        set_pruned.assert_not_called()
+
+    def test_cleanup_task_uses_the_retention_window(self, monkeypatch):
+        monkeypatch.setenv("ISSUE_CHANGE_LOG_RETENTION_DAYS", "7")
+        now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+        with (
+            patch.object(cleanup_task.timezone, "now", return_value=now),
+            patch.object(cleanup_task, "prune_change_log", return_value=3) as prune,
+        ):
+            cleanup_task.delete_issue_change_logs()
+
+        prune.assert_called_once_with(datetime(2024, 1, 24, tzinfo=timezone.utc), cleanup_task.BATCH_SIZE)
+
+
+@pytest.mark.unit
+class TestRecordChanges:
+    """Test the rows appended to the change log"""
+
+    def test_rows_carry_the_writing_transaction(self):
+        issue_id, project_id, workspace_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        connection = MagicMock()
+        connection.cursor.return_value.__enter__.return_value.fetchone.return_value = (4242,)
+
+        with (
+            patch.object(issue_models, "connection", connection),
+            patch.object(issue_models.transaction, "atomic", return_value=nullcontext()),
+            patch.object(issue_models, "invalidate_public_boards_on_commit"),
+            patch.object(issue_models, "invalidate_dependency_graphs_on_commit"),
+            patch.object(IssueChangeLog.objects, "bulk_create", side_effect=lambda rows, **kwargs: rows) as create,
+        ):
+            IssueChangeLog.record([(issue_id, project_id, workspace_id)], IssueChangeLog.CHANGE_UPDATED)
+
+        (row,) = create.call_args.args[0]
+        assert row.transaction_id == 4242
+        assert (row.issue_id, row.project_id, row.change) == (issue_id, project_id, IssueChangeLog.CHANGE_UPDATED)
+
+    def test_membership_changes_are_recorded_as_updates(self):
+        issue_id = uuid.uuid4()
+
+        with patch.object(IssueChangeLog, "record") as record:
+            issue_change_log.record_membership_changes([issue_id])
+
+        issues, change = record.call_args.args
+        assert change == IssueChangeLog.CHANGE_UPDATED
+        query = str(issues.query)
+        assert f'"issues"."id" IN ({issue_id})' in query
+        # Archived and draft issues are not part of the feed
+        assert 'NOT ("issues"."archived_at" IS NOT NULL)' in query
+        assert 'NOT ("issues"."is_draft")' in query
@@ -0,0 +1,49 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from uuid import uuid4
+
+import pytest
+
+from plane.utils.issue_relation_mapper import ISSUE_RELATION_KEYS, partition_relations
+
+
+@pytest.mark.unit
+class TestPartitionRelations:
+    """Test grouping the relation rows of an issue by type and direction"""
+
+    def test_rows_are_read_from_the_issue(self):
+        issue_id = uuid4()
+        other_ids = [uuid4() for _ in range(5)]
+        relations = [
+            (issue_id, other_ids[0], "blocked_by"),
+            (other_ids[1], issue_id, "blocked_by"),
+            (other_ids[2], issue_id, "start_before"),
+            (issue_id, other_ids[3], "finish_before"),
+            (other_ids[4], issue_id, "duplicate"),
+        ]
+
+        partitioned = partition_relations(str(issue_id), relations)
+
+        assert list(partitioned) == ISSUE_RELATION_KEYS
+        assert partitioned["blocked_by"] == [other_ids[0]]
+        assert partitioned["blocking"] == [other_ids[1]]
+        assert partitioned["start_after"] == [other_ids[2]]
+        assert partitioned["finish_before"] == [other_ids[3]]
+        assert partitioned["duplicate"] == [other_ids[4]]
+        assert partitioned["relates_to"] == []
+
+    def test_unlisted_types_and_repeats_are_skipped(self):
+        issue_id = uuid4()
+        other_id = uuid4()
+        relations = [
+            (issue_id, other_id, "relates_to"),
+            (other_id, issue_id, "relates_to"),
+            (issue_id, other_id, "implemented_by"),
+        ]
+
+        partitioned = partition_relations(issue_id, relations)
+
+        assert partitioned["relates_to"] == [other_id]
+        assert sum(len(ids) for ids in partitioned.values()) == 1
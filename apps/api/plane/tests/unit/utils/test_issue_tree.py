@@ -0,0 +1,57 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from uuid import uuid4
+
+import pytest
+
+from plane.utils.issue_tree import roll_up_sub_issue_tree
+
+
+def node(parent_id, depth, state_group, estimate_value=None):
+    return {
+        "id": uuid4(),
+        "parent_id": parent_id,
+        "depth": depth,
+        "state_group": state_group,
+        "estimate_value": estimate_value,
+    }
+
+
+@pytest.mark.unit
+class TestRollUpSubIssueTree:
+    """Test the descendant counts and estimates rolled up the sub-issue tree"""
+
+    def test_descendants_are_rolled_up_to_every_ancestor(self):
+        root_id = uuid4()
+        epic = node(root_id, 1, "started", "5")
+        story = node(epic["id"], 2, "completed", "3")
+        task = node(story["id"], 3, "completed", "2")
+        bug = node(epic["id"], 2, "backlog", "Large")
+        other = node(root_id, 1, "unstarted", "1")
+
+        summary = roll_up_sub_issue_tree([epic, other, story, bug, task])
+
+        assert epic["descendant_count"] == 3
+        assert epic["state_distribution"]["completed"] == 2
+        assert epic["state_distribution"]["backlog"] == 1
+        assert (epic["estimate_total"], epic["estimate_completed"]) == (5.0, 5.0)
+        assert story["descendant_count"] == 1
+        assert task["descendant_count"] == 0
+        assert task["state_distribution"] == {
+            "backlog": 0,
+            "unstarted": 0,
+            "started": 0,
+            "completed": 0,
+            "cancelled": 0,
+        }
+        assert summary["descendant_count"] == 5
+        assert summary["state_distribution"]["completed"] == 2
+        assert (summary["estimate_total"], summary["estimate_completed"]) == (11.0, 5.0)
+
+    def test_empty_tree(self):
+        summary = roll_up_sub_issue_tree([])
+
+        assert summary["descendant_count"] == 0
+        assert summary["estimate_total"] == 0
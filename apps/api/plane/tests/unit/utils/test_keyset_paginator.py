@@ -0,0 +1,111 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from plane.utils.paginator import KeysetCursor, KeysetPaginator, MergedKeysetPaginator
+
+
+@pytest.mark.unit
+class TestKeysetPaginator:
+    """Test the keyset cursor of the newest first activity feeds"""
+
+    def test_cursor_round_trip(self):
+        cursor = KeysetCursor(datetime(2024, 7, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc), uuid4())
+
+        assert KeysetCursor.from_string(str(cursor)) == cursor
+
+    @pytest.mark.parametrize("value", ["", "not a cursor", "MjAyNC0wNy0wMVQxMjowMDowMHxub3QtYS11dWlk"])
+    def test_invalid_cursor(self, value):
+        with pytest.raises(ValueError):
+            KeysetCursor.from_string(value)
+
+    def test_next_cursor_is_the_last_row_of_the_page(self):
+        rows = [{"id": uuid4(), "created_at": datetime(2024, 7, 1, hour, tzinfo=dt_timezone.utc)} for hour in (3, 2, 1)]
+        queryset = MagicMock()
+        queryset.order_by.return_value.__getitem__.return_value = rows
+
+        result = KeysetPaginator(queryset).get_result(limit=2)
+
+        assert result.results == rows[:2]
+        assert result.next == KeysetCursor(rows[1]["created_at"], rows[1]["id"])
+        queryset.order_by.assert_called_once_with("-created_at", "-id")
+        queryset.order_by.return_value.__getitem__.assert_called_once_with(slice(None, 3))
+
+    def test_last_page_has_no_next_cursor(self):
+        cursor = KeysetCursor(datetime(2024, 7, 1, tzinfo=dt_timezone.utc), uuid4())
+        queryset = MagicMock()
+        seek = queryset.order_by.return_value.filter
+        seek.return_value.__getitem__.return_value = [{"id": uuid4(), "created_at": cursor.created_at}]
+
+        result = KeysetPaginator(queryset).get_result(limit=2, cursor=cursor)
+
+        assert len(result) == 1
+        assert result.next is None
+        assert seek.call_args.kwargs == {"created_at__lte": cursor.created_at}
+
+
+def stream(rows, cursor=False):
+    """A queryset returning the (created_at, id) rows of a timeline stream"""
+    queryset = MagicMock()
+    ordered = queryset.order_by.return_value
+    if cursor:
+        ordered = ordered.filter.return_value
+    ordered.values_list.return_value.__getitem__.return_value.iterator.return_value = iter(rows)
+    return queryset
+
+
+def at(hour):
+    return datetime(2024, 7, 1, hour, tzinfo=dt_timezone.utc)
+
+
+@pytest.mark.unit
+class TestMergedKeysetPaginator:
+    """Test the oldest first timeline merged from several querysets"""
+
+    def test_latest_page_is_merged_oldest_first(self):
+        activities = [(at(hour), uuid4()) for hour in (9, 6, 3)]
+        comments = [(at(hour), uuid4()) for hour in (8, 7)]
+        querysets = {"activity": stream(activities), "comment": stream(comments)}
+
+        result = MergedKeysetPaginator(querysets).get_result(limit=3)
+
+        assert [(created_at.hour, kind) for created_at, _, kind in result] == [
+            (7, "comment"),
+            (8, "comment"),
+            (9, "activity"),
+        ]
+        assert result.prev == KeysetCursor(at(7), comments[1][1])
+        assert result.prev.has_results is True
+        assert result.next.has_results is False
+        querysets["activity"].order_by.assert_called_once_with("-created_at", "-id")
+
+    def test_after_cursor_reads_newer_entries(self):
+        cursor = KeysetCursor(at(3), uuid4())
+        activities = [(at(4), uuid4())]
+        querysets = {"activity": stream(activities, cursor=True), "comment": stream([], cursor=True)}
+
+        result = MergedKeysetPaginator(querysets).get_result(limit=2, after=cursor)
+
+        assert [entry[1] for entry in result] == [activities[0][1]]
+        assert result.next == KeysetCursor(*activities[0])
+        assert result.next.has_results is False
+        assert result.prev.has_results is True
+        querysets["comment"].order_by.assert_called_once_with("created_at", "id")
+        seek = querysets["comment"].order_by.return_value.filter
+        assert seek.call_args.kwargs == {"created_at__gte": cursor.created_at}
+
+    def test_empty_page_keeps_the_cursor(self):
+        cursor = KeysetCursor(at(3), uuid4())
+        querysets = {"activity": stream([], cursor=True)}
+
+        result = MergedKeysetPaginator(querysets).get_result(limit=2, after=cursor)
+
+        assert len(result) == 0
+        assert result.next == cursor
+        assert result.next.has_results is False
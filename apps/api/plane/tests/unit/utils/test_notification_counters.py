@@ -0,0 +1,87 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from plane.db.models import Notification
+from plane.utils import notification_counters
+
+
+def build_notification(sender="in_app:issue_activities:assigned", **kwargs):
+    notification = Notification(id=uuid4(), sender=sender, receiver_id=uuid4(), **kwargs)
+    notification.sender_type = Notification.get_sender_type(sender)
+    return notification
+
+
+@pytest.mark.unit
+class TestNotificationSenderType:
+    """Test the categorical sender type"""
+
+    def test_sender_type_is_last_segment(self):
+        assert Notification.get_sender_type("in_app:issue_activities:mentioned") == "mentioned"
+        assert Notification.get_sender_type("in_app:issue_activities:created") == "created"
+
+    def test_unknown_sender_is_other(self):
+        assert Notification.get_sender_type("in_app:something") == "other"
+        assert Notification.get_sender_type(None) == "other"
+
+
+@pytest.mark.unit
+class TestUnreadCounters:
+    """Test the counter deltas and seeding"""
+
+    def test_read_decrements_total(self):
+        notification = build_notification(read_at=timezone.now())
+        assert notification_counters.get_unread_delta(notification, was_unread=True) == (-1, 0)
+
+    def test_new_mention_increments_mention(self):
+        notification = build_notification(sender="in_app:issue_activities:mentioned")
+        assert notification_counters.get_unread_delta(notification, was_unread=False) == (0, 1)
+
+    def test_unchanged_notification_has_no_delta(self):
+        notification = build_notification(snoozed_till=timezone.now())
+        assert notification_counters.get_unread_delta(notification, was_unread=False) == (0, 0)
+
+    @patch.object(notification_counters, "adjust_unread_counters")
+    def test_track_groups_deltas_per_receiver(self, mock_adjust):
+        receiver_id = uuid4()
+        notifications = [build_notification() for _ in range(3)]
+        for notification in notifications:
+            notification.receiver_id = receiver_id
+
+        notification_counters.track_notification_changes("plane", notifications, {})
+
+        mock_adjust.assert_called_once_with({("plane", str(receiver_id)): (3, 0)})
+
+    @patch.object(notification_counters, "count_unread_notifications")
+    @patch.object(notification_counters, "redis_instance")
+    def test_cached_counters_skip_database(self, mock_redis, mock_count):
+        mock_redis.return_value.hmget.return_value = [b"4", b"2"]
+
+        assert notification_counters.get_unread_counters("plane", "user") == {"total": 4, "mention": 2}
+        mock_count.assert_not_called()
+
+    @patch.object(notification_counters, "count_unread_notifications", return_value={"total": 1, "mention": 0})
+    @patch.object(notification_counters, "redis_instance")
+    def test_missing_counters_are_seeded(self, mock_redis, mock_count):
+        client = MagicMock()
+        client.hmget.return_value = [None, None]
+        mock_redis.return_value = client
+
+        assert notification_counters.get_unread_counters("plane", "user") == {"total": 1, "mention": 0}
+        client.pipeline.return_value.hset.assert_called_once_with(
+            "notification_unread:plane:user", mapping={"total": 1, "mention": 0}
+        )
+
+    @patch.object(notification_counters, "count_unread_notifications", return_value={"total": 5, "mention": 1})
+    @patch.object(notification_counters, "redis_instance")
+    def test_redis_failure_falls_back_to_database(self, mock_redis, mock_count):
+        mock_redis.return_value.hmget.side_effect = RedisConnectionError()
+
+        assert notification_counters.get_unread_counters("plane", "user") == {"total": 5, "mention": 1}
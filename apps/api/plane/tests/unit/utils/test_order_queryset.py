@@ -0,0 +1,30 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import pytest
+
+from plane.db.models import Issue
+from plane.utils.order_queryset import order_issue_queryset
+
+
+@pytest.mark.unit
+class TestOrderIssueQueryset:
+    """Test ordering issues by the options offered in the issue lists"""
+
+    @pytest.mark.parametrize("field", ["link_count", "attachment_count", "sub_issues_count"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_order_by_computed_counts(self, field, descending):
+        order_by_param = f"-{field}" if descending else field
+
+        queryset, order_by = order_issue_queryset(Issue.issue_objects.all(), order_by_param)
+
+        assert order_by == order_by_param
+        assert field in queryset.query.annotations
+        assert queryset.query.order_by == (order_by_param, "-created_at")
+        assert f'AS "{field}"' in str(queryset.query)
+
+    def test_plain_fields_are_not_annotated(self):
+        queryset, _ = order_issue_queryset(Issue.issue_objects.all(), "-updated_at")
+
+        assert not queryset.query.annotations
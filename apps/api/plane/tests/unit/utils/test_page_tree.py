@@ -0,0 +1,90 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import uuid
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from django.db.models import Q
+
+from plane.db.models import Page, ProjectPage, User
+from plane.utils import page_tree
+
+
+def make_page(parent=None, name="Page"):
+    page = Page(id=uuid.uuid4(), name=name, workspace_id=uuid.uuid4(), access=0)
+    page.parent_id = parent.id if parent else None
+    page.tree_path = parent.descendants_path if parent else ""
+    return page
+
+
+@pytest.mark.unit
+class TestPageTree:
+    """Test the subtree operations built on the materialized page paths"""
+
+    def test_descendants_path_and_depth(self):
+        root = make_page()
+        child = make_page(root)
+        grandchild = make_page(child)
+
+        assert child.tree_path == f"{root.id}/"
+        assert grandchild.tree_path == f"{root.id}/{child.id}/"
+        assert grandchild.tree_path.startswith(root.descendants_path)
+        assert page_tree.get_depth(grandchild.tree_path, root) == 2
+        assert page_tree.get_depth(grandchild.tree_path, child) == 1
+
+    def test_duplicate_subtree_remaps_parents_and_paths(self):
+        ancestor = make_page()
+        page = make_page(ancestor, name="Spec")
+        child = make_page(page, name="Child")
+        grandchild = make_page(child, name="Grandchild")
+        subtree = MagicMock()
+        subtree.filter.return_value.order_by.return_value = [page, child, grandchild]
+        user = User(id=uuid.uuid4())
+
+        with (
+            patch.object(page_tree, "get_subtree", return_value=subtree),
+            patch.object(page_tree.transaction, "atomic", return_value=nullcontext()),
+            patch.object(Page.objects, "bulk_create") as create_pages,
+            patch.object(ProjectPage.objects, "bulk_create") as create_project_pages,
+        ):
+            copies = page_tree.duplicate_subtree(page, user, ["project-1", "project-2"])
+
+        page_copy, child_copy, grandchild_copy = copies
+        assert page_copy.name == "Spec (Copy)"
+        assert page_copy.parent_id == ancestor.id
+        assert page_copy.tree_path == page.tree_path
+        assert child_copy.parent_id == page_copy.id
+        assert child_copy.tree_path == page_copy.descendants_path
+        assert grandchild_copy.parent_id == child_copy.id
+        assert grandchild_copy.tree_path == child_copy.descendants_path
+        assert {copy.id for copy in copies}.isdisjoint({page.id, child.id, grandchild.id})
+        create_pages.assert_called_once()
+        assert len(create_project_pages.call_args.args[0]) == 6
+
+    def test_duplicate_subtree_skips_pages_the_user_can_not_see(self):
+        page = make_page(name="Spec")
+        hidden = make_page(page, name="Private")
+        visible = make_page(hidden, name="Public")
+        subtree = MagicMock()
+        # The private page of another owner is filtered out of the subtree
+        subtree.filter.return_value.order_by.return_value = [page, visible]
+        user = User(id=uuid.uuid4())
+
+        with (
+            patch.object(page_tree, "get_subtree", return_value=subtree),
+            patch.object(page_tree.transaction, "atomic", return_value=nullcontext()),
+            patch.object(Page.objects, "bulk_create"),
+            patch.object(ProjectPage.objects, "bulk_create"),
+        ):
+            page_copy, visible_copy = page_tree.duplicate_subtree(page, user, ["project-1"])
+
+        # The visible descendant moves under the closest copied ancestor
+        assert visible_copy.parent_id == page_copy.id
+        assert visible_copy.tree_path == page_copy.descendants_path
+        assert str(hidden.id) not in visible_copy.tree_path
+        (visibility,) = subtree.filter.call_args.args
+        assert visibility == Q(pk=page.pk) | Q(owned_by=user) | Q(access=Page.PUBLIC_ACCESS)
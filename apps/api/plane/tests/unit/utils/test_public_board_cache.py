@@ -0,0 +1,95 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.http import QueryDict
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework.response import Response
+
+from plane.utils import public_board_cache
+
+
+def build_request(query="", etag=None):
+    request = MagicMock()
+    request.query_params = QueryDict(query)
+    request.headers = {"If-None-Match": etag} if etag else {}
+    return request
+
+
+@pytest.mark.unit
+class TestPublicBoardSnapshot:
+    """Test serving published boards from snapshots"""
+
+    def test_snapshot_key_ignores_parameter_order(self):
+        first = public_board_cache.get_snapshot_key("anchor", 3, QueryDict("group_by=state&priority=high"))
+        second = public_board_cache.get_snapshot_key("anchor", 3, QueryDict("priority=high&group_by=state"))
+
+        assert first == second
+        assert first != public_board_cache.get_snapshot_key("anchor", 4, QueryDict("priority=high&group_by=state"))
+
+    @patch.object(public_board_cache, "redis_instance")
+    def test_hit_skips_compute(self, mock_redis):
+        mock_redis.return_value.get.return_value = b"2"
+        mock_redis.return_value.hmget.return_value = [b'{"results": []}', b'"etag"']
+        compute = MagicMock()
+
+        response = public_board_cache.serve_public_board_snapshot(build_request(), "anchor", "project", compute)
+
+        compute.assert_not_called()
+        assert response.content == b'{"results": []}'
+        assert response["ETag"] == '"etag"'
+        assert response["Cache-Control"] == public_board_cache.CACHE_CONTROL
+
+    @patch.object(public_board_cache, "redis_instance")
+    def test_matching_etag_is_not_modified(self, mock_redis):
+        mock_redis.return_value.get.return_value = None
+        mock_redis.return_value.hmget.return_value = [b"{}", b'"etag"']
+
+        response = public_board_cache.serve_public_board_snapshot(
+            build_request(etag='"etag"'), "anchor", "project", MagicMock()
+        )
+
+        assert response.status_code == 304
+
+    @patch.object(public_board_cache, "redis_instance")
+    def test_miss_computes_and_stores(self, mock_redis):
+        client = mock_redis.return_value
+        client.get.return_value = None
+        client.hmget.return_value = [None, None]
+        client.lock.return_value.acquire.return_value = True
+        compute = MagicMock(return_value=Response({"results": [1]}))
+
+        response = public_board_cache.serve_public_board_snapshot(build_request(), "anchor", "project", compute)
+
+        compute.assert_called_once()
+        assert response.content == b'{"results":[1]}'
+        client.pipeline.return_value.hset.assert_called_once()
+        client.lock.return_value.release.assert_called_once()
+
+    @patch.object(public_board_cache, "wait_for_snapshot", return_value=[b"{}", b'"etag"'])
+    @patch.object(public_board_cache, "redis_instance")
+    def test_concurrent_miss_waits_for_snapshot(self, mock_redis, mock_wait):
+        client = mock_redis.return_value
+        client.get.return_value = None
+        client.hmget.return_value = [None, None]
+        client.lock.return_value.acquire.return_value = False
+        compute = MagicMock()
+
+        response = public_board_cache.serve_public_board_snapshot(build_request(), "anchor", "project", compute)
+
+        compute.assert_not_called()
+        assert response.content == b"{}"
+
+    @patch.object(public_board_cache, "redis_instance")
+    def test_redis_failure_computes_directly(self, mock_redis):
+        mock_redis.return_value.get.side_effect = RedisConnectionError()
+        expected = Response({})
+
+        response = public_board_cache.serve_public_board_snapshot(
+            build_request(), "anchor", "project", MagicMock(return_value=expected)
+        )
+
+        assert response is expected
@@ -0,0 +1,229 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from plane.db.models import UserRecentVisit
+from plane.utils import recent_visits
+
+
+class FakeRedis:
+    """The sorted set and set commands used by the recent visits, kept in memory"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.data.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in zset):
+                zset[member] = score
+
+    def zrevrange(self, key, start, end, withscores=False):
+        entries = sorted(self.data.get(key, {}).items(), key=lambda entry: -entry[1])
+        entries = entries[start : None if end == -1 else end + 1]
+        return [(member.encode(), score) for member, score in entries]
+
+    def zremrangebyrank(self, key, start, end):
+        entries = sorted(self.data.get(key, {}).items(), key=lambda entry: entry[1])
+        for member, _ in entries[start : len(entries) + end + 1]:
+            del self.data[key][member]
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.data.get(key, {}).pop(member, None)
+
+    def sadd(self, key, *values):
+        self.data.setdefault(key, set()).update(
+            value.decode() if isinstance(value, bytes) else value for value in values
+        )
+
+    def smembers(self, key):
+        return {value.encode() for value in self.data.get(key, set())}
+
+    def spop(self, key, count):
+        values = self.data.pop(key, set())
+        return [value.encode() for value in values]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def expire(self, key, seconds):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+@pytest.mark.unit
+class TestRecentVisits:
+    """Test recording and reading recent visits from redis"""
+
+    @patch.object(recent_visits, "redis_instance")
+    def test_record_trims_and_marks_dirty(self, mock_redis):
+        pipe = mock_redis.return_value.pipeline.return_value
+        issue_id, project_id = uuid4(), uuid4()
+
+        recent_visits.record_recent_visit("plane", "user", "issue", issue_id, project_id)
+
+        key = "recent_visits:plane:user"
+        member = f"issue:{issue_id}:{project_id}"
+        assert list(pipe.zadd.call_args.args[1]) == [member]
+        pipe.zremrangebyrank.assert_called_once_with(key, 0, -(recent_visits.MAX_RECENT_VISITS + 1))
+        pipe.sadd.assert_called_once_with(recent_visits.DIRTY_KEY, "plane:user")
+        pipe.execute.assert_called_once()
+
+    @patch("plane.bgtasks.recent_visited_task.recent_visited_task")
+    @patch.object(recent_visits, "redis_instance")
+    def test_record_falls_back_to_task(self, mock_redis, mock_task):
+        mock_redis.return_value.pipeline.return_value.execute.side_effect = RedisConnectionError()
+
+        recent_visits.record_recent_visit("plane", "user", "project", "project-id", "project-id")
+
+        mock_task.delay.assert_called_once()
+
+    @patch.object(recent_visits, "seed_recent_visits")
+    @patch.object(recent_visits, "redis_instance")
+    def test_seeded_visits_are_read_from_redis(self, mock_redis, mock_seed):
+        page_id = uuid4()
+        mock_redis.return_value.pipeline.return_value.execute.return_value = [
+            [(f"page:{page_id}:".encode(), 1700000000.0), (f"view:{uuid4()}:".encode(), 1690000000.0)],
+            1,
+        ]
+
+        visits = recent_visits.get_recent_visits("plane", "user", entity_names=["page"])
+
+        mock_seed.assert_not_called()
+        assert len(visits) == 1
+        assert visits[0].entity_identifier == str(page_id)
+        assert visits[0].project_id is None
+        assert visits[0].visited_at.timestamp() == 1700000000.0
+
+    @patch.object(recent_visits, "seed_recent_visits", return_value=[])
+    @patch.object(recent_visits, "redis_instance")
+    def test_missing_visits_are_seeded(self, mock_redis, mock_seed):
+        mock_redis.return_value.pipeline.return_value.execute.return_value = [[], 0]
+
+        assert recent_visits.get_recent_visits("plane", "user") == []
+        mock_seed.assert_called_once_with("plane", "user")
+
+    @patch.object(recent_visits, "load_recent_visits")
+    @patch.object(recent_visits, "redis_instance")
+    def test_redis_failure_reads_database(self, mock_redis, mock_load):
+        visit = UserRecentVisit(entity_name="issue", entity_identifier=uuid4())
+        mock_load.return_value = [visit]
+        mock_redis.return_value.pipeline.side_effect = RedisConnectionError()
+
+        assert recent_visits.get_recent_visits("plane", "user") == [visit]
+
+    @patch.object(recent_visits, "persist_recent_visits")
+    @patch.object(recent_visits, "Workspace")
+    @patch.object(recent_visits, "redis_instance")
+    def test_failed_flush_keeps_users_pending(self, mock_redis, mock_workspace, mock_persist):
+        client = MagicMock()
+        client.spop.return_value = [b"plane:user"]
+        client.pipeline.return_value.execute.return_value = [[(f"issue:{uuid4()}:".encode(), 1700000000.0)]]
+        mock_redis.return_value = client
+        mock_workspace.objects.filter.return_value.values_list.return_value = [("plane", "workspace-id")]
+        mock_persist.side_effect = RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            recent_visits.flush_recent_visits()
+
+        client.sadd.assert_called_once_with(recent_visits.DIRTY_KEY, b"plane:user")
+
+    @pytest.mark.django_db
+    def test_persisted_visits_keep_the_visit_time(self, workspace, create_user):
+        issue_id, page_id = uuid4(), uuid4()
+        UserRecentVisit.objects.create(
+            workspace=workspace, user=create_user, entity_name="page", entity_identifier=page_id
+        )
+        visits = [
+            recent_visits.build_visit(workspace.slug, create_user.id, f"issue:{issue_id}:", 1700000000.0),
+            recent_visits.build_visit(workspace.slug, create_user.id, f"page:{page_id}:", 1690000000.0),
+        ]
+
+        recent_visits.persist_recent_visits({(workspace.id, create_user.id): visits})
+
+        stored = dict(UserRecentVisit.objects.filter(user=create_user).values_list("entity_identifier", "visited_at"))
+        assert stored[issue_id].timestamp() == 1700000000.0
+        assert stored[page_id].timestamp() == 1690000000.0
+
+    def test_new_visits_are_written_with_their_visit_time(self):
+        visit = recent_visits.build_visit("plane", uuid4(), f"issue:{uuid4()}:", 1700000000.0)
+
+        with (
+            patch.object(recent_visits.transaction, "atomic", return_value=nullcontext()),
+            patch.object(UserRecentVisit.objects, "filter") as filter_visits,
+            patch.object(UserRecentVisit.objects, "bulk_create") as bulk_create,
+            patch.object(UserRecentVisit.objects, "bulk_update") as bulk_update,
+        ):
+            filter_visits.return_value.only.return_value = []
+            filter_visits.return_value.annotate.return_value.filter.return_value.values.return_value = []
+            recent_visits.persist_recent_visits({(uuid4(), visit.user_id): [visit]})
+
+        (created,) = bulk_create.call_args.args[0]
+        assert bulk_update.call_args.args[0] == [created]
+        assert bulk_update.call_args.args[1] == ["visited_at"]
+        assert created.visited_at.timestamp() == 1700000000.0
+
+    @patch.object(recent_visits, "redis_instance")
+    def test_removed_entities_leave_the_sorted_sets(self, mock_redis):
+        client = mock_redis.return_value
+        issue_id, project_id = uuid4(), uuid4()
+        client.smembers.return_value = {b"plane:dirty-user", b"other:other-user"}
+
+        with patch.object(UserRecentVisit.objects, "filter") as filter_visits:
+            filter_visits.return_value.filter.return_value.values_list.return_value = [uuid4()]
+            recent_visits.remove_recent_visits("plane", "issue", [issue_id], project_id=project_id)
+
+        visits = filter_visits.return_value.filter.return_value
+        visits.delete.assert_called_once_with(soft=False)
+        (persisted_user,) = visits.values_list.return_value
+        removed = {call.args for call in client.pipeline.return_value.zrem.call_args_list}
+        member = f"issue:{issue_id}:{project_id}"
+        assert removed == {
+            (f"recent_visits:plane:{persisted_user}", member),
+            ("recent_visits:plane:dirty-user", member),
+        }
+
+    @pytest.mark.django_db
+    def test_deleted_entity_is_gone_from_the_list_and_the_table(self, workspace, create_user):
+        client = FakeRedis()
+        kept, deleted = uuid4(), uuid4()
+
+        with patch.object(recent_visits, "redis_instance", return_value=client):
+            recent_visits.record_recent_visit(workspace.slug, create_user.id, "issue", kept)
+            recent_visits.record_recent_visit(workspace.slug, create_user.id, "issue", deleted)
+            recent_visits.flush_recent_visits()
+            # A visit after the last flush is only in the sorted set
+            recent_visits.record_recent_visit(workspace.slug, create_user.id, "issue", deleted)
+
+            recent_visits.remove_recent_visits(workspace.slug, "issue", [deleted])
+
+            visits = recent_visits.get_recent_visits(workspace.slug, create_user.id)
+            recent_visits.flush_recent_visits()
+
+        assert [visit.entity_identifier for visit in visits] == [str(kept)]
+        assert list(UserRecentVisit.objects.values_list("entity_identifier", flat=True)) == [kept]
@@ -0,0 +1,79 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+import random
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from plane.db.models import Issue, IssueActivity, IssueSequence, State
+from plane.utils import synthetic_data
+from plane.utils.synthetic_data import SyntheticWorkspace, heavy_tailed_count, skewed_counts
+
+
+def generate_issues(seed):
+    generator = SyntheticWorkspace(None, "synthetic", seed=seed, batch_size=10**6)
+    base = {"workspace_id": uuid.uuid4(), "project_id": uuid.uuid4()}
+    context = {
+        "base": base,
+        "states": [State(id=generator.uuid(), name=name, group=group) for name, _, group, _ in synthetic_data.STATES],
+        "labels": [generator.uuid() for _ in range(5)],
+        "label_weights": synthetic_data.zipf_weights(5),
+        "members": [generator.uuid() for _ in range(3)],
+        "member_weights": synthetic_data.zipf_weights(3),
+        "cycles": [],
+        "modules": [],
+        "issue_ids": [],
+    }
+    for sequence_id in range(1, 21):
+        context["issue_ids"].append(generator.create_issue(context, sequence_id))
+    return generator
+
+
+@pytest.mark.unit
+class TestSyntheticData:
+    """Test the skewed and deterministic synthetic workspace generator"""
+
+    def test_skewed_counts_keep_the_total(self):
+        counts = skewed_counts(1000, 7, 1.2)
+
+        assert sum(counts) == 1000
+        assert counts == sorted(counts, reverse=True)
+        assert counts[0] > 5 * counts[-1]
+        assert skewed_counts(1000, 4, 0) == [250, 250, 250, 250]
+
+    def test_heavy_tailed_count_is_capped(self):
+        rng = random.Random(0)
+
+        values = [heavy_tailed_count(rng, 3, 2.5, 40) for _ in range(5000)]
+
+        assert min(values) >= 0
+        assert max(values) == 40
+        assert 2 < sum(values) / len(values) < 4
+        assert heavy_tailed_count(rng, 0, 2.5, 40) == 0
+
+    def test_same_seed_generates_the_same_rows(self):
+        first, second, other = generate_issues(1), generate_issues(1), generate_issues(2)
+
+        def ids(generator):
+            return [obj.id for objects in generator.pending.values() for obj in objects]
+
+        assert ids(first) == ids(second)
+        assert set(ids(first)).isdisjoint(ids(other))
+        assert [issue.name for issue in first.pending[Issue]] == [issue.name for issue in second.pending[Issue]]
+        assert len(first.pending[IssueSequence]) == 20
+        assert len(first.pending[IssueActivity]) >= 20
+
+    def test_rows_are_flushed_in_batches(self):
+        generator = SyntheticWorkspace(None, "synthetic", batch_size=3)
+        states = [State(id=generator.uuid(), created_at=generator.start) for _ in range(7)]
+
+        with patch.object(synthetic_data, "copy_objects", side_effect=lambda model, objects, using: len(objects)):
+            for state in states:
+                generator.add(state)
+
+        assert generator.counts[State._meta.db_table] == 6
+        assert generator.pending[State] == states[6:]
+        assert states[0].updated_at == states[0].created_at
@@ -0,0 +1,58 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+
+from plane.utils import timezone_converter
+
+
+@pytest.fixture(autouse=True)
+def clear_project_timezones():
+    timezone_converter._project_timezones.clear()
+    yield
+    timezone_converter._project_timezones.clear()
+
+
+@pytest.mark.unit
+class TestTimezoneConverter:
+    """Test the conversion of datetimes to user and project timezones"""
+
+    def test_columns_are_converted_in_place(self):
+        value = datetime(2024, 7, 1, 12, 0, tzinfo=dt_timezone.utc)
+        rows = [{"created_at": value, "archived_at": None}, {"name": "no datetime"}]
+
+        result = timezone_converter.convert_datetime_columns(rows, ["created_at", "archived_at"], "Asia/Kolkata")
+
+        assert result is rows
+        assert result[0]["created_at"].isoformat() == "2024-07-01T17:30:00+05:30"
+        assert result[0]["archived_at"] is None
+
+    def test_utc_is_not_converted(self):
+        value = datetime(2024, 7, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+        result = timezone_converter.user_timezone_converter({"created_at": value}, ["created_at"], "UTC")
+
+        assert result["created_at"] is value
+
+    @patch.object(timezone_converter, "Project")
+    def test_project_timezone_is_cached(self, mock_project):
+        mock_project.objects.values_list.return_value.get.return_value = "Europe/Berlin"
+
+        assert timezone_converter.get_project_timezone("project") == "Europe/Berlin"
+        assert timezone_converter.get_project_timezone("project") == "Europe/Berlin"
+        assert mock_project.objects.values_list.call_count == 1
+
+        timezone_converter.forget_project_timezone("project")
+        timezone_converter.get_project_timezone("project")
+        assert mock_project.objects.values_list.call_count == 2
+
+    @patch.object(timezone_converter, "get_project_timezone", return_value="America/New_York")
+    def test_end_date_is_last_minute_of_local_day(self, mock_timezone):
+        # Clocks fall back on this day, the end of the day is still 23:59 local time
+        result = timezone_converter.convert_to_utc("2024-11-03", "project")
+
+        assert result == datetime(2024, 11, 4, 4, 59, tzinfo=dt_timezone.utc)
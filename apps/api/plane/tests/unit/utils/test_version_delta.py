@@ -0,0 +1,67 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+from uuid import uuid4
+
+import pytest
+
+from plane.db.models import PageVersion
+from plane.utils.version_delta import apply_delta, make_delta
+
+BASE_HTML = "".join(f"<p>paragraph {index} of the page</p>" for index in range(500)).encode()
+
+
+@pytest.mark.unit
+class TestVersionDelta:
+    """Test the delta encoding of description versions"""
+
+    def test_round_trip_small_edit(self):
+        target = BASE_HTML.replace(b"paragraph 250 ", b"edited paragraph 250 ")
+        delta = make_delta([BASE_HTML], [target])
+
+        assert apply_delta([BASE_HTML], delta) == [target]
+        assert len(delta) < len(target) // 20
+
+    def test_round_trip_several_fields(self):
+        bases = [BASE_HTML, b"\x00\x01binary", b'{"type": "doc"}']
+        targets = [BASE_HTML[100:] + b"<p>new</p>", None, b'{"type": "doc", "content": []}']
+
+        assert apply_delta(bases, make_delta(bases, targets)) == targets
+
+    def test_round_trip_without_base(self):
+        delta = make_delta([None, b""], [b"<p>first</p>", b""])
+
+        assert apply_delta([None, b""], delta) == [b"<p>first</p>", b""]
+
+
+@pytest.mark.unit
+class TestDescriptionVersionMixin:
+    """Test storing a version as a delta against a snapshot"""
+
+    def test_delta_version_rebuilds_description(self):
+        snapshot = PageVersion(id=uuid4(), page_id=uuid4(), description_html=BASE_HTML.decode(), description_json={})
+        version = PageVersion(id=uuid4(), page_id=snapshot.page_id)
+        version._get_delta_base = lambda: snapshot
+
+        html = BASE_HTML.decode().replace("paragraph 10 ", "paragraph ten ")
+        version.set_description({"description_html": html, "description_binary": None, "description_json": {}})
+
+        assert not version.is_snapshot
+        assert version.description_html == ""
+
+        version.load_description()
+        assert version.description_html == html
+        assert version.description_binary is None
+
+    def test_large_change_stores_snapshot(self):
+        snapshot = PageVersion(id=uuid4(), page_id=uuid4(), description_html="<p>old</p>", description_json={})
+        version = PageVersion(id=uuid4(), page_id=snapshot.page_id)
+        version._get_delta_base = lambda: snapshot
+
+        version.set_description(
+            {"description_html": "<p>rewritten</p>", "description_binary": None, "description_json": {}}
+        )
+
+        assert version.is_snapshot
+        assert version.description_html == "<p>rewritten</p>"
@@ -0,0 +1,370 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Build and read the daily issue analytics rollups.
+Rollups are bucketed by the UTC creation date of the issue, so charts that
+filter or bucket by date only read them while the active timezone is UTC.
+Everything else falls back to the live queries in the analytics views.
+"""
+
+# Python imports
+from datetime import timezone as dt_timezone
+from itertools import groupby
+
+# Django imports
+from django.db import models, transaction
+from django.db.models import Case, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce, Concat, TruncDate
+from django.utils import timezone
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueAnalyticsRollup,
+    Label,
+    Module,
+    State,
+    StateGroup,
+    User,
+)
+from plane.settings.redis import redis_instance
+from plane.utils.analytics_plot import annotate_with_monthly_dimension, sort_data
+from plane.utils.build_chart import process_grouped_data
+
+ROLLUP_WATERMARK_KEY = "issue_analytics_rollup:watermark"
+
+NONE = IssueAnalyticsRollup.DIMENSION_NONE
+ASSIGNEE = IssueAnalyticsRollup.DIMENSION_ASSIGNEE
+LABEL = IssueAnalyticsRollup.DIMENSION_LABEL
+CYCLE = IssueAnalyticsRollup.DIMENSION_CYCLE
+MODULE = IssueAnalyticsRollup.DIMENSION_MODULE
+
+# dimension -> (issue field holding the value, filter keeping live memberships)
+ROLLUP_DIMENSIONS = {
+    NONE: (None, None),
+    ASSIGNEE: ("issue_assignee__assignee_id", Q(issue_assignee__deleted_at__isnull=True)),
+    LABEL: ("label_issue__label_id", Q(label_issue__deleted_at__isnull=True)),
+    CYCLE: ("issue_cycle__cycle_id", Q(issue_cycle__deleted_at__isnull=True)),
+    MODULE: ("issue_module__module_id", Q(issue_module__deleted_at__isnull=True)),
+}
+
+# build_analytics_chart axis -> (dimension, rollup field, model for names, name attribute)
+ROLLUP_CHART_AXES = {
+    "STATES": (NONE, "state_id", State.all_objects, "name"),
+    "STATE_GROUPS": (NONE, "state_group", None, None),
+    "PRIORITY": (NONE, "priority", None, None),
+    "CREATED_AT": (NONE, "date", None, None),
+    "ASSIGNEES": (ASSIGNEE, "dimension_id", User.objects, "display_name"),
+    "LABELS": (LABEL, "dimension_id", Label.all_objects, "name"),
+    "CYCLES": (CYCLE, "dimension_id", Cycle.all_objects, "name"),
+    "MODULES": (MODULE, "dimension_id", Module.all_objects, "name"),
+}
+
+# build_graph_plot axis -> (dimension, rollup field)
+ROLLUP_GRAPH_AXES = {
+    "state_id": (NONE, "state_id"),
+    "state__group": (NONE, "state_group"),
+    "priority": (NONE, "priority"),
+    "created_at": (NONE, "date"),
+    "assignees__id": (ASSIGNEE, "dimension_id"),
+    "labels__id": (LABEL, "dimension_id"),
+    "issue_cycle__cycle_id": (CYCLE, "dimension_id"),
+    "issue_module__module_id": (MODULE, "dimension_id"),
+}
+
+DATE_AXES = {"CREATED_AT", "created_at"}
+
+NUMERIC_ESTIMATE = r"^[0-9]+(\.[0-9]+)?$"
+
+
+def rollup_issue_queryset():
+    """
+    Issues counted by the rollups, mirrors Issue.issue_objects but keeps the
+    issues of archived projects so unarchiving does not need a rebuild.
+    """
+    return (
+        Issue.objects.exclude(state__group=StateGroup.TRIAGE.value)
+        .exclude(archived_at__isnull=False)
+        .exclude(is_draft=True)
+        .annotate(day=TruncDate("created_at", tzinfo=dt_timezone.utc))
+    )
+
+
+def compute_rollup_rows(project_id, dates=None):
+    """Aggregate the issues of a project into rollup rows, optionally for some days only"""
+    issues = rollup_issue_queryset().filter(project_id=project_id)
+    if dates is not None:
+        issues = issues.filter(day__in=list(dates))
+
+    # Categorical estimates cannot be summed, only numeric values are cast
+    estimate = Case(
+        When(
+            estimate_point__value__regex=NUMERIC_ESTIMATE,
+            then=Cast("estimate_point__value", FloatField()),
+        ),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+
+    rows = []
+    for dimension, (field, membership) in ROLLUP_DIMENSIONS.items():
+        queryset = issues.filter(membership) if membership is not None else issues
+        group_fields = ["workspace_id", "day", "state_id", "state__group", "priority"]
+        if field:
+            group_fields.append(field)
+
+        aggregated = (
+            queryset.order_by()
+            .values(*group_fields)
+            .annotate(
+                total=models.Count("id", distinct=True),
+                estimate=Coalesce(Sum(estimate), Value(0.0), output_field=FloatField()),
+            )
+        )
+        for row in aggregated:
+            rows.append(
+                IssueAnalyticsRollup(
+                    workspace_id=row["workspace_id"],
+                    project_id=project_id,
+                    date=row["day"],
+                    state_id=row["state_id"],
+                    state_group=row["state__group"],
+                    priority=row["priority"],
+                    dimension=dimension,
+                    dimension_id=row[field] if field else None,
+                    issue_count=row["total"],
+                    estimate_total=row["estimate"],
+                )
+            )
+    return rows
+
+
+def refresh_project_rollups(project_id, dates=None):
+    """Replace the rollups of a project, or only of the given UTC days"""
+    rows = compute_rollup_rows(project_id, dates=dates)
+    with transaction.atomic():
+        existing = IssueAnalyticsRollup.objects.filter(project_id=project_id)
+        if dates is not None:
+            existing = existing.filter(date__in=list(dates))
+        existing.delete()
+        IssueAnalyticsRollup.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def get_rollup_watermark():
+    try:
+        watermark = redis_instance().get(ROLLUP_WATERMARK_KEY)
+    except RedisError:
+        return None
+    return watermark.decode() if watermark else None
+
+
+def set_rollup_watermark(value):
+    redis_instance().set(ROLLUP_WATERMARK_KEY, value.isoformat())
+
+
+def rollups_ready():
+    """Rollups are only read once a full build has completed"""
+    return get_rollup_watermark() is not None
+
+
+def rollup_dates_match_timezone():
+    return timezone.get_current_timezone_name() == "UTC"
+
+
+def can_use_rollups(axes, date_filtered=False):
+    """
+    Check whether a chart over the given axes can be answered from rollups.
+    At most one multi-valued dimension may be involved and date bucketing or
+    filtering requires the request to run in UTC.
+    """
+    axes = [axis for axis in axes if axis]
+    if not all(axis in ROLLUP_CHART_AXES or axis in ROLLUP_GRAPH_AXES for axis in axes):
+        return False
+
+    dimensions = {(ROLLUP_CHART_AXES.get(axis) or ROLLUP_GRAPH_AXES.get(axis))[0] for axis in axes} - {NONE}
+    if len(dimensions) > 1:
+        return False
+
+    if (date_filtered or DATE_AXES.intersection(axes)) and not rollup_dates_match_timezone():
+        return False
+    return rollups_ready()
+
+
+def get_rollup_queryset(projects, date_range=None):
+    """Rollups of the given projects, optionally limited to a (start, end) range of UTC days"""
+    queryset = IssueAnalyticsRollup.objects.filter(project_id__in=projects.values("id"))
+    if date_range:
+        start_date, end_date = date_range
+        queryset = queryset.filter(date__gte=start_date, date__lte=end_date)
+    return queryset
+
+
+def _resolve_names(axis, keys):
+    _, _, manager, attribute = ROLLUP_CHART_AXES[axis]
+    if manager is None:
+        return {key: key for key in keys}
+    ids = [key for key in keys if key]
+    return dict(manager.filter(id__in=ids).values_list("id", attribute))
+
+
+def build_rollup_analytics_chart(rollup_queryset, x_axis, group_by=None):
+    """Rollup backed equivalent of plane.utils.build_chart.build_analytics_chart"""
+    x_dimension, x_field, _, _ = ROLLUP_CHART_AXES[x_axis]
+    group_dimension, group_field = (ROLLUP_CHART_AXES[group_by][:2]) if group_by else (NONE, None)
+    queryset = rollup_queryset.filter(dimension=x_dimension or group_dimension).order_by()
+
+    if not group_field:
+        data = list(queryset.values(x_field).annotate(count=Sum("issue_count")).order_by(x_field))
+        names = _resolve_names(x_axis, [item[x_field] for item in data])
+        response = [
+            {
+                "key": item[x_field] if item[x_field] else "None",
+                "name": names.get(item[x_field]) or "None",
+                "count": item["count"],
+            }
+            for item in data
+        ]
+        return {"data": response, "schema": {}}
+
+    data = list(queryset.values(x_field, group_field).annotate(count=Sum("issue_count")).order_by("-count"))
+    names = _resolve_names(x_axis, [item[x_field] for item in data])
+    group_names = _resolve_names(group_by, [item[group_field] for item in data])
+    response, schema = process_grouped_data(
+        [
+            {
+                "key": item[x_field],
+                "display_name": names.get(item[x_field]),
+                "group_key": item[group_field],
+                "group_name": group_names.get(item[group_field]),
+                "count": item["count"],
+            }
+            for item in data
+        ]
+    )
+    return {"data": response, "schema": schema}
+
+
+def _graph_axis(queryset, axis, attribute):
+    _, field = ROLLUP_GRAPH_AXES[axis]
+    if axis == "created_at":
+        return annotate_with_monthly_dimension(queryset, field, attribute)
+    return queryset.annotate(**{attribute: F(field)})
+
+
+def build_rollup_graph_plot(rollup_queryset, x_axis, y_axis, segment=None):
+    """Rollup backed equivalent of plane.utils.analytics_plot.build_graph_plot"""
+    dimension = ROLLUP_GRAPH_AXES[x_axis][0] or (ROLLUP_GRAPH_AXES[segment][0] if segment else NONE)
+    # The rollups have a dimension field, so the axes are annotated under other names
+    queryset = _graph_axis(rollup_queryset.filter(dimension=dimension).order_by(), x_axis, "dimension_key")
+    queryset = queryset.exclude(dimension_key__isnull=True)
+
+    group_fields = ["dimension_key"]
+    if segment:
+        queryset = _graph_axis(queryset, segment, "segment_key")
+        group_fields.append("segment_key")
+
+    if y_axis == "issue_count":
+        queryset = queryset.values(*group_fields).annotate(count=Sum("issue_count"))
+    else:
+        queryset = queryset.values(*group_fields).annotate(estimate=Sum("estimate_total"))
+
+    result_values = []
+    for row in queryset.order_by("dimension_key"):
+        row["dimension"] = row.pop("dimension_key")
+        if segment:
+            row["segment"] = row.pop("segment_key")
+        result_values.append(row)
+    grouped_data = {str(key): list(items) for key, items in groupby(result_values, key=lambda x: x["dimension"])}
+    return sort_data(grouped_data, x_axis)
+
+
+def get_rollup_total(rollup_queryset):
+    """Number of issues covered by a rollup queryset"""
+    return rollup_queryset.filter(dimension=NONE).aggregate(total=Coalesce(Sum("issue_count"), 0))["total"]
+
+
+def build_rollup_graph_extras(rollup_queryset, x_axis, segment=None):
+    """Rollup backed equivalent of the detail lookups returned by AnalyticsEndpoint"""
+    axes = {x_axis, segment}
+    extras = {
+        "state_details": {},
+        "assignee_details": {},
+        "label_details": {},
+        "cycle_details": {},
+        "module_details": {},
+    }
+
+    def dimension_ids(dimension):
+        return (
+            rollup_queryset.filter(dimension=dimension, dimension_id__isnull=False)
+            .order_by()
+            .values_list("dimension_id", flat=True)
+            .distinct()
+        )
+
+    if "state_id" in axes:
+        state_ids = rollup_queryset.filter(dimension=NONE).order_by().values_list("state_id", flat=True).distinct()
+        extras["state_details"] = [
+            {"state_id": state["id"], "state__name": state["name"], "state__color": state["color"]}
+            for state in State.all_objects.filter(id__in=state_ids).order_by("id").values("id", "name", "color")
+        ]
+
+    if "labels__id" in axes:
+        extras["label_details"] = [
+            {"labels__id": label["id"], "labels__color": label["color"], "labels__name": label["name"]}
+            for label in Label.all_objects.filter(id__in=dimension_ids(LABEL))
+            .order_by("id")
+            .values("id", "color", "name")
+        ]
+
+    if "assignees__id" in axes:
+        users = (
+            User.objects.filter(
+                Q(avatar__isnull=False) | Q(avatar_asset__isnull=False),
+                id__in=dimension_ids(ASSIGNEE),
+            )
+            .annotate(
+                avatar_url_value=Case(
+                    When(
+                        avatar_asset__isnull=False,
+                        then=Concat(Value("/api/assets/v2/static/"), "avatar_asset", Value("/")),
+                    ),
+                    When(avatar_asset__isnull=True, then="avatar"),
+                    default=Value(None),
+                    output_field=models.CharField(),
+                )
+            )
+            .order_by("id")
+            .values("id", "avatar_url_value", "display_name", "first_name", "last_name")
+        )
+        extras["assignee_details"] = [
+            {
+                "assignees__avatar_url": user["avatar_url_value"],
+                "assignees__display_name": user["display_name"],
+                "assignees__first_name": user["first_name"],
+                "assignees__last_name": user["last_name"],
+                "assignees__id": user["id"],
+            }
+            for user in users
+        ]
+
+    if "issue_cycle__cycle_id" in axes:
+        extras["cycle_details"] = [
+            {"issue_cycle__cycle_id": cycle["id"], "issue_cycle__cycle__name": cycle["name"]}
+            for cycle in Cycle.all_objects.filter(id__in=dimension_ids(CYCLE)).order_by("id").values("id", "name")
+        ]
+
+    if "issue_module__module_id" in axes:
+        extras["module_details"] = [
+            {"issue_module__module_id": module["id"], "issue_module__module__name": module["name"]}
+            for module in Module.all_objects.filter(id__in=dimension_ids(MODULE)).order_by("id").values("id", "name")
+        ]
+
+    return extras
@@ -0,0 +1,162 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+API token lookups for authentication. Active tokens are cached by a hash of
+the token, briefly in process and for a minute in redis, and forgotten when
+the token is saved or deleted. The last use of a token is kept in a redis
+hash and flushed to the database in bulk by a periodic task.
+"""
+
+# Python imports
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+# Django imports
+from django.utils import timezone
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api")
+
+TOKEN_KEY_PREFIX = "api_token"
+TOKEN_CACHE_TTL = 60
+# Other processes see a revoked token at most this late
+LOCAL_TOKEN_TTL = 10
+LOCAL_TOKEN_MAX_ENTRIES = 10000
+# Hash of token id -> unix timestamp of its last use
+LAST_USED_KEY = "api_token_last_used"
+# A token's last use is written to redis at most once per interval per process
+LAST_USED_INTERVAL = 10
+
+_lock = threading.Lock()
+_local_tokens = {}
+_last_recorded = {}
+
+
+def hash_token(token):
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_key(token_hash):
+    return f"{TOKEN_KEY_PREFIX}:{token_hash}"
+
+
+def load_api_token(token):
+    """The cached fields of an active token, None if there is none"""
+    api_token = (
+        APIToken.objects.filter(token=token, is_active=True)
+        .values("id", "user_id", "workspace_id", "is_service", "expired_at")
+        .first()
+    )
+    if api_token is None:
+        return None
+
+    return {
+        "id": str(api_token["id"]),
+        "user_id": str(api_token["user_id"]),
+        "workspace_id": str(api_token["workspace_id"]) if api_token["workspace_id"] else None,
+        "is_service": api_token["is_service"],
+        "expired_at": api_token["expired_at"].timestamp() if api_token["expired_at"] else None,
+    }
+
+
+def get_valid_api_token(token):
+    """Return the cached fields of a valid token, or None if it is unknown, inactive or expired"""
+    token_hash = hash_token(token)
+    cached = _local_tokens.get(token_hash)
+    if cached is not None and cached[0] > time.monotonic():
+        api_token = cached[1]
+    else:
+        api_token = None
+        try:
+            value = redis_instance().get(get_token_key(token_hash))
+            api_token = json.loads(value) if value else None
+        except RedisError as e:
+            logger.warning(f"Could not read the api token cache: {e}")
+
+        if api_token is None:
+            api_token = load_api_token(token)
+            if api_token is None:
+                return None
+            try:
+                redis_instance().set(get_token_key(token_hash), json.dumps(api_token), ex=TOKEN_CACHE_TTL)
+            except RedisError as e:
+                logger.warning(f"Could not cache the api token: {e}")
+
+        with _lock:
+            if len(_local_tokens) >= LOCAL_TOKEN_MAX_ENTRIES:
+                _local_tokens.clear()
+            _local_tokens[token_hash] = (time.monotonic() + LOCAL_TOKEN_TTL, api_token)
+
+    # The expiry is checked on every use, the cache outlives it
+    if api_token["expired_at"] is not None and api_token["expired_at"] <= time.time():
+        return None
+    return api_token
+
+
+def forget_api_token(token):
+    token_hash = hash_token(token)
+    _local_tokens.pop(token_hash, None)
+    try:
+        redis_instance().delete(get_token_key(token_hash))
+    except RedisError as e:
+        logger.warning(f"Could not invalidate the api token cache: {e}")
+
+
+def record_api_token_use(token_id):
+    """Record the use of a token in redis, the database is updated by flush_api_token_last_used"""
+    now = time.time()
+    if now - _last_recorded.get(token_id, 0) < LAST_USED_INTERVAL:
+        return
+
+    try:
+        redis_instance().hset(LAST_USED_KEY, token_id, now)
+    except RedisError as e:
+        logger.warning(f"Could not record the api token use: {e}")
+        APIToken.objects.filter(pk=token_id).update(last_used=timezone.now())
+        return
+
+    with _lock:
+        if len(_last_recorded) >= LOCAL_TOKEN_MAX_ENTRIES:
+            _last_recorded.clear()
+        _last_recorded[token_id] = now
+
+
+def flush_api_token_last_used():
+    """Write the last use of the tokens recorded since the last flush, returns the number of tokens"""
+    ri = redis_instance()
+    pipe = ri.pipeline()
+    pipe.hgetall(LAST_USED_KEY)
+    pipe.delete(LAST_USED_KEY)
+    recorded = pipe.execute()[0]
+    if not recorded:
+        return 0
+
+    api_tokens = [
+        APIToken(
+            id=token_id.decode() if isinstance(token_id, bytes) else token_id,
+            last_used=datetime.fromtimestamp(float(timestamp), tz=dt_timezone.utc),
+        )
+        for token_id, timestamp in recorded.items()
+    ]
+    try:
+        APIToken.objects.bulk_update(api_tokens, ["last_used"], batch_size=500)
+    except Exception:
+        # Keep the uses for the next flush, unless a newer one was recorded meanwhile
+        pipe = ri.pipeline(transaction=False)
+        for token_id, timestamp in recorded.items():
+            pipe.hsetnx(LAST_USED_KEY, token_id, timestamp)
+        pipe.execute()
+        raise
+    return len(api_tokens)
@@ -0,0 +1,162 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Replay a seeded mix of the requests the web app makes most, against a
+workspace, and report the latency percentiles and query counts per
+endpoint. Requests go through the full middleware and view stack in
+process with the Django test client, one at a time.
+"""
+
+# Python imports
+import math
+import random
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+
+# Django imports
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Q
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.db.models import Issue, Project
+from plane.utils.synthetic_data import WORDS
+
+# Endpoint names with their share of the mix
+REQUEST_MIX = [
+    ("issue-list", 30),
+    ("issue-board", 20),
+    ("issue-detail", 25),
+    ("issue-timeline", 10),
+    ("search", 10),
+    ("analytics", 5),
+]
+
+SAMPLE_ISSUES = 200
+
+
+def percentile(values, percent):
+    """The nearest rank percentile of values"""
+    if not values:
+        return 0
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def build_requests(rng, projects, count):
+    """
+    Draw count (endpoint, path) pairs, paths relative to the workspace.
+    Projects are (project_id, issue_count, issue_ids) and are picked in
+    proportion to their issues.
+    """
+    names = [name for name, _ in REQUEST_MIX]
+    weights = [weight for _, weight in REQUEST_MIX]
+    project_weights = [max(issue_count, 1) for _, issue_count, _ in projects]
+
+    requests = []
+    for _ in range(count):
+        endpoint = rng.choices(names, weights)[0]
+        project_id, _, issue_ids = rng.choices(projects, project_weights)[0]
+        if endpoint in ("issue-detail", "issue-timeline") and not issue_ids:
+            endpoint = "issue-list"
+
+        if endpoint == "issue-list":
+            path = f"projects/{project_id}/issues/?per_page=100&order_by=-created_at"
+        elif endpoint == "issue-board":
+            path = f"projects/{project_id}/issues/?group_by=state_id&per_page=50"
+            if rng.random() < 0.3:
+                path += "&sub_group_by=priority"
+        elif endpoint == "issue-detail":
+            path = f"projects/{project_id}/issues/{rng.choice(issue_ids)}/"
+        elif endpoint == "issue-timeline":
+            path = f"projects/{project_id}/issues/{rng.choice(issue_ids)}/timeline/"
+        elif endpoint == "search":
+            path = f"search/?search={rng.choice(WORDS)}&workspace_search=true"
+        else:
+            x_axis = rng.choice(["state__group", "priority"])
+            path = f"analytics/?x_axis={x_axis}&y_axis=issue_count"
+        requests.append((endpoint, path))
+    return requests
+
+
+def summarize(samples):
+    """Aggregate (endpoint, status, seconds, queries) samples per endpoint"""
+    grouped = defaultdict(list)
+    for sample in samples:
+        grouped[sample[0]].append(sample)
+
+    report = {}
+    for endpoint, endpoint_samples in sorted(grouped.items()):
+        latencies = [seconds * 1000 for _, _, seconds, _ in endpoint_samples]
+        queries = [query_count for _, _, _, query_count in endpoint_samples]
+        report[endpoint] = {
+            "requests": len(endpoint_samples),
+            "errors": sum(1 for _, status, _, _ in endpoint_samples if status >= 400),
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies),
+            "mean_queries": sum(queries) / len(queries),
+            "max_queries": max(queries),
+        }
+    return report
+
+
+class ApiBenchmark:
+    """Send the request mix to a workspace as one of its members"""
+
+    def __init__(self, user, slug, seed=0, host="localhost"):
+        self.user = user
+        self.slug = slug
+        self.rng = random.Random(f"{slug}:{seed}")
+        self.client = Client(HTTP_HOST=host)
+        self.client.force_login(user)
+
+    def get_projects(self):
+        projects = (
+            Project.objects.filter(
+                workspace__slug=self.slug,
+                project_projectmember__member=self.user,
+                project_projectmember__is_active=True,
+            )
+            .annotate(issue_count=Count("project_issue", filter=Q(project_issue__deleted_at__isnull=True)))
+            .order_by("id")
+            .values_list("id", "issue_count")
+        )
+        samples = []
+        for project_id, issue_count in projects:
+            issue_ids = Issue.issue_objects.filter(project_id=project_id).order_by("id").values_list("id", flat=True)
+            samples.append((project_id, issue_count, list(issue_ids[:SAMPLE_ISSUES])))
+        return samples
+
+    def send(self, path):
+        """Returns the status, the seconds taken and the number of queries"""
+        with ExitStack() as stack:
+            contexts = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in settings.DATABASES]
+            start = time.perf_counter()
+            response = self.client.get(f"/api/workspaces/{self.slug}/{path}")
+            if response.streaming:
+                for _ in response.streaming_content:
+                    pass
+            seconds = time.perf_counter() - start
+        return response.status_code, seconds, sum(len(context) for context in contexts)
+
+    def run(self, count, warmup=0):
+        projects = self.get_projects()
+        if not projects:
+            return {}
+
+        for _, path in build_requests(self.rng, projects, warmup):
+            self.send(path)
+
+        samples = []
+        for endpoint, path in build_requests(self.rng, projects, count):
+            samples.append((endpoint, *self.send(path)))
+        return summarize(samples)
@@ -14,6 +14,8 @@ from .request_scope import (
     set_use_read_replica,
     should_use_read_replica,
     clear_read_replica_context,
+    set_read_replica_alias,
+    get_read_replica_alias,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "set_use_read_replica",
     "should_use_read_replica",
     "clear_read_replica_context",
+    "set_read_replica_alias",
+    "get_read_replica_alias",
 ]
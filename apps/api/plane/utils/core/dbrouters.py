@@ -13,7 +13,7 @@ from typing import Type
 
 from django.db import models
 
-from .request_scope import should_use_read_replica
+from .request_scope import get_read_replica_alias, should_use_read_replica
 
 logger = logging.getLogger("plane.db")
 
@@ -34,11 +34,12 @@ class ReadReplicaRouter:
             model: The Django model class being queried
             **hints: Additional routing hints
         Returns:
-            str: Database alias ('replica' or 'default')
+            str: Database alias (the selected replica or 'default')
         """
         if should_use_read_replica():
-            logger.debug(f"Routing read for {model._meta.label} to replica database")
-            return "replica"
+            alias = get_read_replica_alias()
+            logger.debug(f"Routing read for {model._meta.label} to replica database {alias}")
+            return alias
         else:
             logger.debug(f"Routing read for {model._meta.label} to primary database")
             return "default"
@@ -11,7 +11,8 @@ class ReadReplicaControlMixin:
     """
     Mixin to control read replica usage in DRF views.
     Set use_read_replica = True/False to route read operations to
-    replica/primary database. Works with ReadReplicaRoutingMiddleware.
+    replica/primary database. None leaves the view eligible for automatic
+    opt-in (READ_REPLICA_AUTO_OPT_IN). Works with ReadReplicaRoutingMiddleware.
     Usage:
         class MyViewSet(ReadReplicaControlMixin, ModelViewSet):
             use_read_replica = True  # Use replica for GET requests
@@ -0,0 +1,174 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Read replica selection utilities.
+This module decides which replica a read-only request should use. It supports
+several replicas with round-robin or least-connections selection, excludes
+replicas whose replication lag exceeds the configured staleness budget, and
+keeps clients that have just written pinned to the primary database
+(read-your-writes stickiness).
+"""
+
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger("plane.db")
+
+__all__ = [
+    "get_replica_aliases",
+    "select_replica",
+    "release_replica",
+    "get_replica_lag",
+    "get_sticky_key",
+    "mark_recent_write",
+    "has_recent_write",
+]
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+
+RECENT_WRITE_CACHE_PREFIX = "db_recent_write"
+
+# Seconds behind the primary, 0 when the replica has replayed everything
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+_lock = threading.Lock()
+_round_robin = itertools.count()
+_active_connections: Dict[str, int] = {}
+# alias -> (checked_at, lag in seconds or None when the probe failed)
+_lag_cache: Dict[str, tuple] = {}
+
+
+def get_replica_aliases() -> List[str]:
+    """
+    Return the configured replica database aliases.
+    Falls back to the single legacy "replica" alias when none are configured.
+    """
+    aliases = getattr(settings, "READ_REPLICA_ALIASES", None)
+    if aliases:
+        return list(aliases)
+    return ["replica"]
+
+
+def get_replica_lag(alias: str) -> Optional[float]:
+    """
+    Return the replication lag of a replica in seconds.
+    The probe result is cached per process for READ_REPLICA_LAG_CHECK_INTERVAL
+    seconds. None means the replica could not be probed and should not be used.
+    """
+    interval = getattr(settings, "READ_REPLICA_LAG_CHECK_INTERVAL", 5)
+    now = time.monotonic()
+
+    cached = _lag_cache.get(alias)
+    if cached is not None and now - cached[0] < interval:
+        return cached[1]
+
+    lag = None
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(LAG_QUERY)
+            row = cursor.fetchone()
+            lag = float(row[0]) if row and row[0] is not None else 0.0
+    except Exception as e:
+        logger.warning(f"Replica lag probe failed for {alias}: {e}")
+
+    _lag_cache[alias] = (now, lag)
+    return lag
+
+
+def _is_replica_fresh(alias: str) -> bool:
+    max_lag = getattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 0)
+    # A budget of 0 disables the lag probe entirely
+    if not max_lag:
+        return True
+
+    lag = get_replica_lag(alias)
+    if lag is None or lag > max_lag:
+        logger.debug(f"Skipping replica {alias}, lag {lag} exceeds {max_lag}s")
+        return False
+    return True
+
+
+def select_replica() -> Optional[str]:
+    """
+    Pick a replica for the current request.
+    Returns the alias of a replica within the staleness budget, or None when
+    every replica is lagging and the request should go to the primary.
+    Every successful selection must be paired with release_replica().
+    """
+    candidates = [alias for alias in get_replica_aliases() if _is_replica_fresh(alias)]
+    if not candidates:
+        return None
+
+    strategy = getattr(settings, "READ_REPLICA_SELECTION", ROUND_ROBIN)
+    with _lock:
+        if strategy == LEAST_CONNECTIONS:
+            alias = min(candidates, key=lambda candidate: _active_connections.get(candidate, 0))
+        else:
+            alias = candidates[next(_round_robin) % len(candidates)]
+        _active_connections[alias] = _active_connections.get(alias, 0) + 1
+    return alias
+
+
+def release_replica(alias: Optional[str]) -> None:
+    """Release a replica previously returned by select_replica()."""
+    if not alias:
+        return
+    with _lock:
+        _active_connections[alias] = max(_active_connections.get(alias, 0) - 1, 0)
+
+
+def get_sticky_key(request) -> Optional[str]:
+    """
+    Return the identity used for read-your-writes stickiness.
+    API clients are keyed by a hash of their key, before and after DRF has
+    authenticated them, and session users by user id.
+    """
+    api_key = request.headers.get("X-Api-Key")
+    if api_key:
+        return f"token:{hashlib.sha256(api_key.encode()).hexdigest()}"
+
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.id}"
+    return None
+
+
+def mark_recent_write(sticky_key: Optional[str]) -> None:
+    """Pin a client to the primary for READ_REPLICA_STICKY_SECONDS."""
+    seconds = getattr(settings, "READ_REPLICA_STICKY_SECONDS", 0)
+    if not sticky_key or not seconds:
+        return
+    try:
+        cache.set(f"{RECENT_WRITE_CACHE_PREFIX}:{sticky_key}", 1, seconds)
+    except Exception as e:
+        logger.warning(f"Could not record recent write: {e}")
+
+
+def has_recent_write(sticky_key: Optional[str]) -> bool:
+    """
+    Check whether a client wrote within the stickiness window.
+    Errs on the side of the primary when the cache is unavailable.
+    """
+    if not sticky_key or not getattr(settings, "READ_REPLICA_STICKY_SECONDS", 0):
+        return False
+    try:
+        return cache.get(f"{RECENT_WRITE_CACHE_PREFIX}:{sticky_key}") is not None
+    except Exception as e:
+        logger.warning(f"Could not read recent write marker: {e}")
+        return True
@@ -17,6 +17,8 @@ __all__ = [
     "set_use_read_replica",
     "should_use_read_replica",
     "clear_read_replica_context",
+    "set_read_replica_alias",
+    "get_read_replica_alias",
 ]
 
 # Request-scoped context storage for database routing preferences
@@ -59,6 +61,24 @@ def should_use_read_replica() -> bool:
     return getattr(_db_routing_context, "use_read_replica", False)
 
 
+def set_read_replica_alias(alias: str) -> None:
+    """
+    Record which replica the current request was assigned to.
+    Args:
+        alias (str): Database alias chosen by the replica selector
+    """
+    _db_routing_context.read_replica_alias = alias
+
+
+def get_read_replica_alias() -> str:
+    """
+    Return the replica alias assigned to the current request.
+    Returns:
+        str: The selected alias, or "replica" when none was recorded
+    """
+    return getattr(_db_routing_context, "read_replica_alias", "replica")
+
+
 def clear_read_replica_context() -> None:
     """
     Clear the read replica context for the current request.
@@ -70,7 +90,8 @@ def clear_read_replica_context() -> None:
     - Ensuring clean state for each new request
     - Proper memory management in long-running processes
     """
-    try:
-        delattr(_db_routing_context, "use_read_replica")
-    except AttributeError:
-        pass
+    for attribute in ("use_read_replica", "read_replica_alias"):
+        try:
+            delattr(_db_routing_context, attribute)
+        except AttributeError:
+            pass
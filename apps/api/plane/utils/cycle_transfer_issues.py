@@ -30,6 +30,7 @@ from plane.db.models import (
 from plane.utils.analytics_plot import burndown_plot
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.utils.host import base_host
+from plane.utils.issue_change_log import record_membership_changes
 
 
 def transfer_cycle_issues(
@@ -456,6 +457,7 @@ def transfer_cycle_issues(
 
     # Bulk update cycle issues
     cycle_issues = CycleIssue.objects.bulk_update(updated_cycles, ["cycle_id"], batch_size=100)
+    record_membership_changes([cycle_issue.issue_id for cycle_issue in updated_cycles])
 
     # Capture Issue Activity
     issue_activity.delay(
@@ -0,0 +1,383 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Dependency graph of the work items of a project or cycle, built from their
+blocked_by, start_before and finish_before relations. The graph computes
+the transitive blockers of every work item, the dependency cycles, a
+topological order and a critical path schedule.
+
+Computed graphs are cached in redis under a version of the project, bumped
+whenever its relations or work items change, so a change makes every graph
+of the project unreachable at once and the remaining ones expire with
+GRAPH_TTL.
+"""
+
+# Python imports
+import heapq
+import json
+import logging
+from datetime import timedelta
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api")
+
+GRAPH_KEY_PREFIX = "dependency_graph"
+VERSION_KEY_PREFIX = "dependency_graph_version"
+# Upper bound of the staleness of changes that do not bump the version,
+# e.g. the dates of a related work item of another project
+GRAPH_TTL = 60 * 10
+VERSION_TTL = 60 * 60 * 24
+
+DEPENDENCY_RELATIONS = ("blocked_by", "start_before", "finish_before")
+
+# How a predecessor constrains its successor
+FINISH_TO_START = 0
+START_TO_START = 1
+FINISH_TO_FINISH = 2
+
+
+def get_version_key(project_id):
+    return f"{VERSION_KEY_PREFIX}:{project_id}"
+
+
+def bump_dependency_graph_versions(project_ids):
+    """Invalidate the dependency graphs of projects after their relations or work items changed"""
+    try:
+        pipe = redis_instance().pipeline(transaction=False)
+        for project_id in set(project_ids):
+            pipe.incr(get_version_key(project_id))
+            pipe.expire(get_version_key(project_id), VERSION_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not invalidate dependency graphs: {e}")
+
+
+def invalidate_dependency_graphs_on_commit(project_ids):
+    project_ids = list(project_ids)
+    transaction.on_commit(lambda: bump_dependency_graph_versions(project_ids))
+
+
+def get_dependency_graph_version(project_id):
+    """The version of the graphs of a project, None if redis is unavailable"""
+    try:
+        return int(redis_instance().get(get_version_key(project_id)) or 0)
+    except RedisError as e:
+        logger.warning(f"Could not read the dependency graph version: {e}")
+        return None
+
+
+def strongly_connected_components(size, adjacency):
+    """
+    Tarjan's algorithm without recursion over nodes 0..size-1. A component
+    is returned after every component reachable from it.
+    """
+    index = [None] * size
+    lowlink = [0] * size
+    on_stack = [False] * size
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(size):
+        if index[root] is not None:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, position = work.pop()
+            if position == 0:
+                index[node] = lowlink[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            neighbours = adjacency[node]
+            while position < len(neighbours):
+                neighbour = neighbours[position]
+                position += 1
+                if index[neighbour] is None:
+                    work.append((node, position))
+                    work.append((neighbour, 0))
+                    break
+                if on_stack[neighbour]:
+                    lowlink[node] = min(lowlink[node], index[neighbour])
+            else:
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+    return components
+
+
+class DependencyGraph:
+    """
+    Work items are indexed 0..n-1 and edges are kept as adjacency lists of
+    (node, constraint) pairs, from a predecessor to its successor.
+
+    A work item lasts from its start date to its target date, both
+    included, or a single day when either is missing. A planned start date
+    is the earliest start of the work item.
+    """
+
+    def __init__(self, issues, relations):
+        """
+        issues: {issue id: (start_date, target_date)}
+        relations: (issue_id, related_issue_id, relation_type) rows
+        """
+        self.ids = sorted(issues, key=str)
+        self.index = {issue_id: position for position, issue_id in enumerate(self.ids)}
+        self.dates = [issues[issue_id] for issue_id in self.ids]
+        self.successors = [[] for _ in self.ids]
+        self.predecessors = [[] for _ in self.ids]
+        self.edges = []
+
+        for issue_id, related_issue_id, relation_type in relations:
+            if issue_id not in self.index or related_issue_id not in self.index:
+                continue
+            issue, related = self.index[issue_id], self.index[related_issue_id]
+            # The issue is blocked by the related issue, or starts or finishes before it
+            if relation_type == "blocked_by":
+                source, target, constraint = related, issue, FINISH_TO_START
+            elif relation_type == "start_before":
+                source, target, constraint = issue, related, START_TO_START
+            elif relation_type == "finish_before":
+                source, target, constraint = issue, related, FINISH_TO_FINISH
+            else:
+                continue
+            self.successors[source].append((target, constraint))
+            self.predecessors[target].append((source, constraint))
+            self.edges.append((source, target, relation_type))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def durations(self):
+        durations = []
+        for start_date, target_date in self.dates:
+            if start_date and target_date:
+                durations.append(max((target_date - start_date).days, 0) + 1)
+            else:
+                durations.append(1)
+        return durations
+
+    def cycles(self):
+        """Work items that depend on each other, as lists of indexes"""
+        adjacency = [[target for target, _ in targets] for targets in self.successors]
+        return [
+            sorted(component)
+            for component in strongly_connected_components(len(self), adjacency)
+            if len(component) > 1 or component[0] in adjacency[component[0]]
+        ]
+
+    def topological_order(self):
+        """
+        Kahn's algorithm, ties broken by index. Work items in or after a
+        cycle are left out.
+        """
+        in_degree = [len(sources) for sources in self.predecessors]
+        ready = [node for node, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            node = heapq.heappop(ready)
+            order.append(node)
+            for target, _ in self.successors[node]:
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    heapq.heappush(ready, target)
+        return order
+
+    def transitive_blockers(self):
+        """
+        For each work item, the bitmask of the work items blocking it
+        directly or through other blocked work items.
+        """
+        # Edges from a work item to its blockers, so components are returned
+        # after the components of their blockers
+        blockers = [
+            [source for source, constraint in sources if constraint == FINISH_TO_START] for sources in self.predecessors
+        ]
+        masks = [0] * len(self)
+        for component in strongly_connected_components(len(self), blockers):
+            mask = 0
+            for node in component:
+                for source in blockers[node]:
+                    mask |= masks[source] | (1 << source)
+            for node in component:
+                masks[node] = mask & ~(1 << node)
+        return masks
+
+    def schedule(self, order, start_date):
+        """
+        Earliest and latest start and finish of the work items in order, in
+        days after start_date, with finishes exclusive. Returns
+        (earliest start, earliest finish, latest start, latest finish) lists.
+        """
+        durations = self.durations()
+        size = len(self)
+        earliest_start = [None] * size
+        earliest_finish = [None] * size
+        latest_start = [None] * size
+        latest_finish = [None] * size
+
+        for node in order:
+            planned_start = self.dates[node][0] or self.dates[node][1]
+            start = max((planned_start - start_date).days, 0) if planned_start else 0
+            for source, constraint in self.predecessors[node]:
+                if constraint == FINISH_TO_START:
+                    start = max(start, earliest_finish[source])
+                elif constraint == START_TO_START:
+                    start = max(start, earliest_start[source])
+                else:
+                    start = max(start, earliest_finish[source] - durations[node])
+            earliest_start[node] = start
+            earliest_finish[node] = start + durations[node]
+
+        finish = max((earliest_finish[node] for node in order), default=0)
+        for node in reversed(order):
+            end = finish
+            for target, constraint in self.successors[node]:
+                if latest_start[target] is None:
+                    continue
+                if constraint == FINISH_TO_START:
+                    end = min(end, latest_start[target])
+                elif constraint == START_TO_START:
+                    end = min(end, latest_start[target] + durations[node])
+                else:
+                    end = min(end, latest_finish[target])
+            latest_finish[node] = end
+            latest_start[node] = end - durations[node]
+
+        return earliest_start, earliest_finish, latest_start, latest_finish
+
+    def critical_path(self, order, earliest_start, earliest_finish, latest_start):
+        """The chain of work items without slack ending with the last one to finish"""
+        if not order:
+            return []
+
+        def is_critical(node):
+            return earliest_start[node] == latest_start[node]
+
+        finish = max(earliest_finish[node] for node in order)
+        node = next(node for node in reversed(order) if earliest_finish[node] == finish)
+        path = [node]
+        while True:
+            # The predecessor holding the work item back
+            for source, constraint in self.predecessors[node]:
+                if not is_critical(source):
+                    continue
+                if (
+                    (constraint == FINISH_TO_START and earliest_finish[source] == earliest_start[node])
+                    or (constraint == START_TO_START and earliest_start[source] == earliest_start[node])
+                    or (constraint == FINISH_TO_FINISH and earliest_finish[source] == earliest_finish[node])
+                ):
+                    node = source
+                    path.append(node)
+                    break
+            else:
+                return path[::-1]
+
+    def get_start_date(self):
+        """The first planned date, today when no work item is planned"""
+        dates = [start_date or target_date for start_date, target_date in self.dates]
+        return min((date for date in dates if date), default=timezone.now().date())
+
+    def to_dict(self):
+        order = self.topological_order()
+        start_date = self.get_start_date()
+        earliest_start, earliest_finish, latest_start, latest_finish = self.schedule(order, start_date)
+        blockers = self.transitive_blockers()
+
+        def as_date(days, finish=False):
+            if days is None:
+                return None
+            # Finish dates are the last day of the work, included
+            return start_date + timedelta(days=days - 1 if finish else days)
+
+        def as_ids(mask):
+            ids = []
+            while mask:
+                low = mask & -mask
+                ids.append(self.ids[low.bit_length() - 1])
+                mask ^= low
+            return ids
+
+        durations = self.durations()
+        nodes = []
+        for node, issue_id in enumerate(self.ids):
+            scheduled = earliest_start[node] is not None
+            slack = latest_start[node] - earliest_start[node] if scheduled else None
+            nodes.append(
+                {
+                    "id": issue_id,
+                    "start_date": self.dates[node][0],
+                    "target_date": self.dates[node][1],
+                    "duration": durations[node],
+                    "earliest_start": as_date(earliest_start[node]),
+                    "earliest_finish": as_date(earliest_finish[node], finish=True),
+                    "latest_start": as_date(latest_start[node]),
+                    "latest_finish": as_date(latest_finish[node], finish=True),
+                    "slack": slack,
+                    "is_critical": slack == 0,
+                    "blocker_ids": as_ids(blockers[node]),
+                }
+            )
+
+        return {
+            "nodes": nodes,
+            "edges": [
+                {"source": self.ids[source], "target": self.ids[target], "relation_type": relation_type}
+                for source, target, relation_type in self.edges
+            ],
+            "topological_order": [self.ids[node] for node in order],
+            "cycles": [[self.ids[node] for node in cycle] for cycle in self.cycles()],
+            "critical_path": [
+                self.ids[node] for node in self.critical_path(order, earliest_start, earliest_finish, latest_start)
+            ],
+            "start_date": start_date if order else None,
+            "finish_date": as_date(max((earliest_finish[node] for node in order), default=None), finish=True),
+        }
+
+
+def get_dependency_graph(project_id, scope, compute):
+    """
+    Return the rendered graph of a scope of a project, computing the
+    DependencyGraph with compute() on a miss. The scope distinguishes the
+    graphs of a project, e.g. a cycle and its work items.
+    """
+    version = get_dependency_graph_version(project_id)
+    if version is None:
+        return json.dumps(compute().to_dict(), cls=DjangoJSONEncoder)
+
+    key = f"{GRAPH_KEY_PREFIX}:{project_id}:{version}:{scope}"
+    try:
+        cached = redis_instance().get(key)
+        if cached is not None:
+            return cached.decode() if isinstance(cached, bytes) else cached
+    except RedisError as e:
+        logger.warning(f"Could not read the dependency graph: {e}")
+
+    body = json.dumps(compute().to_dict(), cls=DjangoJSONEncoder)
+    try:
+        redis_instance().set(key, body, ex=GRAPH_TTL)
+    except RedisError as e:
+        logger.warning(f"Could not store the dependency graph: {e}")
+    return body
@@ -3,7 +3,12 @@
 # See the LICENSE file for details.
 
 # Python imports
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 # Django imports
 from django.db.models import Q
@@ -16,6 +21,54 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 
 from plane.utils.exception_logger import log_exception
 
+FILTER_PLAN_CACHE_SIZE = 512
+
+_filter_plans = OrderedDict()
+_filter_plans_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """A validated filter tree compiled to the Q object applied to querysets"""
+
+    key: str
+    q: Optional[Q]
+    fields: Tuple[str, ...]
+
+
+def normalize_filter(node):
+    """
+    Return an equivalent filter tree in a canonical order: children of
+    or/and and the comma separated values of __in lookups are sorted, so
+    the same filter written differently maps to the same plan. Malformed
+    nodes are returned unchanged and rejected by validation.
+    """
+    if not isinstance(node, dict):
+        return node
+
+    normalized = {}
+    for key, value in node.items():
+        if key in ("or", "and") and isinstance(value, list):
+            children = [normalize_filter(child) for child in value]
+            normalized[key] = sorted(children, key=lambda child: json.dumps(child, sort_keys=True, default=str))
+        elif key == "not":
+            normalized[key] = normalize_filter(value)
+        elif isinstance(key, str) and key.endswith("__in") and isinstance(value, str):
+            normalized[key] = ",".join(sorted(value.split(",")))
+        else:
+            normalized[key] = value
+    return normalized
+
+
+def get_filter_plan_key(filter_data, *scope):
+    payload = json.dumps([normalize_filter(filter_data), [str(item) for item in scope]], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def clear_filter_plans():
+    with _filter_plans_lock:
+        _filter_plans.clear()
+
 
 class ComplexFilterBackend(filters.BaseFilterBackend):
     """
@@ -27,6 +80,10 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
 
     filter_param = "filters"
     default_max_depth = 5
+    # Compiled filter plans are cached per process. Subclasses whose leaf
+    # preprocessing depends on the view or the queryset must disable this.
+    cache_filter_plans = True
+    _depends_on_queryset = False
 
     def filter_queryset(self, request, queryset, view, filter_data=None):
         """Normalize filter input and apply JSON-based filtering.
@@ -82,20 +139,56 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
         if not filter_data:
             return queryset
 
-        # Validate structure and depth before field allowlist checks
+        plan = self._get_filter_plan(filter_data, view, queryset)
+        if plan.q is None:
+            return queryset
+
+        # Apply the combined Q object to the queryset once
+        return queryset.filter(plan.q)
+
+    def _get_filter_plan(self, filter_data, view, queryset):
+        """Return the compiled plan of a filter, from the plan cache when possible.
+
+        Plans are keyed by the normalized filter together with everything
+        that affects its compilation: the backend, the FilterSet and the
+        maximum depth. Filters failing validation are never cached.
+        """
         max_depth = self._get_max_depth(view)
+        key = get_filter_plan_key(filter_data, type(self), getattr(view, "filterset_class", None), max_depth)
+
+        if self.cache_filter_plans:
+            with _filter_plans_lock:
+                plan = _filter_plans.get(key)
+                if plan is not None:
+                    _filter_plans.move_to_end(key)
+                    return plan
+
+        plan, cacheable = self._compile_filter_plan(key, filter_data, view, queryset, max_depth)
+
+        if self.cache_filter_plans and cacheable:
+            with _filter_plans_lock:
+                _filter_plans[key] = plan
+                if len(_filter_plans) > FILTER_PLAN_CACHE_SIZE:
+                    _filter_plans.popitem(last=False)
+        return plan
+
+    def _compile_filter_plan(self, key, filter_data, view, queryset, max_depth):
+        """Validate a filter tree and build its Q object.
+
+        Returns the plan and whether it may be reused with other querysets.
+        """
+        # Validate structure and depth before field allowlist checks
         self._validate_structure(filter_data, max_depth=max_depth, current_depth=1)
 
         # Validate against the view's FilterSet (only declared filters are allowed)
         self._validate_fields(filter_data, view)
 
         # Build combined Q object from the filter tree
+        self._depends_on_queryset = False
         combined_q = self._evaluate_node(filter_data, view, queryset)
-        if combined_q is None:
-            return queryset
 
-        # Apply the combined Q object to the queryset once
-        return queryset.filter(combined_q)
+        plan = FilterPlan(key=key, q=combined_q, fields=tuple(self._extract_field_names(filter_data)))
+        return plan, not self._depends_on_queryset
 
     def _validate_fields(self, filter_data, view):
         """Validate that filtered fields are defined in the view's FilterSet."""
@@ -293,7 +386,10 @@ class ComplexFilterBackend(filters.BaseFilterBackend):
                 }
             )
 
-        return fs.build_combined_q()
+        combined_q = fs.build_combined_q()
+        if getattr(fs, "depends_on_queryset", False):
+            self._depends_on_queryset = True
+        return combined_q
 
     def _get_max_depth(self, view):
         """Return the maximum allowed nesting depth for complex filters.
@@ -22,6 +22,7 @@ from plane.db.models import (
     ModuleIssue,
     IssueLabel,
 )
+from plane.utils.issue_annotations import annotate_issues, issue_values
 from typing import Optional, Dict, Tuple, Any, Union, List
 
 
@@ -46,6 +47,10 @@ def issue_queryset_grouper(
         if group_key in GROUP_FILTER_MAPPER:
             queryset = queryset.filter(GROUP_FILTER_MAPPER[group_key])
 
+    # The grouped paginators partition the queryset by the group field in SQL
+    if "cycle_id" in {group_by, sub_group_by}:
+        queryset = annotate_issues(queryset, ["cycle_id"])
+
     issue_assignee_subquery = Subquery(
         IssueAssignee.objects.filter(
             issue_id=OuterRef("pk"),
@@ -138,7 +143,7 @@ def issue_on_results(
         original_list.append(sub_group_by)
 
     required_fields.extend(original_list)
-    return list(issues.values(*required_fields))
+    return issue_values(issues, required_fields)
 
 
 def issue_group_values(
@@ -0,0 +1,136 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Computed issue fields shared by the issue list and detail views.
+Every field is defined once as a grouped query over a set of issue ids,
+used to enrich a page of results after pagination, and as a correlated
+subquery for the cases that need the field in SQL (grouping or ordering).
+"""
+
+# Python imports
+from typing import Any, Dict, Iterable, List
+
+# Django imports
+from django.db.models import Count, F, Func, OuterRef, QuerySet, Subquery
+
+# Module imports
+from plane.db.models import CycleIssue, FileAsset, Issue, IssueLink
+
+ISSUE_ANNOTATION_FIELDS = ("cycle_id", "link_count", "attachment_count", "sub_issues_count")
+
+# Value of a field for issues missing from its grouped query
+ANNOTATION_DEFAULTS = {
+    "cycle_id": None,
+    "link_count": 0,
+    "attachment_count": 0,
+    "sub_issues_count": 0,
+}
+
+
+def _count_by(queryset: QuerySet, key: str) -> QuerySet:
+    return queryset.order_by().values(key).annotate(value=Count("id")).values_list(key, "value")
+
+
+def _field_querysets(field: str, issue_ids: List[Any]) -> QuerySet:
+    """(issue id, value) rows of a field for the given issues"""
+    if field == "cycle_id":
+        return CycleIssue.objects.filter(issue_id__in=issue_ids).values_list("issue_id", "cycle_id")
+    if field == "link_count":
+        return _count_by(IssueLink.objects.filter(issue_id__in=issue_ids), "issue_id")
+    if field == "attachment_count":
+        return _count_by(
+            FileAsset.objects.filter(
+                issue_id__in=issue_ids,
+                entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+            ),
+            "issue_id",
+        )
+    if field == "sub_issues_count":
+        return _count_by(Issue.issue_objects.filter(parent_id__in=issue_ids), "parent_id")
+    raise ValueError(f"Unknown issue annotation {field}")
+
+
+def _field_subquery(field: str, outer_ref: str) -> Subquery:
+    """Correlated subquery of a field, outer_ref names the issue id of the outer query"""
+    if field == "cycle_id":
+        return Subquery(CycleIssue.objects.filter(issue_id=OuterRef(outer_ref)).values("cycle_id")[:1])
+
+    if field == "link_count":
+        queryset = IssueLink.objects.filter(issue_id=OuterRef(outer_ref))
+    elif field == "attachment_count":
+        queryset = FileAsset.objects.filter(
+            issue_id=OuterRef(outer_ref),
+            entity_type=FileAsset.EntityTypeContext.ISSUE_ATTACHMENT,
+        )
+    elif field == "sub_issues_count":
+        queryset = Issue.issue_objects.filter(parent_id=OuterRef(outer_ref))
+    else:
+        raise ValueError(f"Unknown issue annotation {field}")
+    return Subquery(queryset.order_by().annotate(count=Func(F("id"), function="Count")).values("count"))
+
+
+def issue_annotation_expressions(
+    fields: Iterable[str] = ISSUE_ANNOTATION_FIELDS, outer_ref: str = "id"
+) -> Dict[str, Subquery]:
+    """Correlated subqueries of the fields, for single issues or SQL grouping"""
+    return {field: _field_subquery(field, outer_ref) for field in fields}
+
+
+def annotate_issues(
+    queryset: QuerySet, fields: Iterable[str] = ISSUE_ANNOTATION_FIELDS, outer_ref: str = "id"
+) -> QuerySet:
+    """Annotate the fields missing from a queryset in SQL"""
+    fields = [field for field in fields if field not in queryset.query.annotations]
+    return queryset.annotate(**issue_annotation_expressions(fields, outer_ref)) if fields else queryset
+
+
+def fetch_issue_annotations(issue_ids: List[Any], fields: Iterable[str]) -> Dict[str, Dict[Any, Any]]:
+    """Return {field: {issue id: value}} with one grouped query per field"""
+    if not issue_ids:
+        return {field: {} for field in fields}
+    return {field: dict(_field_querysets(field, issue_ids)) for field in fields}
+
+
+def enrich_issues(issues: List[Any], fields: Iterable[str] = ISSUE_ANNOTATION_FIELDS, key: str = "id") -> List[Any]:
+    """
+    Set the fields on a page of issues, given as dictionaries or model
+    instances. Values already present, e.g. annotated in SQL, are kept.
+    """
+    if not issues:
+        return issues
+
+    is_dict = isinstance(issues[0], dict)
+
+    def has_value(issue, field):
+        return field in issue if is_dict else field in issue.__dict__
+
+    missing = [field for field in fields if not has_value(issues[0], field)]
+    if not missing:
+        return issues
+
+    issue_ids = [issue[key] if is_dict else getattr(issue, key) for issue in issues]
+    values = fetch_issue_annotations(issue_ids, missing)
+    for issue, issue_id in zip(issues, issue_ids):
+        for field in missing:
+            value = values[field].get(issue_id, ANNOTATION_DEFAULTS[field])
+            if is_dict:
+                issue[field] = value
+            else:
+                setattr(issue, field, value)
+    return issues
+
+
+def issue_values(queryset: QuerySet, fields: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Evaluate queryset.values(*fields) for a page of issues, reading the
+    annotation fields that are not annotated on the queryset with
+    enrich_issues() instead of per row subqueries.
+    """
+    annotated = set(queryset.query.annotations)
+    deferred = [field for field in fields if field in ISSUE_ANNOTATION_FIELDS and field not in annotated]
+    selected = [field for field in fields if field not in deferred]
+    if deferred and "id" not in selected:
+        selected.append("id")
+    return enrich_issues(list(queryset.values(*selected)), deferred)
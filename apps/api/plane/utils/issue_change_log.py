@@ -0,0 +1,113 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Django imports
+from django.db import connections, router
+from django.db.models import BigIntegerField, Max
+from django.db.models.expressions import RawSQL
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import Issue, IssueChangeLog
+from plane.settings.redis import redis_instance
+
+# Maximum number of change rows read per delta batch
+CHANGE_LOG_BATCH_SIZE = 1000
+# Highest transaction id removed by the retention cleanup
+CHANGE_LOG_PRUNED_KEY = "issue_change_log:pruned_transaction_id"
+
+SNAPSHOT_XMIN_SQL = "pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+
+
+def _settled_changes():
+    # Transactions below the xmin of the snapshot have all finished, the
+    # rows of transactions still in flight are held back until they commit
+    return IssueChangeLog.objects.filter(
+        transaction_id__lt=RawSQL(SNAPSHOT_XMIN_SQL, [], output_field=BigIntegerField())
+    )
+
+
+def get_change_log_cursor():
+    """Cursor a client should pass as `since` after a full sync started now"""
+    # Read from the database serving the sync, so a lagging replica does not
+    # hand out a cursor past changes it has not replayed yet
+    with connections[router.db_for_read(IssueChangeLog)].cursor() as cursor:
+        cursor.execute(f"SELECT {SNAPSHOT_XMIN_SQL}")
+        return cursor.fetchone()[0] - 1
+
+
+def set_change_log_pruned(transaction_id):
+    redis_instance().set(CHANGE_LOG_PRUNED_KEY, transaction_id)
+
+
+def is_change_log_pruned(since):
+    """Whether changes after `since` may have been removed by the retention cleanup"""
+    try:
+        pruned = redis_instance().get(CHANGE_LOG_PRUNED_KEY)
+    except RedisError:
+        # Without the watermark a full sync is the only safe answer
+        return True
+    return pruned is not None and int(pruned) > since
+
+
+def prune_change_log(cutoff_time, batch_size):
+    """Delete the changes written before the cutoff, returns the number of deleted rows"""
+    expired = IssueChangeLog.objects.filter(created_at__lte=cutoff_time)
+    pruned = expired.aggregate(transaction_id=Max("transaction_id"))["transaction_id"]
+    if pruned is None:
+        return 0
+
+    # The watermark is raised first, so a client never misses deleted rows
+    set_change_log_pruned(pruned)
+    total_deleted = 0
+    while True:
+        ids = list(
+            IssueChangeLog.objects.filter(transaction_id__lte=pruned)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return total_deleted
+        total_deleted += IssueChangeLog.objects.filter(id__in=ids).delete()[0]
+
+
+def record_membership_changes(issue_ids):
+    """Record the issues added to or removed from a cycle or a module as updated"""
+    # Membership rows are written without saving the issue, so the post_save
+    # hook of Issue never sees these changes
+    IssueChangeLog.record(
+        Issue.issue_objects.filter(pk__in=issue_ids).values_list("id", "project_id", "workspace_id"),
+        IssueChangeLog.CHANGE_UPDATED,
+    )
+
+
+def get_changed_issue_ids(project_id, since, limit=CHANGE_LOG_BATCH_SIZE):
+    """
+    Return the issues changed in a project in transactions after `since`.
+    Returns a tuple of (issue ids in change order, next since, has more).
+    Batches end on a transaction boundary, so a cursor never splits the rows
+    of a transaction.
+    """
+    changes = _settled_changes().filter(project_id=project_id, transaction_id__gt=since)
+    rows = list(changes.order_by("transaction_id", "id").values_list("transaction_id", "issue_id")[: limit + 1])
+    has_more = len(rows) > limit
+    if has_more:
+        last_transaction_id = rows[-1][0]
+        if rows[0][0] == last_transaction_id:
+            # A single transaction larger than a batch is sent whole
+            rows = list(
+                changes.filter(transaction_id=last_transaction_id)
+                .order_by("id")
+                .values_list("transaction_id", "issue_id")
+            )
+            has_more = changes.filter(transaction_id__gt=last_transaction_id).exists()
+        else:
+            rows = [row for row in rows if row[0] != last_transaction_id]
+
+    # Keep the last occurrence of every issue, the current state is sent once
+    issue_ids = list(dict.fromkeys(issue_id for _, issue_id in reversed(rows)))[::-1]
+    next_since = rows[-1][0] if rows else since
+    return issue_ids, next_since, has_more
@@ -30,3 +30,34 @@ def get_actual_relation(relation_type):
     }
 
     return actual_relation.get(relation_type, relation_type)
+
+
+# Relation lists of an issue, keyed as seen from that issue
+ISSUE_RELATION_KEYS = [
+    "blocking",
+    "blocked_by",
+    "duplicate",
+    "relates_to",
+    "start_after",
+    "start_before",
+    "finish_after",
+    "finish_before",
+]
+
+
+def partition_relations(issue_id, relations):
+    """
+    Group (issue_id, related_issue_id, relation_type) rows of the relations
+    of an issue into {relation key: [other issue ids]} as seen from that issue.
+    A row stored on the other issue is read as the inverse relation.
+    """
+    issue_id = str(issue_id)
+    partitioned = {key: [] for key in ISSUE_RELATION_KEYS}
+    for source_id, related_id, relation_type in relations:
+        if str(source_id) == issue_id:
+            key, other_id = relation_type, related_id
+        else:
+            key, other_id = get_inverse_relation(relation_type), source_id
+        if key in partitioned and other_id not in partitioned[key]:
+            partitioned[key].append(other_id)
+    return partitioned
@@ -0,0 +1,144 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+# Python imports
+from collections import Counter
+
+# Django imports
+from django.db import connection
+
+# Module imports
+from plane.db.models import StateGroup
+
+MAX_SUB_ISSUE_DEPTH = 10
+
+SUB_ISSUE_TREE_FIELDS = [
+    "id",
+    "parent_id",
+    "depth",
+    "name",
+    "sequence_id",
+    "project_id",
+    "state_id",
+    "state_group",
+    "priority",
+    "sort_order",
+    "start_date",
+    "target_date",
+    "completed_at",
+    "estimate_point",
+    "estimate_value",
+]
+
+# The descendants of an issue down to a depth, with the visibility rules of
+# Issue.issue_objects. The path of each row stops the walk on parent loops.
+SUB_ISSUE_TREE_SQL = """
+WITH RECURSIVE tree AS (
+    SELECT issues.id, 1 AS depth, ARRAY[%(issue_id)s::uuid, issues.id] AS path
+    FROM issues
+    JOIN projects ON projects.id = issues.project_id
+    LEFT JOIN states ON states.id = issues.state_id
+    WHERE issues.parent_id = %(issue_id)s
+        AND issues.workspace_id = %(workspace_id)s
+        AND projects.archived_at IS NULL
+        AND issues.deleted_at IS NULL
+        AND issues.archived_at IS NULL
+        AND NOT issues.is_draft
+        AND states."group" IS DISTINCT FROM 'triage'
+    UNION ALL
+    SELECT issues.id, tree.depth + 1, tree.path || issues.id
+    FROM issues
+    JOIN tree ON issues.parent_id = tree.id
+    JOIN projects ON projects.id = issues.project_id
+    LEFT JOIN states ON states.id = issues.state_id
+    WHERE tree.depth < %(max_depth)s
+        AND NOT issues.id = ANY(tree.path)
+        AND projects.archived_at IS NULL
+        AND issues.deleted_at IS NULL
+        AND issues.archived_at IS NULL
+        AND NOT issues.is_draft
+        AND states."group" IS DISTINCT FROM 'triage'
+)
+SELECT
+    issues.id,
+    issues.parent_id,
+    tree.depth,
+    issues.name,
+    issues.sequence_id,
+    issues.project_id,
+    issues.state_id,
+    states."group",
+    issues.priority,
+    issues.sort_order,
+    issues.start_date,
+    issues.target_date,
+    issues.completed_at,
+    issues.estimate_point_id,
+    estimate_points.value
+FROM tree
+JOIN issues ON issues.id = tree.id
+LEFT JOIN states ON states.id = issues.state_id
+LEFT JOIN estimate_points ON estimate_points.id = issues.estimate_point_id AND estimate_points.deleted_at IS NULL
+ORDER BY tree.depth, issues.sort_order, issues.id
+"""
+
+
+def fetch_sub_issue_tree(issue_id, workspace_id, max_depth=MAX_SUB_ISSUE_DEPTH):
+    """All the descendants of an issue, parents first, as dictionaries of SUB_ISSUE_TREE_FIELDS"""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SUB_ISSUE_TREE_SQL,
+            {"issue_id": issue_id, "workspace_id": workspace_id, "max_depth": max_depth},
+        )
+        return [dict(zip(SUB_ISSUE_TREE_FIELDS, row)) for row in cursor.fetchall()]
+
+
+def estimate_value(value):
+    """Numeric value of an estimate point, categories are not summed"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def roll_up_sub_issue_tree(nodes):
+    """
+    Set on each node the counts of its descendants by state group and the
+    sums of their numeric estimates, total and completed, walking the nodes
+    from the deepest up. Returns the totals of the whole tree.
+    """
+    state_groups = [group for group in StateGroup.values if group != StateGroup.TRIAGE]
+    rollups = {node["id"]: (Counter(), [0.0, 0.0]) for node in nodes}
+    tree_counts, tree_estimates = Counter(), [0.0, 0.0]
+
+    for node in sorted(nodes, key=lambda node: node["depth"], reverse=True):
+        counts, estimates = rollups[node["id"]]
+        node["descendant_count"] = sum(counts.values())
+        node["state_distribution"] = {group: counts[group] for group in state_groups}
+        node["estimate_total"], node["estimate_completed"] = estimates
+
+        # The node with its subtree, added to its parent
+        counts = counts + Counter({node["state_group"]: 1})
+        estimates = list(estimates)
+        value = estimate_value(node["estimate_value"])
+        if value is not None:
+            estimates[0] += value
+            if node["state_group"] == StateGroup.COMPLETED:
+                estimates[1] += value
+
+        parent = rollups.get(node["parent_id"])
+        if parent is None:
+            tree_counts.update(counts)
+            tree_estimates = [tree_estimates[0] + estimates[0], tree_estimates[1] + estimates[1]]
+        else:
+            parent[0].update(counts)
+            parent[1][0] += estimates[0]
+            parent[1][1] += estimates[1]
+
+    return {
+        "descendant_count": sum(tree_counts.values()),
+        "state_distribution": {group: tree_counts[group] for group in state_groups},
+        "estimate_total": tree_estimates[0],
+        "estimate_completed": tree_estimates[1],
+    }
@@ -0,0 +1,157 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Unread notification counters per (workspace, user) kept in a redis hash.
+The hash holds the unread non-mention count under "total" and the unread
+mention count under "mention". Writers only adjust counters that already
+exist, a missing hash is seeded from Postgres on the next read and drift is
+repaired by the periodic reconciliation task.
+"""
+
+# Python imports
+import logging
+from collections import defaultdict
+
+# Django imports
+from django.db.models import Count, Q
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import Notification, NotificationSenderType
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api")
+
+COUNTER_KEY_PREFIX = "notification_unread"
+# Counters of users who stop polling expire and are seeded again on return
+COUNTER_TTL = 60 * 60 * 24
+TOTAL_FIELD = "total"
+MENTION_FIELD = "mention"
+
+# Apply the increments only when the hash exists so a partially seeded
+# counter is never created by a writer
+ADJUST_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], 'total', ARGV[1])
+    redis.call('HINCRBY', KEYS[1], 'mention', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+_adjust_script = None
+
+
+def get_counter_key(slug, user_id):
+    return f"{COUNTER_KEY_PREFIX}:{slug}:{user_id}"
+
+
+def parse_counter_key(key):
+    """Return (slug, user_id) of a counter key"""
+    _, slug, user_id = key.split(":", 2)
+    return slug, user_id
+
+
+def count_unread_notifications(slug, user_id):
+    """Count the unread notifications of a user in Postgres"""
+    counts = Notification.objects.filter(
+        workspace__slug=slug,
+        receiver_id=user_id,
+        read_at__isnull=True,
+        archived_at__isnull=True,
+        snoozed_till__isnull=True,
+    ).aggregate(
+        total=Count("id", filter=~Q(sender_type=NotificationSenderType.MENTIONED)),
+        mention=Count("id", filter=Q(sender_type=NotificationSenderType.MENTIONED)),
+    )
+    return {TOTAL_FIELD: counts["total"], MENTION_FIELD: counts["mention"]}
+
+
+def set_unread_counters(slug, user_id, counts):
+    key = get_counter_key(slug, user_id)
+    pipe = redis_instance().pipeline()
+    pipe.hset(key, mapping=counts)
+    pipe.expire(key, COUNTER_TTL)
+    pipe.execute()
+
+
+def get_unread_counters(slug, user_id):
+    """Return the unread counters, seeding them from Postgres when missing"""
+    try:
+        values = redis_instance().hmget(get_counter_key(slug, user_id), TOTAL_FIELD, MENTION_FIELD)
+        if None not in values:
+            return {TOTAL_FIELD: max(int(values[0]), 0), MENTION_FIELD: max(int(values[1]), 0)}
+    except RedisError as e:
+        logger.warning(f"Could not read notification counters: {e}")
+        return count_unread_notifications(slug, user_id)
+
+    counts = count_unread_notifications(slug, user_id)
+    try:
+        set_unread_counters(slug, user_id, counts)
+    except RedisError as e:
+        logger.warning(f"Could not seed notification counters: {e}")
+    return counts
+
+
+def adjust_unread_counters(deltas):
+    """
+    Apply counter changes, deltas maps (slug, user_id) to (total, mention).
+    A failed write only leaves the counter stale until the next reconciliation.
+    """
+    global _adjust_script
+
+    deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+
+    try:
+        ri = redis_instance()
+        if _adjust_script is None:
+            _adjust_script = ri.register_script(ADJUST_SCRIPT)
+        pipe = ri.pipeline(transaction=False)
+        for (slug, user_id), (total, mention) in deltas.items():
+            _adjust_script(keys=[get_counter_key(slug, user_id)], args=[total, mention], client=pipe)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not update notification counters: {e}")
+
+
+def get_unread_delta(notification, was_unread):
+    """Counter change for a notification that was (or was not) unread before a write"""
+    change = int(notification.is_unread) - int(was_unread)
+    if notification.is_mention:
+        return (0, change)
+    return (change, 0)
+
+
+def track_notification_changes(slug, notifications, was_unread):
+    """
+    Adjust the counters after notifications of a workspace were written.
+    was_unread holds the previous unread flag per notification id, new
+    notifications are simply absent from it.
+    """
+    deltas = defaultdict(lambda: (0, 0))
+    for notification in notifications:
+        total, mention = get_unread_delta(notification, was_unread.get(notification.id, False))
+        key = (slug, str(notification.receiver_id))
+        deltas[key] = (deltas[key][0] + total, deltas[key][1] + mention)
+    adjust_unread_counters(deltas)
+
+
+def reconcile_unread_counters():
+    """Recompute every live counter from Postgres, returns the number of counters fixed"""
+    ri = redis_instance()
+    fixed = 0
+    for key in ri.scan_iter(match=f"{COUNTER_KEY_PREFIX}:*", count=500):
+        key = key.decode() if isinstance(key, bytes) else key
+        slug, user_id = parse_counter_key(key)
+        counts = count_unread_notifications(slug, user_id)
+        values = ri.hmget(key, TOTAL_FIELD, MENTION_FIELD)
+        if values != [str(counts[TOTAL_FIELD]).encode(), str(counts[MENTION_FIELD]).encode()]:
+            set_unread_counters(slug, user_id, counts)
+            fixed += 1
+    return fixed
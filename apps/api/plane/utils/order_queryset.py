@@ -4,12 +4,19 @@
 
 from django.db.models import Case, CharField, Min, Value, When
 
+from plane.utils.issue_annotations import ISSUE_ANNOTATION_FIELDS, annotate_issues
+
 # Custom ordering for priority and state
 PRIORITY_ORDER = ["urgent", "high", "medium", "low", "none"]
 STATE_ORDER = ["backlog", "unstarted", "started", "completed", "cancelled"]
 
 
 def order_issue_queryset(issue_queryset, order_by_param="-created_at"):
+    # Computed fields are added to the page after pagination, they are only
+    # annotated in SQL when the issues are ordered by them
+    if order_by_param.lstrip("-") in ISSUE_ANNOTATION_FIELDS:
+        issue_queryset = annotate_issues(issue_queryset, [order_by_param.lstrip("-")])
+
     # Priority Ordering
     if order_by_param == "priority" or order_by_param == "-priority":
         issue_queryset = issue_queryset.annotate(
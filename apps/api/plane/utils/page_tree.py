@@ -0,0 +1,147 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Operations on a page and its descendants. Every page stores the ids of its
+ancestors in tree_path, kept in sync by Page.save(), so a subtree is one
+indexed prefix match and each operation updates it with a fixed number of
+queries whatever its size.
+"""
+
+# Python imports
+import uuid
+
+# Django imports
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Length, Substr
+
+# Module imports
+from plane.bgtasks.deletion_task import soft_delete_related_objects
+from plane.db.models import Page, ProjectPage
+
+
+def get_subtree(page, include_self=True):
+    """The descendants of a page, with the page itself unless include_self is False"""
+    descendants = Q(tree_path__startswith=page.descendants_path)
+    return Page.objects.filter(descendants | Q(pk=page.pk) if include_self else descendants)
+
+
+def get_depth(tree_path, root):
+    """Levels between root and a page of its subtree, given the tree_path of the page"""
+    return tree_path[len(root.tree_path) :].count("/")
+
+
+def set_subtree_archived(page, archived_at):
+    return get_subtree(page).update(archived_at=archived_at)
+
+
+def set_subtree_access(page, access, owned_by_id):
+    """Change the access of the pages of a subtree owned by a user, other owners keep theirs"""
+    return get_subtree(page).filter(owned_by_id=owned_by_id).update(access=access)
+
+
+def detach_children(page):
+    """Make each child of a page the root of its own subtree"""
+    with transaction.atomic():
+        Page.all_objects.filter(parent_id=page.id).update(parent=None)
+        Page.all_objects.filter(tree_path__startswith=page.descendants_path).update(
+            tree_path=Substr("tree_path", len(page.descendants_path) + 1)
+        )
+
+
+def delete_subtree(page):
+    """Soft delete a page with its descendants, returns their ids"""
+    page_ids = list(get_subtree(page).values_list("id", flat=True))
+    Page.objects.filter(pk__in=page_ids).delete()
+    for page_id in page_ids:
+        soft_delete_related_objects.delay(Page._meta.app_label, Page._meta.model_name, page_id)
+    return page_ids
+
+
+def move_subtree_to_project(page, project_id, new_project_id, user):
+    """Move a page with its descendants from a project to another"""
+    page_ids = list(get_subtree(page).values_list("id", flat=True))
+    with transaction.atomic():
+        ProjectPage.objects.filter(page_id__in=page_ids, project_id=project_id).delete()
+        ProjectPage.objects.bulk_create(
+            [
+                ProjectPage(
+                    workspace_id=page.workspace_id,
+                    project_id=new_project_id,
+                    page_id=page_id,
+                    created_by=user,
+                    updated_by=user,
+                )
+                for page_id in page_ids
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+    return page_ids
+
+
+def duplicate_subtree(page, user, project_ids):
+    """
+    Copy a page with its descendants into the given projects, owned by the
+    user. The copy of the page keeps its parent and the copies of the
+    descendants keep their hierarchy. Private pages of other owners are not
+    copied, their visible descendants move under the closest copied
+    ancestor. Returns the copies, parents first.
+    """
+    pages = list(
+        get_subtree(page)
+        .filter(Q(pk=page.pk) | Q(owned_by=user) | Q(access=Page.PUBLIC_ACCESS))
+        .order_by(Length("tree_path"), "sort_order")
+    )
+    new_ids = {str(original.id): uuid.uuid4() for original in pages}
+
+    copies = []
+    for original in pages:
+        # The ancestors inside the subtree are replaced by their copies
+        subtree_path = original.tree_path[len(page.tree_path) :]
+        ancestor_ids = [new_ids[pk] for pk in subtree_path.split("/") if pk in new_ids]
+        tree_path = page.tree_path + "".join(f"{ancestor_id}/" for ancestor_id in ancestor_ids)
+        is_root = original.id == page.id
+        copies.append(
+            Page(
+                id=new_ids[str(original.id)],
+                workspace_id=original.workspace_id,
+                name=f"{original.name} (Copy)" if is_root else original.name,
+                description_json=original.description_json,
+                description_html=original.description_html,
+                description_stripped=original.description_stripped,
+                owned_by=user,
+                access=original.access,
+                color=original.color,
+                parent_id=original.parent_id if is_root else ancestor_ids[-1],
+                tree_path=tree_path,
+                archived_at=original.archived_at,
+                is_locked=original.is_locked,
+                view_props=original.view_props,
+                logo_props=original.logo_props,
+                is_global=original.is_global,
+                sort_order=original.sort_order,
+                created_by=user,
+                updated_by=user,
+            )
+        )
+
+    with transaction.atomic():
+        Page.objects.bulk_create(copies, batch_size=100)
+        ProjectPage.objects.bulk_create(
+            [
+                ProjectPage(
+                    workspace_id=copy.workspace_id,
+                    project_id=project_id,
+                    page_id=copy.id,
+                    created_by=user,
+                    updated_by=user,
+                )
+                for copy in copies
+                for project_id in project_ids
+            ],
+            batch_size=1000,
+        )
+    return copies
@@ -3,12 +3,18 @@
 # See the LICENSE file for details.
 
 # Python imports
+import base64
+import binascii
+import heapq
 import math
+import uuid
 from collections import defaultdict
 from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.db.models import Count, F, Q, Window
 from django.db.models.functions import RowNumber
 
 # Third party imports
@@ -16,6 +22,7 @@ from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
 # Module imports
+from plane.utils.profiler import profile_phase
 
 
 class Cursor:
@@ -632,6 +639,157 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
 
+class KeysetCursor:
+    """
+    Opaque position in a newest first feed, the (created_at, id) of the last
+    row of the previous page
+    """
+
+    def __init__(self, created_at, id, has_results=None):
+        self.created_at = created_at
+        self.id = id
+        self.has_results = has_results
+
+    def __str__(self):
+        value = f"{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+    def __eq__(self, other):
+        return isinstance(other, KeysetCursor) and (self.created_at, self.id) == (other.created_at, other.id)
+
+    def __repr__(self):
+        return f"{type(self).__name__}: created_at={self.created_at.isoformat()} id={self.id}"
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor from its opaque string format"""
+        try:
+            value = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+            created_at, id = value.split("|")
+            created_at = datetime.fromisoformat(created_at)
+            if created_at.tzinfo is None:
+                raise ValueError("Cursor timestamp must be timezone aware")
+            return cls(created_at, uuid.UUID(id))
+        except (TypeError, ValueError, UnicodeDecodeError, binascii.Error) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
+class KeysetPaginator:
+    """
+    Newest first paginator seeking past the (created_at, id) of the previous
+    page instead of skipping an offset, every page is a range scan of an index
+    on the filtered columns followed by created_at and id. It does not count
+    the queryset, the response only tells if there is a next page.
+    """
+
+    def __init__(self, queryset, max_limit=MAX_LIMIT, on_results=None):
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.on_results = on_results
+
+    def get_result(self, limit=50, cursor=None):
+        limit = min(limit, self.max_limit)
+        queryset = self.queryset.order_by("-created_at", "-id")
+
+        if cursor is not None:
+            # created_at <= value bounds the index scan, the id only breaks ties
+            queryset = queryset.filter(
+                Q(created_at__lt=cursor.created_at) | Q(id__lt=cursor.id),
+                created_at__lte=cursor.created_at,
+            )
+
+        results = list(queryset[: limit + 1])
+        has_next = len(results) > limit
+        results = results[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = results[-1]
+            if isinstance(last, dict):
+                next_cursor = KeysetCursor(last["created_at"], last["id"])
+            else:
+                next_cursor = KeysetCursor(last.created_at, last.id)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(results=results, next=next_cursor, prev=None)
+
+
+class MergedKeysetPaginator:
+    """
+    Oldest first timeline of several querysets, e.g. the activities and the
+    comments of an issue, ordered together by (created_at, id). Each
+    queryset is read as a stream of keys seeking past the cursor and the
+    streams are merged lazily, so a page reads at most limit + 1 keys of
+    each stream. Results are (created_at, id, kind) entries, kind being the
+    key of the queryset, on_results loads the rows of the page.
+    """
+
+    def __init__(self, querysets, max_limit=MAX_LIMIT, on_results=None):
+        self.querysets = querysets
+        self.max_limit = max_limit
+        self.on_results = on_results
+
+    def get_stream(self, kind, queryset, limit, cursor, backward):
+        if backward:
+            queryset = queryset.order_by("-created_at", "-id")
+            if cursor is not None:
+                queryset = queryset.filter(
+                    Q(created_at__lt=cursor.created_at) | Q(id__lt=cursor.id),
+                    created_at__lte=cursor.created_at,
+                )
+        else:
+            queryset = queryset.order_by("created_at", "id")
+            if cursor is not None:
+                queryset = queryset.filter(
+                    Q(created_at__gt=cursor.created_at) | Q(id__gt=cursor.id),
+                    created_at__gte=cursor.created_at,
+                )
+
+        for created_at, id in queryset.values_list("created_at", "id")[: limit + 1].iterator():
+            yield created_at, id, kind
+
+    def get_result(self, limit=50, before=None, after=None):
+        """
+        The page after the `after` cursor, else the page before the `before`
+        cursor, else the latest page. next is the cursor of the newer entries
+        and prev of the older ones, their has_results tell if there are any.
+        """
+        limit = min(limit, self.max_limit)
+        backward = after is None
+        cursor = before if backward else after
+
+        streams = [
+            self.get_stream(kind, queryset, limit, cursor, backward) for kind, queryset in self.querysets.items()
+        ]
+        merged = heapq.merge(*streams, key=lambda entry: (entry[0], entry[1]), reverse=backward)
+        results = list(islice(merged, limit + 1))
+        has_more = len(results) > limit
+        results = results[:limit]
+        if backward:
+            results.reverse()
+
+        # Without results the page keeps the requested position
+        if results:
+            next_cursor = KeysetCursor(results[-1][0], results[-1][1])
+            prev_cursor = KeysetCursor(results[0][0], results[0][1])
+        elif cursor is not None:
+            next_cursor = KeysetCursor(cursor.created_at, cursor.id)
+            prev_cursor = KeysetCursor(cursor.created_at, cursor.id)
+        else:
+            next_cursor = prev_cursor = None
+        if next_cursor is not None:
+            next_cursor.has_results = has_more if not backward else before is not None
+        if prev_cursor is not None:
+            prev_cursor.has_results = has_more if backward else True
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(results=results, next=next_cursor, prev=prev_cursor)
+
+
 class BasePaginator:
     """BasePaginator class can be inherited by any View to return a paginated view"""
 
@@ -699,7 +857,8 @@ class BasePaginator:
             raise ParseError(detail="Error in parsing")
 
         if on_results:
-            results = on_results(cursor_result.results)
+            with profile_phase("serialize"):
+                results = on_results(cursor_result.results)
         else:
             results = cursor_result.results
 
@@ -731,3 +890,89 @@ class BasePaginator:
         )
 
         return response
+
+    def paginate_keyset(
+        self,
+        request,
+        queryset,
+        on_results=None,
+        extra_results=None,
+        default_per_page=50,
+        max_per_page=100,
+    ):
+        """
+        Paginate a newest first feed with a keyset cursor, extra_results
+        returns additional response keys computed from the page results
+        """
+        per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        input_cursor = None
+        if request.GET.get(self.cursor_name):
+            try:
+                input_cursor = KeysetCursor.from_string(request.GET.get(self.cursor_name))
+            except ValueError:
+                raise ParseError(detail="Invalid cursor parameter.")
+
+        paginator = KeysetPaginator(queryset=queryset, max_limit=max_per_page)
+        cursor_result = paginator.get_result(limit=per_page, cursor=input_cursor)
+
+        if on_results:
+            with profile_phase("serialize"):
+                results = on_results(cursor_result.results)
+        else:
+            results = cursor_result.results
+
+        return Response(
+            {
+                "next_cursor": str(cursor_result.next) if cursor_result.next else None,
+                "next_page_results": cursor_result.next is not None,
+                "count": len(cursor_result),
+                **(extra_results(cursor_result.results) if extra_results else {}),
+                "results": results,
+            }
+        )
+
+    def paginate_timeline(
+        self,
+        request,
+        querysets,
+        on_results=None,
+        default_per_page=50,
+        max_per_page=100,
+    ):
+        """
+        Paginate the merged oldest first timeline of querysets with `before`
+        and `after` keyset cursors, on_results loads and serializes the
+        (created_at, id, kind) entries of the page
+        """
+        per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        cursors = {}
+        for name in ("before", "after"):
+            if request.GET.get(name):
+                try:
+                    cursors[name] = KeysetCursor.from_string(request.GET.get(name))
+                except ValueError:
+                    raise ParseError(detail=f"Invalid {name} parameter.")
+        if len(cursors) > 1:
+            raise ParseError(detail="Only one of before and after can be set.")
+
+        paginator = MergedKeysetPaginator(querysets=querysets, max_limit=max_per_page)
+        cursor_result = paginator.get_result(limit=per_page, **cursors)
+
+        if on_results:
+            with profile_phase("serialize"):
+                results = on_results(cursor_result.results)
+        else:
+            results = cursor_result.results
+
+        return Response(
+            {
+                "next_cursor": str(cursor_result.next) if cursor_result.next else None,
+                "next_page_results": bool(cursor_result.next and cursor_result.next.has_results),
+                "prev_cursor": str(cursor_result.prev) if cursor_result.prev else None,
+                "prev_page_results": bool(cursor_result.prev and cursor_result.prev.has_results),
+                "count": len(cursor_result),
+                "results": results,
+            }
+        )
@@ -0,0 +1,241 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Per-request profiling helpers used by RequestProfilerMiddleware.
+A profile is only active for sampled requests, every hook below is a no-op
+otherwise so instrumented code paths pay a single context lookup.
+"""
+
+# Python imports
+import logging
+import math
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Third party imports
+from asgiref.local import Local
+from django_redis.client import DefaultClient
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api.request")
+
+ROUTE_SET_KEY = "request_profile:routes"
+ROUTE_KEY_PREFIX = "request_profile:route:"
+# Number of recent samples kept per route for the percentiles
+ROUTE_SAMPLE_LIMIT = 500
+ROUTE_TTL = 60 * 60 * 24
+
+_profile_context = Local()
+
+
+class RequestProfile:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+        self.queries = Counter()
+        self.cache_count = 0
+        self.cache_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.phases = {}
+
+    def record_query(self, sql, duration):
+        self.query_count += 1
+        self.query_time += duration
+        self.queries[sql] += 1
+
+    def record_cache(self, duration, hits=0, misses=0):
+        self.cache_count += 1
+        self.cache_time += duration
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+    def add_phase(self, name, duration):
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    @property
+    def duplicate_queries(self):
+        return sum(count - 1 for count in self.queries.values() if count > 1)
+
+    def top_duplicates(self, limit=3):
+        return [{"sql": sql[:200], "count": count} for sql, count in self.queries.most_common(limit) if count > 1]
+
+    def total_time(self):
+        return time.perf_counter() - self.started_at
+
+    def as_log_fields(self):
+        return {
+            "profile_query_count": self.query_count,
+            "profile_query_ms": round(self.query_time * 1000, 2),
+            "profile_duplicate_queries": self.duplicate_queries,
+            "profile_top_duplicates": self.top_duplicates(),
+            "profile_cache_count": self.cache_count,
+            "profile_cache_ms": round(self.cache_time * 1000, 2),
+            "profile_cache_hits": self.cache_hits,
+            "profile_cache_misses": self.cache_misses,
+            "profile_phases_ms": {name: round(value * 1000, 2) for name, value in self.phases.items()},
+        }
+
+    def server_timing(self):
+        metrics = [
+            f'db;dur={self.query_time * 1000:.2f};desc="{self.query_count} queries"',
+            f'cache;dur={self.cache_time * 1000:.2f};desc="{self.cache_count} ops"',
+        ]
+        for name, value in self.phases.items():
+            metrics.append(f"{name};dur={value * 1000:.2f}")
+        metrics.append(f"total;dur={self.total_time() * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+def start_profile():
+    profile = RequestProfile()
+    _profile_context.profile = profile
+    return profile
+
+
+def get_current_profile():
+    return getattr(_profile_context, "profile", None)
+
+
+def clear_profile():
+    try:
+        del _profile_context.profile
+    except AttributeError:
+        pass
+
+
+@contextmanager
+def profile_phase(name):
+    """Time a block of work as a named phase of the current request"""
+    profile = get_current_profile()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_phase(name, time.perf_counter() - start)
+
+
+def query_profiler(execute, sql, params, many, context):
+    """connection.execute_wrapper hook recording every query of the request"""
+    profile = get_current_profile()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, time.perf_counter() - start)
+
+
+class ProfilingRedisClient(DefaultClient):
+    """django-redis client that reports cache reads and writes to the request profile"""
+
+    def get(self, key, default=None, version=None, client=None):
+        profile = get_current_profile()
+        if profile is None:
+            return super().get(key, default=default, version=version, client=client)
+
+        start = time.perf_counter()
+        value = super().get(key, default=default, version=version, client=client)
+        hit = value is not default
+        profile.record_cache(time.perf_counter() - start, hits=int(hit), misses=int(not hit))
+        return value
+
+    def get_many(self, keys, version=None, client=None):
+        profile = get_current_profile()
+        if profile is None:
+            return super().get_many(keys, version=version, client=client)
+
+        keys = list(keys)
+        start = time.perf_counter()
+        values = super().get_many(keys, version=version, client=client)
+        profile.record_cache(time.perf_counter() - start, hits=len(values), misses=len(keys) - len(values))
+        return values
+
+    def set(self, *args, **kwargs):
+        return self._timed(super().set, *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        return self._timed(super().delete, *args, **kwargs)
+
+    def delete_many(self, *args, **kwargs):
+        return self._timed(super().delete_many, *args, **kwargs)
+
+    def _timed(self, method, *args, **kwargs):
+        profile = get_current_profile()
+        if profile is None:
+            return method(*args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            profile.record_cache(time.perf_counter() - start)
+
+
+def record_route_profile(route, profile, duration):
+    """Push a sample for the route into its capped redis list"""
+    sample = f"{duration * 1000:.2f}:{profile.query_count}:{profile.query_time * 1000:.2f}"
+    key = f"{ROUTE_KEY_PREFIX}{route}"
+    try:
+        pipe = redis_instance().pipeline(transaction=False)
+        pipe.lpush(key, sample)
+        pipe.ltrim(key, 0, ROUTE_SAMPLE_LIMIT - 1)
+        pipe.expire(key, ROUTE_TTL)
+        pipe.sadd(ROUTE_SET_KEY, route)
+        pipe.expire(ROUTE_SET_KEY, ROUTE_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not record request profile: {e}")
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return None
+    index = max(math.ceil(fraction * len(values)) - 1, 0)
+    return values[index]
+
+
+def get_route_profiles():
+    """Aggregate the recorded samples into per-route percentiles"""
+    ri = redis_instance()
+    routes = sorted(route.decode() for route in ri.smembers(ROUTE_SET_KEY))
+
+    pipe = ri.pipeline(transaction=False)
+    for route in routes:
+        pipe.lrange(f"{ROUTE_KEY_PREFIX}{route}", 0, -1)
+
+    profiles = []
+    for route, samples in zip(routes, pipe.execute()):
+        if not samples:
+            continue
+        parsed = [tuple(float(part) for part in sample.decode().split(":")) for sample in samples]
+        durations = sorted(sample[0] for sample in parsed)
+        query_counts = sorted(sample[1] for sample in parsed)
+        query_times = sorted(sample[2] for sample in parsed)
+        profiles.append(
+            {
+                "route": route,
+                "samples": len(parsed),
+                "p50_ms": percentile(durations, 0.5),
+                "p95_ms": percentile(durations, 0.95),
+                "p50_queries": percentile(query_counts, 0.5),
+                "p95_queries": percentile(query_counts, 0.95),
+                "p50_query_ms": percentile(query_times, 0.5),
+                "p95_query_ms": percentile(query_times, 0.95),
+            }
+        )
+    return sorted(profiles, key=lambda profile: profile["p95_ms"], reverse=True)
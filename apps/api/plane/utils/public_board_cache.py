@@ -0,0 +1,141 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Rendered snapshots of published board responses kept in redis.
+A snapshot is keyed by the deploy board anchor, the board version of its
+project and the normalized query string. Issue changes bump the project
+version, which makes every snapshot of the project unreachable at once,
+and the remaining ones expire with SNAPSHOT_TTL. Concurrent misses of the
+same key are computed once behind a short lock.
+"""
+
+# Python imports
+import hashlib
+import logging
+import time
+from urllib.parse import urlencode
+
+# Django imports
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotModified
+
+# Third party imports
+from redis.exceptions import RedisError
+from rest_framework.renderers import JSONRenderer
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api")
+
+SNAPSHOT_KEY_PREFIX = "public_board_snapshot"
+VERSION_KEY_PREFIX = "public_board_version"
+# Upper bound of the staleness of data that does not bump the version
+SNAPSHOT_TTL = 60
+VERSION_TTL = 60 * 60 * 24
+LOCK_TIMEOUT = 10
+# How long a miss waits for another request computing the same snapshot
+LOCK_WAIT = 5
+LOCK_POLL_INTERVAL = 0.05
+# Browsers revalidate every time, shared caches may serve a snapshot briefly
+CACHE_CONTROL = "public, max-age=0, s-maxage=15, must-revalidate"
+
+
+def get_version_key(project_id):
+    return f"{VERSION_KEY_PREFIX}:{project_id}"
+
+
+def bump_public_board_versions(project_ids):
+    """Invalidate the snapshots of projects after their issues changed"""
+    try:
+        pipe = redis_instance().pipeline(transaction=False)
+        for project_id in set(project_ids):
+            pipe.incr(get_version_key(project_id))
+            pipe.expire(get_version_key(project_id), VERSION_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not invalidate public board snapshots: {e}")
+
+
+def invalidate_public_boards_on_commit(project_ids):
+    project_ids = list(project_ids)
+    transaction.on_commit(lambda: bump_public_board_versions(project_ids))
+
+
+def get_snapshot_key(anchor, version, query_params):
+    query = urlencode(sorted((key, value) for key in query_params for value in query_params.getlist(key)))
+    digest = hashlib.sha1(query.encode()).hexdigest()
+    return f"{SNAPSHOT_KEY_PREFIX}:{anchor}:{version}:{digest}"
+
+
+def build_response(request, body, etag):
+    if etag in request.headers.get("If-None-Match", ""):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def store_snapshot(key, body, etag):
+    try:
+        pipe = redis_instance().pipeline()
+        pipe.hset(key, mapping={"body": body, "etag": etag})
+        pipe.expire(key, SNAPSHOT_TTL)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not store public board snapshot: {e}")
+
+
+def wait_for_snapshot(key):
+    """Poll for a snapshot computed by the request holding the lock"""
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        cached = redis_instance().hmget(key, "body", "etag")
+        if cached[0] is not None:
+            return cached
+    return None
+
+
+def serve_public_board_snapshot(request, anchor, project_id, compute):
+    """
+    Serve a published board response from its snapshot, computing it with
+    compute() on a miss. Requests that cannot use redis are computed directly.
+    """
+    lock = None
+    try:
+        ri = redis_instance()
+        version = int(ri.get(get_version_key(project_id)) or 0)
+        key = get_snapshot_key(anchor, version, request.query_params)
+        cached = ri.hmget(key, "body", "etag")
+        if cached[0] is None:
+            lock = ri.lock(f"{key}:lock", timeout=LOCK_TIMEOUT)
+            if not lock.acquire(blocking=False):
+                cached = wait_for_snapshot(key) or cached
+                lock = None
+    except RedisError as e:
+        logger.warning(f"Could not read public board snapshot: {e}")
+        return compute()
+
+    if cached[0] is not None:
+        return build_response(request, cached[0], cached[1].decode())
+
+    try:
+        response = compute()
+        if response.status_code != 200:
+            return response
+
+        body = JSONRenderer().render(response.data)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        store_snapshot(key, body, etag)
+        return build_response(request, body, etag)
+    finally:
+        if lock is not None:
+            try:
+                lock.release()
+            except RedisError:
+                pass
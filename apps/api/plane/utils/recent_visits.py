@@ -0,0 +1,262 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Recent visits per (workspace, user) kept in a bounded redis sorted set.
+Members are "entity_name:entity_identifier:project_id" scored by the visit
+timestamp. Visits are recorded on the request path, read back from redis
+and periodically flushed in bulk to UserRecentVisit, which is also used to
+seed the sorted set when it expired.
+"""
+
+# Python imports
+import logging
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+# Django imports
+from django.db import transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+# Third party imports
+from redis.exceptions import RedisError
+
+# Module imports
+from plane.db.models import UserRecentVisit, Workspace
+from plane.settings.redis import redis_instance
+
+logger = logging.getLogger("plane.api")
+
+MAX_RECENT_VISITS = 20
+VISITS_KEY_PREFIX = "recent_visits"
+SEEDED_KEY_PREFIX = "recent_visits_seeded"
+# Set of "slug:user_id" whose sorted set changed since the last flush
+DIRTY_KEY = "recent_visits_dirty"
+VISITS_TTL = 60 * 60 * 24 * 7
+FLUSH_BATCH_SIZE = 500
+
+
+def get_visits_key(slug, user_id):
+    return f"{VISITS_KEY_PREFIX}:{slug}:{user_id}"
+
+
+def get_seeded_key(slug, user_id):
+    return f"{SEEDED_KEY_PREFIX}:{slug}:{user_id}"
+
+
+def get_visit_member(entity_name, entity_identifier, project_id):
+    return f"{entity_name}:{entity_identifier or ''}:{project_id or ''}"
+
+
+def get_visit_id(user_id, slug, member):
+    """Stable id of a visit served from redis"""
+    return uuid.uuid5(uuid.NAMESPACE_URL, f"{slug}:{user_id}:{member}")
+
+
+def build_visit(slug, user_id, member, score):
+    member = member.decode() if isinstance(member, bytes) else member
+    entity_name, entity_identifier, project_id = member.split(":", 2)
+    return UserRecentVisit(
+        id=get_visit_id(user_id, slug, member),
+        user_id=user_id,
+        entity_name=entity_name,
+        entity_identifier=entity_identifier or None,
+        project_id=project_id or None,
+        visited_at=datetime.fromtimestamp(score, tz=dt_timezone.utc),
+    )
+
+
+def record_recent_visit(slug, user_id, entity_name, entity_identifier, project_id=None):
+    """Record a visit in a single redis round trip, falling back to the celery task"""
+    key = get_visits_key(slug, user_id)
+    member = get_visit_member(entity_name, entity_identifier, project_id)
+    try:
+        pipe = redis_instance().pipeline()
+        pipe.zadd(key, {member: timezone.now().timestamp()})
+        pipe.zremrangebyrank(key, 0, -(MAX_RECENT_VISITS + 1))
+        pipe.expire(key, VISITS_TTL)
+        pipe.expire(get_seeded_key(slug, user_id), VISITS_TTL)
+        pipe.sadd(DIRTY_KEY, f"{slug}:{user_id}")
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not record recent visit: {e}")
+        # Imported here as the task module imports this one
+        from plane.bgtasks.recent_visited_task import recent_visited_task
+
+        recent_visited_task.delay(
+            slug=slug,
+            entity_name=entity_name,
+            entity_identifier=entity_identifier,
+            user_id=user_id,
+            project_id=project_id,
+        )
+
+
+def load_recent_visits(slug, user_id, limit=MAX_RECENT_VISITS):
+    return list(UserRecentVisit.objects.filter(workspace__slug=slug, user_id=user_id).order_by("-visited_at")[:limit])
+
+
+def seed_recent_visits(slug, user_id):
+    """Merge the persisted visits into the sorted set, newer redis scores win"""
+    key = get_visits_key(slug, user_id)
+    visits = {
+        get_visit_member(visit.entity_name, visit.entity_identifier, visit.project_id): visit.visited_at.timestamp()
+        for visit in load_recent_visits(slug, user_id)
+    }
+    pipe = redis_instance().pipeline()
+    if visits:
+        pipe.zadd(key, visits, nx=True)
+        pipe.zremrangebyrank(key, 0, -(MAX_RECENT_VISITS + 1))
+        pipe.expire(key, VISITS_TTL)
+    pipe.set(get_seeded_key(slug, user_id), 1, ex=VISITS_TTL)
+    pipe.zrevrange(key, 0, MAX_RECENT_VISITS - 1, withscores=True)
+    return pipe.execute()[-1]
+
+
+def get_recent_visits(slug, user_id, entity_names=None):
+    """Return the latest visits of a user as unsaved UserRecentVisit instances"""
+    try:
+        pipe = redis_instance().pipeline(transaction=False)
+        pipe.zrevrange(get_visits_key(slug, user_id), 0, MAX_RECENT_VISITS - 1, withscores=True)
+        pipe.exists(get_seeded_key(slug, user_id))
+        entries, seeded = pipe.execute()
+        if not seeded:
+            entries = seed_recent_visits(slug, user_id)
+        visits = [build_visit(slug, user_id, member, score) for member, score in entries]
+    except RedisError as e:
+        logger.warning(f"Could not read recent visits: {e}")
+        visits = load_recent_visits(slug, user_id)
+
+    if entity_names is not None:
+        visits = [visit for visit in visits if visit.entity_name in entity_names]
+    return visits
+
+
+def remove_recent_visits(slug, entity_name, entity_ids, project_id=None):
+    """Forget the visits of deleted entities, in the table and in the sorted set of every visitor"""
+    visits = UserRecentVisit.objects.filter(
+        workspace__slug=slug, entity_name=entity_name, entity_identifier__in=entity_ids
+    )
+    if project_id is not None:
+        visits = visits.filter(project_id=project_id)
+    user_ids = {str(user_id) for user_id in visits.values_list("user_id", flat=True)}
+    visits.delete(soft=False)
+
+    members = [get_visit_member(entity_name, entity_id, project_id) for entity_id in entity_ids]
+    if not members:
+        return
+    try:
+        ri = redis_instance()
+        # Visits not flushed yet are only in the sorted sets of the dirty users
+        for owner in ri.smembers(DIRTY_KEY):
+            owner_slug, user_id = (owner.decode() if isinstance(owner, bytes) else owner).split(":", 1)
+            if owner_slug == slug:
+                user_ids.add(user_id)
+        pipe = ri.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.zrem(get_visits_key(slug, user_id), *members)
+        pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not remove recent visits: {e}")
+
+
+def persist_recent_visits(visits_by_user):
+    """
+    Upsert the visits of several users in bulk, visits_by_user maps
+    (workspace_id, user_id) to a list of unsaved visits. Rows beyond the
+    latest MAX_RECENT_VISITS of a user are removed.
+    """
+    if not visits_by_user:
+        return
+
+    owners = Q()
+    for workspace_id, user_id in visits_by_user:
+        owners |= Q(workspace_id=workspace_id, user_id=user_id)
+
+    existing = {
+        (
+            str(row.workspace_id),
+            str(row.user_id),
+            get_visit_member(row.entity_name, row.entity_identifier, row.project_id),
+        ): row
+        for row in UserRecentVisit.objects.filter(owners).only(
+            "id", "workspace_id", "user_id", "entity_name", "entity_identifier", "project_id", "visited_at"
+        )
+    }
+
+    updated = []
+    created = []
+    for (workspace_id, user_id), visits in visits_by_user.items():
+        for visit in visits:
+            member = get_visit_member(visit.entity_name, visit.entity_identifier, visit.project_id)
+            row = existing.get((str(workspace_id), str(user_id), member))
+            if row is None:
+                created.append(
+                    UserRecentVisit(
+                        workspace_id=workspace_id,
+                        project_id=visit.project_id,
+                        user_id=user_id,
+                        entity_name=visit.entity_name,
+                        entity_identifier=visit.entity_identifier,
+                        visited_at=visit.visited_at,
+                        created_by_id=user_id,
+                        updated_by_id=user_id,
+                    )
+                )
+            elif row.visited_at != visit.visited_at:
+                row.visited_at = visit.visited_at
+                updated.append(row)
+
+    with transaction.atomic():
+        UserRecentVisit.objects.bulk_create(created, batch_size=FLUSH_BATCH_SIZE)
+        # visited_at is auto_now, so bulk_create stamps the flush time on the
+        # new rows; bulk_update writes the buffered visit times as they are
+        UserRecentVisit.objects.bulk_update(updated + created, ["visited_at"], batch_size=FLUSH_BATCH_SIZE)
+        stale = (
+            UserRecentVisit.objects.filter(owners)
+            .annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=[F("workspace_id"), F("user_id")],
+                    order_by=F("visited_at").desc(),
+                )
+            )
+            .filter(row_number__gt=MAX_RECENT_VISITS)
+            .values("id")
+        )
+        UserRecentVisit.objects.filter(id__in=[row["id"] for row in stale]).delete()
+
+
+def flush_recent_visits():
+    """Persist the sorted sets changed since the last flush, returns the number of users flushed"""
+    ri = redis_instance()
+    flushed = 0
+    while True:
+        pending = ri.spop(DIRTY_KEY, FLUSH_BATCH_SIZE)
+        if not pending:
+            return flushed
+
+        owners = [(value.decode() if isinstance(value, bytes) else value).split(":", 1) for value in pending]
+        pipe = ri.pipeline(transaction=False)
+        for slug, user_id in owners:
+            pipe.zrevrange(get_visits_key(slug, user_id), 0, -1, withscores=True)
+        entries = pipe.execute()
+
+        workspace_ids = dict(Workspace.objects.filter(slug__in={slug for slug, _ in owners}).values_list("slug", "id"))
+        visits_by_user = {}
+        for (slug, user_id), user_entries in zip(owners, entries):
+            if slug in workspace_ids and user_entries:
+                visits_by_user[(workspace_ids[slug], user_id)] = [
+                    build_visit(slug, user_id, member, score) for member, score in user_entries
+                ]
+
+        try:
+            persist_recent_visits(visits_by_user)
+        except Exception:
+            # Keep the users pending so the next flush retries them
+            ri.sadd(DIRTY_KEY, *pending)
+            raise
+        flushed += len(pending)
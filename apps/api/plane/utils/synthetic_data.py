@@ -0,0 +1,513 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Deterministic synthetic workspaces for load testing. Every id, name, date
+and relation is drawn from a random generator seeded with the workspace
+slug and a seed, so the same arguments always produce the same workspace.
+
+Issues are split across projects with Zipf weights and the per issue
+counts of labels, assignees, activities and comments follow a heavy tailed
+distribution around their mean, so a few projects and issues carry most of
+the data like in real workspaces. Rows are written with COPY in batches,
+bypassing save() and signals like bulk_create.
+"""
+
+# Python imports
+import random
+import uuid
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+# Django imports
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Description,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    IssueSequence,
+    Label,
+    Module,
+    ModuleIssue,
+    Page,
+    Project,
+    ProjectMember,
+    ProjectPage,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+WORDS = [
+    "plane",
+    "issue",
+    "cycle",
+    "module",
+    "page",
+    "state",
+    "label",
+    "estimate",
+    "intake",
+    "view",
+    "release",
+    "sprint",
+    "backend",
+    "frontend",
+    "migration",
+    "dashboard",
+    "latency",
+    "search",
+    "export",
+    "webhook",
+    "billing",
+    "onboarding",
+    "mobile",
+    "editor",
+]
+
+STATES = [
+    ("Backlog", "#A3A3A3", "backlog", True),
+    ("Todo", "#3A3A3A", "unstarted", False),
+    ("In Progress", "#F59E0B", "started", False),
+    ("Done", "#16A34A", "completed", False),
+    ("Cancelled", "#EF4444", "cancelled", False),
+]
+
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+ACTIVITY_FIELDS = ["state", "priority", "assignees", "labels", "target_date"]
+
+
+def copy_objects(model, objects, using=DEFAULT_DB_ALIAS):
+    """
+    Insert unsaved model instances with COPY. Like bulk_create, save() and
+    signals are skipped, instances must carry their primary key.
+    """
+    if not objects:
+        return 0
+
+    connection = connections[using]
+    fields = model._meta.concrete_fields
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    statement = f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(statement) as copy:
+            for obj in objects:
+                row = []
+                for field in fields:
+                    value = getattr(obj, field.attname)
+                    # Timestamps set by the generator are kept
+                    if value is None and (getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)):
+                        value = field.pre_save(obj, add=True)
+                    row.append(field.get_db_prep_save(value, connection))
+                copy.write_row(row)
+    return len(objects)
+
+
+def skewed_counts(total, buckets, skew):
+    """Split total into buckets with weights 1 / rank ** skew, a skew of 0 is uniform"""
+    if buckets <= 0:
+        return []
+    weights = [1 / rank**skew for rank in range(1, buckets + 1)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for bucket in range(total - sum(counts)):
+        counts[bucket % buckets] += 1
+    return counts
+
+
+def heavy_tailed_count(rng, mean, tail, maximum):
+    """
+    A count drawn from a Pareto distribution shifted to start at 0 and
+    scaled to mean, capped at maximum. A smaller tail gives heavier tails.
+    """
+    if mean <= 0 or maximum <= 0:
+        return 0
+    value = (rng.paretovariate(tail) - 1) * mean * (tail - 1)
+    return min(int(round(value)), maximum)
+
+
+def zipf_weights(size, skew=1.0):
+    return [1 / rank**skew for rank in range(1, size + 1)]
+
+
+class SyntheticWorkspace:
+    """
+    Generate a workspace owned by an existing user. The members are new
+    users, the projects share them and every project gets its own states,
+    labels, cycles, modules, pages and issues.
+    """
+
+    def __init__(
+        self,
+        owner,
+        slug,
+        seed=0,
+        projects=10,
+        issues=10000,
+        skew=1.0,
+        members=20,
+        labels=30,
+        labels_per_issue=2.0,
+        assignees_per_issue=1.0,
+        activities_per_issue=6.0,
+        comments_per_issue=2.0,
+        pages=20,
+        cycles=6,
+        modules=8,
+        tail=2.5,
+        start_date=None,
+        days=365,
+        batch_size=5000,
+        using=DEFAULT_DB_ALIAS,
+        log=None,
+    ):
+        self.owner = owner
+        self.slug = slug
+        self.rng = random.Random(f"{slug}:{seed}")
+        self.projects = projects
+        self.issues = issues
+        self.skew = skew
+        self.members = members
+        self.labels = labels
+        self.labels_per_issue = labels_per_issue
+        self.assignees_per_issue = assignees_per_issue
+        self.activities_per_issue = activities_per_issue
+        self.comments_per_issue = comments_per_issue
+        self.pages = pages
+        self.cycles = cycles
+        self.modules = modules
+        self.tail = tail
+        self.start = datetime.combine(start_date or datetime(2024, 1, 1).date(), time(), tzinfo=dt_timezone.utc)
+        self.days = days
+        self.batch_size = batch_size
+        self.using = using
+        self.log = log or (lambda message: None)
+
+        self.counts = Counter()
+        # Models keep the order of their first rows, so parents are copied first
+        self.pending = {}
+        self.pending_rows = 0
+
+    def uuid(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def text(self, low, high):
+        return " ".join(self.rng.choice(WORDS) for _ in range(self.rng.randint(low, high)))
+
+    def timestamp(self, after=None):
+        """A time in the generated period, after another one when given"""
+        end = self.start + timedelta(days=self.days)
+        after = after or self.start
+        return after + (end - after) * self.rng.random()
+
+    def add(self, obj):
+        if obj.updated_at is None:
+            obj.updated_at = obj.created_at
+        self.pending.setdefault(type(obj), []).append(obj)
+        self.pending_rows += 1
+        if self.pending_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for model, objects in self.pending.items():
+            self.counts[model._meta.db_table] += copy_objects(model, objects, using=self.using)
+        self.pending = {}
+        self.pending_rows = 0
+
+    def generate(self):
+        """Create the workspace, returns it with the number of rows written per table"""
+        workspace = Workspace.objects.create(
+            id=self.uuid(), name=f"Synthetic {self.slug}", slug=self.slug, owner=self.owner
+        )
+        WorkspaceMember.objects.create(workspace=workspace, member=self.owner, role=20)
+
+        members = self.create_members(workspace)
+        issue_counts = skewed_counts(self.issues, self.projects, self.skew)
+        for index, issue_count in enumerate(issue_counts):
+            with transaction.atomic(using=self.using):
+                project = self.create_project(workspace, index, members)
+                self.create_project_data(workspace, project, members, issue_count)
+                self.flush()
+            self.log(f"Project {index + 1}/{self.projects}: {issue_count} issues")
+        return workspace, self.counts
+
+    def create_members(self, workspace):
+        users = []
+        for index in range(self.members):
+            user = User(
+                id=self.uuid(),
+                username=uuid.UUID(int=self.rng.getrandbits(128)).hex,
+                email=f"{self.slug}-member-{index}@synthetic.plane.so",
+                display_name=f"{self.slug}-member-{index}",
+                first_name=self.rng.choice(WORDS).title(),
+                last_name=self.rng.choice(WORDS).title(),
+                is_active=True,
+                is_password_autoset=True,
+                date_joined=self.start,
+                created_at=self.start,
+            )
+            users.append(user)
+            self.add(user)
+            self.add(WorkspaceMember(id=self.uuid(), workspace=workspace, member=user, role=15, created_at=self.start))
+        self.flush()
+        return [self.owner.id] + [user.id for user in users]
+
+    def create_project(self, workspace, index, members):
+        project = Project.objects.create(
+            id=self.uuid(),
+            workspace=workspace,
+            name=f"{self.text(1, 3).title()} {index + 1}",
+            identifier=f"SYN{index + 1}",
+        )
+        ProjectMember.objects.create(project=project, workspace=workspace, member=self.owner, role=20)
+        for member_id in members[1:]:
+            self.add(
+                ProjectMember(
+                    id=self.uuid(),
+                    project=project,
+                    workspace=workspace,
+                    member_id=member_id,
+                    role=15,
+                    created_at=self.start,
+                )
+            )
+        return project
+
+    def create_project_data(self, workspace, project, members, issue_count):
+        base = {"workspace_id": workspace.id, "project_id": project.id}
+
+        states = []
+        for sequence, (name, color, group, default) in enumerate(STATES, start=1):
+            state = State(
+                id=self.uuid(),
+                name=name,
+                slug=name.lower().replace(" ", "-"),
+                color=color,
+                group=group,
+                default=default,
+                sequence=sequence * 15000,
+                created_at=self.start,
+                **base,
+            )
+            states.append(state)
+            self.add(state)
+
+        labels = []
+        for index in range(self.labels):
+            label = Label(
+                id=self.uuid(),
+                name=f"{self.rng.choice(WORDS)}-{index}",
+                color=f"#{self.rng.getrandbits(24):06x}",
+                sort_order=(index + 1) * 10000,
+                created_at=self.start,
+                **base,
+            )
+            labels.append(label.id)
+            self.add(label)
+
+        cycles = []
+        for index in range(self.cycles):
+            start_date = self.timestamp().date()
+            cycle = Cycle(
+                id=self.uuid(),
+                name=f"Cycle {index + 1}",
+                owned_by_id=self.owner.id,
+                start_date=start_date,
+                end_date=start_date + timedelta(days=14),
+                sort_order=65535 - index * 10000,
+                created_at=self.start,
+                **base,
+            )
+            cycles.append(cycle.id)
+            self.add(cycle)
+
+        modules = []
+        for index in range(self.modules):
+            module = Module(
+                id=self.uuid(),
+                name=f"{self.text(1, 2).title()} {index + 1}",
+                sort_order=65535 - index * 10000,
+                created_at=self.start,
+                **base,
+            )
+            modules.append(module.id)
+            self.add(module)
+
+        self.create_pages(workspace, project, members)
+
+        # Popular labels and busy members are picked more often
+        context = {
+            "base": base,
+            "states": states,
+            "labels": labels,
+            "label_weights": zipf_weights(len(labels)),
+            "members": members,
+            "member_weights": zipf_weights(len(members)),
+            "cycles": cycles,
+            "modules": modules,
+            "issue_ids": [],
+        }
+        for sequence_id in range(1, issue_count + 1):
+            context["issue_ids"].append(self.create_issue(context, sequence_id))
+
+    def create_pages(self, workspace, project, members):
+        pages = []
+        for index in range(self.pages):
+            text = self.text(50, 400)
+            page = Page(
+                id=self.uuid(),
+                workspace=workspace,
+                name=f"{self.text(2, 5).title()}",
+                description_html=f"<p>{text}</p>",
+                description_stripped=text,
+                owned_by_id=self.rng.choice(members),
+                access=0 if self.rng.random() < 0.8 else 1,
+                sort_order=(index + 1) * 10000,
+                created_at=self.timestamp(),
+            )
+            # A third of the pages are nested under an earlier page
+            if pages and self.rng.random() < 0.3:
+                parent = self.rng.choice(pages)
+                page.parent_id = parent.id
+                page.tree_path = parent.descendants_path
+            pages.append(page)
+            self.add(page)
+            self.add(
+                ProjectPage(id=self.uuid(), workspace=workspace, project=project, page=page, created_at=page.created_at)
+            )
+
+    def create_issue(self, context, sequence_id):
+        base, members, member_weights = context["base"], context["members"], context["member_weights"]
+        rng = self.rng
+        created_at = self.timestamp()
+        creator_id = rng.choices(members, member_weights)[0]
+        state = rng.choice(context["states"])
+        text = self.text(20, 200)
+        start_date = created_at.date() if rng.random() < 0.5 else None
+        issue = Issue(
+            id=self.uuid(),
+            name=self.text(3, 12).capitalize(),
+            description_html=f"<p>{text}</p>",
+            description_stripped=text,
+            state_id=state.id,
+            priority=rng.choice(PRIORITIES),
+            sequence_id=sequence_id,
+            sort_order=sequence_id * 1000,
+            start_date=start_date,
+            target_date=start_date + timedelta(days=rng.randint(1, 30)) if start_date else None,
+            completed_at=self.timestamp(created_at) if state.group == "completed" else None,
+            # A fifth of the issues are sub-issues of an earlier issue
+            parent_id=rng.choice(context["issue_ids"]) if context["issue_ids"] and rng.random() < 0.2 else None,
+            created_by_id=creator_id,
+            created_at=created_at,
+            updated_at=created_at,
+            **base,
+        )
+        self.add(issue)
+        self.add(IssueSequence(id=self.uuid(), issue_id=issue.id, sequence=sequence_id, created_at=created_at, **base))
+
+        labels, cycles, modules = context["labels"], context["cycles"], context["modules"]
+        label_count = heavy_tailed_count(rng, self.labels_per_issue, self.tail, len(labels))
+        for label_id in {rng.choices(labels, context["label_weights"])[0] for _ in range(label_count)}:
+            self.add(IssueLabel(id=self.uuid(), issue_id=issue.id, label_id=label_id, created_at=created_at, **base))
+
+        assignee_count = heavy_tailed_count(rng, self.assignees_per_issue, self.tail, len(members))
+        for assignee_id in {rng.choices(members, member_weights)[0] for _ in range(assignee_count)}:
+            self.add(
+                IssueAssignee(id=self.uuid(), issue_id=issue.id, assignee_id=assignee_id, created_at=created_at, **base)
+            )
+
+        if cycles and rng.random() < 0.5:
+            cycle_id = rng.choice(cycles)
+            self.add(CycleIssue(id=self.uuid(), issue_id=issue.id, cycle_id=cycle_id, created_at=created_at, **base))
+        for module_id in set(rng.sample(modules, min(len(modules), rng.choice([0, 0, 1, 1, 2])))):
+            self.add(ModuleIssue(id=self.uuid(), issue_id=issue.id, module_id=module_id, created_at=created_at, **base))
+
+        self.create_history(base, issue, context["states"], members, member_weights)
+        return issue.id
+
+    def create_history(self, base, issue, states, members, member_weights):
+        rng = self.rng
+        self.add(
+            IssueActivity(
+                id=self.uuid(),
+                issue_id=issue.id,
+                actor_id=issue.created_by_id,
+                verb="created",
+                comment="created the issue",
+                epoch=issue.created_at.timestamp(),
+                created_at=issue.created_at,
+                **base,
+            )
+        )
+
+        happened_at = issue.created_at
+        for _ in range(heavy_tailed_count(rng, self.activities_per_issue, self.tail, 500)):
+            happened_at = self.timestamp(happened_at)
+            field = rng.choice(ACTIVITY_FIELDS)
+            old_value, new_value, old_identifier, new_identifier = None, None, None, None
+            if field == "state":
+                old_state, new_state = rng.sample(states, 2)
+                old_value, new_value = old_state.name, new_state.name
+                old_identifier, new_identifier = old_state.id, new_state.id
+            elif field == "priority":
+                old_value, new_value = rng.sample(PRIORITIES, 2)
+            elif field == "target_date":
+                new_value = happened_at.date().isoformat()
+            else:
+                new_value = rng.choice(WORDS)
+            self.add(
+                IssueActivity(
+                    id=self.uuid(),
+                    issue_id=issue.id,
+                    actor_id=rng.choices(members, member_weights)[0],
+                    verb="updated",
+                    field=field,
+                    old_value=old_value,
+                    new_value=new_value,
+                    old_identifier=old_identifier,
+                    new_identifier=new_identifier,
+                    comment=f"updated the {field} to",
+                    epoch=happened_at.timestamp(),
+                    created_at=happened_at,
+                    **base,
+                )
+            )
+
+        commented_at = issue.created_at
+        for _ in range(heavy_tailed_count(rng, self.comments_per_issue, self.tail, 200)):
+            commented_at = self.timestamp(commented_at)
+            actor_id = rng.choices(members, member_weights)[0]
+            text = self.text(5, 80)
+            description = Description(
+                id=self.uuid(),
+                description_html=f"<p>{text}</p>",
+                description_stripped=text,
+                created_by_id=actor_id,
+                created_at=commented_at,
+                **base,
+            )
+            self.add(description)
+            self.add(
+                IssueComment(
+                    id=self.uuid(),
+                    issue_id=issue.id,
+                    actor_id=actor_id,
+                    comment_html=f"<p>{text}</p>",
+                    comment_stripped=text,
+                    description_id=description.id,
+                    created_by_id=actor_id,
+                    created_at=commented_at,
+                    **base,
+                )
+            )
@@ -3,9 +3,10 @@
 # See the LICENSE file for details.
 
 # Python imports
-import pytz
-from datetime import datetime, time
-from datetime import timedelta
+import time as time_module
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 # Django imports
 from django.utils import timezone
@@ -13,30 +14,64 @@ from django.utils import timezone
 # Module imports
 from plane.db.models import Project
 
+# Seconds a project timezone is served from the in-process cache. Saving a
+# project clears its entry in the saving process, other processes pick the
+# change up when the entry expires.
+PROJECT_TIMEZONE_TTL = 60
+PROJECT_TIMEZONE_CACHE_SIZE = 10000
 
-def user_timezone_converter(queryset, datetime_fields, user_timezone):
-    # Create a timezone object for the user's timezone
-    user_tz = pytz.timezone(user_timezone)
+_project_timezones = {}
 
-    # Check if queryset is a dictionary (single item) or a list of dictionaries
-    if isinstance(queryset, dict):
-        queryset_values = [queryset]
-    else:
-        queryset_values = list(queryset)
 
-    # Iterate over the dictionaries in the list
-    for item in queryset_values:
-        # Iterate over the datetime fields
-        for field in datetime_fields:
-            # Convert the datetime field to the user's timezone
-            if field in item and item[field]:
-                item[field] = item[field].astimezone(user_tz)
+@lru_cache(maxsize=None)
+def get_timezone(timezone_name):
+    """Return the (cached) tzinfo of an IANA timezone name"""
+    if timezone_name in ("UTC", "Etc/UTC"):
+        return dt_timezone.utc
+    return ZoneInfo(timezone_name)
+
+
+def get_project_timezone(project_id):
+    """Return the timezone name of a project, cached in-process"""
+    cached = _project_timezones.get(str(project_id))
+    now = time_module.monotonic()
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    timezone_name = Project.objects.values_list("timezone", flat=True).get(id=project_id)
+    if len(_project_timezones) >= PROJECT_TIMEZONE_CACHE_SIZE:
+        _project_timezones.clear()
+    _project_timezones[str(project_id)] = (timezone_name, now + PROJECT_TIMEZONE_TTL)
+    return timezone_name
+
+
+def forget_project_timezone(project_id):
+    _project_timezones.pop(str(project_id), None)
+
 
-    # If queryset was a single item, return a single item
+def convert_datetime_columns(rows, datetime_fields, timezone_name):
+    """
+    Convert the datetime fields of a list of dictionaries to a timezone in
+    place, one column at a time. Values are stored in UTC, so nothing is
+    converted for UTC.
+    """
+    tz = get_timezone(timezone_name)
+    if tz is dt_timezone.utc or not rows:
+        return rows
+
+    for field in datetime_fields:
+        for row in rows:
+            value = row.get(field)
+            if value:
+                row[field] = value.astimezone(tz)
+    return rows
+
+
+def user_timezone_converter(queryset, datetime_fields, user_timezone):
+    # Check if queryset is a dictionary (single item) or a list of dictionaries
     if isinstance(queryset, dict):
-        return queryset_values[0]
-    else:
-        return queryset_values
+        return convert_datetime_columns([queryset], datetime_fields, user_timezone)[0]
+    return convert_datetime_columns(list(queryset), datetime_fields, user_timezone)
 
 
 def convert_to_utc(date, project_id, is_start_date=False):
@@ -52,8 +87,7 @@ def convert_to_utc(date, project_id, is_start_date=False):
         datetime: The UTC datetime.
     """
     # Retrieve the project's timezone using the project ID
-    project = Project.objects.get(id=project_id)
-    project_timezone = project.timezone
+    project_timezone = get_project_timezone(project_id)
     if not date or not project_timezone:
         raise ValueError("Both date and timezone must be provided.")
 
@@ -61,23 +95,20 @@ def convert_to_utc(date, project_id, is_start_date=False):
     start_date = datetime.strptime(date, "%Y-%m-%d").date()
 
     # Get the project's timezone
-    local_tz = pytz.timezone(project_timezone)
-
-    # Combine the date with 12:00 AM time
-    local_datetime = datetime.combine(start_date, time.min)
+    local_tz = get_timezone(project_timezone)
 
-    # Localize the datetime to the project's timezone
-    localized_datetime = local_tz.localize(local_datetime)
+    # Combine the date with 12:00 AM time in the project's timezone
+    localized_datetime = datetime.combine(start_date, time.min, tzinfo=local_tz)
 
     # If it's an start date, add one minute
     if is_start_date:
         localized_datetime += timedelta(minutes=0, seconds=1)
 
         # Convert the localized datetime to UTC
-        utc_datetime = localized_datetime.astimezone(pytz.utc)
+        utc_datetime = localized_datetime.astimezone(dt_timezone.utc)
 
         current_datetime_in_project_tz = timezone.now().astimezone(local_tz)
-        current_datetime_in_utc = current_datetime_in_project_tz.astimezone(pytz.utc)
+        current_datetime_in_utc = current_datetime_in_project_tz.astimezone(dt_timezone.utc)
 
         if localized_datetime.date() == current_datetime_in_project_tz.date():
             return current_datetime_in_utc
@@ -88,7 +119,7 @@ def convert_to_utc(date, project_id, is_start_date=False):
         localized_datetime += timedelta(hours=23, minutes=59, seconds=0)
 
         # Convert the localized datetime to UTC
-        utc_datetime = localized_datetime.astimezone(pytz.utc)
+        utc_datetime = localized_datetime.astimezone(dt_timezone.utc)
 
         # Return the UTC datetime for storage
         return utc_datetime
@@ -106,18 +137,17 @@ def convert_utc_to_project_timezone(utc_datetime, project_id):
         datetime: The datetime in the project's local timezone.
     """
     # Retrieve the project's timezone using the project ID
-    project = Project.objects.get(id=project_id)
-    project_timezone = project.timezone
+    project_timezone = get_project_timezone(project_id)
     if not project_timezone:
         raise ValueError("Project timezone must be provided.")
 
     # Get the timezone object for the project's timezone
-    local_tz = pytz.timezone(project_timezone)
+    local_tz = get_timezone(project_timezone)
 
     # Convert the UTC datetime to the project's local timezone
     if utc_datetime.tzinfo is None:
         # Localize UTC datetime if it's naive (i.e., without timezone info)
-        utc_datetime = pytz.utc.localize(utc_datetime)
+        utc_datetime = utc_datetime.replace(tzinfo=dt_timezone.utc)
 
     # Convert to the project's local timezone
     local_datetime = utc_datetime.astimezone(local_tz)
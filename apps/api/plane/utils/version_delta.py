@@ -0,0 +1,143 @@
+# Copyright (c) 2023-present Plane Software, Inc. and contributors
+# SPDX-License-Identifier: AGPL-3.0-only
+# See the LICENSE file for details.
+
+"""
+Binary deltas between description versions.
+A delta is a list of copy (offset, length in the base) and insert (literal
+bytes) operations, computed on content-defined tokens so an edit only
+produces operations around the edit, and the whole payload is compressed
+with zlib. Several fields are packed into one payload.
+"""
+
+# Python imports
+import re
+import struct
+import zlib
+from difflib import SequenceMatcher
+
+# Token boundaries that are frequent in html, json and yjs updates
+TOKEN_PATTERN = re.compile(rb"[^>\n\x00},]*[>\n\x00},]|[^>\n\x00},]+")
+
+COPY = b"C"
+INSERT = b"I"
+NULL_LENGTH = 0xFFFFFFFF
+
+_UINT = struct.Struct(">I")
+_COPY = struct.Struct(">II")
+
+
+def _common_prefix(base, target):
+    limit = min(len(base), len(target))
+    low, high = 0, limit
+    # Binary search on slice equality, each comparison runs in C
+    while low < high:
+        mid = (low + high + 1) // 2
+        if base[:mid] == target[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(base, target, prefix):
+    limit = min(len(base), len(target)) - prefix
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if base[len(base) - mid :] == target[len(target) - mid :]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def diff(base, target):
+    """Return the operations rebuilding target from base"""
+    prefix = _common_prefix(base, target)
+    suffix = _common_suffix(base, target, prefix)
+
+    ops = []
+    if prefix:
+        ops.append((COPY, 0, prefix))
+
+    base_middle = base[prefix : len(base) - suffix]
+    target_middle = target[prefix : len(target) - suffix]
+    if base_middle and target_middle:
+        base_tokens = TOKEN_PATTERN.findall(base_middle)
+        target_tokens = TOKEN_PATTERN.findall(target_middle)
+
+        offsets = [prefix]
+        for token in base_tokens:
+            offsets.append(offsets[-1] + len(token))
+
+        matcher = SequenceMatcher(None, base_tokens, target_tokens)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append((COPY, offsets[i1], offsets[i2] - offsets[i1]))
+            elif j2 > j1:
+                ops.append((INSERT, b"".join(target_tokens[j1:j2])))
+    elif target_middle:
+        ops.append((INSERT, target_middle))
+
+    if suffix:
+        ops.append((COPY, len(base) - suffix, suffix))
+    return ops
+
+
+def _encode_ops(ops):
+    parts = []
+    for op in ops:
+        if op[0] == COPY:
+            parts.append(COPY + _COPY.pack(op[1], op[2]))
+        else:
+            parts.append(INSERT + _UINT.pack(len(op[1])) + op[1])
+    return b"".join(parts)
+
+
+def _apply_ops(base, payload, position, end):
+    parts = []
+    while position < end:
+        kind = payload[position : position + 1]
+        position += 1
+        if kind == COPY:
+            offset, length = _COPY.unpack_from(payload, position)
+            position += _COPY.size
+            parts.append(base[offset : offset + length])
+        else:
+            (length,) = _UINT.unpack_from(payload, position)
+            position += _UINT.size
+            parts.append(payload[position : position + length])
+            position += length
+    return b"".join(parts)
+
+
+def make_delta(bases, targets):
+    """
+    Encode targets against bases, both are lists of bytes or None aligned
+    by field. Returns the compressed payload.
+    """
+    parts = []
+    for base, target in zip(bases, targets):
+        if target is None:
+            parts.append(_UINT.pack(NULL_LENGTH))
+            continue
+        encoded = _encode_ops(diff(base or b"", target))
+        parts.append(_UINT.pack(len(encoded)) + encoded)
+    return zlib.compress(b"".join(parts))
+
+
+def apply_delta(bases, delta):
+    """Rebuild the field values encoded by make_delta()"""
+    payload = zlib.decompress(delta)
+    targets = []
+    position = 0
+    for base in bases:
+        (length,) = _UINT.unpack_from(payload, position)
+        position += _UINT.size
+        if length == NULL_LENGTH:
+            targets.append(None)
+            continue
+        targets.append(_apply_ops(base or b"", payload, position, position + length))
+        position += length
+    return targets